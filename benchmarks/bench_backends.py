@@ -0,0 +1,63 @@
+"""
+Benchmark dos executores do modo em lote.
+
+Executa os mesmos programas gerados (veja `bench_batch.py`) com cada
+executor de `run_batch`: processos, threads e subinterpretadores. Threads só
+escalam em builds free-threaded do Python e subinterpretadores exigem o
+Python 3.14+; executores indisponíveis são informados e ignorados.
+
+Uso:
+    python benchmarks/bench_backends.py [-n 1000] [-j N] [--chunksize K]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bench_batch import generate  # noqa: E402
+
+from microC.batch import available_executors, free_threading_enabled, run_batch  # noqa: E402
+
+BACKENDS = ("process", "thread", "interpreter")
+
+
+def bench(folder: Path, jobs: int, executor: str, chunksize: int | None) -> tuple[float, int]:
+    start = time.perf_counter()
+    results = run_batch([folder], jobs=jobs, executor=executor, chunksize=chunksize)
+    failures = sum(not r.ok for r in results)
+    return time.perf_counter() - start, failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-n", type=int, default=1000)
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunksize", type=int)
+    args = parser.parse_args()
+
+    gil = "desligado" if free_threading_enabled() else "ligado"
+    print(f"Python {sys.version.split()[0]}, GIL {gil}, jobs={args.jobs}")
+    available = available_executors()
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = Path(tmp)
+        generate(folder, args.n)
+        serial, _ = bench(folder, 1, "process", args.chunksize)
+        print(f"{'serial':<12} {serial:7.3f}s  {args.n / serial:8.1f} programas/s")
+        for executor in BACKENDS:
+            if executor not in available:
+                print(f"{executor:<12} indisponível")
+                continue
+            elapsed, failures = bench(folder, args.jobs, executor, args.chunksize)
+            print(
+                f"{executor:<12} {elapsed:7.3f}s  {args.n / elapsed:8.1f} programas/s  "
+                f"speedup {serial / elapsed:5.2f}x  falhas={failures}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Benchmark do modo em lote: executa 1000 programas gerados.
+
+Gera programas pequenos (laços, funções recursivas e arrays) numa pasta
+temporária e mede a vazão de `run_batch` com 1, 2, 4, ... workers da pool
+de processos, até o número de núcleos da máquina. Idealmente a vazão cresce
+de forma quase linear com o número de workers.
+
+Uso:
+    python benchmarks/bench_batch.py [-n 1000] [--max-jobs N] [--chunksize K]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from microC.batch import run_batch  # noqa: E402
+
+TEMPLATES = [
+    """
+int main() {{
+    int soma = 0;
+    for (int i = 0; i < {n}; i++) {{
+        soma += i * {k};
+    }}
+    printf(soma);
+    return 0;
+}}
+""",
+    """
+int fib(int n) {{
+    if (n < 2) {{
+        return n;
+    }}
+    return fib(n - 1) + fib(n - 2);
+}}
+
+int main() {{
+    printf(fib({f}));
+    return 0;
+}}
+""",
+    """
+int main() {{
+    int v[{size}];
+    int i = 0;
+    while (i < {size}) {{
+        v[i] = ({k} * i) % 97;
+        i++;
+    }}
+    int maior = 0;
+    for (i = 0; i < {size}; i++) {{
+        if (v[i] > maior) {{
+            maior = v[i];
+        }}
+    }}
+    printf(maior);
+    return 0;
+}}
+""",
+]
+
+
+def generate(folder: Path, count: int) -> None:
+    for i in range(count):
+        template = TEMPLATES[i % len(TEMPLATES)]
+        source = template.format(n=200 + i % 300, k=i % 13 + 1, f=10 + i % 6, size=50 + i % 100)
+        (folder / f"prog_{i:05}.microc").write_text(source)
+
+
+def bench(folder: Path, jobs: int, chunksize: int | None) -> tuple[float, int]:
+    start = time.perf_counter()
+    failures = sum(not r.ok for r in run_batch([folder], jobs=jobs, chunksize=chunksize))
+    return time.perf_counter() - start, failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-n", type=int, default=1000)
+    parser.add_argument("--max-jobs", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunksize", type=int)
+    args = parser.parse_args()
+
+    jobs_list = [1]
+    while jobs_list[-1] * 2 <= args.max_jobs:
+        jobs_list.append(jobs_list[-1] * 2)
+    if jobs_list[-1] != args.max_jobs:
+        jobs_list.append(args.max_jobs)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = Path(tmp)
+        generate(folder, args.n)
+        baseline = None
+        for jobs in jobs_list:
+            elapsed, failures = bench(folder, jobs, args.chunksize)
+            baseline = baseline or elapsed
+            print(
+                f"jobs={jobs:<3} {elapsed:7.3f}s  {args.n / elapsed:8.1f} programas/s  "
+                f"speedup {baseline / elapsed:5.2f}x  falhas={failures}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Benchmark da construção da AST: reduções diretas versus transformer.
+
+Analisa um corpus com os exemplos de `exemplos/` e programas sintéticos
+(`microC.generator`) com dois parsers:
+
+* direct: `load_parser(McTransformer())`, com as reduções de
+  `microC/builder.py`;
+* transformer: `load_parser(McTransformer(), direct=False)`, com os
+  callbacks do Lark chamando o transformer, como antes.
+
+Mede o tempo de análise e, em execuções separadas, o número de chamadas de
+funções (`cProfile`), de nós da AST e de árvores do Lark criados e a
+memória alocada (`tracemalloc`). Para cada programa, o pico é o máximo de
+memória alocada durante a análise, incluindo os objetos temporários (listas
+dos filhos, nós e árvores descartados), e o retido é o que continua alocado
+com a AST e as posições prontas; as colunas somam os programas do corpus.
+
+Uso:
+    python benchmarks/bench_builder.py [--size 300] [--programs 20] [--repeat 5]
+"""
+
+import argparse
+import cProfile
+import pstats
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+
+from lark import Tree
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from microC.generator import generate_program  # noqa: E402
+from microC.node import Node  # noqa: E402
+from microC.parser import load_parser  # noqa: E402
+from microC.transformer import McTransformer  # noqa: E402
+
+
+def corpus(size: int, programs: int) -> list[str]:
+    sources = [path.read_text() for path in sorted((ROOT / "exemplos").rglob("*.microc"))]
+    sources += [generate_program(seed, size).source for seed in range(programs)]
+    return sources
+
+
+def parse_all(parser, transformer: McTransformer, sources: list[str]):
+    for src in sources:
+        transformer.reset()
+        parser.parse(src, start="start")
+    transformer.reset()
+
+
+@contextmanager
+def count_instances():
+    """
+    Conta as instâncias de `Node` e de `Tree` criadas dentro do bloco.
+    """
+    counts = {"Node": 0, "Tree": 0}
+    tree_init = Tree.__init__
+
+    def node_new(cls, *args, **kwargs):
+        counts["Node"] += 1
+        return object.__new__(cls)
+
+    def tree_new(self, *args, **kwargs):
+        counts["Tree"] += 1
+        tree_init(self, *args, **kwargs)
+
+    Node.__new__ = node_new
+    Tree.__init__ = tree_new
+    try:
+        yield counts
+    finally:
+        # Sem `__new__` próprio o CPython não volta a usar `object.__new__`
+        Node.__new__ = _node_new
+        Tree.__init__ = tree_init
+
+
+def _node_new(cls, *args, **kwargs):
+    return object.__new__(cls)
+
+
+def measure_memory(parser, transformer: McTransformer, sources: list[str]) -> tuple[int, int]:
+    """
+    Soma dos picos e da memória retida pela análise de cada programa, em
+    bytes.
+    """
+    peak = retained = 0
+    tracemalloc.start()
+    try:
+        for src in sources:
+            transformer.reset()
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            tree = parser.parse(src, start="start")
+            current, top = tracemalloc.get_traced_memory()
+            peak += top - before
+            retained += current - before
+            del tree
+        transformer.reset()
+    finally:
+        tracemalloc.stop()
+    return peak, retained
+
+
+def measure(name: str, parser, transformer: McTransformer, sources: list[str], repeat: int):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse_all(parser, transformer, sources)
+        times.append(time.perf_counter() - start)
+    profile = cProfile.Profile()
+    profile.runcall(parse_all, parser, transformer, sources)
+    calls = pstats.Stats(profile).total_calls
+    with count_instances() as counts:
+        parse_all(parser, transformer, sources)
+    peak, retained = measure_memory(parser, transformer, sources)
+    print(
+        f"{name:<12} {min(times) * 1000:9.1f}ms {calls:12,} {counts['Node']:10,} "
+        f"{counts['Tree']:8,} {peak / 2**20:8.1f}MiB {retained / 2**20:8.1f}MiB"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=300)
+    parser.add_argument("--programs", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    sources = corpus(args.size, args.programs)
+    lines = sum(src.count("\n") for src in sources)
+    print(f"corpus: {len(sources)} programas, {lines} linhas")
+    print(
+        f"{'modo':<12} {'tempo':>11} {'chamadas':>12} {'nós':>10} {'Trees':>8} "
+        f"{'pico':>11} {'retido':>11}"
+    )
+    direct, lark = McTransformer(), McTransformer()
+    measure("direct", load_parser(direct), direct, sources, args.repeat)
+    measure("transformer", load_parser(lark, direct=False), lark, sources, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark da análise incremental: `Document.edit` versus `parse`.
+
+Monta um arquivo grande com as funções de vários programas sintéticos
+(`microC.generator`), com os nomes prefixados para não colidirem, e aplica
+edições de um caractere em posições aleatórias (troca de um dígito e
+inserção de um espaço), medindo cada `Document.edit`. A referência é
+`parse` do arquivo inteiro, como o editor fazia a cada tecla.
+
+Os programas gerados concentram a maior parte do código em `main`; uma
+edição dentro dela analisa `main` inteira de novo, por isso o arquivo usa
+apenas as outras funções.
+
+Uso:
+    python benchmarks/bench_incremental.py [--lines 20000] [--edits 200]
+"""
+
+import argparse
+import random
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from microC.generator import generate_program  # noqa: E402
+from microC.incremental import Document  # noqa: E402
+from microC.parser import parse  # noqa: E402
+
+
+def functions_file(lines: int, seed: int) -> str:
+    """
+    Funções de programas gerados a partir de `seed` até somar `lines` linhas.
+    """
+    parts: list[str] = []
+    total = 0
+    while total < lines:
+        src = generate_program(seed + len(parts), 1000).source
+        head = src[: src.index("int main(")]
+        parts.append(re.sub(r"\b([a-z]+\d+)\b", rf"s{len(parts)}_\1", head))
+        total += head.count("\n")
+    return "".join(parts)
+
+
+def percentile(values: list[float], p: float) -> float:
+    values = sorted(values)
+    return values[min(int(len(values) * p), len(values) - 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lines", type=int, default=20000)
+    parser.add_argument("--edits", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    src = functions_file(args.lines, args.seed)
+    print(f"programa: {src.count(chr(10))} linhas, {len(src)} caracteres")
+
+    start = time.perf_counter()
+    parse(src)
+    full = time.perf_counter() - start
+    start = time.perf_counter()
+    doc = Document(src)
+    print(f"parse (arquivo inteiro): {full * 1000:8.1f}ms")
+    print(f"Document (criação):      {(time.perf_counter() - start) * 1000:8.1f}ms")
+
+    rng = random.Random(args.seed)
+    times, reparsed = [], []
+    for i in range(args.edits):
+        # Dígitos dentro de expressões: trocar um dígito por outro e inserir
+        # um espaço antes dele mantêm o programa válido
+        digits = [m.start() for m in re.finditer(r"(?<=[ (])\d", doc.src)]
+        pos = rng.choice(digits)
+        if i % 2:
+            edit = (pos, pos + 1, str(rng.randrange(1, 10)))
+        else:
+            edit = (pos, pos, " ")
+        start = time.perf_counter()
+        doc.edit(*edit)
+        times.append(time.perf_counter() - start)
+        reparsed.append(doc.reparsed)
+
+    print(
+        f"Document.edit: mediana {statistics.median(times) * 1000:.2f}ms, "
+        f"p95 {percentile(times, 0.95) * 1000:.2f}ms, "
+        f"máximo {max(times) * 1000:.2f}ms "
+        f"({statistics.mean(reparsed):.1f} declarações por edição)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark do analisador léxico: lexer contextual do Lark versus `microC.lexer`.
+
+Mede, em programas sintéticos de `microC.generator`, o tempo para produzir
+todos os tokens e o tempo da análise sintática completa (árvore concreta,
+sem transformer) com cada lexer.
+
+Uso:
+    python benchmarks/bench_lexer.py [--sizes 1000 5000] [--repeat 5]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from microC.generator import generate_program  # noqa: E402
+from microC.parser import load_parser  # noqa: E402
+
+
+def best_of(fn, repeat: int) -> float:
+    """
+    Menor tempo de `repeat` execuções de `fn()`.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    lark = load_parser(fast_lexer=False)
+    fast = load_parser()
+    lexers = {
+        "lark": lambda src: list(lark.lex(src)),
+        "microC.lexer": lambda src: list(fast.parser.lexer.tokenizer.tokenize(src)),
+    }
+    parsers = {"lark": lark, "microC.lexer": fast}
+
+    print(f"{'tamanho':>8} {'lexer':<13} {'tokens':>10} {'análise':>10}")
+    for size in args.sizes:
+        src = generate_program(args.seed, size).source
+        for name in lexers:
+            lex_time = best_of(lambda: lexers[name](src), args.repeat)
+            parse_time = best_of(lambda: parsers[name].parse(src, start="start"), args.repeat)
+            print(
+                f"{size:>8} {name:<13} {lex_time * 1000:8.1f}ms {parse_time * 1000:8.1f}ms",
+                flush=True,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Benchmark da criação do parser: gramática versus tabelas pré-geradas.
+
+Cada medida roda num processo novo (sem nada importado, com os `.pyc` já
+gerados) e inclui a importação do Lark, a criação do parser e a primeira
+análise de um programa de exemplo:
+
+* grammar: `Lark(GRAMMAR_PATH.open(), parser="lalr", ...)`, como antes;
+* tables: `Lark._load_from_dict` com `microC/_parser_tables.py` (veja
+  `microC/build_parser.py`).
+
+Também mede `import microC` completo, que usa as tabelas se estiverem
+atualizadas.
+
+Uso:
+    python benchmarks/bench_parser_load.py [--repeat 10]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+EXAMPLE = ROOT / "exemplos" / "bubble_sort.microc"
+
+SETUP = """
+import json, sys, time
+start = time.perf_counter()
+from lark import Lark
+"""
+
+GRAMMAR = """
+parser = Lark(open({grammar!r}), parser="lalr", start=["start", "expr"])
+"""
+
+TABLES = """
+import importlib.util
+spec = importlib.util.spec_from_file_location("_parser_tables", {tables!r})
+tables = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(tables)
+parser = Lark._load_from_dict(tables.DATA, tables.MEMO)
+"""
+
+FIRST_PARSE = """
+ready = time.perf_counter()
+parser.parse(open({example!r}).read(), start="start")
+done = time.perf_counter()
+print(json.dumps([ready - start, done - ready]))
+"""
+
+IMPORT = """
+import json, time
+start = time.perf_counter()
+import microC
+ready = time.perf_counter()
+microC.parse(open({example!r}).read())
+done = time.perf_counter()
+print(json.dumps([ready - start, done - ready]))
+"""
+
+
+def measure(code: str, repeat: int) -> tuple[float, float]:
+    """
+    Medianas (criação, primeira análise) em processos novos.
+    """
+    runs = []
+    for _ in range(repeat + 1):
+        out = subprocess.run(
+            [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout
+        runs.append(json.loads(out))
+    # A primeira execução pode estar gerando os .pyc
+    runs = runs[1:]
+    return statistics.median(r[0] for r in runs), statistics.median(r[1] for r in runs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    paths = {
+        "grammar": str(ROOT / "microC" / "grammar.lark"),
+        "tables": str(ROOT / "microC" / "_parser_tables.py"),
+        "example": str(EXAMPLE),
+    }
+    cases = {
+        "grammar": SETUP + GRAMMAR.format(**paths) + FIRST_PARSE.format(**paths),
+        "tables": SETUP + TABLES.format(**paths) + FIRST_PARSE.format(**paths),
+        "import microC": IMPORT.format(**paths),
+    }
+    print(f"{'modo':<14} {'criação':>10} {'1ª análise':>11}")
+    for name, code in cases.items():
+        load, first = measure(code, args.repeat)
+        print(f"{name:<14} {load * 1000:8.1f}ms {first * 1000:9.1f}ms", flush=True)
+
+
+if __name__ == "__main__":
+    main()
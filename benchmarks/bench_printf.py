@@ -0,0 +1,81 @@
+"""
+Benchmark da saída do `printf`: imprime 10^6 inteiros.
+
+Compara a escrita direta em `sys.stdout` (uma chamada à camada de texto por
+linha) com o `BufferedOutput` usado pela linha de comando. A saída vai para
+`os.devnull` aberto com `line_buffering=True`, que reproduz o comportamento
+de um terminal: cada quebra de linha força um flush.
+
+Uso:
+    python benchmarks/bench_printf.py [-n 1000000] [--buffer-size 65536]
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import microC  # noqa: E402
+from microC.ctx import Ctx  # noqa: E402
+from microC.output import DEFAULT_BUFFER_SIZE, BufferedOutput, Output, StreamOutput  # noqa: E402
+
+PROGRAM = """
+int i = 0;
+while (i < {n}) {{
+    printf(i);
+    i = i + 1;
+}}
+"""
+
+
+def terminal_like_devnull() -> io.TextIOWrapper:
+    raw = open(os.devnull, "wb")
+    return io.TextIOWrapper(raw, line_buffering=True)
+
+
+def bench_sink(output: Output, n: int) -> float:
+    """
+    Mede apenas o custo do destino de saída, sem o interpretador.
+    """
+    start = time.perf_counter()
+    write = output.write
+    for i in range(n):
+        write(str(i) + "\n")
+    output.flush()
+    return time.perf_counter() - start
+
+
+def bench_program(output: Output, n: int) -> float:
+    """
+    Mede a execução de um programa MicroC que imprime `n` inteiros.
+    """
+    ast = microC.parse(PROGRAM.format(n=n))
+    ctx = Ctx.from_dict({}, output=output)
+    start = time.perf_counter()
+    microC.eval(ast, ctx, skip_validation=True)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-n", type=int, default=10**6)
+    parser.add_argument("--buffer-size", type=int, default=DEFAULT_BUFFER_SIZE)
+    args = parser.parse_args()
+
+    for label, bench in [("destino", bench_sink), ("programa", bench_program)]:
+        stream = terminal_like_devnull()
+        direct = bench(StreamOutput(stream), args.n)
+        stream = terminal_like_devnull()
+        buffered = bench(BufferedOutput(stream, buffer_size=args.buffer_size), args.n)
+        print(
+            f"{label:<9} n={args.n}: direto {direct:.3f}s, "
+            f"buffer {buffered:.3f}s ({direct / buffered:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Microbenchmarks da função `runtime.show`.
+
+Compara a versão com tabela de despacho por tipo com a implementação
+anterior, que percorria uma cadeia de `isinstance` e montava arrays de char
+concatenando caractere por caractere.
+
+Uso:
+    python benchmarks/bench_show.py [-r 5]
+"""
+
+import argparse
+import sys
+import timeit
+import types
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from microC.runtime import McFunction, show  # noqa: E402
+
+
+def show_isinstance(value):
+    """
+    Implementação anterior de `show`, mantida aqui apenas para comparação.
+    """
+    if value is None:
+        return "NULL"
+    if isinstance(value, list):
+        if value and all(isinstance(elem, str) and len(elem) == 1 for elem in value):
+            s = ""
+            for c in value:
+                if c == "\0":
+                    break
+                s += c
+            return s
+        return "<array>"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if isinstance(value, McFunction):
+        return f"<fn {value.name}>"
+    if isinstance(value, types.BuiltinFunctionType):
+        return "<native fn>"
+    return str(value)
+
+
+CASES = {
+    "int": (12345, 1_000_000),
+    "char": ("a", 1_000_000),
+    "bool": (True, 1_000_000),
+    "char[64KiB]": (["x"] * (64 * 1024 - 1) + ["\0"], 100),
+    "int[64Ki]": ([1] * (64 * 1024), 100),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'caso':<12} {'isinstance':>12} {'despacho':>12} {'ganho':>7}")
+    for name, (value, number) in CASES.items():
+        assert show(value) == show_isinstance(value), name
+        old = min(timeit.repeat(lambda: show_isinstance(value), number=number, repeat=args.repeat))
+        new = min(timeit.repeat(lambda: show(value), number=number, repeat=args.repeat))
+        print(
+            f"{name:<12} {old / number * 1e9:>10.0f}ns {new / number * 1e9:>10.0f}ns "
+            f"{old / new:>6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark da análise de arquivos grandes: `parse_file` versus `parse`.
+
+Grava num arquivo temporário as funções de vários programas sintéticos
+(veja `bench_incremental.functions_file`) e mede o tempo e o pico de memória
+(`tracemalloc`) de:
+
+* `parse(f.read())`, como a CLI fazia;
+* `parse_file(path)`, que também guarda a AST do arquivo inteiro;
+* percorrer `iter_decls(path)` sem guardar as declarações, caso em que o
+  pico depende apenas da maior declaração.
+
+Uso:
+    python benchmarks/bench_streaming.py [--lines 20000]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bench_incremental import functions_file  # noqa: E402
+from microC.parser import parse  # noqa: E402
+from microC.streaming import iter_decls, parse_file  # noqa: E402
+
+
+def read_and_parse(path: str):
+    with open(path) as f:
+        return parse(f.read(), path)
+
+
+def consume(path: str):
+    for _ in iter_decls(path):
+        pass
+
+
+def measure(name: str, func, path: str):
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(path)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<24} {elapsed * 1000:9.1f}ms   pico {peak / 2**20:8.1f}MiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lines", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    src = functions_file(args.lines, args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "programa.microc")
+        Path(path).write_text(src)
+        print(f"programa: {src.count(chr(10))} linhas, {len(src)} caracteres")
+        del src
+        measure("parse(f.read())", read_and_parse, path)
+        measure("parse_file", parse_file, path)
+        measure("iter_decls (sem guardar)", consume, path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark da vetorização de laços (`--vectorize`).
+
+Executa um programa com somas, máximos, cópias, operações com constantes e
+somas de prefixos sobre arrays de tamanho N, com os laços interpretados, com
+os kernels em Python e com os kernels em NumPy (se instalado).
+
+Uso:
+    python benchmarks/bench_vectorize.py [-n 100000] [--repeat 3]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from microC.batch import run_source  # noqa: E402
+from microC.parser import parse  # noqa: E402
+from microC.vectorize import numpy_available, vectorize  # noqa: E402
+
+SOURCE = """
+int main() {{
+    int v[{n}];
+    int w[{n}];
+    int i;
+    for (i = 0; i < {n}; i++) {{
+        v[i] = (37 * i) % 101;
+    }}
+    int s = 0;
+    int m = 0;
+    for (int r = 0; r < 10; r++) {{
+        for (i = 0; i < {n}; i++) {{ s += v[i]; }}
+        for (i = 0; i < {n}; i++) {{ if (v[i] > m) {{ m = v[i]; }} }}
+        for (i = 0; i < {n}; i++) w[i] = v[i] * 3;
+        for (i = 1; i < {n}; i++) w[i] = w[i] + w[i - 1];
+    }}
+    printf(s);
+    printf(m);
+    printf(w[{n} - 1]);
+    return 0;
+}}
+"""
+
+
+def bench(source: str, use_numpy: bool | None, repeat: int) -> tuple[float, str]:
+    def parse_vectorized(src):
+        tree = parse(src)
+        if use_numpy is not None:
+            vectorize(tree, use_numpy)
+        return tree
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = run_source(source, parse=parse_vectorized)
+        best = min(best, time.perf_counter() - start)
+    return best, result.stdout
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-n", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    source = SOURCE.format(n=args.n)
+    modes = {"laços": None, "python": False}
+    if numpy_available():
+        modes["numpy"] = True
+    baseline = expected = None
+    for name, use_numpy in modes.items():
+        elapsed, stdout = bench(source, use_numpy, args.repeat)
+        baseline = baseline or elapsed
+        expected = expected or stdout
+        status = "ok" if stdout == expected else "SAÍDA DIFERENTE"
+        print(f"{name:<8} {elapsed:8.3f}s  speedup {baseline / elapsed:7.1f}x  {status}")
+    if not numpy_available():
+        print("numpy    indisponível")
+
+
+if __name__ == "__main__":
+    main()
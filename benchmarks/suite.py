@@ -0,0 +1,380 @@
+"""
+Suíte de benchmarks do interpretador MicroC.
+
+Executa programas MicroC parametrizados em vários tamanhos e mede
+separadamente cada fase: análise sintática (parse), validação, desugar e
+execução, além do pico de memória (a contabilizada pelo interpretador, veja
+`microC.limits`, e a alocada pelo Python durante a execução, medida com
+`tracemalloc` numa execução extra, fora das medidas de tempo).
+
+Os algoritmos de ordenação, a busca binária e Kadane usam as funções de
+`exemplos/`, com um `main` gerado para cada tamanho. O programa `generated`
+vem de `microC.generator` e serve para medir o front-end (parse e validação)
+em programas grandes, com milhares de comandos.
+
+Uso:
+    python benchmarks/suite.py run [-o resultados.json] [--sizes small,medium]
+                                   [--repeat 3] [-k fib]
+    python benchmarks/suite.py compare base.json novo.json [--threshold 0.1]
+
+`compare` termina com código 1 se alguma medida ficou mais lenta (ou usou
+mais memória) que `threshold` em relação à base.
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from microC.ctx import Ctx  # noqa: E402
+from microC.generator import generate_program  # noqa: E402
+from microC.limits import Limits  # noqa: E402
+from microC.output import MemoryOutput  # noqa: E402
+from microC.parser import _parse_with_spans  # noqa: E402
+
+EXEMPLOS = ROOT / "exemplos"
+SIZES = ("small", "medium", "large")
+PHASES = ("parse", "validate", "desugar", "execute")
+METRICS = PHASES + ("peak_memory", "python_peak")
+DEFAULT_THRESHOLD = 0.10
+# Fases mais rápidas que isso são dominadas por ruído e não são comparadas
+DEFAULT_MIN_TIME = 0.001
+
+
+def exemplo_functions(path: str) -> str:
+    """
+    Funções de um exemplo, sem o `main`.
+    """
+    source = (EXEMPLOS / path).read_text(encoding="utf-8")
+    return source.split("int main()")[0]
+
+
+def fill_array(n: int) -> str:
+    return f"""
+    int arr[{n}];
+    for (int i = 0; i < {n}; i++) {{
+        arr[i] = (i * 7919) % 10007 - 5000;
+    }}
+"""
+
+
+def sorting(path: str, function: str) -> Callable[[int], str]:
+    def source(n: int) -> str:
+        return exemplo_functions(path) + f"""
+int main() {{
+    {fill_array(n)}
+    {function}(arr, {n});
+    printf(arr[0]);
+    printf(arr[{n} - 1]);
+    return 0;
+}}
+"""
+
+    return source
+
+
+def binary_search(n: int) -> str:
+    return exemplo_functions("algoritmos/busca_binaria.microc") + f"""
+int main() {{
+    int arr[{n}];
+    for (int i = 0; i < {n}; i++) {{
+        arr[i] = 3 * i;
+    }}
+    int achados = 0;
+    for (int i = 0; i < {n}; i++) {{
+        if (buscaBinaria(arr, {n}, i) >= 0) {{
+            achados++;
+        }}
+    }}
+    printf(achados);
+    return 0;
+}}
+"""
+
+
+def kadane(n: int) -> str:
+    return exemplo_functions("algoritmos/kadane_algorithm.microc") + f"""
+int main() {{
+    {fill_array(n)}
+    int total = 0;
+    for (int r = 0; r < 10; r++) {{
+        total += maxSubarraySum(arr, {n});
+    }}
+    printf(total);
+    return 0;
+}}
+"""
+
+
+def fibonacci(n: int) -> str:
+    return f"""
+int fib(int n) {{
+    if (n < 2) {{
+        return n;
+    }}
+    return fib(n - 1) + fib(n - 2);
+}}
+
+int main() {{
+    printf(fib({n}));
+    return 0;
+}}
+"""
+
+
+def nested_loops(n: int) -> str:
+    return f"""
+int main() {{
+    int soma = 0;
+    for (int i = 0; i < {n}; i++) {{
+        for (int j = 0; j < {n}; j++) {{
+            for (int k = 0; k < {n}; k++) {{
+                soma += (i * j + k) % 7;
+            }}
+        }}
+    }}
+    printf(soma);
+    return 0;
+}}
+"""
+
+
+def printf_heavy(n: int) -> str:
+    return f"""
+int main() {{
+    for (int i = 0; i < {n}; i++) {{
+        printf(i);
+    }}
+    return 0;
+}}
+"""
+
+
+def deep_blocks(n: int) -> str:
+    opening = "".join(f"{{ int x{d} = x{d - 1} + 1;\n" for d in range(1, n + 1))
+    closing = "}" * n
+    return f"""
+int main() {{
+    int total = 0;
+    for (int r = 0; r < 100; r++) {{
+        int x0 = r;
+        {opening}
+        total += x{n};
+        {closing}
+    }}
+    printf(total);
+    return 0;
+}}
+"""
+
+
+def generated(n: int) -> str:
+    return generate_program(seed=n, size=n).source
+
+
+@dataclass
+class Workload:
+    name: str
+    source: Callable[[int], str]
+    sizes: dict[str, int]
+
+
+WORKLOADS = [
+    Workload(
+        "bubble_sort",
+        sorting("bubble_sort.microc", "bubbleSort"),
+        {"small": 30, "medium": 120, "large": 300},
+    ),
+    Workload(
+        "selection_sort",
+        sorting("algoritmos/selection_sort.microc", "selectionSort"),
+        {"small": 30, "medium": 120, "large": 300},
+    ),
+    Workload("binary_search", binary_search, {"small": 100, "medium": 1000, "large": 5000}),
+    Workload("kadane", kadane, {"small": 100, "medium": 1000, "large": 10000}),
+    Workload("fibonacci", fibonacci, {"small": 12, "medium": 17, "large": 21}),
+    Workload("nested_loops", nested_loops, {"small": 8, "medium": 20, "large": 40}),
+    Workload("printf_heavy", printf_heavy, {"small": 1000, "medium": 10000, "large": 100000}),
+    Workload("deep_blocks", deep_blocks, {"small": 10, "medium": 40, "large": 80}),
+    Workload("generated", generated, {"small": 100, "medium": 1000, "large": 5000}),
+]
+
+
+@dataclass
+class Measurement:
+    """
+    Medidas de um programa: menor tempo de cada fase entre as repetições,
+    em segundos, e picos de memória, em bytes.
+    """
+
+    name: str
+    size: str
+    n: int
+    parse: float
+    validate: float
+    desugar: float
+    execute: float
+    peak_memory: int
+    python_peak: int
+
+
+def run_phases(source: str, limits: Optional[Limits] = None) -> dict[str, float]:
+    """
+    Executa o programa uma vez, medindo o tempo de cada fase.
+    """
+    times = {}
+    start = time.perf_counter()
+    tree, _ = _parse_with_spans(source, "start")
+    times["parse"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    tree.validate_tree()
+    times["validate"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    tree.desugar_tree()
+    times["desugar"] = time.perf_counter() - start
+
+    ctx = Ctx.from_dict({}, output=MemoryOutput(), limits=limits or Limits())
+    start = time.perf_counter()
+    tree.eval(ctx, auto_execute_main=True)
+    times["execute"] = time.perf_counter() - start
+    return times
+
+
+def measure(workload: Workload, size: str, repeat: int) -> Measurement:
+    n = workload.sizes[size]
+    source = workload.source(n)
+    runs = [run_phases(source) for _ in range(repeat)]
+    best = {phase: min(run[phase] for run in runs) for phase in PHASES}
+
+    limits = Limits()
+    tracemalloc.start()
+    try:
+        run_phases(source, limits)
+        _, python_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return Measurement(
+        workload.name, size, n, **best, peak_memory=limits.peak_memory, python_peak=python_peak
+    )
+
+
+def metadata() -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def run(args) -> None:
+    sizes = args.sizes.split(",")
+    unknown = set(sizes) - set(SIZES)
+    if unknown:
+        sys.exit(f"tamanhos desconhecidos: {', '.join(sorted(unknown))}")
+    results = []
+    print(f"{'programa':<16} {'tamanho':<8} " + " ".join(f"{p:>9}" for p in PHASES) + "  memória")
+    for workload in WORKLOADS:
+        if args.k and args.k not in workload.name:
+            continue
+        for size in sizes:
+            m = measure(workload, size, args.repeat)
+            results.append(asdict(m))
+            phases = " ".join(f"{getattr(m, p) * 1000:8.2f}ms" for p in PHASES)
+            print(f"{m.name:<16} {size:<8} {phases}  {m.python_peak / 1024:7.0f}K", flush=True)
+
+    if args.output:
+        data = {"meta": metadata(), "results": results}
+        Path(args.output).write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+        print(f"Resultados salvos em {args.output}")
+
+
+def compare_results(
+    base: dict, new: dict, threshold: float, min_time: float = DEFAULT_MIN_TIME
+) -> list[tuple[str, str, str, float, float]]:
+    """
+    Compara dois arquivos de resultados e retorna as regressões, como
+    tuplas (programa, tamanho, medida, valor base, valor novo).
+
+    Uma medida regride se `novo > base * (1 + threshold)`. Tempos em que
+    ambos os valores são menores que `min_time` são ignorados.
+    """
+    base_results = {(r["name"], r["size"]): r for r in base["results"]}
+    regressions = []
+    for result in new["results"]:
+        old = base_results.get((result["name"], result["size"]))
+        if old is None or old["n"] != result["n"]:
+            continue
+        for metric in METRICS:
+            before, after = old[metric], result[metric]
+            if metric in PHASES and max(before, after) < min_time:
+                continue
+            if after > before * (1 + threshold):
+                regressions.append((result["name"], result["size"], metric, before, after))
+    return regressions
+
+
+def compare(args) -> None:
+    base = json.loads(Path(args.base).read_text(encoding="utf-8"))
+    new = json.loads(Path(args.new).read_text(encoding="utf-8"))
+    regressions = compare_results(base, new, args.threshold, args.min_time)
+    if not regressions:
+        print(f"Nenhuma regressão acima de {args.threshold:.0%}.")
+        return
+    print(f"Regressões acima de {args.threshold:.0%}:")
+    for name, size, metric, before, after in regressions:
+        if metric in PHASES:
+            values = f"{before * 1000:.2f}ms -> {after * 1000:.2f}ms"
+        else:
+            values = f"{before / 1024:.0f}K -> {after / 1024:.0f}K"
+        change = f"  ({after / before - 1:+.0%})" if before else ""
+        print(f"  {name:<16} {size:<8} {metric:<12} {values}{change}")
+    sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Executa a suíte.")
+    run_parser.add_argument("-o", "--output", help="Salva os resultados em JSON.")
+    run_parser.add_argument("--sizes", default="small,medium", help="Tamanhos, separados por vírgula.")
+    run_parser.add_argument("--repeat", type=int, default=3)
+    run_parser.add_argument("-k", help="Executa apenas os programas cujo nome contém K.")
+    run_parser.set_defaults(func=run)
+
+    compare_parser = commands.add_parser("compare", help="Compara dois resultados.")
+    compare_parser.add_argument("base")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    compare_parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME)
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
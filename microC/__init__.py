@@ -9,8 +9,13 @@ from .ctx import Ctx
 from .errors import SemanticError
 from .node import Node
 from .parser import lex, parse, parse_cst, parse_expr
+from .positions import describe_error
+from .aio import aeval
+from .compiled import CompiledProgram
 
 __all__ = [
+    "aeval",
+    "CompiledProgram",
     "Ctx",
     "eval",
     "Expr",
@@ -39,7 +44,10 @@ def eval(
         env:
             Ambiente onde as variáveis serão avaliadas. Se omitido, um novo
             ambiente vazio será criado. Aceita um dicionário mapeando nomes de
-            variáveis para seus valores ou uma instância de `Ctx`.
+            variáveis para seus valores ou uma instância de `Ctx`. A saída do
+            `printf` vai para `env.output`, que é descarregado ao final da
+            execução, mesmo em caso de erro. A mensagem de erro também é
+            escrita em `env.output`.
         skip_validation:
             Se `True`, ignora a validação do código fonte antes da avaliação.
         auto_execute_main:
@@ -61,6 +69,8 @@ def eval(
     try:
         return ast.eval(env, auto_execute_main)
     except Exception as e:
-        print(f"Programa terminou com um erro: {e}")
-        print("Variáveis:", env)
+        env.output.write(f"Programa terminou com um erro: {describe_error(e)}\n")
+        env.output.write(f"Variáveis: {env}\n")
         raise
+    finally:
+        env.output.flush()
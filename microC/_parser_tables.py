@@ -0,0 +1,4459 @@
+"""
+Tabelas do parser LALR de MicroC.
+
+ARQUIVO GERADO por `python -m microC.build_parser` a partir de
+`grammar.lark`. Não edite: altere a gramática e gere novamente.
+"""
+# fmt: off
+GRAMMAR_HASH = '3b7449c2ea24babe1f6d1f30c4146d2b7ed46762d145a21134aecdb63ebd17f1'
+LARK_VERSION = '0.12.0'
+
+DATA = {'__type__': 'Lark',
+ 'options': {'ambiguity': 'auto',
+             'cache': False,
+             'debug': False,
+             'edit_terminals': None,
+             'g_regex_flags': 0,
+             'import_paths': [],
+             'keep_all_tokens': False,
+             'lexer': 'contextual',
+             'lexer_callbacks': {},
+             'maybe_placeholders': False,
+             'parser': 'lalr',
+             'postlex': None,
+             'priority': 'normal',
+             'propagate_positions': False,
+             'regex': False,
+             'source_path': None,
+             'start': ['start', 'expr'],
+             'transformer': None,
+             'tree_class': None,
+             'use_bytes': False},
+ 'parser': {'__type__': 'ParsingFrontend',
+            'lexer_conf': {'__type__': 'LexerConf',
+                           'g_regex_flags': 0,
+                           'ignore': ['__IGNORE_0'],
+                           'lexer_type': 'contextual',
+                           'terminals': [{'@': 0},
+                                         {'@': 1},
+                                         {'@': 2},
+                                         {'@': 3},
+                                         {'@': 4},
+                                         {'@': 5},
+                                         {'@': 6},
+                                         {'@': 7},
+                                         {'@': 8},
+                                         {'@': 9},
+                                         {'@': 10},
+                                         {'@': 11},
+                                         {'@': 12},
+                                         {'@': 13},
+                                         {'@': 14},
+                                         {'@': 15},
+                                         {'@': 16},
+                                         {'@': 17},
+                                         {'@': 18},
+                                         {'@': 19},
+                                         {'@': 20},
+                                         {'@': 21},
+                                         {'@': 22},
+                                         {'@': 23},
+                                         {'@': 24},
+                                         {'@': 25},
+                                         {'@': 26},
+                                         {'@': 27},
+                                         {'@': 28},
+                                         {'@': 29},
+                                         {'@': 30},
+                                         {'@': 31},
+                                         {'@': 32},
+                                         {'@': 33},
+                                         {'@': 34},
+                                         {'@': 35},
+                                         {'@': 36},
+                                         {'@': 37},
+                                         {'@': 38},
+                                         {'@': 39},
+                                         {'@': 40},
+                                         {'@': 41},
+                                         {'@': 42},
+                                         {'@': 43}],
+                           'use_bytes': False},
+            'options': {'ambiguity': 'auto',
+                        'cache': False,
+                        'debug': False,
+                        'edit_terminals': None,
+                        'g_regex_flags': 0,
+                        'import_paths': [],
+                        'keep_all_tokens': False,
+                        'lexer': 'contextual',
+                        'lexer_callbacks': {},
+                        'maybe_placeholders': False,
+                        'parser': 'lalr',
+                        'postlex': None,
+                        'priority': 'normal',
+                        'propagate_positions': False,
+                        'regex': False,
+                        'source_path': None,
+                        'start': ['start', 'expr'],
+                        'transformer': None,
+                        'tree_class': None,
+                        'use_bytes': False},
+            'parser': {'end_states': {'expr': 7, 'start': 5},
+                       'start_states': {'expr': 117, 'start': 83},
+                       'states': {0: {0: (0, 68)},
+                                  1: {1: (1, {'@': 60}),
+                                      2: (1, {'@': 60}),
+                                      3: (1, {'@': 60}),
+                                      4: (1, {'@': 60}),
+                                      5: (1, {'@': 60}),
+                                      6: (1, {'@': 60}),
+                                      7: (1, {'@': 60}),
+                                      8: (1, {'@': 60}),
+                                      9: (1, {'@': 60}),
+                                      10: (1, {'@': 60}),
+                                      11: (1, {'@': 60}),
+                                      12: (1, {'@': 60}),
+                                      13: (1, {'@': 60}),
+                                      14: (1, {'@': 60}),
+                                      15: (1, {'@': 60}),
+                                      16: (1, {'@': 60}),
+                                      17: (1, {'@': 60}),
+                                      18: (1, {'@': 60}),
+                                      19: (1, {'@': 60}),
+                                      20: (1, {'@': 60}),
+                                      21: (1, {'@': 60})},
+                                  2: {1: (1, {'@': 70}),
+                                      2: (1, {'@': 70}),
+                                      3: (1, {'@': 70}),
+                                      4: (1, {'@': 70}),
+                                      5: (1, {'@': 70}),
+                                      6: (1, {'@': 70}),
+                                      7: (1, {'@': 70}),
+                                      8: (1, {'@': 70}),
+                                      9: (1, {'@': 70}),
+                                      10: (1, {'@': 70}),
+                                      11: (1, {'@': 70}),
+                                      12: (1, {'@': 70}),
+                                      13: (1, {'@': 70}),
+                                      14: (1, {'@': 70}),
+                                      15: (1, {'@': 70}),
+                                      16: (1, {'@': 70}),
+                                      17: (1, {'@': 70}),
+                                      18: (1, {'@': 70}),
+                                      19: (1, {'@': 70}),
+                                      20: (1, {'@': 70}),
+                                      21: (1, {'@': 70}),
+                                      22: (1, {'@': 70})},
+                                  3: {0: (1, {'@': 116}),
+                                      5: (1, {'@': 116}),
+                                      14: (1, {'@': 116}),
+                                      21: (1, {'@': 116}),
+                                      23: (1, {'@': 116}),
+                                      24: (1, {'@': 116}),
+                                      25: (1, {'@': 116}),
+                                      26: (1, {'@': 116}),
+                                      27: (1, {'@': 116}),
+                                      28: (1, {'@': 116}),
+                                      29: (1, {'@': 116}),
+                                      30: (1, {'@': 116}),
+                                      31: (1, {'@': 116}),
+                                      32: (1, {'@': 116}),
+                                      33: (1, {'@': 116}),
+                                      34: (1, {'@': 116}),
+                                      35: (1, {'@': 116}),
+                                      36: (1, {'@': 116}),
+                                      37: (1, {'@': 116})},
+                                  4: {36: (1, {'@': 142}), 37: (1, {'@': 142})},
+                                  5: {},
+                                  6: {0: (1, {'@': 93}),
+                                      5: (1, {'@': 93}),
+                                      21: (1, {'@': 93}),
+                                      35: (1, {'@': 93}),
+                                      36: (1, {'@': 93}),
+                                      37: (1, {'@': 93})},
+                                  7: {},
+                                  8: {37: (0, 114)},
+                                  9: {1: (1, {'@': 66}),
+                                      2: (1, {'@': 66}),
+                                      3: (1, {'@': 66}),
+                                      4: (1, {'@': 66}),
+                                      5: (1, {'@': 66}),
+                                      6: (1, {'@': 66}),
+                                      7: (1, {'@': 66}),
+                                      8: (1, {'@': 66}),
+                                      9: (1, {'@': 66}),
+                                      10: (1, {'@': 66}),
+                                      11: (1, {'@': 66}),
+                                      12: (1, {'@': 66}),
+                                      13: (1, {'@': 66}),
+                                      14: (1, {'@': 66}),
+                                      15: (1, {'@': 66}),
+                                      16: (1, {'@': 66}),
+                                      17: (1, {'@': 66}),
+                                      18: (1, {'@': 66}),
+                                      19: (1, {'@': 66}),
+                                      20: (1, {'@': 66}),
+                                      21: (1, {'@': 66}),
+                                      22: (1, {'@': 66})},
+                                  10: {1: (0, 148),
+                                       2: (0, 119),
+                                       3: (0, 134),
+                                       6: (0, 34),
+                                       7: (0, 125),
+                                       8: (0, 158),
+                                       9: (0, 186),
+                                       10: (0, 91),
+                                       11: (0, 96),
+                                       12: (0, 29),
+                                       13: (0, 25),
+                                       14: (0, 161),
+                                       16: (0, 112),
+                                       17: (0, 85),
+                                       18: (0, 13),
+                                       20: (0, 123),
+                                       38: (0, 88),
+                                       39: (0, 98),
+                                       40: (0, 102),
+                                       41: (0, 104),
+                                       42: (0, 109),
+                                       43: (0, 72),
+                                       44: (0, 128),
+                                       45: (0, 131),
+                                       46: (0, 137),
+                                       47: (0, 144),
+                                       48: (0, 146),
+                                       49: (0, 156),
+                                       50: (0, 165),
+                                       51: (0, 168),
+                                       52: (0, 173),
+                                       53: (0, 178),
+                                       54: (0, 2),
+                                       55: (0, 9),
+                                       56: (0, 16),
+                                       57: (0, 36),
+                                       58: (0, 40)},
+                                  11: {1: (0, 148),
+                                       2: (0, 119),
+                                       3: (0, 134),
+                                       6: (0, 34),
+                                       7: (0, 125),
+                                       8: (0, 158),
+                                       9: (0, 186),
+                                       10: (0, 91),
+                                       11: (0, 96),
+                                       12: (0, 29),
+                                       13: (0, 25),
+                                       14: (0, 161),
+                                       16: (0, 112),
+                                       17: (0, 85),
+                                       18: (0, 13),
+                                       20: (0, 123),
+                                       38: (0, 88),
+                                       39: (0, 98),
+                                       40: (0, 102),
+                                       41: (0, 104),
+                                       42: (0, 109),
+                                       43: (0, 27),
+                                       44: (0, 128),
+                                       45: (0, 131),
+                                       46: (0, 137),
+                                       47: (0, 144),
+                                       48: (0, 146),
+                                       49: (0, 156),
+                                       50: (0, 165),
+                                       51: (0, 168),
+                                       52: (0, 173),
+                                       53: (0, 178),
+                                       54: (0, 2),
+                                       55: (0, 9),
+                                       56: (0, 16),
+                                       57: (0, 36),
+                                       58: (0, 40)},
+                                  12: {0: (1, {'@': 57}),
+                                       1: (1, {'@': 57}),
+                                       2: (1, {'@': 57}),
+                                       3: (1, {'@': 57}),
+                                       4: (1, {'@': 57}),
+                                       5: (1, {'@': 57}),
+                                       6: (1, {'@': 57}),
+                                       7: (1, {'@': 57}),
+                                       8: (1, {'@': 57}),
+                                       9: (1, {'@': 57}),
+                                       10: (1, {'@': 57}),
+                                       11: (1, {'@': 57}),
+                                       12: (1, {'@': 57}),
+                                       13: (1, {'@': 57}),
+                                       14: (1, {'@': 57}),
+                                       15: (1, {'@': 57}),
+                                       16: (1, {'@': 57}),
+                                       17: (1, {'@': 57}),
+                                       18: (1, {'@': 57}),
+                                       19: (1, {'@': 57}),
+                                       20: (1, {'@': 57}),
+                                       21: (1, {'@': 57})},
+                                  13: {7: (0, 171)},
+                                  14: {0: (1, {'@': 129}),
+                                       1: (1, {'@': 129}),
+                                       5: (1, {'@': 129}),
+                                       9: (1, {'@': 129}),
+                                       14: (1, {'@': 129}),
+                                       21: (1, {'@': 129}),
+                                       23: (1, {'@': 129}),
+                                       24: (1, {'@': 129}),
+                                       25: (1, {'@': 129}),
+                                       26: (1, {'@': 129}),
+                                       27: (1, {'@': 129}),
+                                       28: (1, {'@': 129}),
+                                       29: (1, {'@': 129}),
+                                       30: (1, {'@': 129}),
+                                       31: (1, {'@': 129}),
+                                       32: (1, {'@': 129}),
+                                       33: (1, {'@': 129}),
+                                       34: (1, {'@': 129}),
+                                       35: (1, {'@': 129}),
+                                       36: (1, {'@': 129}),
+                                       37: (1, {'@': 129}),
+                                       59: (1, {'@': 129}),
+                                       60: (1, {'@': 129})},
+                                  15: {37: (0, 38)},
+                                  16: {1: (1, {'@': 71}),
+                                       2: (1, {'@': 71}),
+                                       3: (1, {'@': 71}),
+                                       4: (1, {'@': 71}),
+                                       5: (1, {'@': 71}),
+                                       6: (1, {'@': 71}),
+                                       7: (1, {'@': 71}),
+                                       8: (1, {'@': 71}),
+                                       9: (1, {'@': 71}),
+                                       10: (1, {'@': 71}),
+                                       11: (1, {'@': 71}),
+                                       12: (1, {'@': 71}),
+                                       13: (1, {'@': 71}),
+                                       14: (1, {'@': 71}),
+                                       15: (1, {'@': 71}),
+                                       16: (1, {'@': 71}),
+                                       17: (1, {'@': 71}),
+                                       18: (1, {'@': 71}),
+                                       19: (1, {'@': 71}),
+                                       20: (1, {'@': 71}),
+                                       21: (1, {'@': 71}),
+                                       22: (1, {'@': 71})},
+                                  17: {36: (0, 115), 37: (1, {'@': 132}), 61: (0, 108)},
+                                  18: {11: (1, {'@': 51})},
+                                  19: {1: (1, {'@': 91}),
+                                       2: (1, {'@': 91}),
+                                       3: (1, {'@': 91}),
+                                       4: (1, {'@': 91}),
+                                       5: (1, {'@': 91}),
+                                       6: (1, {'@': 91}),
+                                       7: (1, {'@': 91}),
+                                       8: (1, {'@': 91}),
+                                       9: (1, {'@': 91}),
+                                       10: (1, {'@': 91}),
+                                       11: (1, {'@': 91}),
+                                       12: (1, {'@': 91}),
+                                       13: (1, {'@': 91}),
+                                       14: (1, {'@': 91}),
+                                       15: (1, {'@': 91}),
+                                       16: (1, {'@': 91}),
+                                       17: (1, {'@': 91}),
+                                       18: (1, {'@': 91}),
+                                       19: (1, {'@': 91}),
+                                       20: (1, {'@': 91}),
+                                       21: (1, {'@': 91}),
+                                       22: (1, {'@': 91})},
+                                  20: {20: (0, 44)},
+                                  21: {1: (1, {'@': 47}),
+                                       2: (1, {'@': 47}),
+                                       3: (1, {'@': 47}),
+                                       4: (1, {'@': 47}),
+                                       5: (1, {'@': 47}),
+                                       6: (1, {'@': 47}),
+                                       7: (1, {'@': 47}),
+                                       8: (1, {'@': 47}),
+                                       9: (1, {'@': 47}),
+                                       10: (1, {'@': 47}),
+                                       11: (1, {'@': 47}),
+                                       12: (1, {'@': 47}),
+                                       13: (1, {'@': 47}),
+                                       14: (1, {'@': 47}),
+                                       15: (1, {'@': 47}),
+                                       16: (1, {'@': 47}),
+                                       17: (1, {'@': 47}),
+                                       18: (1, {'@': 47}),
+                                       19: (1, {'@': 47}),
+                                       20: (1, {'@': 47}),
+                                       21: (1, {'@': 47})},
+                                  22: {37: (0, 118)},
+                                  23: {1: (0, 148),
+                                       3: (0, 134),
+                                       6: (0, 34),
+                                       7: (0, 125),
+                                       9: (0, 186),
+                                       10: (0, 91),
+                                       11: (0, 96),
+                                       12: (0, 29),
+                                       14: (0, 161),
+                                       38: (0, 88),
+                                       40: (0, 102),
+                                       41: (0, 104),
+                                       42: (0, 109),
+                                       44: (0, 176),
+                                       46: (0, 137),
+                                       49: (0, 156),
+                                       50: (0, 165),
+                                       51: (0, 168),
+                                       52: (0, 173),
+                                       53: (0, 178)},
+                                  24: {1: (0, 148),
+                                       3: (0, 134),
+                                       6: (0, 34),
+                                       7: (0, 125),
+                                       9: (0, 186),
+                                       10: (0, 91),
+                                       11: (0, 130),
+                                       12: (0, 29),
+                                       14: (0, 161),
+                                       38: (0, 135),
+                                       49: (0, 3),
+                                       52: (0, 173),
+                                       53: (0, 178)},
+                                  25: {0: (0, 65),
+                                       1: (0, 148),
+                                       3: (0, 134),
+                                       6: (0, 34),
+                                       7: (0, 125),
+                                       9: (0, 186),
+                                       10: (0, 91),
+                                       11: (0, 96),
+                                       12: (0, 29),
+                                       14: (0, 161),
+                                       38: (0, 88),
+                                       40: (0, 102),
+                                       41: (0, 104),
+                                       42: (0, 109),
+                                       44: (0, 128),
+                                       46: (0, 137),
+                                       47: (0, 0),
+                                       49: (0, 156),
+                                       50: (0, 165),
+                                       51: (0, 168),
+                                       52: (0, 173),
+                                       53: (0, 178)},
+                                  26: {0: (1, {'@': 94}),
+                                       5: (1, {'@': 94}),
+                                       21: (1, {'@': 94}),
+                                       35: (1, {'@': 94}),
+                                       36: (1, {'@': 94}),
+                                       37: (1, {'@': 94})},
+                                  27: {1: (1, {'@': 85}),
+                                       2: (1, {'@': 85}),
+                                       3: (1, {'@': 85}),
+                                       4: (1, {'@': 85}),
+                                       5: (1, {'@': 85}),
+                                       6: (1, {'@': 85}),
+                                       7: (1, {'@': 85}),
+                                       8: (1, {'@': 85}),
+                                       9: (1, {'@': 85}),
+                                       10: (1, {'@': 85}),
+                                       11: (1, {'@': 85}),
+                                       12: (1, {'@': 85}),
+                                       13: (1, {'@': 85}),
+                                       14: (1, {'@': 85}),
+                                       15: (1, {'@': 85}),
+                                       16: (1, {'@': 85}),
+                                       17: (1, {'@': 85}),
+                                       18: (1, {'@': 85}),
+                                       19: (1, {'@': 85}),
+                                       20: (1, {'@': 85}),
+                                       21: (1, {'@': 85}),
+                                       22: (1, {'@': 85})},
+                                  28: {0: (1, {'@': 96}),
+                                       5: (1, {'@': 96}),
+                                       21: (1, {'@': 96}),
+                                       35: (1, {'@': 96}),
+                                       36: (1, {'@': 96}),
+                                       37: (1, {'@': 96})},
+                                  29: {0: (1, {'@': 133}),
+                                       1: (1, {'@': 133}),
+                                       5: (1, {'@': 133}),
+                                       9: (1, {'@': 133}),
+                                       14: (1, {'@': 133}),
+                                       21: (1, {'@': 133}),
+                                       23: (1, {'@': 133}),
+                                       24: (1, {'@': 133}),
+                                       25: (1, {'@': 133}),
+                                       26: (1, {'@': 133}),
+                                       27: (1, {'@': 133}),
+                                       28: (1, {'@': 133}),
+                                       29: (1, {'@': 133}),
+                                       30: (1, {'@': 133}),
+                                       31: (1, {'@': 133}),
+                                       32: (1, {'@': 133}),
+                                       33: (1, {'@': 133}),
+                                       34: (1, {'@': 133}),
+                                       35: (1, {'@': 133}),
+                                       36: (1, {'@': 133}),
+                                       37: (1, {'@': 133}),
+                                       59: (1, {'@': 133}),
+                                       60: (1, {'@': 133})},
+                                  30: {21: (1, {'@': 141}),
+                                       36: (1, {'@': 141}),
+                                       37: (1, {'@': 141})},
+                                  31: {0: (0, 76)},
+                                  32: {0: (1, {'@': 97}),
+                                       5: (1, {'@': 97}),
+                                       21: (1, {'@': 97}),
+                                       35: (1, {'@': 97}),
+                                       36: (1, {'@': 97}),
+                                       37: (1, {'@': 97})},
+                                  33: {21: (1, {'@': 58}), 36: (0, 177)},
+                                  34: {1: (0, 148),
+                                       3: (0, 134),
+                                       6: (0, 34),
+                                       7: (0, 125),
+                                       9: (0, 186),
+                                       10: (0, 91),
+                                       11: (0, 130),
+                                       12: (0, 29),
+                                       14: (0, 161),
+                                       38: (0, 135),
+                                       49: (0, 184),
+                                       52: (0, 173),
+                                       53: (0, 178)},
+                                  35: {0: (1, {'@': 95}),
+                                       5: (1, {'@': 95}),
+                                       21: (1, {'@': 95}),
+                                       35: (1, {'@': 95}),
+                                       36: (1, {'@': 95}),
+                                       37: (1, {'@': 95})},
+                                  36: {1: (1, {'@': 68}),
+                                       2: (1, {'@': 68}),
+                                       3: (1, {'@': 68}),
+                                       4: (1, {'@': 68}),
+                                       5: (1, {'@': 68}),
+                                       6: (1, {'@': 68}),
+                                       7: (1, {'@': 68}),
+                                       8: (1, {'@': 68}),
+                                       9: (1, {'@': 68}),
+                                       10: (1, {'@': 68}),
+                                       11: (1, {'@': 68}),
+                                       12: (1, {'@': 68}),
+                                       13: (1, {'@': 68}),
+                                       14: (1, {'@': 68}),
+                                       15: (1, {'@': 68}),
+                                       16: (1, {'@': 68}),
+                                       17: (1, {'@': 68}),
+                                       18: (1, {'@': 68}),
+                                       19: (1, {'@': 68}),
+                                       20: (1, {'@': 68}),
+                                       21: (1, {'@': 68}),
+                                       22: (1, {'@': 68})},
+                                  37: {0: (1, {'@': 54}),
+                                       1: (1, {'@': 54}),
+                                       2: (1, {'@': 54}),
+                                       3: (1, {'@': 54}),
+                                       4: (1, {'@': 54}),
+                                       5: (1, {'@': 54}),
+                                       6: (1, {'@': 54}),
+                                       7: (1, {'@': 54}),
+                                       8: (1, {'@': 54}),
+                                       9: (1, {'@': 54}),
+                                       10: (1, {'@': 54}),
+                                       11: (1, {'@': 54}),
+                                       12: (1, {'@': 54}),
+                                       13: (1, {'@': 54}),
+                                       14: (1, {'@': 54}),
+                                       15: (1, {'@': 54}),
+                                       16: (1, {'@': 54}),
+                                       17: (1, {'@': 54}),
+                                       18: (1, {'@': 54}),
+                                       19: (1, {'@': 54}),
+                                       20: (1, {'@': 54}),
+                                       21: (1, {'@': 54})},
+                                  38: {0: (0, 69)},
+                                  39: {0: (1, {'@': 113}),
+                                       5: (1, {'@': 113}),
+                                       14: (1, {'@': 113}),
+                                       21: (1, {'@': 113}),
+                                       23: (1, {'@': 113}),
+                                       24: (1, {'@': 113}),
+                                       25: (1, {'@': 113}),
+                                       26: (0, 24),
+                                       27: (1, {'@': 113}),
+                                       28: (0, 80),
+                                       29: (1, {'@': 113}),
+                                       30: (1, {'@': 113}),
+                                       31: (0, 86),
+                                       32: (1, {'@': 113}),
+                                       33: (1, {'@': 113}),
+                                       34: (1, {'@': 113}),
+                                       35: (1, {'@': 113}),
+                                       36: (1, {'@': 113}),
+                                       37: (1, {'@': 113})},
+                                  40: {1: (1, {'@': 72}),
+                                       2: (1, {'@': 72}),
+                                       3: (1, {'@': 72}),
+                                       4: (1, {'@': 72}),
+                                       5: (1, {'@': 72}),
+                                       6: (1, {'@': 72}),
+                                       7: (1, {'@': 72}),
+                                       8: (1, {'@': 72}),
+                                       9: (1, {'@': 72}),
+                                       10: (1, {'@': 72}),
+                                       11: (1, {'@': 72}),
+                                       12: (1, {'@': 72}),
+                                       13: (1, {'@': 72}),
+                                       14: (1, {'@': 72}),
+                                       15: (1, {'@': 72}),
+                                       16: (1, {'@': 72}),
+                                       17: (1, {'@': 72}),
+                                       18: (1, {'@': 72}),
+                                       19: (1, {'@': 72}),
+                                       20: (1, {'@': 72}),
+                                       21: (1, {'@': 72}),
+                                       22: (1, {'@': 72})},
+                                  41: {0: (1, {'@': 110}),
+                                       5: (1, {'@': 110}),
+                                       14: (0, 70),
+                                       21: (1, {'@': 110}),
+                                       23: (1, {'@': 110}),
+                                       24: (1, {'@': 110}),
+                                       25: (1, {'@': 110}),
+                                       27: (1, {'@': 110}),
+                                       29: (1, {'@': 110}),
+                                       30: (1, {'@': 110}),
+                                       32: (1, {'@': 110}),
+                                       33: (0, 162),
+                                       34: (1, {'@': 110}),
+                                       35: (1, {'@': 110}),
+                                       36: (1, {'@': 110}),
+                                       37: (1, {'@': 110})},
+                                  42: {36: (1, {'@': 143}), 37: (1, {'@': 143})},
+                                  43: {1: (0, 148),
+                                       3: (0, 134),
+                                       6: (0, 34),
+                                       7: (0, 125),
+                                       9: (0, 186),
+                                       10: (0, 91),
+                                       11: (0, 96),
+                                       12: (0, 29),
+                                       14: (0, 161),
+                                       38: (0, 88),
+                                       40: (0, 102),
+                                       41: (0, 104),
+                                       42: (0, 109),
+                                       44: (0, 128),
+                                       46: (0, 137),
+                                       47: (0, 122),
+                                       49: (0, 156),
+                                       50: (0, 165),
+                                       51: (0, 168),
+                                       52: (0, 173),
+                                       53: (0, 178)},
+                                  44: {1: (0, 148),
+                                       3: (0, 134),
+                                       6: (0, 34),
+                                       7: (0, 125),
+                                       9: (0, 186),
+                                       10: (0, 91),
+                                       11: (0, 96),
+                                       12: (0, 29),
+                                       14: (0, 161),
+                                       21: (0, 95),
+                                       38: (0, 88),
+                                       40: (0, 102),
+                                       41: (0, 104),
+                                       42: (0, 109),
+                                       44: (0, 128),
+                                       46: (0, 137),
+                                       47: (0, 84),
+                                       49: (0, 156),
+                                       50: (0, 165),
+                                       51: (0, 168),
+                                       52: (0, 173),
+                                       53: (0, 178),
+                                       62: (0, 90)},
+                                  45: {1: (1, {'@': 49}),
+                                       2: (1, {'@': 49}),
+                                       3: (1, {'@': 49}),
+                                       4: (1, {'@': 49}),
+                                       5: (1, {'@': 49}),
+                                       6: (1, {'@': 49}),
+                                       7: (1, {'@': 49}),
+                                       8: (1, {'@': 49}),
+                                       9: (1, {'@': 49}),
+                                       10: (1, {'@': 49}),
+                                       11: (1, {'@': 49}),
+                                       12: (1, {'@': 49}),
+                                       13: (1, {'@': 49}),
+                                       14: (1, {'@': 49}),
+                                       15: (1, {'@': 49}),
+                                       16: (1, {'@': 49}),
+                                       17: (1, {'@': 49}),
+                                       18: (1, {'@': 49}),
+                                       19: (1, {'@': 49}),
+                                       20: (1, {'@': 49}),
+                                       21: (1, {'@': 49})},
+                                  46: {0: (1, {'@': 109}),
+                                       5: (1, {'@': 109}),
+                                       14: (0, 70),
+                                       21: (1, {'@': 109}),
+                                       23: (1, {'@': 109}),
+                                       24: (1, {'@': 109}),
+                                       25: (1, {'@': 109}),
+                                       27: (1, {'@': 109}),
+                                       29: (1, {'@': 109}),
+                                       30: (1, {'@': 109}),
+                                       32: (1, {'@': 109}),
+                                       33: (0, 162),
+                                       34: (1, {'@': 109}),
+                                       35: (1, {'@': 109}),
+                                       36: (1, {'@': 109}),
+                                       37: (1, {'@': 109})},
+                                  47: {0: (1, {'@': 137}),
+                                       1: (1, {'@': 137}),
+                                       5: (1, {'@': 137}),
+                                       9: (1, {'@': 137}),
+                                       14: (1, {'@': 137}),
+                                       21: (1, {'@': 137}),
+                                       23: (1, {'@': 137}),
+                                       24: (1, {'@': 137}),
+                                       25: (1, {'@': 137}),
+                                       26: (1, {'@': 137}),
+                                       27: (1, {'@': 137}),
+                                       28: (1, {'@': 137}),
+                                       29: (1, {'@': 137}),
+                                       30: (1, {'@': 137}),
+                                       31: (1, {'@': 137}),
+                                       32: (1, {'@': 137}),
+                                       33: (1, {'@': 137}),
+                                       34: (1, {'@': 137}),
+                                       35: (1, {'@': 137}),
+                                       36: (1, {'@': 137}),
+                                       37: (1, {'@': 137}),
+                                       59: (1, {'@': 137}),
+                                       60: (1, {'@': 137})},
+                                  48: {1: (0, 148),
+                                       3: (0, 134),
+                                       6: (0, 34),
+                                       7: (0, 125),
+                                       9: (0, 186),
+                                       10: (0, 91),
+                                       11: (0, 130),
+                                       12: (0, 29),
+                                       14: (0, 161),
+                                       38: (0, 135),
+                                       40: (0, 102),
+                                       41: (0, 104),
+                                       46: (0, 116),
+                                       49: (0, 156),
+                                       50: (0, 165),
+                                       52: (0, 173),
+                                       53: (0, 178)},
+                                  49: {0: (1, {'@': 107}),
+                                       5: (1, {'@': 107}),
+                                       14: (0, 70),
+                                       21: (1, {'@': 107}),
+                                       23: (1, {'@': 107}),
+                                       24: (1, {'@': 107}),
+                                       25: (1, {'@': 107}),
+                                       27: (1, {'@': 107}),
+                                       29: (1, {'@': 107}),
+                                       30: (1, {'@': 107}),
+                                       32: (1, {'@': 107}),
+                                       33: (0, 162),
+                                       34: (1, {'@': 107}),
+                                       35: (1, {'@': 107}),
+                                       36: (1, {'@': 107}),
+                                       37: (1, {'@': 107})},
+                                  50: {0: (1, {'@': 126}),
+                                       1: (1, {'@': 126}),
+                                       5: (1, {'@': 126}),
+                                       9: (1, {'@': 126}),
+                                       14: (1, {'@': 126}),
+                                       21: (1, {'@': 126}),
+                                       23: (1, {'@': 126}),
+                                       24: (1, {'@': 126}),
+                                       25: (1, {'@': 126}),
+                                       26: (1, {'@': 126}),
+                                       27: (1, {'@': 126}),
+                                       28: (1, {'@': 126}),
+                                       29: (1, {'@': 126}),
+                                       30: (1, {'@': 126}),
+                                       31: (1, {'@': 126}),
+                                       32: (1, {'@': 126}),
+                                       33: (1, {'@': 126}),
+                                       34: (1, {'@': 126}),
+                                       35: (1, {'@': 126}),
+                                       36: (1, {'@': 126}),
+                                       37: (1, {'@': 126}),
+                                       59: (1, {'@': 126})},
+                                  51: {1: (0, 148),
+                                       3: (0, 134),
+                                       6: (0, 34),
+                                       7: (0, 125),
+                                       9: (0, 186),
+                                       10: (0, 91),
+                                       11: (0, 96),
+                                       12: (0, 29),
+                                       14: (0, 161),
+                                       37: (0, 14),
+                                       38: (0, 88),
+                                       40: (0, 102),
+                                       41: (0, 104),
+                                       42: (0, 109),
+                                       44: (0, 128),
+                                       46: (0, 137),
+                                       47: (0, 17),
+                                       49: (0, 156),
+                                       50: (0, 165),
+                                       51: (0, 168),
+                                       52: (0, 173),
+                                       53: (0, 178),
+                                       63: (0, 22)},
+                                  52: {0: (1, {'@': 53}),
+                                       1: (1, {'@': 53}),
+                                       2: (1, {'@': 53}),
+                                       3: (1, {'@': 53}),
+                                       4: (1, {'@': 53}),
+                                       5: (1, {'@': 53}),
+                                       6: (1, {'@': 53}),
+                                       7: (1, {'@': 53}),
+                                       8: (1, {'@': 53}),
+                                       9: (1, {'@': 53}),
+                                       10: (1, {'@': 53}),
+                                       11: (1, {'@': 53}),
+                                       12: (1, {'@': 53}),
+                                       13: (1, {'@': 53}),
+                                       14: (1, {'@': 53}),
+                                       15: (1, {'@': 53}),
+                                       16: (1, {'@': 53}),
+                                       17: (1, {'@': 53}),
+                                       18: (1, {'@': 53}),
+                                       19: (1, {'@': 53}),
+                                       20: (1, {'@': 53}),
+                                       21: (1, {'@': 53})},
+                                  53: {0: (1, {'@': 108}),
+                                       5: (1, {'@': 108}),
+                                       14: (0, 70),
+                                       21: (1, {'@': 108}),
+                                       23: (1, {'@': 108}),
+                                       24: (1, {'@': 108}),
+                                       25: (1, {'@': 108}),
+                                       27: (1, {'@': 108}),
+                                       29: (1, {'@': 108}),
+                                       30: (1, {'@': 108}),
+                                       32: (1, {'@': 108}),
+                                       33: (0, 162),
+                                       34: (1, {'@': 108}),
+                                       35: (1, {'@': 108}),
+                                       36: (1, {'@': 108}),
+                                       37: (1, {'@': 108})},
+                                  54: {1: (0, 148),
+                                       3: (0, 134),
+                                       6: (0, 34),
+                                       7: (0, 125),
+                                       9: (0, 186),
+                                       10: (0, 91),
+                                       11: (0, 96),
+                                       12: (0, 29),
+                                       14: (0, 161),
+                                       38: (0, 88),
+                                       40: (0, 102),
+                                       41: (0, 104),
+                                       42: (0, 109),
+                                       44: (0, 6),
+                                       46: (0, 137),
+                                       49: (0, 156),
+                                       50: (0, 165),
+                                       51: (0, 168),
+                                       52: (0, 173),
+                                       53: (0, 178)},
+                                  55: {12: (0, 127)},
+                                  56: {1: (0, 148),
+                                       3: (0, 134),
+                                       6: (0, 34),
+                                       7: (0, 125),
+                                       9: (0, 186),
+                                       10: (0, 91),
+                                       11: (0, 96),
+                                       12: (0, 29),
+                                       14: (0, 161),
+                                       37: (1, {'@': 81}),
+                                       38: (0, 88),
+                                       40: (0, 102),
+                                       41: (0, 104),
+                                       42: (0, 109),
+                                       44: (0, 128),
+                                       46: (0, 137),
+                                       47: (0, 58),
+                                       49: (0, 156),
+                                       50: (0, 165),
+                                       51: (0, 168),
+                                       52: (0, 173),
+                                       53: (0, 178),
+                                       64: (0, 64)},
+                                  57: {1: (0, 148),
+                                       2: (0, 119),
+                                       3: (0, 134),
+                                       6: (0, 34),
+                                       7: (0, 125),
+                                       8: (0, 158),
+                                       9: (0, 186),
+                                       10: (0, 91),
+                                       11: (0, 96),
+                                       12: (0, 29),
+                                       13: (0, 25),
+                                       14: (0, 161),
+                                       16: (0, 112),
+                                       17: (0, 85),
+                                       18: (0, 13),
+                                       20: (0, 123),
+                                       38: (0, 88),
+                                       39: (0, 98),
+                                       40: (0, 102),
+                                       41: (0, 104),
+                                       42: (0, 109),
+                                       43: (0, 100),
+                                       44: (0, 128),
+                                       45: (0, 131),
+                                       46: (0, 137),
+                                       47: (0, 144),
+                                       48: (0, 146),
+                                       49: (0, 156),
+                                       50: (0, 165),
+                                       51: (0, 168),
+                                       52: (0, 173),
+                                       53: (0, 178),
+                                       54: (0, 2),
+                                       55: (0, 9),
+                                       56: (0, 16),
+                                       57: (0, 36),
+                                       58: (0, 40)},
+                                  58: {37: (1, {'@': 80})},
+                                  59: {36: (1, {'@': 64}), 37: (1, {'@': 64})},
+                                  60: {1: (0, 148),
+                                       3: (0, 134),
+                                       6: (0, 34),
+                                       7: (0, 125),
+                                       9: (0, 186),
+                                       10: (0, 91),
+                                       11: (0, 96),
+                                       12: (0, 29),
+                                       14: (0, 161),
+                                       38: (0, 88),
+                                       40: (0, 102),
+                                       41: (0, 104),
+                                       42: (0, 109),
+                                       44: (0, 128),
+                                       46: (0, 137),
+                                       47: (0, 142),
+                                       49: (0, 156),
+                                       50: (0, 165),
+                                       51: (0, 168),
+                                       52: (0, 173),
+                                       53: (0, 178)},
+                                  61: {7: (0, 152)},
+                                  62: {1: (0, 148),
+                                       3: (0, 134),
+                                       6: (0, 34),
+                                       7: (0, 125),
+                                       9: (0, 186),
+                                       10: (0, 91),
+                                       11: (0, 96),
+                                       12: (0, 29),
+                                       14: (0, 161),
+                                       38: (0, 88),
+                                       40: (0, 102),
+                                       41: (0, 104),
+                                       42: (0, 109),
+                                       44: (0, 128),
+                                       46: (0, 137),
+                                       47: (0, 8),
+                                       49: (0, 156),
+                                       50: (0, 165),
+                                       51: (0, 168),
+                                       52: (0, 173),
+                                       53: (0, 178)},
+                                  63: {1: (0, 148),
+                                       3: (0, 134),
+                                       6: (0, 34),
+                                       7: (0, 125),
+                                       9: (0, 186),
+                                       10: (0, 91),
+                                       11: (0, 96),
+                                       12: (0, 29),
+                                       14: (0, 161),
+                                       38: (0, 88),
+                                       40: (0, 102),
+                                       41: (0, 104),
+                                       42: (0, 109),
+                                       44: (0, 26),
+                                       46: (0, 137),
+                                       49: (0, 156),
+                                       50: (0, 165),
+                                       51: (0, 168),
+                                       52: (0, 173),
+                                       53: (0, 178)},
+                                  64: {37: (0, 57)},
+                                  65: {1: (1, {'@': 90}),
+                                       2: (1, {'@': 90}),
+                                       3: (1, {'@': 90}),
+                                       4: (1, {'@': 90}),
+                                       5: (1, {'@': 90}),
+                                       6: (1, {'@': 90}),
+                                       7: (1, {'@': 90}),
+                                       8: (1, {'@': 90}),
+                                       9: (1, {'@': 90}),
+                                       10: (1, {'@': 90}),
+                                       11: (1, {'@': 90}),
+                                       12: (1, {'@': 90}),
+                                       13: (1, {'@': 90}),
+                                       14: (1, {'@': 90}),
+                                       15: (1, {'@': 90}),
+                                       16: (1, {'@': 90}),
+                                       17: (1, {'@': 90}),
+                                       18: (1, {'@': 90}),
+                                       19: (1, {'@': 90}),
+                                       20: (1, {'@': 90}),
+                                       21: (1, {'@': 90}),
+                                       22: (1, {'@': 90})},
+                                  66: {4: (0, 18),
+                                       15: (0, 180),
+                                       19: (0, 183),
+                                       37: (0, 145),
+                                       65: (0, 139),
+                                       66: (0, 133),
+                                       67: (0, 138)},
+                                  67: {1: (0, 148),
+                                       3: (0, 134),
+                                       6: (0, 34),
+                                       7: (0, 125),
+                                       9: (0, 186),
+                                       10: (0, 91),
+                                       11: (0, 96),
+                                       12: (0, 29),
+                                       14: (0, 161),
+                                       38: (0, 88),
+                                       40: (0, 102),
+                                       41: (0, 104),
+                                       42: (0, 109),
+                                       44: (0, 28),
+                                       46: (0, 137),
+                                       49: (0, 156),
+                                       50: (0, 165),
+                                       51: (0, 168),
+                                       52: (0, 173),
+                                       53: (0, 178)},
+                                  68: {1: (1, {'@': 89}),
+                                       2: (1, {'@': 89}),
+                                       3: (1, {'@': 89}),
+                                       4: (1, {'@': 89}),
+                                       5: (1, {'@': 89}),
+                                       6: (1, {'@': 89}),
+                                       7: (1, {'@': 89}),
+                                       8: (1, {'@': 89}),
+                                       9: (1, {'@': 89}),
+                                       10: (1, {'@': 89}),
+                                       11: (1, {'@': 89}),
+                                       12: (1, {'@': 89}),
+                                       13: (1, {'@': 89}),
+                                       14: (1, {'@': 89}),
+                                       15: (1, {'@': 89}),
+                                       16: (1, {'@': 89}),
+                                       17: (1, {'@': 89}),
+                                       18: (1, {'@': 89}),
+                                       19: (1, {'@': 89}),
+                                       20: (1, {'@': 89}),
+                                       21: (1, {'@': 89}),
+                                       22: (1, {'@': 89})},
+                                  69: {1: (1, {'@': 86}),
+                                       2: (1, {'@': 86}),
+                                       3: (1, {'@': 86}),
+                                       4: (1, {'@': 86}),
+                                       5: (1, {'@': 86}),
+                                       6: (1, {'@': 86}),
+                                       7: (1, {'@': 86}),
+                                       8: (1, {'@': 86}),
+                                       9: (1, {'@': 86}),
+                                       10: (1, {'@': 86}),
+                                       11: (1, {'@': 86}),
+                                       12: (1, {'@': 86}),
+                                       13: (1, {'@': 86}),
+                                       14: (1, {'@': 86}),
+                                       15: (1, {'@': 86}),
+                                       16: (1, {'@': 86}),
+                                       17: (1, {'@': 86}),
+                                       18: (1, {'@': 86}),
+                                       19: (1, {'@': 86}),
+                                       20: (1, {'@': 86}),
+                                       21: (1, {'@': 86}),
+                                       22: (1, {'@': 86})},
+                                  70: {1: (0, 148),
+                                       3: (0, 134),
+                                       6: (0, 34),
+                                       7: (0, 125),
+                                       9: (0, 186),
+                                       10: (0, 91),
+                                       11: (0, 130),
+                                       12: (0, 29),
+                                       14: (0, 161),
+                                       38: (0, 135),
+                                       40: (0, 39),
+                                       49: (0, 156),
+                                       52: (0, 173),
+                                       53: (0, 178)},
+                                  71: {1: (1, {'@': 61}),
+                                       2: (1, {'@': 61}),
+                                       3: (1, {'@': 61}),
+                                       4: (1, {'@': 61}),
+                                       5: (1, {'@': 61}),
+                                       6: (1, {'@': 61}),
+                                       7: (1, {'@': 61}),
+                                       8: (1, {'@': 61}),
+                                       9: (1, {'@': 61}),
+                                       10: (1, {'@': 61}),
+                                       11: (1, {'@': 61}),
+                                       12: (1, {'@': 61}),
+                                       13: (1, {'@': 61}),
+                                       14: (1, {'@': 61}),
+                                       15: (1, {'@': 61}),
+                                       16: (1, {'@': 61}),
+                                       17: (1, {'@': 61}),
+                                       18: (1, {'@': 61}),
+                                       19: (1, {'@': 61}),
+                                       20: (1, {'@': 61}),
+                                       21: (1, {'@': 61})},
+                                  72: {1: (1, {'@': 83}),
+                                       2: (1, {'@': 83}),
+                                       3: (1, {'@': 83}),
+                                       4: (1, {'@': 83}),
+                                       5: (1, {'@': 83}),
+                                       6: (1, {'@': 83}),
+                                       7: (1, {'@': 83}),
+                                       8: (1, {'@': 83}),
+                                       9: (1, {'@': 83}),
+                                       10: (1, {'@': 83}),
+                                       11: (1, {'@': 83}),
+                                       12: (1, {'@': 83}),
+                                       13: (1, {'@': 83}),
+                                       14: (1, {'@': 83}),
+                                       15: (1, {'@': 83}),
+                                       16: (1, {'@': 83}),
+                                       17: (1, {'@': 83}),
+                                       18: (1, {'@': 83}),
+                                       19: (1, {'@': 83}),
+                                       20: (1, {'@': 83}),
+                                       21: (1, {'@': 83}),
+                                       22: (1, {'@': 83})},
+                                  73: {0: (1, {'@': 124}),
+                                       1: (1, {'@': 124}),
+                                       5: (1, {'@': 124}),
+                                       9: (1, {'@': 124}),
+                                       14: (1, {'@': 124}),
+                                       21: (1, {'@': 124}),
+                                       23: (1, {'@': 124}),
+                                       24: (1, {'@': 124}),
+                                       25: (1, {'@': 124}),
+                                       26: (1, {'@': 124}),
+                                       27: (1, {'@': 124}),
+                                       28: (1, {'@': 124}),
+                                       29: (1, {'@': 124}),
+                                       30: (1, {'@': 124}),
+                                       31: (1, {'@': 124}),
+                                       32: (1, {'@': 124}),
+                                       33: (1, {'@': 124}),
+                                       34: (1, {'@': 124}),
+                                       35: (1, {'@': 124}),
+                                       36: (1, {'@': 124}),
+                                       37: (1, {'@': 124}),
+                                       59: (1, {'@': 124})},
+                                  74: {1: (0, 148),
+                                       3: (0, 134),
+                                       6: (0, 34),
+                                       7: (0, 125),
+                                       9: (0, 186),
+                                       10: (0, 91),
+                                       11: (0, 96),
+                                       12: (0, 29),
+                                       14: (0, 161),
+                                       38: (0, 88),
+                                       40: (0, 102),
+                                       41: (0, 104),
+                                       42: (0, 109),
+                                       44: (0, 32),
+                                       46: (0, 137),
+                                       49: (0, 156),
+                                       50: (0, 165),
+                                       51: (0, 168),
+                                       52: (0, 173),
+                                       53: (0, 178)},
+                                  75: {0: (1, {'@': 100}),
+                                       5: (1, {'@': 100}),
+                                       21: (1, {'@': 100}),
+                                       29: (1, {'@': 100}),
+                                       32: (0, 48),
+                                       35: (1, {'@': 100}),
+                                       36: (1, {'@': 100}),
+                                       37: (1, {'@': 100})},
+                                  76: {0: (1, {'@': 55}),
+                                       1: (1, {'@': 55}),
+                                       2: (1, {'@': 55}),
+                                       3: (1, {'@': 55}),
+                                       4: (1, {'@': 55}),
+                                       5: (1, {'@': 55}),
+                                       6: (1, {'@': 55}),
+                                       7: (1, {'@': 55}),
+                                       8: (1, {'@': 55}),
+                                       9: (1, {'@': 55}),
+                                       10: (1, {'@': 55}),
+                                       11: (1, {'@': 55}),
+                                       12: (1, {'@': 55}),
+                                       13: (1, {'@': 55}),
+                                       14: (1, {'@': 55}),
+                                       15: (1, {'@': 55}),
+                                       16: (1, {'@': 55}),
+                                       17: (1, {'@': 55}),
+                                       18: (1, {'@': 55}),
+                                       19: (1, {'@': 55}),
+                                       20: (1, {'@': 55}),
+                                       21: (1, {'@': 55})},
+                                  77: {1: (0, 148),
+                                       3: (0, 134),
+                                       6: (0, 34),
+                                       7: (0, 125),
+                                       9: (0, 186),
+                                       10: (0, 91),
+                                       11: (0, 96),
+                                       12: (0, 29),
+                                       14: (0, 161),
+                                       38: (0, 88),
+                                       40: (0, 102),
+                                       41: (0, 104),
+                                       42: (0, 109),
+                                       44: (0, 35),
+                                       46: (0, 137),
+                                       49: (0, 156),
+                                       50: (0, 165),
+                                       51: (0, 168),
+                                       52: (0, 173),
+                                       53: (0, 178)},
+                                  78: {0: (1, {'@': 56}),
+                                       1: (1, {'@': 56}),
+                                       2: (1, {'@': 56}),
+                                       3: (1, {'@': 56}),
+                                       4: (1, {'@': 56}),
+                                       5: (1, {'@': 56}),
+                                       6: (1, {'@': 56}),
+                                       7: (1, {'@': 56}),
+                                       8: (1, {'@': 56}),
+                                       9: (1, {'@': 56}),
+                                       10: (1, {'@': 56}),
+                                       11: (1, {'@': 56}),
+                                       12: (1, {'@': 56}),
+                                       13: (1, {'@': 56}),
+                                       14: (1, {'@': 56}),
+                                       15: (1, {'@': 56}),
+                                       16: (1, {'@': 56}),
+                                       17: (1, {'@': 56}),
+                                       18: (1, {'@': 56}),
+                                       19: (1, {'@': 56}),
+                                       20: (1, {'@': 56}),
+                                       21: (1, {'@': 56})},
+                                  79: {0: (1, {'@': 105}),
+                                       5: (1, {'@': 105}),
+                                       21: (1, {'@': 105}),
+                                       23: (0, 97),
+                                       24: (0, 92),
+                                       25: (1, {'@': 105}),
+                                       27: (0, 101),
+                                       29: (1, {'@': 105}),
+                                       30: (0, 106),
+                                       32: (1, {'@': 105}),
+                                       34: (1, {'@': 105}),
+                                       35: (1, {'@': 105}),
+                                       36: (1, {'@': 105}),
+                                       37: (1, {'@': 105})},
+                                  80: {1: (0, 148),
+                                       3: (0, 134),
+                                       6: (0, 34),
+                                       7: (0, 125),
+                                       9: (0, 186),
+                                       10: (0, 91),
+                                       11: (0, 130),
+                                       12: (0, 29),
+                                       14: (0, 161),
+                                       38: (0, 135),
+                                       49: (0, 181),
+                                       52: (0, 173),
+                                       53: (0, 178)},
+                                  81: {0: (1, {'@': 104}),
+                                       5: (1, {'@': 104}),
+                                       21: (1, {'@': 104}),
+                                       23: (0, 97),
+                                       24: (0, 92),
+                                       25: (1, {'@': 104}),
+                                       27: (0, 101),
+                                       29: (1, {'@': 104}),
+                                       30: (0, 106),
+                                       32: (1, {'@': 104}),
+                                       34: (1, {'@': 104}),
+                                       35: (1, {'@': 104}),
+                                       36: (1, {'@': 104}),
+                                       37: (1, {'@': 104})},
+                                  82: {11: (0, 147)},
+                                  83: {1: (0, 148),
+                                       2: (0, 119),
+                                       3: (0, 134),
+                                       4: (0, 18),
+                                       5: (1, {'@': 46}),
+                                       6: (0, 34),
+                                       7: (0, 125),
+                                       8: (0, 158),
+                                       9: (0, 186),
+                                       10: (0, 91),
+                                       11: (0, 96),
+                                       12: (0, 29),
+                                       13: (0, 25),
+                                       14: (0, 161),
+                                       15: (0, 180),
+                                       16: (0, 112),
+                                       17: (0, 85),
+                                       18: (0, 13),
+                                       19: (0, 183),
+                                       20: (0, 123),
+                                       38: (0, 88),
+                                       39: (0, 98),
+                                       40: (0, 102),
+                                       41: (0, 104),
+                                       42: (0, 109),
+                                       43: (0, 45),
+                                       44: (0, 128),
+                                       45: (0, 131),
+                                       46: (0, 137),
+                                       47: (0, 144),
+                                       48: (0, 146),
+                                       49: (0, 156),
+                                       50: (0, 165),
+                                       51: (0, 168),
+                                       52: (0, 173),
+                                       53: (0, 178),
+                                       54: (0, 2),
+                                       55: (0, 9),
+                                       56: (0, 16),
+                                       57: (0, 36),
+                                       58: (0, 40),
+                                       67: (0, 107),
+                                       68: (0, 140),
+                                       69: (0, 151),
+                                       70: (0, 170),
+                                       71: (0, 175),
+                                       72: (0, 5),
+                                       73: (0, 21)},
+                                  84: {21: (1, {'@': 59}), 36: (0, 115), 61: (0, 33)},
+                                  85: {7: (0, 62)},
+                                  86: {1: (0, 148),
+                                       3: (0, 134),
+                                       6: (0, 34),
+                                       7: (0, 125),
+                                       9: (0, 186),
+                                       10: (0, 91),
+                                       11: (0, 130),
+                                       12: (0, 29),
+                                       14: (0, 161),
+                                       38: (0, 135),
+                                       49: (0, 185),
+                                       52: (0, 173),
+                                       53: (0, 178)},
+                                  87: {0: (1, {'@': 77}),
+                                       1: (1, {'@': 77}),
+                                       3: (1, {'@': 77}),
+                                       6: (1, {'@': 77}),
+                                       7: (1, {'@': 77}),
+                                       9: (1, {'@': 77}),
+                                       10: (1, {'@': 77}),
+                                       11: (1, {'@': 77}),
+                                       12: (1, {'@': 77}),
+                                       14: (1, {'@': 77})},
+                                  88: {0: (1, {'@': 123}),
+                                       1: (0, 73),
+                                       5: (1, {'@': 123}),
+                                       9: (0, 164),
+                                       14: (1, {'@': 123}),
+                                       21: (1, {'@': 123}),
+                                       23: (1, {'@': 123}),
+                                       24: (1, {'@': 123}),
+                                       25: (1, {'@': 123}),
+                                       26: (1, {'@': 123}),
+                                       27: (1, {'@': 123}),
+                                       28: (1, {'@': 123}),
+                                       29: (1, {'@': 123}),
+                                       30: (1, {'@': 123}),
+                                       31: (1, {'@': 123}),
+                                       32: (1, {'@': 123}),
+                                       33: (1, {'@': 123}),
+                                       34: (1, {'@': 123}),
+                                       35: (1, {'@': 123}),
+                                       36: (1, {'@': 123}),
+                                       37: (1, {'@': 123}),
+                                       59: (0, 23)},
+                                  89: {0: (1, {'@': 75}),
+                                       1: (1, {'@': 75}),
+                                       3: (1, {'@': 75}),
+                                       6: (1, {'@': 75}),
+                                       7: (1, {'@': 75}),
+                                       9: (1, {'@': 75}),
+                                       10: (1, {'@': 75}),
+                                       11: (1, {'@': 75}),
+                                       12: (1, {'@': 75}),
+                                       14: (1, {'@': 75})},
+                                  90: {21: (0, 31)},
+                                  91: {0: (1, {'@': 134}),
+                                       1: (1, {'@': 134}),
+                                       5: (1, {'@': 134}),
+                                       9: (1, {'@': 134}),
+                                       14: (1, {'@': 134}),
+                                       21: (1, {'@': 134}),
+                                       23: (1, {'@': 134}),
+                                       24: (1, {'@': 134}),
+                                       25: (1, {'@': 134}),
+                                       26: (1, {'@': 134}),
+                                       27: (1, {'@': 134}),
+                                       28: (1, {'@': 134}),
+                                       29: (1, {'@': 134}),
+                                       30: (1, {'@': 134}),
+                                       31: (1, {'@': 134}),
+                                       32: (1, {'@': 134}),
+                                       33: (1, {'@': 134}),
+                                       34: (1, {'@': 134}),
+                                       35: (1, {'@': 134}),
+                                       36: (1, {'@': 134}),
+                                       37: (1, {'@': 134}),
+                                       59: (1, {'@': 134}),
+                                       60: (1, {'@': 134})},
+                                  92: {1: (0, 148),
+                                       3: (0, 134),
+                                       6: (0, 34),
+                                       7: (0, 125),
+                                       9: (0, 186),
+                                       10: (0, 91),
+                                       11: (0, 130),
+                                       12: (0, 29),
+                                       14: (0, 161),
+                                       38: (0, 135),
+                                       40: (0, 102),
+                                       49: (0, 156),
+                                       50: (0, 41),
+                                       52: (0, 173),
+                                       53: (0, 178)},
+                                  93: {0: (1, {'@': 79}),
+                                       1: (0, 148),
+                                       3: (0, 134),
+                                       6: (0, 34),
+                                       7: (0, 125),
+                                       9: (0, 186),
+                                       10: (0, 91),
+                                       11: (0, 96),
+                                       12: (0, 29),
+                                       14: (0, 161),
+                                       38: (0, 88),
+                                       40: (0, 102),
+                                       41: (0, 104),
+                                       42: (0, 109),
+                                       44: (0, 128),
+                                       46: (0, 137),
+                                       47: (0, 160),
+                                       49: (0, 156),
+                                       50: (0, 165),
+                                       51: (0, 168),
+                                       52: (0, 173),
+                                       53: (0, 178),
+                                       74: (0, 163)},
+                                  94: {35: (0, 59)},
+                                  95: {0: (0, 78)},
+                                  96: {0: (1, {'@': 136}),
+                                       1: (1, {'@': 136}),
+                                       5: (1, {'@': 136}),
+                                       7: (0, 51),
+                                       9: (1, {'@': 136}),
+                                       14: (1, {'@': 136}),
+                                       21: (1, {'@': 136}),
+                                       23: (1, {'@': 136}),
+                                       24: (1, {'@': 136}),
+                                       25: (1, {'@': 136}),
+                                       26: (1, {'@': 136}),
+                                       27: (1, {'@': 136}),
+                                       28: (1, {'@': 136}),
+                                       29: (1, {'@': 136}),
+                                       30: (1, {'@': 136}),
+                                       31: (1, {'@': 136}),
+                                       32: (1, {'@': 136}),
+                                       33: (1, {'@': 136}),
+                                       34: (1, {'@': 136}),
+                                       35: (1, {'@': 136}),
+                                       36: (1, {'@': 136}),
+                                       37: (1, {'@': 136}),
+                                       59: (0, 54),
+                                       60: (1, {'@': 136}),
+                                       75: (0, 63),
+                                       76: (0, 67),
+                                       77: (0, 74),
+                                       78: (0, 77)},
+                                  97: {1: (0, 148),
+                                       3: (0, 134),
+                                       6: (0, 34),
+                                       7: (0, 125),
+                                       9: (0, 186),
+                                       10: (0, 91),
+                                       11: (0, 130),
+                                       12: (0, 29),
+                                       14: (0, 161),
+                                       38: (0, 135),
+                                       40: (0, 102),
+                                       49: (0, 156),
+                                       50: (0, 46),
+                                       52: (0, 173),
+                                       53: (0, 178)},
+                                  98: {1: (1, {'@': 69}),
+                                       2: (1, {'@': 69}),
+                                       3: (1, {'@': 69}),
+                                       4: (1, {'@': 69}),
+                                       5: (1, {'@': 69}),
+                                       6: (1, {'@': 69}),
+                                       7: (1, {'@': 69}),
+                                       8: (1, {'@': 69}),
+                                       9: (1, {'@': 69}),
+                                       10: (1, {'@': 69}),
+                                       11: (1, {'@': 69}),
+                                       12: (1, {'@': 69}),
+                                       13: (1, {'@': 69}),
+                                       14: (1, {'@': 69}),
+                                       15: (1, {'@': 69}),
+                                       16: (1, {'@': 69}),
+                                       17: (1, {'@': 69}),
+                                       18: (1, {'@': 69}),
+                                       19: (1, {'@': 69}),
+                                       20: (1, {'@': 69}),
+                                       21: (1, {'@': 69}),
+                                       22: (1, {'@': 69})},
+                                  99: {0: (1, {'@': 76}),
+                                       1: (1, {'@': 76}),
+                                       3: (1, {'@': 76}),
+                                       6: (1, {'@': 76}),
+                                       7: (1, {'@': 76}),
+                                       9: (1, {'@': 76}),
+                                       10: (1, {'@': 76}),
+                                       11: (1, {'@': 76}),
+                                       12: (1, {'@': 76}),
+                                       14: (1, {'@': 76})},
+                                  100: {1: (1, {'@': 74}),
+                                        2: (1, {'@': 74}),
+                                        3: (1, {'@': 74}),
+                                        4: (1, {'@': 74}),
+                                        5: (1, {'@': 74}),
+                                        6: (1, {'@': 74}),
+                                        7: (1, {'@': 74}),
+                                        8: (1, {'@': 74}),
+                                        9: (1, {'@': 74}),
+                                        10: (1, {'@': 74}),
+                                        11: (1, {'@': 74}),
+                                        12: (1, {'@': 74}),
+                                        13: (1, {'@': 74}),
+                                        14: (1, {'@': 74}),
+                                        15: (1, {'@': 74}),
+                                        16: (1, {'@': 74}),
+                                        17: (1, {'@': 74}),
+                                        18: (1, {'@': 74}),
+                                        19: (1, {'@': 74}),
+                                        20: (1, {'@': 74}),
+                                        21: (1, {'@': 74}),
+                                        22: (1, {'@': 74})},
+                                  101: {1: (0, 148),
+                                        3: (0, 134),
+                                        6: (0, 34),
+                                        7: (0, 125),
+                                        9: (0, 186),
+                                        10: (0, 91),
+                                        11: (0, 130),
+                                        12: (0, 29),
+                                        14: (0, 161),
+                                        38: (0, 135),
+                                        40: (0, 102),
+                                        49: (0, 156),
+                                        50: (0, 49),
+                                        52: (0, 173),
+                                        53: (0, 178)},
+                                  102: {0: (1, {'@': 114}),
+                                        5: (1, {'@': 114}),
+                                        14: (1, {'@': 114}),
+                                        21: (1, {'@': 114}),
+                                        23: (1, {'@': 114}),
+                                        24: (1, {'@': 114}),
+                                        25: (1, {'@': 114}),
+                                        26: (0, 24),
+                                        27: (1, {'@': 114}),
+                                        28: (0, 80),
+                                        29: (1, {'@': 114}),
+                                        30: (1, {'@': 114}),
+                                        31: (0, 86),
+                                        32: (1, {'@': 114}),
+                                        33: (1, {'@': 114}),
+                                        34: (1, {'@': 114}),
+                                        35: (1, {'@': 114}),
+                                        36: (1, {'@': 114}),
+                                        37: (1, {'@': 114})},
+                                  103: {0: (1, {'@': 112}),
+                                        5: (1, {'@': 112}),
+                                        14: (1, {'@': 112}),
+                                        21: (1, {'@': 112}),
+                                        23: (1, {'@': 112}),
+                                        24: (1, {'@': 112}),
+                                        25: (1, {'@': 112}),
+                                        26: (0, 24),
+                                        27: (1, {'@': 112}),
+                                        28: (0, 80),
+                                        29: (1, {'@': 112}),
+                                        30: (1, {'@': 112}),
+                                        31: (0, 86),
+                                        32: (1, {'@': 112}),
+                                        33: (1, {'@': 112}),
+                                        34: (1, {'@': 112}),
+                                        35: (1, {'@': 112}),
+                                        36: (1, {'@': 112}),
+                                        37: (1, {'@': 112})},
+                                  104: {0: (1, {'@': 106}),
+                                        5: (1, {'@': 106}),
+                                        21: (1, {'@': 106}),
+                                        23: (0, 97),
+                                        24: (0, 92),
+                                        25: (1, {'@': 106}),
+                                        27: (0, 101),
+                                        29: (1, {'@': 106}),
+                                        30: (0, 106),
+                                        32: (1, {'@': 106}),
+                                        34: (1, {'@': 106}),
+                                        35: (1, {'@': 106}),
+                                        36: (1, {'@': 106}),
+                                        37: (1, {'@': 106})},
+                                  105: {1: (1, {'@': 87}),
+                                        2: (1, {'@': 87}),
+                                        3: (1, {'@': 87}),
+                                        4: (1, {'@': 87}),
+                                        5: (1, {'@': 87}),
+                                        6: (1, {'@': 87}),
+                                        7: (1, {'@': 87}),
+                                        8: (1, {'@': 87}),
+                                        9: (1, {'@': 87}),
+                                        10: (1, {'@': 87}),
+                                        11: (1, {'@': 87}),
+                                        12: (1, {'@': 87}),
+                                        13: (1, {'@': 87}),
+                                        14: (1, {'@': 87}),
+                                        15: (1, {'@': 87}),
+                                        16: (1, {'@': 87}),
+                                        17: (1, {'@': 87}),
+                                        18: (1, {'@': 87}),
+                                        19: (1, {'@': 87}),
+                                        20: (1, {'@': 87}),
+                                        21: (1, {'@': 87}),
+                                        22: (1, {'@': 87})},
+                                  106: {1: (0, 148),
+                                        3: (0, 134),
+                                        6: (0, 34),
+                                        7: (0, 125),
+                                        9: (0, 186),
+                                        10: (0, 91),
+                                        11: (0, 130),
+                                        12: (0, 29),
+                                        14: (0, 161),
+                                        38: (0, 135),
+                                        40: (0, 102),
+                                        49: (0, 156),
+                                        50: (0, 53),
+                                        52: (0, 173),
+                                        53: (0, 178)},
+                                  107: {11: (0, 113)},
+                                  108: {36: (0, 177), 37: (1, {'@': 131})},
+                                  109: {0: (1, {'@': 99}),
+                                        5: (1, {'@': 99}),
+                                        21: (1, {'@': 99}),
+                                        29: (0, 110),
+                                        35: (1, {'@': 99}),
+                                        36: (1, {'@': 99}),
+                                        37: (1, {'@': 99})},
+                                  110: {1: (0, 148),
+                                        3: (0, 134),
+                                        6: (0, 34),
+                                        7: (0, 125),
+                                        9: (0, 186),
+                                        10: (0, 91),
+                                        11: (0, 130),
+                                        12: (0, 29),
+                                        14: (0, 161),
+                                        38: (0, 135),
+                                        40: (0, 102),
+                                        41: (0, 104),
+                                        46: (0, 137),
+                                        49: (0, 156),
+                                        50: (0, 165),
+                                        51: (0, 75),
+                                        52: (0, 173),
+                                        53: (0, 178)},
+                                  111: {37: (0, 11)},
+                                  112: {1: (0, 148),
+                                        2: (0, 119),
+                                        3: (0, 134),
+                                        6: (0, 34),
+                                        7: (0, 125),
+                                        8: (0, 158),
+                                        9: (0, 186),
+                                        10: (0, 91),
+                                        11: (0, 96),
+                                        12: (0, 29),
+                                        13: (0, 25),
+                                        14: (0, 161),
+                                        16: (0, 112),
+                                        17: (0, 85),
+                                        18: (0, 13),
+                                        20: (0, 123),
+                                        38: (0, 88),
+                                        39: (0, 98),
+                                        40: (0, 102),
+                                        41: (0, 104),
+                                        42: (0, 109),
+                                        43: (0, 132),
+                                        44: (0, 128),
+                                        45: (0, 131),
+                                        46: (0, 137),
+                                        47: (0, 144),
+                                        48: (0, 146),
+                                        49: (0, 156),
+                                        50: (0, 165),
+                                        51: (0, 168),
+                                        52: (0, 173),
+                                        53: (0, 178),
+                                        54: (0, 2),
+                                        55: (0, 9),
+                                        56: (0, 16),
+                                        57: (0, 36),
+                                        58: (0, 40)},
+                                  113: {0: (0, 37), 7: (0, 66), 59: (0, 60), 60: (0, 55)},
+                                  114: {1: (0, 148),
+                                        2: (0, 119),
+                                        3: (0, 134),
+                                        6: (0, 34),
+                                        7: (0, 125),
+                                        8: (0, 158),
+                                        9: (0, 186),
+                                        10: (0, 91),
+                                        11: (0, 96),
+                                        12: (0, 29),
+                                        13: (0, 25),
+                                        14: (0, 161),
+                                        16: (0, 112),
+                                        17: (0, 85),
+                                        18: (0, 13),
+                                        20: (0, 123),
+                                        38: (0, 88),
+                                        39: (0, 98),
+                                        40: (0, 102),
+                                        41: (0, 104),
+                                        42: (0, 109),
+                                        43: (0, 179),
+                                        44: (0, 128),
+                                        45: (0, 131),
+                                        46: (0, 137),
+                                        47: (0, 144),
+                                        48: (0, 146),
+                                        49: (0, 156),
+                                        50: (0, 165),
+                                        51: (0, 168),
+                                        52: (0, 173),
+                                        53: (0, 178),
+                                        54: (0, 2),
+                                        55: (0, 9),
+                                        56: (0, 16),
+                                        57: (0, 36),
+                                        58: (0, 40)},
+                                  115: {1: (0, 148),
+                                        3: (0, 134),
+                                        6: (0, 34),
+                                        7: (0, 125),
+                                        9: (0, 186),
+                                        10: (0, 91),
+                                        11: (0, 96),
+                                        12: (0, 29),
+                                        14: (0, 161),
+                                        38: (0, 88),
+                                        40: (0, 102),
+                                        41: (0, 104),
+                                        42: (0, 109),
+                                        44: (0, 128),
+                                        46: (0, 137),
+                                        47: (0, 153),
+                                        49: (0, 156),
+                                        50: (0, 165),
+                                        51: (0, 168),
+                                        52: (0, 173),
+                                        53: (0, 178)},
+                                  116: {0: (1, {'@': 102}),
+                                        5: (1, {'@': 102}),
+                                        21: (1, {'@': 102}),
+                                        25: (0, 120),
+                                        29: (1, {'@': 102}),
+                                        32: (1, {'@': 102}),
+                                        34: (0, 136),
+                                        35: (1, {'@': 102}),
+                                        36: (1, {'@': 102}),
+                                        37: (1, {'@': 102})},
+                                  117: {1: (0, 148),
+                                        3: (0, 134),
+                                        6: (0, 34),
+                                        7: (0, 125),
+                                        9: (0, 186),
+                                        10: (0, 91),
+                                        11: (0, 96),
+                                        12: (0, 29),
+                                        14: (0, 161),
+                                        38: (0, 88),
+                                        40: (0, 102),
+                                        41: (0, 104),
+                                        42: (0, 109),
+                                        44: (0, 128),
+                                        46: (0, 137),
+                                        47: (0, 7),
+                                        49: (0, 156),
+                                        50: (0, 165),
+                                        51: (0, 168),
+                                        52: (0, 173),
+                                        53: (0, 178)},
+                                  118: {0: (1, {'@': 128}),
+                                        1: (1, {'@': 128}),
+                                        5: (1, {'@': 128}),
+                                        9: (1, {'@': 128}),
+                                        14: (1, {'@': 128}),
+                                        21: (1, {'@': 128}),
+                                        23: (1, {'@': 128}),
+                                        24: (1, {'@': 128}),
+                                        25: (1, {'@': 128}),
+                                        26: (1, {'@': 128}),
+                                        27: (1, {'@': 128}),
+                                        28: (1, {'@': 128}),
+                                        29: (1, {'@': 128}),
+                                        30: (1, {'@': 128}),
+                                        31: (1, {'@': 128}),
+                                        32: (1, {'@': 128}),
+                                        33: (1, {'@': 128}),
+                                        34: (1, {'@': 128}),
+                                        35: (1, {'@': 128}),
+                                        36: (1, {'@': 128}),
+                                        37: (1, {'@': 128}),
+                                        59: (1, {'@': 128}),
+                                        60: (1, {'@': 128})},
+                                  119: {7: (0, 129)},
+                                  120: {1: (0, 148),
+                                        3: (0, 134),
+                                        6: (0, 34),
+                                        7: (0, 125),
+                                        9: (0, 186),
+                                        10: (0, 91),
+                                        11: (0, 130),
+                                        12: (0, 29),
+                                        14: (0, 161),
+                                        38: (0, 135),
+                                        40: (0, 102),
+                                        41: (0, 79),
+                                        49: (0, 156),
+                                        50: (0, 165),
+                                        52: (0, 173),
+                                        53: (0, 178)},
+                                  121: {37: (0, 47)},
+                                  122: {35: (0, 50)},
+                                  123: {1: (0, 148),
+                                        2: (0, 119),
+                                        3: (0, 134),
+                                        4: (0, 18),
+                                        6: (0, 34),
+                                        7: (0, 125),
+                                        8: (0, 158),
+                                        9: (0, 186),
+                                        10: (0, 91),
+                                        11: (0, 96),
+                                        12: (0, 29),
+                                        13: (0, 25),
+                                        14: (0, 161),
+                                        15: (0, 180),
+                                        16: (0, 112),
+                                        17: (0, 85),
+                                        18: (0, 13),
+                                        19: (0, 183),
+                                        20: (0, 123),
+                                        21: (0, 141),
+                                        38: (0, 88),
+                                        39: (0, 98),
+                                        40: (0, 102),
+                                        41: (0, 104),
+                                        42: (0, 109),
+                                        43: (0, 45),
+                                        44: (0, 128),
+                                        45: (0, 131),
+                                        46: (0, 137),
+                                        47: (0, 144),
+                                        48: (0, 146),
+                                        49: (0, 156),
+                                        50: (0, 165),
+                                        51: (0, 168),
+                                        52: (0, 173),
+                                        53: (0, 178),
+                                        54: (0, 2),
+                                        55: (0, 9),
+                                        56: (0, 16),
+                                        57: (0, 36),
+                                        58: (0, 40),
+                                        67: (0, 107),
+                                        68: (0, 143),
+                                        70: (0, 170),
+                                        71: (0, 175),
+                                        73: (0, 21)},
+                                  124: {37: (0, 150)},
+                                  125: {1: (0, 148),
+                                        3: (0, 134),
+                                        6: (0, 34),
+                                        7: (0, 125),
+                                        9: (0, 186),
+                                        10: (0, 91),
+                                        11: (0, 96),
+                                        12: (0, 29),
+                                        14: (0, 161),
+                                        38: (0, 88),
+                                        40: (0, 102),
+                                        41: (0, 104),
+                                        42: (0, 109),
+                                        44: (0, 128),
+                                        46: (0, 137),
+                                        47: (0, 121),
+                                        49: (0, 156),
+                                        50: (0, 165),
+                                        51: (0, 168),
+                                        52: (0, 173),
+                                        53: (0, 178)},
+                                  126: {0: (1, {'@': 121}),
+                                        5: (1, {'@': 121}),
+                                        14: (1, {'@': 121}),
+                                        21: (1, {'@': 121}),
+                                        23: (1, {'@': 121}),
+                                        24: (1, {'@': 121}),
+                                        25: (1, {'@': 121}),
+                                        26: (1, {'@': 121}),
+                                        27: (1, {'@': 121}),
+                                        28: (1, {'@': 121}),
+                                        29: (1, {'@': 121}),
+                                        30: (1, {'@': 121}),
+                                        31: (1, {'@': 121}),
+                                        32: (1, {'@': 121}),
+                                        33: (1, {'@': 121}),
+                                        34: (1, {'@': 121}),
+                                        35: (1, {'@': 121}),
+                                        36: (1, {'@': 121}),
+                                        37: (1, {'@': 121})},
+                                  127: {35: (0, 167)},
+                                  128: {0: (1, {'@': 92}),
+                                        5: (1, {'@': 92}),
+                                        21: (1, {'@': 92}),
+                                        35: (1, {'@': 92}),
+                                        36: (1, {'@': 92}),
+                                        37: (1, {'@': 92})},
+                                  129: {0: (0, 87),
+                                        1: (0, 148),
+                                        3: (0, 134),
+                                        4: (0, 18),
+                                        6: (0, 34),
+                                        7: (0, 125),
+                                        9: (0, 186),
+                                        10: (0, 91),
+                                        11: (0, 96),
+                                        12: (0, 29),
+                                        14: (0, 161),
+                                        15: (0, 180),
+                                        19: (0, 183),
+                                        38: (0, 88),
+                                        40: (0, 102),
+                                        41: (0, 104),
+                                        42: (0, 109),
+                                        44: (0, 128),
+                                        46: (0, 137),
+                                        47: (0, 144),
+                                        49: (0, 156),
+                                        50: (0, 165),
+                                        51: (0, 168),
+                                        52: (0, 173),
+                                        53: (0, 178),
+                                        55: (0, 99),
+                                        67: (0, 82),
+                                        73: (0, 89),
+                                        79: (0, 93)},
+                                  130: {0: (1, {'@': 136}),
+                                        1: (1, {'@': 136}),
+                                        5: (1, {'@': 136}),
+                                        7: (0, 51),
+                                        9: (1, {'@': 136}),
+                                        14: (1, {'@': 136}),
+                                        21: (1, {'@': 136}),
+                                        23: (1, {'@': 136}),
+                                        24: (1, {'@': 136}),
+                                        25: (1, {'@': 136}),
+                                        26: (1, {'@': 136}),
+                                        27: (1, {'@': 136}),
+                                        28: (1, {'@': 136}),
+                                        29: (1, {'@': 136}),
+                                        30: (1, {'@': 136}),
+                                        31: (1, {'@': 136}),
+                                        32: (1, {'@': 136}),
+                                        33: (1, {'@': 136}),
+                                        34: (1, {'@': 136}),
+                                        35: (1, {'@': 136}),
+                                        36: (1, {'@': 136}),
+                                        37: (1, {'@': 136}),
+                                        60: (1, {'@': 136})},
+                                  131: {1: (1, {'@': 73}),
+                                        2: (1, {'@': 73}),
+                                        3: (1, {'@': 73}),
+                                        4: (1, {'@': 73}),
+                                        5: (1, {'@': 73}),
+                                        6: (1, {'@': 73}),
+                                        7: (1, {'@': 73}),
+                                        8: (1, {'@': 73}),
+                                        9: (1, {'@': 73}),
+                                        10: (1, {'@': 73}),
+                                        11: (1, {'@': 73}),
+                                        12: (1, {'@': 73}),
+                                        13: (1, {'@': 73}),
+                                        14: (1, {'@': 73}),
+                                        15: (1, {'@': 73}),
+                                        16: (1, {'@': 73}),
+                                        17: (1, {'@': 73}),
+                                        18: (1, {'@': 73}),
+                                        19: (1, {'@': 73}),
+                                        20: (1, {'@': 73}),
+                                        21: (1, {'@': 73}),
+                                        22: (1, {'@': 73})},
+                                  132: {8: (0, 61)},
+                                  133: {36: (0, 166), 37: (1, {'@': 63}), 80: (0, 182)},
+                                  134: {0: (1, {'@': 135}),
+                                        1: (1, {'@': 135}),
+                                        5: (1, {'@': 135}),
+                                        9: (1, {'@': 135}),
+                                        14: (1, {'@': 135}),
+                                        21: (1, {'@': 135}),
+                                        23: (1, {'@': 135}),
+                                        24: (1, {'@': 135}),
+                                        25: (1, {'@': 135}),
+                                        26: (1, {'@': 135}),
+                                        27: (1, {'@': 135}),
+                                        28: (1, {'@': 135}),
+                                        29: (1, {'@': 135}),
+                                        30: (1, {'@': 135}),
+                                        31: (1, {'@': 135}),
+                                        32: (1, {'@': 135}),
+                                        33: (1, {'@': 135}),
+                                        34: (1, {'@': 135}),
+                                        35: (1, {'@': 135}),
+                                        36: (1, {'@': 135}),
+                                        37: (1, {'@': 135}),
+                                        59: (1, {'@': 135}),
+                                        60: (1, {'@': 135})},
+                                  135: {0: (1, {'@': 123}),
+                                        1: (0, 73),
+                                        5: (1, {'@': 123}),
+                                        9: (0, 164),
+                                        14: (1, {'@': 123}),
+                                        21: (1, {'@': 123}),
+                                        23: (1, {'@': 123}),
+                                        24: (1, {'@': 123}),
+                                        25: (1, {'@': 123}),
+                                        26: (1, {'@': 123}),
+                                        27: (1, {'@': 123}),
+                                        28: (1, {'@': 123}),
+                                        29: (1, {'@': 123}),
+                                        30: (1, {'@': 123}),
+                                        31: (1, {'@': 123}),
+                                        32: (1, {'@': 123}),
+                                        33: (1, {'@': 123}),
+                                        34: (1, {'@': 123}),
+                                        35: (1, {'@': 123}),
+                                        36: (1, {'@': 123}),
+                                        37: (1, {'@': 123})},
+                                  136: {1: (0, 148),
+                                        3: (0, 134),
+                                        6: (0, 34),
+                                        7: (0, 125),
+                                        9: (0, 186),
+                                        10: (0, 91),
+                                        11: (0, 130),
+                                        12: (0, 29),
+                                        14: (0, 161),
+                                        38: (0, 135),
+                                        40: (0, 102),
+                                        41: (0, 81),
+                                        49: (0, 156),
+                                        50: (0, 165),
+                                        52: (0, 173),
+                                        53: (0, 178)},
+                                  137: {0: (1, {'@': 103}),
+                                        5: (1, {'@': 103}),
+                                        21: (1, {'@': 103}),
+                                        25: (0, 120),
+                                        29: (1, {'@': 103}),
+                                        32: (1, {'@': 103}),
+                                        34: (0, 136),
+                                        35: (1, {'@': 103}),
+                                        36: (1, {'@': 103}),
+                                        37: (1, {'@': 103})},
+                                  138: {11: (0, 172)},
+                                  139: {37: (0, 169)},
+                                  140: {1: (0, 148),
+                                        2: (0, 119),
+                                        3: (0, 134),
+                                        4: (0, 18),
+                                        5: (1, {'@': 45}),
+                                        6: (0, 34),
+                                        7: (0, 125),
+                                        8: (0, 158),
+                                        9: (0, 186),
+                                        10: (0, 91),
+                                        11: (0, 96),
+                                        12: (0, 29),
+                                        13: (0, 25),
+                                        14: (0, 161),
+                                        15: (0, 180),
+                                        16: (0, 112),
+                                        17: (0, 85),
+                                        18: (0, 13),
+                                        19: (0, 183),
+                                        20: (0, 123),
+                                        38: (0, 88),
+                                        39: (0, 98),
+                                        40: (0, 102),
+                                        41: (0, 104),
+                                        42: (0, 109),
+                                        43: (0, 45),
+                                        44: (0, 128),
+                                        45: (0, 131),
+                                        46: (0, 137),
+                                        47: (0, 144),
+                                        48: (0, 146),
+                                        49: (0, 156),
+                                        50: (0, 165),
+                                        51: (0, 168),
+                                        52: (0, 173),
+                                        53: (0, 178),
+                                        54: (0, 2),
+                                        55: (0, 9),
+                                        56: (0, 16),
+                                        57: (0, 36),
+                                        58: (0, 40),
+                                        67: (0, 107),
+                                        70: (0, 170),
+                                        71: (0, 157),
+                                        73: (0, 21)},
+                                  141: {1: (1, {'@': 88}),
+                                        2: (1, {'@': 88}),
+                                        3: (1, {'@': 88}),
+                                        4: (1, {'@': 88}),
+                                        5: (1, {'@': 88}),
+                                        6: (1, {'@': 88}),
+                                        7: (1, {'@': 88}),
+                                        8: (1, {'@': 88}),
+                                        9: (1, {'@': 88}),
+                                        10: (1, {'@': 88}),
+                                        11: (1, {'@': 88}),
+                                        12: (1, {'@': 88}),
+                                        13: (1, {'@': 88}),
+                                        14: (1, {'@': 88}),
+                                        15: (1, {'@': 88}),
+                                        16: (1, {'@': 88}),
+                                        17: (1, {'@': 88}),
+                                        18: (1, {'@': 88}),
+                                        19: (1, {'@': 88}),
+                                        20: (1, {'@': 88}),
+                                        21: (1, {'@': 88}),
+                                        22: (1, {'@': 88})},
+                                  142: {0: (0, 52)},
+                                  143: {1: (0, 148),
+                                        2: (0, 119),
+                                        3: (0, 134),
+                                        4: (0, 18),
+                                        6: (0, 34),
+                                        7: (0, 125),
+                                        8: (0, 158),
+                                        9: (0, 186),
+                                        10: (0, 91),
+                                        11: (0, 96),
+                                        12: (0, 29),
+                                        13: (0, 25),
+                                        14: (0, 161),
+                                        15: (0, 180),
+                                        16: (0, 112),
+                                        17: (0, 85),
+                                        18: (0, 13),
+                                        19: (0, 183),
+                                        20: (0, 123),
+                                        21: (0, 105),
+                                        38: (0, 88),
+                                        39: (0, 98),
+                                        40: (0, 102),
+                                        41: (0, 104),
+                                        42: (0, 109),
+                                        43: (0, 45),
+                                        44: (0, 128),
+                                        45: (0, 131),
+                                        46: (0, 137),
+                                        47: (0, 144),
+                                        48: (0, 146),
+                                        49: (0, 156),
+                                        50: (0, 165),
+                                        51: (0, 168),
+                                        52: (0, 173),
+                                        53: (0, 178),
+                                        54: (0, 2),
+                                        55: (0, 9),
+                                        56: (0, 16),
+                                        57: (0, 36),
+                                        58: (0, 40),
+                                        67: (0, 107),
+                                        70: (0, 170),
+                                        71: (0, 157),
+                                        73: (0, 21)},
+                                  144: {0: (0, 154)},
+                                  145: {20: (0, 123), 56: (0, 71)},
+                                  146: {1: (1, {'@': 67}),
+                                        2: (1, {'@': 67}),
+                                        3: (1, {'@': 67}),
+                                        4: (1, {'@': 67}),
+                                        5: (1, {'@': 67}),
+                                        6: (1, {'@': 67}),
+                                        7: (1, {'@': 67}),
+                                        8: (1, {'@': 67}),
+                                        9: (1, {'@': 67}),
+                                        10: (1, {'@': 67}),
+                                        11: (1, {'@': 67}),
+                                        12: (1, {'@': 67}),
+                                        13: (1, {'@': 67}),
+                                        14: (1, {'@': 67}),
+                                        15: (1, {'@': 67}),
+                                        16: (1, {'@': 67}),
+                                        17: (1, {'@': 67}),
+                                        18: (1, {'@': 67}),
+                                        19: (1, {'@': 67}),
+                                        20: (1, {'@': 67}),
+                                        21: (1, {'@': 67}),
+                                        22: (1, {'@': 67})},
+                                  147: {0: (0, 37), 59: (0, 60), 60: (0, 55)},
+                                  148: {1: (0, 148),
+                                        3: (0, 134),
+                                        6: (0, 34),
+                                        7: (0, 125),
+                                        9: (0, 186),
+                                        10: (0, 91),
+                                        11: (0, 130),
+                                        12: (0, 29),
+                                        14: (0, 161),
+                                        38: (0, 135),
+                                        49: (0, 126),
+                                        52: (0, 173),
+                                        53: (0, 178)},
+                                  149: {1: (0, 148),
+                                        3: (0, 134),
+                                        6: (0, 34),
+                                        7: (0, 125),
+                                        9: (0, 186),
+                                        10: (0, 91),
+                                        11: (0, 96),
+                                        12: (0, 29),
+                                        14: (0, 161),
+                                        38: (0, 88),
+                                        40: (0, 102),
+                                        41: (0, 104),
+                                        42: (0, 109),
+                                        44: (0, 128),
+                                        46: (0, 137),
+                                        47: (0, 111),
+                                        49: (0, 156),
+                                        50: (0, 165),
+                                        51: (0, 168),
+                                        52: (0, 173),
+                                        53: (0, 178)},
+                                  150: {0: (0, 19)},
+                                  151: {5: (1, {'@': 44})},
+                                  152: {1: (0, 148),
+                                        3: (0, 134),
+                                        6: (0, 34),
+                                        7: (0, 125),
+                                        9: (0, 186),
+                                        10: (0, 91),
+                                        11: (0, 96),
+                                        12: (0, 29),
+                                        14: (0, 161),
+                                        38: (0, 88),
+                                        40: (0, 102),
+                                        41: (0, 104),
+                                        42: (0, 109),
+                                        44: (0, 128),
+                                        46: (0, 137),
+                                        47: (0, 15),
+                                        49: (0, 156),
+                                        50: (0, 165),
+                                        51: (0, 168),
+                                        52: (0, 173),
+                                        53: (0, 178)},
+                                  153: {21: (1, {'@': 140}),
+                                        36: (1, {'@': 140}),
+                                        37: (1, {'@': 140})},
+                                  154: {0: (1, {'@': 82}),
+                                        1: (1, {'@': 82}),
+                                        2: (1, {'@': 82}),
+                                        3: (1, {'@': 82}),
+                                        4: (1, {'@': 82}),
+                                        5: (1, {'@': 82}),
+                                        6: (1, {'@': 82}),
+                                        7: (1, {'@': 82}),
+                                        8: (1, {'@': 82}),
+                                        9: (1, {'@': 82}),
+                                        10: (1, {'@': 82}),
+                                        11: (1, {'@': 82}),
+                                        12: (1, {'@': 82}),
+                                        13: (1, {'@': 82}),
+                                        14: (1, {'@': 82}),
+                                        15: (1, {'@': 82}),
+                                        16: (1, {'@': 82}),
+                                        17: (1, {'@': 82}),
+                                        18: (1, {'@': 82}),
+                                        19: (1, {'@': 82}),
+                                        20: (1, {'@': 82}),
+                                        21: (1, {'@': 82}),
+                                        22: (1, {'@': 82})},
+                                  155: {4: (0, 18),
+                                        15: (0, 180),
+                                        19: (0, 183),
+                                        66: (0, 42),
+                                        67: (0, 138)},
+                                  156: {0: (1, {'@': 118}),
+                                        5: (1, {'@': 118}),
+                                        14: (1, {'@': 118}),
+                                        21: (1, {'@': 118}),
+                                        23: (1, {'@': 118}),
+                                        24: (1, {'@': 118}),
+                                        25: (1, {'@': 118}),
+                                        26: (1, {'@': 118}),
+                                        27: (1, {'@': 118}),
+                                        28: (1, {'@': 118}),
+                                        29: (1, {'@': 118}),
+                                        30: (1, {'@': 118}),
+                                        31: (1, {'@': 118}),
+                                        32: (1, {'@': 118}),
+                                        33: (1, {'@': 118}),
+                                        34: (1, {'@': 118}),
+                                        35: (1, {'@': 118}),
+                                        36: (1, {'@': 118}),
+                                        37: (1, {'@': 118})},
+                                  157: {1: (1, {'@': 139}),
+                                        2: (1, {'@': 139}),
+                                        3: (1, {'@': 139}),
+                                        4: (1, {'@': 139}),
+                                        5: (1, {'@': 139}),
+                                        6: (1, {'@': 139}),
+                                        7: (1, {'@': 139}),
+                                        8: (1, {'@': 139}),
+                                        9: (1, {'@': 139}),
+                                        10: (1, {'@': 139}),
+                                        11: (1, {'@': 139}),
+                                        12: (1, {'@': 139}),
+                                        13: (1, {'@': 139}),
+                                        14: (1, {'@': 139}),
+                                        15: (1, {'@': 139}),
+                                        16: (1, {'@': 139}),
+                                        17: (1, {'@': 139}),
+                                        18: (1, {'@': 139}),
+                                        19: (1, {'@': 139}),
+                                        20: (1, {'@': 139}),
+                                        21: (1, {'@': 139})},
+                                  158: {7: (0, 149)},
+                                  159: {0: (1, {'@': 120}),
+                                        5: (1, {'@': 120}),
+                                        14: (1, {'@': 120}),
+                                        21: (1, {'@': 120}),
+                                        23: (1, {'@': 120}),
+                                        24: (1, {'@': 120}),
+                                        25: (1, {'@': 120}),
+                                        26: (1, {'@': 120}),
+                                        27: (1, {'@': 120}),
+                                        28: (1, {'@': 120}),
+                                        29: (1, {'@': 120}),
+                                        30: (1, {'@': 120}),
+                                        31: (1, {'@': 120}),
+                                        32: (1, {'@': 120}),
+                                        33: (1, {'@': 120}),
+                                        34: (1, {'@': 120}),
+                                        35: (1, {'@': 120}),
+                                        36: (1, {'@': 120}),
+                                        37: (1, {'@': 120})},
+                                  160: {0: (1, {'@': 78})},
+                                  161: {1: (0, 148),
+                                        3: (0, 134),
+                                        6: (0, 34),
+                                        7: (0, 125),
+                                        9: (0, 186),
+                                        10: (0, 91),
+                                        11: (0, 130),
+                                        12: (0, 29),
+                                        14: (0, 161),
+                                        38: (0, 135),
+                                        49: (0, 159),
+                                        52: (0, 173),
+                                        53: (0, 178)},
+                                  162: {1: (0, 148),
+                                        3: (0, 134),
+                                        6: (0, 34),
+                                        7: (0, 125),
+                                        9: (0, 186),
+                                        10: (0, 91),
+                                        11: (0, 130),
+                                        12: (0, 29),
+                                        14: (0, 161),
+                                        38: (0, 135),
+                                        40: (0, 103),
+                                        49: (0, 156),
+                                        52: (0, 173),
+                                        53: (0, 178)},
+                                  163: {0: (0, 56)},
+                                  164: {0: (1, {'@': 125}),
+                                        1: (1, {'@': 125}),
+                                        5: (1, {'@': 125}),
+                                        9: (1, {'@': 125}),
+                                        14: (1, {'@': 125}),
+                                        21: (1, {'@': 125}),
+                                        23: (1, {'@': 125}),
+                                        24: (1, {'@': 125}),
+                                        25: (1, {'@': 125}),
+                                        26: (1, {'@': 125}),
+                                        27: (1, {'@': 125}),
+                                        28: (1, {'@': 125}),
+                                        29: (1, {'@': 125}),
+                                        30: (1, {'@': 125}),
+                                        31: (1, {'@': 125}),
+                                        32: (1, {'@': 125}),
+                                        33: (1, {'@': 125}),
+                                        34: (1, {'@': 125}),
+                                        35: (1, {'@': 125}),
+                                        36: (1, {'@': 125}),
+                                        37: (1, {'@': 125}),
+                                        59: (1, {'@': 125})},
+                                  165: {0: (1, {'@': 111}),
+                                        5: (1, {'@': 111}),
+                                        14: (0, 70),
+                                        21: (1, {'@': 111}),
+                                        23: (1, {'@': 111}),
+                                        24: (1, {'@': 111}),
+                                        25: (1, {'@': 111}),
+                                        27: (1, {'@': 111}),
+                                        29: (1, {'@': 111}),
+                                        30: (1, {'@': 111}),
+                                        32: (1, {'@': 111}),
+                                        33: (0, 162),
+                                        34: (1, {'@': 111}),
+                                        35: (1, {'@': 111}),
+                                        36: (1, {'@': 111}),
+                                        37: (1, {'@': 111})},
+                                  166: {4: (0, 18),
+                                        15: (0, 180),
+                                        19: (0, 183),
+                                        66: (0, 4),
+                                        67: (0, 138)},
+                                  167: {0: (0, 12), 59: (0, 20)},
+                                  168: {0: (1, {'@': 101}),
+                                        5: (1, {'@': 101}),
+                                        21: (1, {'@': 101}),
+                                        29: (1, {'@': 101}),
+                                        32: (0, 48),
+                                        35: (1, {'@': 101}),
+                                        36: (1, {'@': 101}),
+                                        37: (1, {'@': 101})},
+                                  169: {20: (0, 123), 56: (0, 1)},
+                                  170: {1: (1, {'@': 48}),
+                                        2: (1, {'@': 48}),
+                                        3: (1, {'@': 48}),
+                                        4: (1, {'@': 48}),
+                                        5: (1, {'@': 48}),
+                                        6: (1, {'@': 48}),
+                                        7: (1, {'@': 48}),
+                                        8: (1, {'@': 48}),
+                                        9: (1, {'@': 48}),
+                                        10: (1, {'@': 48}),
+                                        11: (1, {'@': 48}),
+                                        12: (1, {'@': 48}),
+                                        13: (1, {'@': 48}),
+                                        14: (1, {'@': 48}),
+                                        15: (1, {'@': 48}),
+                                        16: (1, {'@': 48}),
+                                        17: (1, {'@': 48}),
+                                        18: (1, {'@': 48}),
+                                        19: (1, {'@': 48}),
+                                        20: (1, {'@': 48}),
+                                        21: (1, {'@': 48})},
+                                  171: {1: (0, 148),
+                                        3: (0, 134),
+                                        6: (0, 34),
+                                        7: (0, 125),
+                                        9: (0, 186),
+                                        10: (0, 91),
+                                        11: (0, 96),
+                                        12: (0, 29),
+                                        14: (0, 161),
+                                        38: (0, 88),
+                                        40: (0, 102),
+                                        41: (0, 104),
+                                        42: (0, 109),
+                                        44: (0, 128),
+                                        46: (0, 137),
+                                        47: (0, 124),
+                                        49: (0, 156),
+                                        50: (0, 165),
+                                        51: (0, 168),
+                                        52: (0, 173),
+                                        53: (0, 178)},
+                                  172: {36: (1, {'@': 65}), 37: (1, {'@': 65}), 60: (0, 94)},
+                                  173: {0: (1, {'@': 127}),
+                                        1: (1, {'@': 127}),
+                                        5: (1, {'@': 127}),
+                                        9: (1, {'@': 127}),
+                                        14: (1, {'@': 127}),
+                                        21: (1, {'@': 127}),
+                                        23: (1, {'@': 127}),
+                                        24: (1, {'@': 127}),
+                                        25: (1, {'@': 127}),
+                                        26: (1, {'@': 127}),
+                                        27: (1, {'@': 127}),
+                                        28: (1, {'@': 127}),
+                                        29: (1, {'@': 127}),
+                                        30: (1, {'@': 127}),
+                                        31: (1, {'@': 127}),
+                                        32: (1, {'@': 127}),
+                                        33: (1, {'@': 127}),
+                                        34: (1, {'@': 127}),
+                                        35: (1, {'@': 127}),
+                                        36: (1, {'@': 127}),
+                                        37: (1, {'@': 127}),
+                                        59: (1, {'@': 127}),
+                                        60: (0, 43)},
+                                  174: {0: (1, {'@': 122}),
+                                        5: (1, {'@': 122}),
+                                        14: (1, {'@': 122}),
+                                        21: (1, {'@': 122}),
+                                        23: (1, {'@': 122}),
+                                        24: (1, {'@': 122}),
+                                        25: (1, {'@': 122}),
+                                        26: (1, {'@': 122}),
+                                        27: (1, {'@': 122}),
+                                        28: (1, {'@': 122}),
+                                        29: (1, {'@': 122}),
+                                        30: (1, {'@': 122}),
+                                        31: (1, {'@': 122}),
+                                        32: (1, {'@': 122}),
+                                        33: (1, {'@': 122}),
+                                        34: (1, {'@': 122}),
+                                        35: (1, {'@': 122}),
+                                        36: (1, {'@': 122}),
+                                        37: (1, {'@': 122})},
+                                  175: {1: (1, {'@': 138}),
+                                        2: (1, {'@': 138}),
+                                        3: (1, {'@': 138}),
+                                        4: (1, {'@': 138}),
+                                        5: (1, {'@': 138}),
+                                        6: (1, {'@': 138}),
+                                        7: (1, {'@': 138}),
+                                        8: (1, {'@': 138}),
+                                        9: (1, {'@': 138}),
+                                        10: (1, {'@': 138}),
+                                        11: (1, {'@': 138}),
+                                        12: (1, {'@': 138}),
+                                        13: (1, {'@': 138}),
+                                        14: (1, {'@': 138}),
+                                        15: (1, {'@': 138}),
+                                        16: (1, {'@': 138}),
+                                        17: (1, {'@': 138}),
+                                        18: (1, {'@': 138}),
+                                        19: (1, {'@': 138}),
+                                        20: (1, {'@': 138}),
+                                        21: (1, {'@': 138})},
+                                  176: {0: (1, {'@': 98}),
+                                        5: (1, {'@': 98}),
+                                        21: (1, {'@': 98}),
+                                        35: (1, {'@': 98}),
+                                        36: (1, {'@': 98}),
+                                        37: (1, {'@': 98})},
+                                  177: {1: (0, 148),
+                                        3: (0, 134),
+                                        6: (0, 34),
+                                        7: (0, 125),
+                                        9: (0, 186),
+                                        10: (0, 91),
+                                        11: (0, 96),
+                                        12: (0, 29),
+                                        14: (0, 161),
+                                        38: (0, 88),
+                                        40: (0, 102),
+                                        41: (0, 104),
+                                        42: (0, 109),
+                                        44: (0, 128),
+                                        46: (0, 137),
+                                        47: (0, 30),
+                                        49: (0, 156),
+                                        50: (0, 165),
+                                        51: (0, 168),
+                                        52: (0, 173),
+                                        53: (0, 178)},
+                                  178: {0: (1, {'@': 130}),
+                                        1: (1, {'@': 130}),
+                                        5: (1, {'@': 130}),
+                                        9: (1, {'@': 130}),
+                                        14: (1, {'@': 130}),
+                                        21: (1, {'@': 130}),
+                                        23: (1, {'@': 130}),
+                                        24: (1, {'@': 130}),
+                                        25: (1, {'@': 130}),
+                                        26: (1, {'@': 130}),
+                                        27: (1, {'@': 130}),
+                                        28: (1, {'@': 130}),
+                                        29: (1, {'@': 130}),
+                                        30: (1, {'@': 130}),
+                                        31: (1, {'@': 130}),
+                                        32: (1, {'@': 130}),
+                                        33: (1, {'@': 130}),
+                                        34: (1, {'@': 130}),
+                                        35: (1, {'@': 130}),
+                                        36: (1, {'@': 130}),
+                                        37: (1, {'@': 130}),
+                                        59: (1, {'@': 130}),
+                                        60: (1, {'@': 130})},
+                                  179: {1: (1, {'@': 84}),
+                                        2: (1, {'@': 84}),
+                                        3: (1, {'@': 84}),
+                                        4: (1, {'@': 84}),
+                                        5: (1, {'@': 84}),
+                                        6: (1, {'@': 84}),
+                                        7: (1, {'@': 84}),
+                                        8: (1, {'@': 84}),
+                                        9: (1, {'@': 84}),
+                                        10: (1, {'@': 84}),
+                                        11: (1, {'@': 84}),
+                                        12: (1, {'@': 84}),
+                                        13: (1, {'@': 84}),
+                                        14: (1, {'@': 84}),
+                                        15: (1, {'@': 84}),
+                                        16: (1, {'@': 84}),
+                                        17: (1, {'@': 84}),
+                                        18: (1, {'@': 84}),
+                                        19: (1, {'@': 84}),
+                                        20: (1, {'@': 84}),
+                                        21: (1, {'@': 84}),
+                                        22: (0, 10)},
+                                  180: {11: (1, {'@': 52})},
+                                  181: {0: (1, {'@': 115}),
+                                        5: (1, {'@': 115}),
+                                        14: (1, {'@': 115}),
+                                        21: (1, {'@': 115}),
+                                        23: (1, {'@': 115}),
+                                        24: (1, {'@': 115}),
+                                        25: (1, {'@': 115}),
+                                        26: (1, {'@': 115}),
+                                        27: (1, {'@': 115}),
+                                        28: (1, {'@': 115}),
+                                        29: (1, {'@': 115}),
+                                        30: (1, {'@': 115}),
+                                        31: (1, {'@': 115}),
+                                        32: (1, {'@': 115}),
+                                        33: (1, {'@': 115}),
+                                        34: (1, {'@': 115}),
+                                        35: (1, {'@': 115}),
+                                        36: (1, {'@': 115}),
+                                        37: (1, {'@': 115})},
+                                  182: {36: (0, 155), 37: (1, {'@': 62})},
+                                  183: {11: (1, {'@': 50})},
+                                  184: {0: (1, {'@': 119}),
+                                        5: (1, {'@': 119}),
+                                        14: (1, {'@': 119}),
+                                        21: (1, {'@': 119}),
+                                        23: (1, {'@': 119}),
+                                        24: (1, {'@': 119}),
+                                        25: (1, {'@': 119}),
+                                        26: (1, {'@': 119}),
+                                        27: (1, {'@': 119}),
+                                        28: (1, {'@': 119}),
+                                        29: (1, {'@': 119}),
+                                        30: (1, {'@': 119}),
+                                        31: (1, {'@': 119}),
+                                        32: (1, {'@': 119}),
+                                        33: (1, {'@': 119}),
+                                        34: (1, {'@': 119}),
+                                        35: (1, {'@': 119}),
+                                        36: (1, {'@': 119}),
+                                        37: (1, {'@': 119})},
+                                  185: {0: (1, {'@': 117}),
+                                        5: (1, {'@': 117}),
+                                        14: (1, {'@': 117}),
+                                        21: (1, {'@': 117}),
+                                        23: (1, {'@': 117}),
+                                        24: (1, {'@': 117}),
+                                        25: (1, {'@': 117}),
+                                        26: (1, {'@': 117}),
+                                        27: (1, {'@': 117}),
+                                        28: (1, {'@': 117}),
+                                        29: (1, {'@': 117}),
+                                        30: (1, {'@': 117}),
+                                        31: (1, {'@': 117}),
+                                        32: (1, {'@': 117}),
+                                        33: (1, {'@': 117}),
+                                        34: (1, {'@': 117}),
+                                        35: (1, {'@': 117}),
+                                        36: (1, {'@': 117}),
+                                        37: (1, {'@': 117})},
+                                  186: {1: (0, 148),
+                                        3: (0, 134),
+                                        6: (0, 34),
+                                        7: (0, 125),
+                                        9: (0, 186),
+                                        10: (0, 91),
+                                        11: (0, 130),
+                                        12: (0, 29),
+                                        14: (0, 161),
+                                        38: (0, 135),
+                                        49: (0, 174),
+                                        52: (0, 173),
+                                        53: (0, 178)}},
+                       'tokens': {0: 'SEMICOLON',
+                                  1: '__ANON_11',
+                                  2: 'FOR',
+                                  3: 'NULL',
+                                  4: '__ANON_0',
+                                  5: '$END',
+                                  6: 'BANG',
+                                  7: 'LPAR',
+                                  8: 'WHILE',
+                                  9: '__ANON_12',
+                                  10: 'CHAR',
+                                  11: 'VAR',
+                                  12: 'NUMBER',
+                                  13: 'RETURN',
+                                  14: 'MINUS',
+                                  15: 'VOID',
+                                  16: 'DO',
+                                  17: 'IF',
+                                  18: 'PRINTF',
+                                  19: 'INT',
+                                  20: 'LBRACE',
+                                  21: 'RBRACE',
+                                  22: 'ELSE',
+                                  23: '__ANON_9',
+                                  24: '__ANON_10',
+                                  25: '__ANON_8',
+                                  26: 'SLASH',
+                                  27: 'MORETHAN',
+                                  28: 'STAR',
+                                  29: '__ANON_5',
+                                  30: 'LESSTHAN',
+                                  31: 'PERCENT',
+                                  32: '__ANON_6',
+                                  33: 'PLUS',
+                                  34: '__ANON_7',
+                                  35: 'RSQB',
+                                  36: 'COMMA',
+                                  37: 'RPAR',
+                                  38: 'postfix',
+                                  39: 'do_while_stmt',
+                                  40: 'mul_expr',
+                                  41: 'rel_expr',
+                                  42: 'or_expr',
+                                  43: 'stmt',
+                                  44: 'assign_expr',
+                                  45: 'printf_stmt',
+                                  46: 'eq_expr',
+                                  47: 'expr',
+                                  48: 'if_stmt',
+                                  49: 'unary_expr',
+                                  50: 'add_expr',
+                                  51: 'and_expr',
+                                  52: 'call',
+                                  53: 'atom',
+                                  54: 'for_cmd',
+                                  55: 'expr_stmt',
+                                  56: 'block',
+                                  57: 'while_stmt',
+                                  58: 'return_stmt',
+                                  59: 'EQUAL',
+                                  60: 'LSQB',
+                                  61: '__array_init_star_1',
+                                  62: 'array_init',
+                                  63: 'call_params',
+                                  64: 'forincr',
+                                  65: 'param_list',
+                                  66: 'param',
+                                  67: 'type',
+                                  68: '__program_star_0',
+                                  69: 'program',
+                                  70: 'func_decl',
+                                  71: 'decl',
+                                  72: 'start',
+                                  73: 'var_decl',
+                                  74: 'forcond',
+                                  75: '__ANON_1',
+                                  76: '__ANON_3',
+                                  77: '__ANON_4',
+                                  78: '__ANON_2',
+                                  79: 'forinit',
+                                  80: '__param_list_star_2'}},
+            'parser_conf': {'__type__': 'ParserConf',
+                            'parser_type': 'lalr',
+                            'rules': [{'@': 44},
+                                      {'@': 45},
+                                      {'@': 46},
+                                      {'@': 47},
+                                      {'@': 48},
+                                      {'@': 49},
+                                      {'@': 50},
+                                      {'@': 51},
+                                      {'@': 52},
+                                      {'@': 53},
+                                      {'@': 54},
+                                      {'@': 55},
+                                      {'@': 56},
+                                      {'@': 57},
+                                      {'@': 58},
+                                      {'@': 59},
+                                      {'@': 60},
+                                      {'@': 61},
+                                      {'@': 62},
+                                      {'@': 63},
+                                      {'@': 64},
+                                      {'@': 65},
+                                      {'@': 66},
+                                      {'@': 67},
+                                      {'@': 68},
+                                      {'@': 69},
+                                      {'@': 70},
+                                      {'@': 71},
+                                      {'@': 72},
+                                      {'@': 73},
+                                      {'@': 74},
+                                      {'@': 75},
+                                      {'@': 76},
+                                      {'@': 77},
+                                      {'@': 78},
+                                      {'@': 79},
+                                      {'@': 80},
+                                      {'@': 81},
+                                      {'@': 82},
+                                      {'@': 83},
+                                      {'@': 84},
+                                      {'@': 85},
+                                      {'@': 86},
+                                      {'@': 87},
+                                      {'@': 88},
+                                      {'@': 89},
+                                      {'@': 90},
+                                      {'@': 91},
+                                      {'@': 92},
+                                      {'@': 93},
+                                      {'@': 94},
+                                      {'@': 95},
+                                      {'@': 96},
+                                      {'@': 97},
+                                      {'@': 98},
+                                      {'@': 99},
+                                      {'@': 100},
+                                      {'@': 101},
+                                      {'@': 102},
+                                      {'@': 103},
+                                      {'@': 104},
+                                      {'@': 105},
+                                      {'@': 106},
+                                      {'@': 107},
+                                      {'@': 108},
+                                      {'@': 109},
+                                      {'@': 110},
+                                      {'@': 111},
+                                      {'@': 112},
+                                      {'@': 113},
+                                      {'@': 114},
+                                      {'@': 115},
+                                      {'@': 116},
+                                      {'@': 117},
+                                      {'@': 118},
+                                      {'@': 119},
+                                      {'@': 120},
+                                      {'@': 121},
+                                      {'@': 122},
+                                      {'@': 123},
+                                      {'@': 124},
+                                      {'@': 125},
+                                      {'@': 126},
+                                      {'@': 127},
+                                      {'@': 128},
+                                      {'@': 129},
+                                      {'@': 130},
+                                      {'@': 131},
+                                      {'@': 132},
+                                      {'@': 133},
+                                      {'@': 134},
+                                      {'@': 135},
+                                      {'@': 136},
+                                      {'@': 137},
+                                      {'@': 138},
+                                      {'@': 139},
+                                      {'@': 140},
+                                      {'@': 141},
+                                      {'@': 142},
+                                      {'@': 143}],
+                            'start': ['start', 'expr']}},
+ 'rules': [{'@': 44},
+           {'@': 45},
+           {'@': 46},
+           {'@': 47},
+           {'@': 48},
+           {'@': 49},
+           {'@': 50},
+           {'@': 51},
+           {'@': 52},
+           {'@': 53},
+           {'@': 54},
+           {'@': 55},
+           {'@': 56},
+           {'@': 57},
+           {'@': 58},
+           {'@': 59},
+           {'@': 60},
+           {'@': 61},
+           {'@': 62},
+           {'@': 63},
+           {'@': 64},
+           {'@': 65},
+           {'@': 66},
+           {'@': 67},
+           {'@': 68},
+           {'@': 69},
+           {'@': 70},
+           {'@': 71},
+           {'@': 72},
+           {'@': 73},
+           {'@': 74},
+           {'@': 75},
+           {'@': 76},
+           {'@': 77},
+           {'@': 78},
+           {'@': 79},
+           {'@': 80},
+           {'@': 81},
+           {'@': 82},
+           {'@': 83},
+           {'@': 84},
+           {'@': 85},
+           {'@': 86},
+           {'@': 87},
+           {'@': 88},
+           {'@': 89},
+           {'@': 90},
+           {'@': 91},
+           {'@': 92},
+           {'@': 93},
+           {'@': 94},
+           {'@': 95},
+           {'@': 96},
+           {'@': 97},
+           {'@': 98},
+           {'@': 99},
+           {'@': 100},
+           {'@': 101},
+           {'@': 102},
+           {'@': 103},
+           {'@': 104},
+           {'@': 105},
+           {'@': 106},
+           {'@': 107},
+           {'@': 108},
+           {'@': 109},
+           {'@': 110},
+           {'@': 111},
+           {'@': 112},
+           {'@': 113},
+           {'@': 114},
+           {'@': 115},
+           {'@': 116},
+           {'@': 117},
+           {'@': 118},
+           {'@': 119},
+           {'@': 120},
+           {'@': 121},
+           {'@': 122},
+           {'@': 123},
+           {'@': 124},
+           {'@': 125},
+           {'@': 126},
+           {'@': 127},
+           {'@': 128},
+           {'@': 129},
+           {'@': 130},
+           {'@': 131},
+           {'@': 132},
+           {'@': 133},
+           {'@': 134},
+           {'@': 135},
+           {'@': 136},
+           {'@': 137},
+           {'@': 138},
+           {'@': 139},
+           {'@': 140},
+           {'@': 141},
+           {'@': 142},
+           {'@': 143}]}
+
+MEMO = {0: {'__type__': 'TerminalDef',
+     'name': 'NULL',
+     'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': 'NULL'},
+     'priority': 1},
+ 1: {'__type__': 'TerminalDef',
+     'name': 'VAR',
+     'pattern': {'__type__': 'PatternRE',
+                 '_width': [1, 18446744073709551616],
+                 'flags': [],
+                 'value': '[a-zA-Z_]\\w*'},
+     'priority': 1},
+ 2: {'__type__': 'TerminalDef',
+     'name': 'NUMBER',
+     'pattern': {'__type__': 'PatternRE',
+                 '_width': [1, 18446744073709551616],
+                 'flags': [],
+                 'value': '([1-9][0-9]*|0)'},
+     'priority': 1},
+ 3: {'__type__': 'TerminalDef',
+     'name': 'CHAR',
+     'pattern': {'__type__': 'PatternRE',
+                 '_width': [3, 4],
+                 'flags': [],
+                 'value': "'(\\\\.|[^\\\\'])'"},
+     'priority': 1},
+ 4: {'__type__': 'TerminalDef',
+     'name': '__IGNORE_0',
+     'pattern': {'__type__': 'PatternRE',
+                 '_width': [1, 18446744073709551616],
+                 'flags': [],
+                 'value': '(?:\\/\\*[\\s\\S]*?\\*\\/|//[^\n]*|\\s)'},
+     'priority': 1},
+ 5: {'__type__': 'TerminalDef',
+     'name': 'INT',
+     'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': 'int'},
+     'priority': 1},
+ 6: {'__type__': 'TerminalDef',
+     'name': '__ANON_0',
+     'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': 'char'},
+     'priority': 1},
+ 7: {'__type__': 'TerminalDef',
+     'name': 'VOID',
+     'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': 'void'},
+     'priority': 1},
+ 8: {'__type__': 'TerminalDef',
+     'name': 'EQUAL',
+     'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '='},
+     'priority': 1},
+ 9: {'__type__': 'TerminalDef',
+     'name': 'LBRACE',
+     'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '{'},
+     'priority': 1},
+ 10: {'__type__': 'TerminalDef',
+      'name': 'RBRACE',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '}'},
+      'priority': 1},
+ 11: {'__type__': 'TerminalDef',
+      'name': 'LSQB',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '['},
+      'priority': 1},
+ 12: {'__type__': 'TerminalDef',
+      'name': 'RSQB',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': ']'},
+      'priority': 1},
+ 13: {'__type__': 'TerminalDef',
+      'name': 'SEMICOLON',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': ';'},
+      'priority': 1},
+ 14: {'__type__': 'TerminalDef',
+      'name': 'COMMA',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': ','},
+      'priority': 1},
+ 15: {'__type__': 'TerminalDef',
+      'name': 'LPAR',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '('},
+      'priority': 1},
+ 16: {'__type__': 'TerminalDef',
+      'name': 'RPAR',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': ')'},
+      'priority': 1},
+ 17: {'__type__': 'TerminalDef',
+      'name': 'FOR',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': 'for'},
+      'priority': 1},
+ 18: {'__type__': 'TerminalDef',
+      'name': 'ELSE',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': 'else'},
+      'priority': 1},
+ 19: {'__type__': 'TerminalDef',
+      'name': 'IF',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': 'if'},
+      'priority': 1},
+ 20: {'__type__': 'TerminalDef',
+      'name': 'WHILE',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': 'while'},
+      'priority': 1},
+ 21: {'__type__': 'TerminalDef',
+      'name': 'DO',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': 'do'},
+      'priority': 1},
+ 22: {'__type__': 'TerminalDef',
+      'name': 'RETURN',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': 'return'},
+      'priority': 1},
+ 23: {'__type__': 'TerminalDef',
+      'name': 'PRINTF',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': 'printf'},
+      'priority': 1},
+ 24: {'__type__': 'TerminalDef',
+      'name': '__ANON_1',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '+='},
+      'priority': 1},
+ 25: {'__type__': 'TerminalDef',
+      'name': '__ANON_2',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '-='},
+      'priority': 1},
+ 26: {'__type__': 'TerminalDef',
+      'name': '__ANON_3',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '*='},
+      'priority': 1},
+ 27: {'__type__': 'TerminalDef',
+      'name': '__ANON_4',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '/='},
+      'priority': 1},
+ 28: {'__type__': 'TerminalDef',
+      'name': '__ANON_5',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '||'},
+      'priority': 1},
+ 29: {'__type__': 'TerminalDef',
+      'name': '__ANON_6',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '&&'},
+      'priority': 1},
+ 30: {'__type__': 'TerminalDef',
+      'name': '__ANON_7',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '=='},
+      'priority': 1},
+ 31: {'__type__': 'TerminalDef',
+      'name': '__ANON_8',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '!='},
+      'priority': 1},
+ 32: {'__type__': 'TerminalDef',
+      'name': 'MORETHAN',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '>'},
+      'priority': 1},
+ 33: {'__type__': 'TerminalDef',
+      'name': 'LESSTHAN',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '<'},
+      'priority': 1},
+ 34: {'__type__': 'TerminalDef',
+      'name': '__ANON_9',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '>='},
+      'priority': 1},
+ 35: {'__type__': 'TerminalDef',
+      'name': '__ANON_10',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '<='},
+      'priority': 1},
+ 36: {'__type__': 'TerminalDef',
+      'name': 'PLUS',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '+'},
+      'priority': 1},
+ 37: {'__type__': 'TerminalDef',
+      'name': 'MINUS',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '-'},
+      'priority': 1},
+ 38: {'__type__': 'TerminalDef',
+      'name': 'STAR',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '*'},
+      'priority': 1},
+ 39: {'__type__': 'TerminalDef',
+      'name': 'SLASH',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '/'},
+      'priority': 1},
+ 40: {'__type__': 'TerminalDef',
+      'name': 'PERCENT',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '%'},
+      'priority': 1},
+ 41: {'__type__': 'TerminalDef',
+      'name': 'BANG',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '!'},
+      'priority': 1},
+ 42: {'__type__': 'TerminalDef',
+      'name': '__ANON_11',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '++'},
+      'priority': 1},
+ 43: {'__type__': 'TerminalDef',
+      'name': '__ANON_12',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'value': '--'},
+      'priority': 1},
+ 44: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'program'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'start'}},
+ 45: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': '__program_star_0'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'program'}},
+ 46: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'program'}},
+ 47: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'var_decl'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'decl'}},
+ 48: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'func_decl'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'decl'}},
+ 49: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'stmt'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 2,
+      'origin': {'__type__': 'NonTerminal', 'name': 'decl'}},
+ 50: {'__type__': 'Rule',
+      'alias': 'type_int',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'INT'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'type'}},
+ 51: {'__type__': 'Rule',
+      'alias': 'type_char',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': '__ANON_0'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'type'}},
+ 52: {'__type__': 'Rule',
+      'alias': 'type_void',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'VOID'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 2,
+      'origin': {'__type__': 'NonTerminal', 'name': 'type'}},
+ 53: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'type'},
+                    {'__type__': 'Terminal', 'filter_out': False, 'name': 'VAR'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'EQUAL'},
+                    {'__type__': 'NonTerminal', 'name': 'expr'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'SEMICOLON'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'var_decl'}},
+ 54: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'type'},
+                    {'__type__': 'Terminal', 'filter_out': False, 'name': 'VAR'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'SEMICOLON'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'var_decl'}},
+ 55: {'__type__': 'Rule',
+      'alias': 'array_decl',
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'type'},
+                    {'__type__': 'Terminal', 'filter_out': False, 'name': 'VAR'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LSQB'},
+                    {'__type__': 'Terminal', 'filter_out': False, 'name': 'NUMBER'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RSQB'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'EQUAL'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LBRACE'},
+                    {'__type__': 'NonTerminal', 'name': 'array_init'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RBRACE'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'SEMICOLON'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 2,
+      'origin': {'__type__': 'NonTerminal', 'name': 'var_decl'}},
+ 56: {'__type__': 'Rule',
+      'alias': 'array_decl',
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'type'},
+                    {'__type__': 'Terminal', 'filter_out': False, 'name': 'VAR'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LSQB'},
+                    {'__type__': 'Terminal', 'filter_out': False, 'name': 'NUMBER'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RSQB'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'EQUAL'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LBRACE'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RBRACE'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'SEMICOLON'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': [False,
+                                    False,
+                                    False,
+                                    False,
+                                    False,
+                                    False,
+                                    False,
+                                    True,
+                                    False,
+                                    False],
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 3,
+      'origin': {'__type__': 'NonTerminal', 'name': 'var_decl'}},
+ 57: {'__type__': 'Rule',
+      'alias': 'array_decl',
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'type'},
+                    {'__type__': 'Terminal', 'filter_out': False, 'name': 'VAR'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LSQB'},
+                    {'__type__': 'Terminal', 'filter_out': False, 'name': 'NUMBER'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RSQB'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'SEMICOLON'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 4,
+      'origin': {'__type__': 'NonTerminal', 'name': 'var_decl'}},
+ 58: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'expr'},
+                    {'__type__': 'NonTerminal', 'name': '__array_init_star_1'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'array_init'}},
+ 59: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'expr'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'array_init'}},
+ 60: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'type'},
+                    {'__type__': 'Terminal', 'filter_out': False, 'name': 'VAR'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LPAR'},
+                    {'__type__': 'NonTerminal', 'name': 'param_list'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RPAR'},
+                    {'__type__': 'NonTerminal', 'name': 'block'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'func_decl'}},
+ 61: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'type'},
+                    {'__type__': 'Terminal', 'filter_out': False, 'name': 'VAR'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LPAR'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RPAR'},
+                    {'__type__': 'NonTerminal', 'name': 'block'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': [False, False, False, True, False, False],
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'func_decl'}},
+ 62: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'param'},
+                    {'__type__': 'NonTerminal', 'name': '__param_list_star_2'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'param_list'}},
+ 63: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'param'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'param_list'}},
+ 64: {'__type__': 'Rule',
+      'alias': 'array_param',
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'type'},
+                    {'__type__': 'Terminal', 'filter_out': False, 'name': 'VAR'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LSQB'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RSQB'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'param'}},
+ 65: {'__type__': 'Rule',
+      'alias': 'simple_param',
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'type'},
+                    {'__type__': 'Terminal', 'filter_out': False, 'name': 'VAR'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'param'}},
+ 66: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'expr_stmt'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'stmt'}},
+ 67: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'if_stmt'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'stmt'}},
+ 68: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'while_stmt'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 2,
+      'origin': {'__type__': 'NonTerminal', 'name': 'stmt'}},
+ 69: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'do_while_stmt'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 3,
+      'origin': {'__type__': 'NonTerminal', 'name': 'stmt'}},
+ 70: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'for_cmd'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 4,
+      'origin': {'__type__': 'NonTerminal', 'name': 'stmt'}},
+ 71: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'block'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 5,
+      'origin': {'__type__': 'NonTerminal', 'name': 'stmt'}},
+ 72: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'return_stmt'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 6,
+      'origin': {'__type__': 'NonTerminal', 'name': 'stmt'}},
+ 73: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'printf_stmt'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 7,
+      'origin': {'__type__': 'NonTerminal', 'name': 'stmt'}},
+ 74: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'FOR'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LPAR'},
+                    {'__type__': 'NonTerminal', 'name': 'forinit'},
+                    {'__type__': 'NonTerminal', 'name': 'forcond'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'SEMICOLON'},
+                    {'__type__': 'NonTerminal', 'name': 'forincr'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RPAR'},
+                    {'__type__': 'NonTerminal', 'name': 'stmt'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'for_cmd'}},
+ 75: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'var_decl'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'forinit'}},
+ 76: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'expr_stmt'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'forinit'}},
+ 77: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'SEMICOLON'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 2,
+      'origin': {'__type__': 'NonTerminal', 'name': 'forinit'}},
+ 78: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'expr'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'forcond'}},
+ 79: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'forcond'}},
+ 80: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'expr'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'forincr'}},
+ 81: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'forincr'}},
+ 82: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'expr'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'SEMICOLON'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'expr_stmt'}},
+ 83: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'IF'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LPAR'},
+                    {'__type__': 'NonTerminal', 'name': 'expr'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RPAR'},
+                    {'__type__': 'NonTerminal', 'name': 'stmt'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'ELSE'},
+                    {'__type__': 'NonTerminal', 'name': 'stmt'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'if_stmt'}},
+ 84: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'IF'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LPAR'},
+                    {'__type__': 'NonTerminal', 'name': 'expr'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RPAR'},
+                    {'__type__': 'NonTerminal', 'name': 'stmt'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'if_stmt'}},
+ 85: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'WHILE'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LPAR'},
+                    {'__type__': 'NonTerminal', 'name': 'expr'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RPAR'},
+                    {'__type__': 'NonTerminal', 'name': 'stmt'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'while_stmt'}},
+ 86: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'DO'},
+                    {'__type__': 'NonTerminal', 'name': 'stmt'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'WHILE'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LPAR'},
+                    {'__type__': 'NonTerminal', 'name': 'expr'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RPAR'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'SEMICOLON'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'do_while_stmt'}},
+ 87: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'LBRACE'},
+                    {'__type__': 'NonTerminal', 'name': '__program_star_0'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RBRACE'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'block'}},
+ 88: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'LBRACE'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RBRACE'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'block'}},
+ 89: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'RETURN'},
+                    {'__type__': 'NonTerminal', 'name': 'expr'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'SEMICOLON'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'return_stmt'}},
+ 90: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'RETURN'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'SEMICOLON'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'return_stmt'}},
+ 91: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'PRINTF'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LPAR'},
+                    {'__type__': 'NonTerminal', 'name': 'expr'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RPAR'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'SEMICOLON'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'printf_stmt'}},
+ 92: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'assign_expr'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'expr'}},
+ 93: {'__type__': 'Rule',
+      'alias': 'set',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'VAR'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'EQUAL'},
+                    {'__type__': 'NonTerminal', 'name': 'assign_expr'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'assign_expr'}},
+ 94: {'__type__': 'Rule',
+      'alias': 'iadd',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'VAR'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': '__ANON_1'},
+                    {'__type__': 'NonTerminal', 'name': 'assign_expr'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'assign_expr'}},
+ 95: {'__type__': 'Rule',
+      'alias': 'isub',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'VAR'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': '__ANON_2'},
+                    {'__type__': 'NonTerminal', 'name': 'assign_expr'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 2,
+      'origin': {'__type__': 'NonTerminal', 'name': 'assign_expr'}},
+ 96: {'__type__': 'Rule',
+      'alias': 'imul',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'VAR'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': '__ANON_3'},
+                    {'__type__': 'NonTerminal', 'name': 'assign_expr'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 3,
+      'origin': {'__type__': 'NonTerminal', 'name': 'assign_expr'}},
+ 97: {'__type__': 'Rule',
+      'alias': 'itruediv',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'VAR'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': '__ANON_4'},
+                    {'__type__': 'NonTerminal', 'name': 'assign_expr'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 4,
+      'origin': {'__type__': 'NonTerminal', 'name': 'assign_expr'}},
+ 98: {'__type__': 'Rule',
+      'alias': 'set',
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'postfix'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'EQUAL'},
+                    {'__type__': 'NonTerminal', 'name': 'assign_expr'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 5,
+      'origin': {'__type__': 'NonTerminal', 'name': 'assign_expr'}},
+ 99: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'or_expr'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 6,
+      'origin': {'__type__': 'NonTerminal', 'name': 'assign_expr'}},
+ 100: {'__type__': 'Rule',
+       'alias': 'or_',
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'or_expr'},
+                     {'__type__': 'Terminal', 'filter_out': True, 'name': '__ANON_5'},
+                     {'__type__': 'NonTerminal', 'name': 'and_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'or_expr'}},
+ 101: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'and_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': 'or_expr'}},
+ 102: {'__type__': 'Rule',
+       'alias': 'and_',
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'and_expr'},
+                     {'__type__': 'Terminal', 'filter_out': True, 'name': '__ANON_6'},
+                     {'__type__': 'NonTerminal', 'name': 'eq_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'and_expr'}},
+ 103: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'eq_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': 'and_expr'}},
+ 104: {'__type__': 'Rule',
+       'alias': 'eq',
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'eq_expr'},
+                     {'__type__': 'Terminal', 'filter_out': True, 'name': '__ANON_7'},
+                     {'__type__': 'NonTerminal', 'name': 'rel_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'eq_expr'}},
+ 105: {'__type__': 'Rule',
+       'alias': 'ne',
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'eq_expr'},
+                     {'__type__': 'Terminal', 'filter_out': True, 'name': '__ANON_8'},
+                     {'__type__': 'NonTerminal', 'name': 'rel_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': 'eq_expr'}},
+ 106: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'rel_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 2,
+       'origin': {'__type__': 'NonTerminal', 'name': 'eq_expr'}},
+ 107: {'__type__': 'Rule',
+       'alias': 'gt',
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'rel_expr'},
+                     {'__type__': 'Terminal', 'filter_out': True, 'name': 'MORETHAN'},
+                     {'__type__': 'NonTerminal', 'name': 'add_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'rel_expr'}},
+ 108: {'__type__': 'Rule',
+       'alias': 'lt',
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'rel_expr'},
+                     {'__type__': 'Terminal', 'filter_out': True, 'name': 'LESSTHAN'},
+                     {'__type__': 'NonTerminal', 'name': 'add_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': 'rel_expr'}},
+ 109: {'__type__': 'Rule',
+       'alias': 'ge',
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'rel_expr'},
+                     {'__type__': 'Terminal', 'filter_out': True, 'name': '__ANON_9'},
+                     {'__type__': 'NonTerminal', 'name': 'add_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 2,
+       'origin': {'__type__': 'NonTerminal', 'name': 'rel_expr'}},
+ 110: {'__type__': 'Rule',
+       'alias': 'le',
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'rel_expr'},
+                     {'__type__': 'Terminal', 'filter_out': True, 'name': '__ANON_10'},
+                     {'__type__': 'NonTerminal', 'name': 'add_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 3,
+       'origin': {'__type__': 'NonTerminal', 'name': 'rel_expr'}},
+ 111: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'add_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 4,
+       'origin': {'__type__': 'NonTerminal', 'name': 'rel_expr'}},
+ 112: {'__type__': 'Rule',
+       'alias': 'add',
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'add_expr'},
+                     {'__type__': 'Terminal', 'filter_out': True, 'name': 'PLUS'},
+                     {'__type__': 'NonTerminal', 'name': 'mul_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'add_expr'}},
+ 113: {'__type__': 'Rule',
+       'alias': 'sub',
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'add_expr'},
+                     {'__type__': 'Terminal', 'filter_out': True, 'name': 'MINUS'},
+                     {'__type__': 'NonTerminal', 'name': 'mul_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': 'add_expr'}},
+ 114: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'mul_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 2,
+       'origin': {'__type__': 'NonTerminal', 'name': 'add_expr'}},
+ 115: {'__type__': 'Rule',
+       'alias': 'mul',
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'mul_expr'},
+                     {'__type__': 'Terminal', 'filter_out': True, 'name': 'STAR'},
+                     {'__type__': 'NonTerminal', 'name': 'unary_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'mul_expr'}},
+ 116: {'__type__': 'Rule',
+       'alias': 'div',
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'mul_expr'},
+                     {'__type__': 'Terminal', 'filter_out': True, 'name': 'SLASH'},
+                     {'__type__': 'NonTerminal', 'name': 'unary_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': 'mul_expr'}},
+ 117: {'__type__': 'Rule',
+       'alias': 'mod',
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'mul_expr'},
+                     {'__type__': 'Terminal', 'filter_out': True, 'name': 'PERCENT'},
+                     {'__type__': 'NonTerminal', 'name': 'unary_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 2,
+       'origin': {'__type__': 'NonTerminal', 'name': 'mul_expr'}},
+ 118: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'unary_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 3,
+       'origin': {'__type__': 'NonTerminal', 'name': 'mul_expr'}},
+ 119: {'__type__': 'Rule',
+       'alias': 'not_',
+       'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'BANG'},
+                     {'__type__': 'NonTerminal', 'name': 'unary_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'unary_expr'}},
+ 120: {'__type__': 'Rule',
+       'alias': 'neg',
+       'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'MINUS'},
+                     {'__type__': 'NonTerminal', 'name': 'unary_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': 'unary_expr'}},
+ 121: {'__type__': 'Rule',
+       'alias': 'preinc',
+       'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': '__ANON_11'},
+                     {'__type__': 'NonTerminal', 'name': 'unary_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 2,
+       'origin': {'__type__': 'NonTerminal', 'name': 'unary_expr'}},
+ 122: {'__type__': 'Rule',
+       'alias': 'predec',
+       'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': '__ANON_12'},
+                     {'__type__': 'NonTerminal', 'name': 'unary_expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 3,
+       'origin': {'__type__': 'NonTerminal', 'name': 'unary_expr'}},
+ 123: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'postfix'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 4,
+       'origin': {'__type__': 'NonTerminal', 'name': 'unary_expr'}},
+ 124: {'__type__': 'Rule',
+       'alias': 'postinc',
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'postfix'},
+                     {'__type__': 'Terminal', 'filter_out': True, 'name': '__ANON_11'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'postfix'}},
+ 125: {'__type__': 'Rule',
+       'alias': 'postdec',
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'postfix'},
+                     {'__type__': 'Terminal', 'filter_out': True, 'name': '__ANON_12'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': 'postfix'}},
+ 126: {'__type__': 'Rule',
+       'alias': 'array_access',
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'call'},
+                     {'__type__': 'Terminal', 'filter_out': True, 'name': 'LSQB'},
+                     {'__type__': 'NonTerminal', 'name': 'expr'},
+                     {'__type__': 'Terminal', 'filter_out': True, 'name': 'RSQB'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 2,
+       'origin': {'__type__': 'NonTerminal', 'name': 'postfix'}},
+ 127: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'call'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 3,
+       'origin': {'__type__': 'NonTerminal', 'name': 'postfix'}},
+ 128: {'__type__': 'Rule',
+       'alias': 'call',
+       'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'VAR'},
+                     {'__type__': 'Terminal', 'filter_out': True, 'name': 'LPAR'},
+                     {'__type__': 'NonTerminal', 'name': 'call_params'},
+                     {'__type__': 'Terminal', 'filter_out': True, 'name': 'RPAR'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'call'}},
+ 129: {'__type__': 'Rule',
+       'alias': 'call',
+       'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'VAR'},
+                     {'__type__': 'Terminal', 'filter_out': True, 'name': 'LPAR'},
+                     {'__type__': 'Terminal', 'filter_out': True, 'name': 'RPAR'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': [False, False, True, False],
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': 'call'}},
+ 130: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'atom'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 2,
+       'origin': {'__type__': 'NonTerminal', 'name': 'call'}},
+ 131: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'expr'},
+                     {'__type__': 'NonTerminal', 'name': '__array_init_star_1'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'call_params'}},
+ 132: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': 'call_params'}},
+ 133: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'NUMBER'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'atom'}},
+ 134: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'CHAR'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': 'atom'}},
+ 135: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'NULL'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 2,
+       'origin': {'__type__': 'NonTerminal', 'name': 'atom'}},
+ 136: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'VAR'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 3,
+       'origin': {'__type__': 'NonTerminal', 'name': 'atom'}},
+ 137: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'LPAR'},
+                     {'__type__': 'NonTerminal', 'name': 'expr'},
+                     {'__type__': 'Terminal', 'filter_out': True, 'name': 'RPAR'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 4,
+       'origin': {'__type__': 'NonTerminal', 'name': 'atom'}},
+ 138: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'decl'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': '__program_star_0'}},
+ 139: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': '__program_star_0'},
+                     {'__type__': 'NonTerminal', 'name': 'decl'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': '__program_star_0'}},
+ 140: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'COMMA'},
+                     {'__type__': 'NonTerminal', 'name': 'expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': '__array_init_star_1'}},
+ 141: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': '__array_init_star_1'},
+                     {'__type__': 'Terminal', 'filter_out': True, 'name': 'COMMA'},
+                     {'__type__': 'NonTerminal', 'name': 'expr'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': '__array_init_star_1'}},
+ 142: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'COMMA'},
+                     {'__type__': 'NonTerminal', 'name': 'param'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': '__param_list_star_2'}},
+ 143: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': '__param_list_star_2'},
+                     {'__type__': 'Terminal', 'filter_out': True, 'name': 'COMMA'},
+                     {'__type__': 'NonTerminal', 'name': 'param'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': '__param_list_star_2'}}}
@@ -0,0 +1,298 @@
+"""
+Execução de programas MicroC dentro de um laço asyncio.
+
+`Program.eval` roda o programa inteiro numa única chamada e bloquearia o
+laço de eventos. A função `aeval` usa um avaliador alternativo, escrito com
+geradores, que pausa a execução a cada passo. Depois de `step_budget`
+passos, ela devolve o controle ao laço (`await asyncio.sleep(0)`), de forma
+que vários programas podem ser executados de maneira justa no mesmo laço,
+sem threads.
+
+Um passo é a execução de um comando, uma iteração de laço ou a entrada numa
+função MicroC. Subárvores sem chamadas nem laços (a maior parte das
+expressões e muitos comandos) são avaliadas de uma vez com o `eval` normal;
+apenas o caminho até chamadas e laços passa pelos geradores. A semântica de
+cada nó continua em `ast.py`: os geradores avaliam os filhos e delegam aos
+mesmos métodos (`assign`, `define`, `write`, ...) usados pelo `eval`.
+"""
+
+import asyncio
+from typing import Callable, Generator, Optional
+
+from .ast import (
+    And,
+    ArrayAccess,
+    ArrayAssign,
+    ArrayDef,
+    Assign,
+    BinOp,
+    Block,
+    Call,
+    Function,
+    If,
+    Or,
+    Printf,
+    Program,
+    Return,
+    UnaryOp,
+    Value,
+    VarDef,
+    While,
+)
+from .ctx import Ctx
+from .node import Node
+from .parser import parse
+from .positions import locate
+from .runtime import McFunction, McReturn
+
+__all__ = ["aeval", "DEFAULT_STEP_BUDGET"]
+
+DEFAULT_STEP_BUDGET = 1000
+
+Steps = Generator[None, None, Value]
+
+
+async def aeval(
+    src: str | Node,
+    env: Ctx | dict[str, Value] | None = None,
+    step_budget: int = DEFAULT_STEP_BUDGET,
+    timeout: Optional[float] = None,
+    deadline: Optional[float] = None,
+    skip_validation: bool = False,
+    auto_execute_main: bool = False,
+) -> Value:
+    """
+    Versão assíncrona de `microC.eval`.
+
+    Executa o programa em fatias de `step_budget` passos, devolvendo o
+    controle ao laço de eventos entre as fatias. A tarefa pode ser cancelada
+    normalmente; o cancelamento é percebido na próxima pausa.
+
+    Args:
+        src, env, skip_validation, auto_execute_main:
+            Como em `microC.eval`.
+        step_budget:
+            Número de passos executados antes de ceder o controle.
+        timeout:
+            Tempo máximo de execução, em segundos.
+        deadline:
+            Instante limite, no relógio do laço (`loop.time()`). Se `timeout`
+            também for dado, vale o que terminar antes.
+
+    Raises:
+        asyncio.TimeoutError:
+            Se o prazo terminar antes do programa. O prazo é verificado
+            entre as fatias.
+    """
+    if step_budget < 1:
+        raise ValueError("step_budget deve ser positivo")
+    if env is None:
+        env = Ctx.from_dict({})
+    elif not isinstance(env, Ctx):
+        env = Ctx.from_dict(env)
+    ast = src if isinstance(src, Node) else parse(src)
+    if not skip_validation:
+        ast.validate_tree()
+
+    loop = asyncio.get_running_loop()
+    if timeout is not None:
+        limit = loop.time() + timeout
+        deadline = limit if deadline is None else min(deadline, limit)
+
+    if isinstance(ast, Program):
+        steps = Stepper(ast).program(ast, env, auto_execute_main)
+    else:
+        steps = Stepper(ast).run(ast, env)
+    try:
+        while True:
+            try:
+                for _ in range(step_budget):
+                    next(steps)
+            except StopIteration as stop:
+                return stop.value
+            if deadline is not None and loop.time() >= deadline:
+                raise asyncio.TimeoutError("prazo de execução esgotado")
+            await asyncio.sleep(0)
+    except Exception as exc:
+        locate(exc, ast)
+        raise
+    finally:
+        steps.close()
+        env.output.flush()
+
+
+class Stepper:
+    """
+    Avaliador passo a passo de uma árvore.
+
+    Cada método gerador produz `None` a cada passo e retorna o valor do nó.
+    """
+
+    def __init__(self, tree: Node):
+        self.suspends: dict[int, bool] = {}
+        self._mark(tree)
+        self.handlers: dict[type, Callable[[Node, Ctx], Steps]] = {
+            Block: self.block,
+            While: self.while_,
+            If: self.if_,
+            Return: self.return_,
+            Printf: self.printf,
+            VarDef: self.var_def,
+            ArrayDef: self.array_def,
+            Call: self.call,
+            Assign: self.assign,
+            BinOp: self.bin_op,
+            And: self.and_,
+            Or: self.or_,
+            UnaryOp: self.unary_op,
+            ArrayAccess: self.array_access,
+            ArrayAssign: self.array_assign,
+        }
+
+    def _mark(self, node: Node) -> bool:
+        """
+        Marca os nós cuja avaliação pode pausar: os que contêm chamadas ou
+        laços. A definição de uma função não executa o corpo e nunca pausa.
+        """
+        suspends = False
+        for child in node.children():
+            suspends = self._mark(child) or suspends
+        if isinstance(node, Function):
+            suspends = False
+        elif isinstance(node, (Call, While)):
+            suspends = True
+        self.suspends[id(node)] = suspends
+        return suspends
+
+    def run(self, node: Node, ctx: Ctx) -> Steps:
+        """
+        Avalia um nó, passo a passo se ele puder pausar.
+        """
+        if not self.suspends.get(id(node), True):
+            return node.eval(ctx)
+        handler = self.handlers.get(type(node))
+        if handler is None:
+            # Nós desconhecidos (ex.: criados por extensões) são atômicos
+            return node.eval(ctx)
+        return (yield from handler(node, ctx))
+
+    def statements(self, stmts, ctx: Ctx) -> Steps:
+        for stmt in stmts:
+            yield
+            yield from self.run(stmt, ctx)
+
+    def program(self, node: Program, ctx: Ctx, auto_execute_main: bool) -> Steps:
+        yield from self.statements(node.stmts, ctx)
+        if auto_execute_main:
+            main_entry = ctx.scope.get("main")
+            if main_entry is not None and isinstance(main_entry[1], McFunction):
+                return (yield from self.call_function(main_entry[1], []))
+
+    def call_function(self, func: McFunction, args: list[Value]) -> Steps:
+        if type(func) is not McFunction:
+            # Funções observadas pelo profiler ou tracer executam de uma vez
+            return func(*args)
+        local_ctx = func.enter(args)
+        limits = local_ctx.limits
+        yield
+        try:
+            if limits is not None:
+                limits.enter(func)
+            for stmt in func.body:
+                yield
+                yield from self.run(stmt, local_ctx)
+        except McReturn as e:
+            return e.value
+        finally:
+            if limits is not None:
+                limits.leave()
+        return None
+
+    def block(self, node: Block, ctx: Ctx) -> Steps:
+        limits = ctx.limits
+        if limits is None:
+            return (yield from self.statements(node.stmts, ctx.push({})))
+        mark = limits.memory
+        try:
+            yield from self.statements(node.stmts, ctx.push({}))
+        finally:
+            limits.memory = mark
+
+    def while_(self, node: While, ctx: Ctx) -> Steps:
+        limits = ctx.limits
+        weight = node.weight if limits is not None else 0
+        while (yield from self.run(node.expr, ctx)):
+            yield
+            if limits is not None:
+                limits.tick(weight)
+            yield from self.run(node.stmt, ctx)
+
+    def if_(self, node: If, ctx: Ctx) -> Steps:
+        if (yield from self.run(node.expr, ctx)):
+            return (yield from self.run(node.then_branch, ctx))
+        elif node.else_branch is not None:
+            return (yield from self.run(node.else_branch, ctx))
+
+    def return_(self, node: Return, ctx: Ctx) -> Steps:
+        val = (yield from self.run(node.value, ctx)) if node.value else None
+        raise McReturn(val)
+
+    def printf(self, node: Printf, ctx: Ctx) -> Steps:
+        node.write(ctx, (yield from self.run(node.expr, ctx)))
+
+    def var_def(self, node: VarDef, ctx: Ctx) -> Steps:
+        val = (yield from self.run(node.value, ctx)) if node.value is not None else None
+        node.define(ctx, val)
+
+    def array_def(self, node: ArrayDef, ctx: Ctx) -> Steps:
+        init = None
+        if node.init_values:
+            init = []
+            for expr in node.init_values:
+                init.append((yield from self.run(expr, ctx)))
+        node.define(ctx, init)
+
+    def call(self, node: Call, ctx: Ctx) -> Steps:
+        func = yield from self.run(node.callee, ctx)
+        args = []
+        for param in node.params:
+            args.append((yield from self.run(param, ctx)))
+        if isinstance(func, McFunction):
+            return (yield from self.call_function(func, args))
+        return node.invoke(func, args)
+
+    def assign(self, node: Assign, ctx: Ctx) -> Steps:
+        return node.assign(ctx, (yield from self.run(node.value, ctx)))
+
+    def bin_op(self, node: BinOp, ctx: Ctx) -> Steps:
+        left = yield from self.run(node.left, ctx)
+        right = yield from self.run(node.right, ctx)
+        return node.op(left, right)
+
+    def and_(self, node: And, ctx: Ctx) -> Steps:
+        if not (yield from self.run(node.left, ctx)):
+            return 0
+        return 1 if (yield from self.run(node.right, ctx)) else 0
+
+    def or_(self, node: Or, ctx: Ctx) -> Steps:
+        if (yield from self.run(node.left, ctx)):
+            return 1
+        return 1 if (yield from self.run(node.right, ctx)) else 0
+
+    def unary_op(self, node: UnaryOp, ctx: Ctx) -> Steps:
+        target = node.params
+        if isinstance(target, ArrayAccess) and (node.op == "++" or node.op == "--"):
+            arr = yield from self.run(target.array, ctx)
+            idx = yield from self.run(target.index, ctx)
+            return node.apply(ctx, target.get_item(arr, idx), (arr, idx))
+        return node.apply(ctx, (yield from self.run(target, ctx)))
+
+    def array_access(self, node: ArrayAccess, ctx: Ctx) -> Steps:
+        arr = yield from self.run(node.array, ctx)
+        idx = yield from self.run(node.index, ctx)
+        return node.get_item(arr, idx)
+
+    def array_assign(self, node: ArrayAssign, ctx: Ctx) -> Steps:
+        arr = yield from self.run(node.array, ctx)
+        idx = yield from self.run(node.index, ctx)
+        return node.set_item(arr, idx, (yield from self.run(node.value, ctx)))
@@ -1,10 +1,14 @@
 from abc import ABC
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Callable, Optional
-from .runtime import McFunction, McReturn
+from .runtime import McFunction, McReturn, show
 from .errors import SemanticError
+from .limits import array_size, body_weight
+from .natives import NATIVES, arity
+from .positions import locate
 
-from .ctx import Ctx
+from .ctx import Ctx, _Builtins
 
 # Declaramos nossa classe base num módulo separado para esconder um pouco de
 # Python relativamente avançado de quem não se interessar pelo assunto.
@@ -36,6 +40,10 @@ class Type(Node):
         return self.name
 
 
+# Tipo das funções embutidas (veja `microC.ctx`)
+_Builtins.TYPE = Type("builtin")
+
+
 class Expr(Node, ABC):
     """
     Classe base para expressões.
@@ -60,23 +68,20 @@ class Program(Node):
     stmts: list[Stmt]
 
     def eval(self, ctx: Ctx, auto_execute_main: bool = False):
-        for stmt in self.stmts:
-            stmt.eval(ctx)
-        
-        # Se existe uma função main e auto_execute_main é True, executa automaticamente
-        if auto_execute_main and 'main' in ctx:
-            main_entry = ctx.scope['main']
-            if isinstance(main_entry, tuple) and len(main_entry) == 2:
-                main_func = main_entry[1]
-                from .runtime import McFunction
-                if isinstance(main_func, McFunction):
-                    try:
-                        main_func()  # Chama a função main sem argumentos
-                    except Exception as e:
-                        # Se for um McReturn, não é um erro
-                        from .runtime import McReturn
-                        if not isinstance(e, McReturn):
-                            raise
+        try:
+            for stmt in self.stmts:
+                stmt.eval(ctx)
+
+            # Se existe uma função main e auto_execute_main é True, executa automaticamente
+            # e retorna o valor devolvido por ela
+            if auto_execute_main:
+                main_entry = ctx.scope.get("main")
+                if main_entry is not None and isinstance(main_entry[1], McFunction):
+                    return main_entry[1]()  # Chama a função main sem argumentos
+        except Exception as exc:
+            # A posição do erro é procurada só agora, na pilha da exceção
+            locate(exc, self)
+            raise
 
     def validate_self(self, cursor: Cursor):
         pass
@@ -180,26 +185,44 @@ class UnaryOp(Expr):
     is_postfix: bool = False
 
     def eval(self, ctx: Ctx):
-        val = self.params.eval(ctx)
+        target = self.params
+        if isinstance(target, ArrayAccess) and (self.op == "++" or self.op == "--"):
+            # O array e o índice são avaliados uma única vez (ex.: a[i++]++)
+            arr = target.array.eval(ctx)
+            idx = target.index.eval(ctx)
+            return self.apply(ctx, target.get_item(arr, idx), (arr, idx))
+        return self.apply(ctx, target.eval(ctx))
+
+    def apply(self, ctx: Ctx, val: Value, item: tuple | None = None):
+        """
+        Aplica o operador ao valor já avaliado do operando. Em ++/-- numa
+        posição de array, `item` é o par (array, índice) já avaliado.
+        """
         if self.op == "-":
             return -val
         
         elif self.op == "not":
             return 1 if not val else 0
         
-        elif self.op == "++":
-            if self.is_postfix:
-                result = val
-                self.params.eval(ctx)
-                return result + 1
-            return val + 1
-        
-        elif self.op == "--":
-            if self.is_postfix:
-                result = val
-                self.params.eval(ctx)
-                return result - 1
-            return val - 1
+        elif self.op == "++" or self.op == "--":
+            step = 1 if self.op == "++" else -1
+            new = chr(ord(val) + step) if isinstance(val, str) else val + step
+            self.store(ctx, new, item)
+            return val if self.is_postfix else new
+
+    def store(self, ctx: Ctx, value: Value, item: tuple | None = None):
+        """
+        Guarda o resultado de ++/-- na variável ou na posição de array
+        `item`, lida (com os limites verificados) por `get_item`.
+        """
+        target = self.params
+        if isinstance(target, Var):
+            ctx[target.name] = value
+        elif isinstance(target, ArrayAccess) and item is not None:
+            arr, idx = item
+            arr[idx] = value
+        else:
+            raise TypeError(f"operador {self.op} exige uma variável ou posição de array")
 
 
 @dataclass
@@ -210,13 +233,31 @@ class Call(Expr):
     def eval(self, ctx: Ctx):
         func = self.callee.eval(ctx)
         args = [param.eval(ctx) for param in self.params]
-        from .runtime import McClass, McInstance
-        if isinstance(func, McClass):
-            return McInstance(func)
+        return self.invoke(func, args)
+
+    def invoke(self, func, args: list[Value]):
+        """
+        Chama a função já avaliada com os argumentos já avaliados.
+        """
         if callable(func):
             return func(*args)
         raise TypeError(f"{self.callee} não é uma função!")
 
+    def validate_self(self, cursor: Cursor):
+        # Confere o número de argumentos das funções nativas, a não ser que
+        # o programa defina outra função ou variável com o mesmo nome
+        if not isinstance(self.callee, Var) or self.callee.name not in NATIVES:
+            return
+        name = self.callee.name
+        if name in defined_names(cursor.root()):
+            return
+        expected = arity(name)
+        if len(self.params) != expected:
+            raise SemanticError(
+                f"{name} espera {expected} argumentos, mas recebeu {len(self.params)}",
+                token=name,
+            )
+
 
 
 @dataclass
@@ -230,7 +271,12 @@ class Assign(Expr):
     value: Expr
 
     def eval(self, ctx: Ctx):
-        val = self.value.eval(ctx)
+        return self.assign(ctx, self.value.eval(ctx))
+
+    def assign(self, ctx: Ctx, val: Value):
+        """
+        Converte o valor já avaliado para o tipo da variável e o atribui.
+        """
         var_type = ctx.get_type(self.name)
         if var_type.name == "char" and isinstance(val, int):
             val = chr(val)
@@ -249,7 +295,6 @@ class Return(Stmt):
 
     def eval(self, ctx):
         val = self.value.eval(ctx) if self.value else None
-        from .runtime import McReturn
         raise McReturn(val)
     
 @dataclass
@@ -257,16 +302,19 @@ class Printf(Stmt):
     expr: Expr
 
     def eval(self, ctx: Ctx):
-        value = self.expr.eval(ctx)
-        tipo = None
+        self.write(ctx, self.expr.eval(ctx))
+
+    def write(self, ctx: Ctx, value: Value):
+        """
+        Imprime o valor já avaliado da expressão.
+        """
         if isinstance(self.expr, Var):
             tipo = ctx.get_type(self.expr.name)
             if tipo.name == "void":
                 raise TypeError("printf não pode imprimir valores do tipo void")
             if tipo.name == "int" and isinstance(value, list):
                 raise TypeError("printf não pode imprimir arrays de inteiros diretamente, use um loop :)")
-        from .runtime import print
-        print(value)
+        ctx.output.write(show(value) + "\n")
 
 @dataclass
 class VarDef(Stmt):
@@ -275,8 +323,14 @@ class VarDef(Stmt):
     value: Expr | None = None
 
     def eval(self, ctx: Ctx):
+        self.define(ctx, self.value.eval(ctx) if self.value is not None else None)
+
+    def define(self, ctx: Ctx, val: Value):
+        """
+        Define a variável com o valor já avaliado do inicializador (None se
+        não houver inicializador).
+        """
         if self.value is not None:
-            val = self.value.eval(ctx)
             if self.type.name == "int" and isinstance(val, str):
                 val = ord(val)
             elif self.type.name == "char" and isinstance(val, int):
@@ -329,9 +383,23 @@ class While(Stmt):
     stmt : Stmt
 
     def eval(self, ctx: Ctx):
+        limits = ctx.limits
+        if limits is None:
+            while self.expr.eval(ctx):
+                self.stmt.eval(ctx)
+            return
+        weight = self.weight
         while self.expr.eval(ctx):
+            limits.tick(weight)
             self.stmt.eval(ctx)
 
+    @cached_property
+    def weight(self) -> int:
+        """
+        Passos contados por iteração: 1 mais o número de nós do corpo.
+        """
+        return 1 + body_weight([self.stmt])
+
 
 @dataclass
 class Block(Node):
@@ -339,9 +407,19 @@ class Block(Node):
 
     def eval(self, ctx: Ctx):
         new_ctx = ctx.push({})
-        for stmt in self.stmts:
-            stmt.eval(new_ctx)
-        env, ctx = new_ctx.pop()
+        limits = ctx.limits
+        if limits is None:
+            for stmt in self.stmts:
+                stmt.eval(new_ctx)
+            env, ctx = new_ctx.pop()
+            return
+        # Arrays declarados no bloco são liberados ao sair dele
+        mark = limits.memory
+        try:
+            for stmt in self.stmts:
+                stmt.eval(new_ctx)
+        finally:
+            limits.memory = mark
 
     def validate_self(self, cursor: Cursor):
         var_names = [stmt.name for stmt in self.stmts if isinstance(stmt, VarDef)]
@@ -358,10 +436,17 @@ class Function(Stmt):
     name: str
     params: list[str]
     body: Stmt
+    param_types: list[Type] = field(default_factory=list)
+
+    def __post_init__(self):
+        # Árvores montadas à mão (ou por transformers antigos) podem não
+        # trazer os tipos dos parâmetros: assumimos int, o tipo padrão do C
+        if not self.param_types and self.params:
+            self.param_types = [Type("int") for _ in self.params]
 
     def eval(self, ctx: "Ctx"):
         stmts = self.body.stmts if hasattr(self.body, "stmts") else [self.body]
-        func = McFunction(self.type.name, self.name, self.params, stmts, ctx)
+        func = McFunction(self.type.name, self.name, self.params, stmts, ctx, self.param_types)
         ctx.var_def(self.type, self.name, func)
         return func
 
@@ -389,24 +474,33 @@ class ArrayDef(Stmt):
     init_values: Optional[list[Expr]] = None
 
     def eval(self, ctx: Ctx):
+        init = [expr.eval(ctx) for expr in self.init_values] if self.init_values else None
+        self.define(ctx, init)
+
+    def define(self, ctx: Ctx, init: Optional[list[Value]]):
+        """
+        Cria o array a partir dos valores iniciais já avaliados.
+        """
+        if ctx.limits is not None:
+            ctx.limits.allocate(array_size(self.size))
         if self.type.name == "char":
-            if self.init_values:
-                chars = [str(expr.eval(ctx)) for expr in self.init_values]
+            if init:
+                chars = [str(value) for value in init]
                 while len(chars) < self.size - 1:
                     chars.append('\0')
                 chars.append('\0')
-                value = ''.join(chars[:self.size])
+                value = chars[:self.size]
             else:
-                value = '\0' * self.size
-            ctx[self.name] = value
+                value = ['\0'] * self.size
+            ctx.var_def(self.type, self.name, value)
         else:
-            if self.init_values:
-                values = [expr.eval(ctx) for expr in self.init_values]
+            if init:
+                values = list(init)
                 while len(values) < self.size:
                     values.append(0)
             else:
                 values = [0] * self.size
-            ctx[self.name] = values
+            ctx.var_def(self.type, self.name, values)
 
     def validate_self(self, cursor: Cursor):
         reserved = {
@@ -423,8 +517,12 @@ class ArrayAccess(Expr):
     index: Expr
 
     def eval(self, ctx: Ctx):
-        arr = self.array.eval(ctx)
-        idx = self.index.eval(ctx)
+        return self.get_item(self.array.eval(ctx), self.index.eval(ctx))
+
+    def get_item(self, arr, idx: Value) -> Value:
+        """
+        Lê a posição do array, verificando o tipo e os limites do índice.
+        """
         if not isinstance(arr, list):
             raise TypeError(f"{self.array} não é um array!")
         if not isinstance(idx, int):
@@ -442,7 +540,12 @@ class ArrayAssign(Expr):
     def eval(self, ctx: Ctx):
         arr = self.array.eval(ctx)
         idx = self.index.eval(ctx)
-        val = self.value.eval(ctx)
+        return self.set_item(arr, idx, self.value.eval(ctx))
+
+    def set_item(self, arr, idx: Value, val: Value) -> Value:
+        """
+        Escreve na posição do array, verificando o tipo e os limites do índice.
+        """
         if not isinstance(arr, list):
             raise TypeError(f"{self.array} não é um array!")
         if not isinstance(idx, int):
@@ -450,4 +553,29 @@ class ArrayAssign(Expr):
         if idx < 0 or idx >= len(arr):
             raise IndexError(f"Índice {idx} fora dos limites do array!")
         arr[idx] = val
-        return val
\ No newline at end of file
+        return val
+
+
+#
+# VALIDAÇÃO
+#
+
+def defined_names(root: Cursor) -> frozenset[str]:
+    """
+    Nomes de funções, variáveis, arrays e parâmetros definidos na árvore de
+    `root`.
+
+    O conjunto fica guardado no próprio cursor raiz, que é compartilhado
+    por todos os cursores de uma validação: a árvore é percorrida uma vez
+    por validação, e não uma vez por chamada.
+    """
+    names = vars(root).get("defined_names")
+    if names is None:
+        found = set()
+        for node in root.node.descendants():
+            if isinstance(node, (Function, VarDef, ArrayDef)):
+                found.add(node.name)
+                if isinstance(node, Function):
+                    found.update(node.params)
+        names = root.defined_names = frozenset(found)  # type: ignore[attr-defined]
+    return names
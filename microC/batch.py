@@ -0,0 +1,457 @@
+"""
+Execução de lotes de programas MicroC.
+
+Usado pelo comando `microc run`, que recebe arquivos e pastas e escreve um
+resultado por programa no formato JSON Lines. Cada programa roda num `Ctx`
+próprio, com seu próprio destino de saída.
+
+Os programas podem rodar em série ou numa pool de workers:
+
+* "process": processos. Cada worker carrega o parser uma única vez (no
+  inicializador), recebe os programas em blocos para diluir o custo de
+  comunicação e pode ter limites de tempo de CPU e de memória aplicados com
+  `resource.setrlimit`;
+* "thread": threads do próprio processo, cada uma com o seu próprio
+  transformer (`microC.parser.ThreadParser`), mas com as tabelas do parser
+  compartilhadas. Só executam em paralelo em builds free-threaded do Python
+  (3.13+, com o GIL desligado);
+* "interpreter": subinterpretadores, cada um com seu próprio GIL, via
+  `concurrent.futures.InterpreterPoolExecutor` (Python 3.14+);
+* "auto": threads se o GIL estiver desligado, senão processos.
+
+Os resultados são devolvidos à medida que os programas (ou blocos)
+terminam.
+"""
+
+import concurrent.futures
+import json
+import math
+import signal
+import sys
+import threading
+import time
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from dataclasses import asdict, dataclass
+from functools import partial
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore[assignment]
+
+from lark.exceptions import LarkError
+
+from .ast import Program
+from .ctx import Ctx
+from .errors import SemanticError
+from .limits import LimitExceeded, Limits
+from .output import MemoryOutput
+from .parser import ThreadParser, parse
+from .positions import locate
+from .vectorize import vectorize as vectorize_loops
+
+SUFFIX = ".microc"
+EXECUTORS = ("auto", "process", "thread", "interpreter")
+
+# Blocos pequenos equilibram melhor a carga; blocos grandes reduzem a
+# comunicação entre processos. `chunk_size` procura ~4 blocos por worker.
+MAX_CHUNK_SIZE = 32
+WARMUP_SOURCE = "int main() { return 0; }"
+
+
+class ResourceLimitExceeded(Exception):
+    """
+    Um programa excedeu o limite de tempo de CPU do worker.
+    """
+
+
+@dataclass
+class BatchResult:
+    """
+    Resultado da execução de um programa.
+
+    Attributes:
+        file:
+            Caminho do programa.
+        stdout:
+            Tudo o que o programa imprimiu, mesmo que tenha terminado com erro.
+        status:
+            Código de saída: o valor retornado por `main` (0 se não for um
+            inteiro ou se não houver `main`) ou 1 em caso de erro.
+        error:
+            Mensagem de erro ou None.
+        error_kind:
+            "syntax", "semantic", "runtime", "io" (falha ao ler o arquivo),
+            "limit" (limite de passos, CPU ou memória excedido) ou "crash" (o
+            worker morreu), ou None se não houve erro.
+        error_type:
+            Nome da classe da exceção, ou None.
+        elapsed:
+            Tempo total (análise e execução), em segundos.
+        peak_memory:
+            Pico de memória contabilizada para arrays e frames, em bytes
+            (veja `microC.limits`), ou None se o programa não chegou a rodar.
+        line, column:
+            Posição do erro no programa (veja `microC.positions`), ou None
+            se não houve erro ou se a posição é desconhecida.
+    """
+
+    file: str
+    stdout: str
+    status: int
+    error: Optional[str] = None
+    error_kind: Optional[str] = None
+    error_type: Optional[str] = None
+    elapsed: float = 0.0
+    peak_memory: Optional[int] = None
+    line: Optional[int] = None
+    column: Optional[int] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def to_json(self) -> str:
+        """
+        Serializa o resultado como uma linha JSON.
+        """
+        return json.dumps(asdict(self), ensure_ascii=False)
+
+
+def iter_sources(paths: Iterable[str | Path]) -> Iterator[Path]:
+    """
+    Expande pastas (recursivamente, em ordem alfabética) em arquivos .microc.
+
+    Arquivos passados explicitamente são incluídos mesmo sem a extensão.
+    """
+    for path in map(Path, paths):
+        if path.is_dir():
+            yield from sorted(path.rglob(f"*{SUFFIX}"))
+        else:
+            yield path
+
+
+def error_kind(exc: Exception) -> str:
+    """
+    Classifica uma exceção como erro de sintaxe, semântico, de execução ou
+    de limite de recursos.
+    """
+    if isinstance(exc, (ResourceLimitExceeded, LimitExceeded, MemoryError)):
+        return "limit"
+    if isinstance(exc, LarkError):
+        return "syntax"
+    if isinstance(exc, SemanticError):
+        return "semantic"
+    return "runtime"
+
+
+def run_source(
+    source: str,
+    file: str = "<string>",
+    parse: Callable[[str], Program] = parse,
+    max_steps: Optional[int] = None,
+    max_memory: Optional[int] = None,
+    vectorize: bool = False,
+) -> BatchResult:
+    """
+    Analisa e executa um programa num contexto isolado.
+
+    `parse` pode ser trocado por uma versão com cache (veja `microC.server`).
+    `max_steps` e `max_memory` limitam a execução (veja `microC.limits`).
+    Com `vectorize`, os laços reconhecidos por `microC.vectorize` rodam como
+    operações sobre fatias; nesse caso `parse` deve retornar uma árvore nova
+    (não congelada) a cada chamada.
+    """
+    out = MemoryOutput()
+    limits = Limits(max_steps, max_memory)
+    ctx = Ctx.from_dict({}, output=out, limits=limits)
+    start = time.perf_counter()
+    try:
+        ast = parse(source)
+        if vectorize:
+            vectorize_loops(ast)
+        value = ast.eval(ctx, auto_execute_main=True)
+    except Exception as exc:
+        location = locate(exc)
+        return BatchResult(
+            file=file,
+            stdout=out.getvalue(),
+            status=1,
+            error=str(exc) or type(exc).__name__,
+            error_kind=error_kind(exc),
+            error_type=type(exc).__name__,
+            elapsed=time.perf_counter() - start,
+            peak_memory=limits.peak_memory,
+            line=location and location.line,
+            column=location and location.column,
+        )
+    status = value if type(value) is int else 0
+    return BatchResult(
+        file,
+        out.getvalue(),
+        status,
+        elapsed=time.perf_counter() - start,
+        peak_memory=limits.peak_memory,
+    )
+
+
+def run_file(
+    path: str | Path,
+    max_steps: Optional[int] = None,
+    max_memory: Optional[int] = None,
+    parse: Callable[[str], Program] = parse,
+    vectorize: bool = False,
+) -> BatchResult:
+    """
+    Lê e executa um arquivo. Erros de leitura são reportados no resultado.
+    """
+    try:
+        source = Path(path).read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError) as exc:
+        return BatchResult(str(path), "", 1, str(exc), "io", type(exc).__name__)
+    return run_source(source, str(path), parse, max_steps, max_memory, vectorize)
+
+
+_thread_parsers = threading.local()
+
+
+def thread_parse(source: str) -> Program:
+    """
+    `parse` com um `ThreadParser` por thread: as threads da pool analisam
+    os programas ao mesmo tempo, sem disputar o lock do parser global.
+    """
+    parser = getattr(_thread_parsers, "parser", None)
+    if parser is None:
+        parser = _thread_parsers.parser = ThreadParser()
+    return parser.parse(source)
+
+
+def free_threading_enabled() -> bool:
+    """
+    Verifica se o interpretador roda sem o GIL (build free-threaded do
+    Python 3.13+ com o GIL desligado).
+    """
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def interpreters_available() -> bool:
+    """
+    Verifica se há uma pool de subinterpretadores (Python 3.14+).
+    """
+    return hasattr(concurrent.futures, "InterpreterPoolExecutor")
+
+
+def available_executors() -> list[str]:
+    """
+    Executores que rodam programas em paralelo neste interpretador.
+    """
+    executors = ["process"]
+    if free_threading_enabled():
+        executors.append("thread")
+    if interpreters_available():
+        executors.append("interpreter")
+    return executors
+
+
+def resolve_executor(executor: str) -> str:
+    """
+    Resolve "auto" para o melhor executor disponível e verifica se o
+    executor pedido existe neste interpretador.
+    """
+    if executor not in EXECUTORS:
+        raise ValueError(f"executor desconhecido: {executor}")
+    if executor == "auto":
+        return "thread" if free_threading_enabled() else "process"
+    if executor == "interpreter" and not interpreters_available():
+        raise ValueError("subinterpretadores exigem Python 3.14+ (InterpreterPoolExecutor)")
+    return executor
+
+
+def chunk_size(count: int, jobs: int) -> int:
+    """
+    Tamanho de bloco padrão para `count` programas distribuídos em `jobs`
+    workers.
+    """
+    return max(1, min(MAX_CHUNK_SIZE, count // (4 * jobs)))
+
+
+def run_batch(
+    paths: Iterable[str | Path],
+    jobs: int = 1,
+    executor: str = "auto",
+    chunksize: Optional[int] = None,
+    cpu_limit: Optional[float] = None,
+    memory_limit: Optional[int] = None,
+    max_steps: Optional[int] = None,
+    max_memory: Optional[int] = None,
+    vectorize: bool = False,
+) -> Iterator[BatchResult]:
+    """
+    Executa todos os programas encontrados em `paths`.
+
+    Com `jobs <= 1` e sem limites, os programas rodam em série, na ordem
+    dos arquivos. Caso contrário, rodam numa pool (`executor`) e os
+    resultados saem na ordem em que terminam.
+
+    Args:
+        paths:
+            Arquivos e pastas com programas.
+        jobs:
+            Número de workers.
+        executor:
+            "auto", "process", "thread" ou "interpreter" (veja a descrição
+            do módulo). Com o GIL ligado, threads compartilham o parser mas
+            não executam em paralelo: o ganho vem apenas de sobrepor leitura
+            de arquivos e escrita dos resultados.
+        chunksize:
+            Programas enviados de uma vez a cada worker de processo ou
+            subinterpretador. Por padrão é calculado por `chunk_size`.
+        cpu_limit:
+            Tempo máximo de CPU por programa, em segundos (arredondado para
+            cima pelo sistema operacional). Exige a pool de processos.
+        memory_limit:
+            Espaço de endereçamento máximo de cada worker, em bytes. Exige a
+            pool de processos.
+        max_steps, max_memory:
+            Número máximo de passos e memória máxima (em bytes, contabilizada
+            pelo interpretador) de cada programa (veja `microC.limits`).
+            Funcionam com qualquer executor.
+        vectorize:
+            Vetoriza os laços reconhecidos (veja `microC.vectorize`).
+
+    Raises:
+        ValueError:
+            Se as opções forem inválidas. A verificação ocorre na chamada,
+            antes de qualquer programa ser executado.
+    """
+    executor = resolve_executor(executor)
+    limited = cpu_limit is not None or memory_limit is not None
+    if limited:
+        if resource is None:
+            raise ValueError("limites de recursos exigem o módulo `resource` (Unix)")
+        if executor != "process":
+            raise ValueError("limites de recursos exigem executor='process'")
+    run = partial(run_file, max_steps=max_steps, max_memory=max_memory, vectorize=vectorize)
+    return _iter_batch(paths, jobs, executor, chunksize, cpu_limit, memory_limit, run, limited)
+
+
+def _iter_batch(
+    paths: Iterable[str | Path],
+    jobs: int,
+    executor: str,
+    chunksize: Optional[int],
+    cpu_limit: Optional[float],
+    memory_limit: Optional[int],
+    run: Callable[[Path], BatchResult],
+    limited: bool,
+) -> Iterator[BatchResult]:
+    files = iter_sources(paths)
+    if jobs <= 1 and not limited:
+        for path in files:
+            yield run(path)
+        return
+
+    if executor == "thread":
+        run = partial(run, parse=thread_parse)
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            futures = [pool.submit(run, path) for path in files]
+            for future in as_completed(futures):
+                yield future.result()
+        return
+
+    files = list(files)
+    jobs = max(jobs, 1)
+    size = chunksize or chunk_size(len(files), jobs)
+    if executor == "interpreter":
+        pool = concurrent.futures.InterpreterPoolExecutor(
+            max_workers=jobs, initializer=_warm_up
+        )
+    else:
+        pool = ProcessPoolExecutor(
+            max_workers=jobs, initializer=_init_worker, initargs=(memory_limit,)
+        )
+    with pool:
+        yield from _run_chunks(pool, files, size, cpu_limit, run)
+
+
+def _run_chunks(
+    pool: Executor,
+    files: list[Path],
+    size: int,
+    cpu_limit: Optional[float],
+    run: Callable[[Path], BatchResult],
+) -> Iterator[BatchResult]:
+    chunks = {}
+    for start in range(0, len(files), size):
+        chunk = files[start : start + size]
+        chunks[pool.submit(_run_chunk, chunk, cpu_limit, run)] = chunk
+    for future in as_completed(chunks):
+        try:
+            results = future.result()
+        except Exception as exc:
+            # O worker morreu (ex.: SIGKILL ao atingir o limite rígido)
+            results = [
+                BatchResult(str(path), "", 1, str(exc), "crash", type(exc).__name__)
+                for path in chunks[future]
+            ]
+        yield from results
+
+
+def _init_worker(memory_limit: Optional[int]) -> None:
+    """
+    Inicializa um worker da pool de processos: aplica o limite de memória,
+    instala o tratador de SIGXCPU e aquece o parser.
+    """
+    if memory_limit is not None:
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, hard))
+    if resource is not None:
+        signal.signal(signal.SIGXCPU, _on_cpu_limit)
+    _warm_up()
+
+
+def _warm_up() -> None:
+    """
+    Carrega o parser e executa um programa trivial, para que o primeiro
+    programa do worker não pague esse custo.
+    """
+    run_source(WARMUP_SOURCE)
+
+
+def _on_cpu_limit(signum, frame):
+    raise ResourceLimitExceeded("limite de tempo de CPU excedido")
+
+
+def _run_chunk(
+    paths: list[Path], cpu_limit: Optional[float], run: Callable[[Path], BatchResult]
+) -> list[BatchResult]:
+    """
+    Executa um bloco de programas num worker da pool de processos. `run` é
+    `run_file` com as opções de execução já aplicadas.
+    """
+    if cpu_limit is None:
+        return [run(path) for path in paths]
+
+    results = []
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    try:
+        for path in paths:
+            # RLIMIT_CPU conta o tempo acumulado do processo: o limite do
+            # programa é o tempo já gasto mais `cpu_limit`.
+            usage = resource.getrusage(resource.RUSAGE_SELF)
+            soft = math.ceil(usage.ru_utime + usage.ru_stime + cpu_limit)
+            if hard != resource.RLIM_INFINITY:
+                soft = min(soft, hard)
+            resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+            results.append(run(path))
+    finally:
+        resource.setrlimit(resource.RLIMIT_CPU, (hard, hard))
+    return results
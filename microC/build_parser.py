@@ -0,0 +1,106 @@
+"""
+Gera as tabelas do parser LALR a partir de `grammar.lark`.
+
+Criar o parser com `Lark(GRAMMAR_PATH.open(), ...)` analisa a gramática e
+monta as tabelas LALR a cada importação de `microC.parser`. Este módulo
+faz esse trabalho uma única vez e grava o resultado (a serialização do
+próprio Lark, a mesma usada pelo gerador standalone e pelo `cache=True`)
+como literais Python em `microC/_parser_tables.py`. O `.pyc` desse módulo é
+carregado direto, sem analisar a gramática; as classes (`Token`, `Tree`,
+exceções) continuam sendo as do pacote `lark`.
+
+O módulo gerado guarda o hash da gramática e a versão do Lark. Se algum dos
+dois não bater, `microC.parser` ignora as tabelas e volta a construir o
+parser a partir da gramática.
+
+Uso:
+    python -m microC.build_parser          # gera as tabelas, se desatualizadas
+    python -m microC.build_parser --check  # código 1 se estiverem desatualizadas
+
+As tabelas devem ser geradas novamente sempre que a gramática mudar (ou
+quando a versão do Lark mudar).
+"""
+
+import argparse
+import pprint
+import sys
+from pathlib import Path
+
+import lark
+from lark import Lark
+from lark.grammar import Rule
+from lark.lexer import TerminalDef
+
+# O hash e a verificação ficam em `microC.parser`, que os usa ao ser
+# importado: assim o pacote não importa este módulo, que pode ser executado
+# com `python -m` sem avisos do runpy
+from .parser import GRAMMAR_PATH, PARSER_OPTIONS, grammar_hash, is_stale
+
+__all__ = ["PARSER_OPTIONS", "TABLES_PATH", "build", "grammar_hash", "is_stale"]
+
+DIR = Path(__file__).parent
+TABLES_PATH = DIR / "_parser_tables.py"
+
+HEADER = '''"""
+Tabelas do parser LALR de MicroC.
+
+ARQUIVO GERADO por `python -m microC.build_parser` a partir de
+`grammar.lark`. Não edite: altere a gramática e gere novamente.
+"""
+# fmt: off
+'''
+
+
+def build(grammar: Path = GRAMMAR_PATH) -> str:
+    """
+    Código fonte do módulo de tabelas para a gramática.
+    """
+    with grammar.open() as fd:
+        parser = Lark(fd, **PARSER_OPTIONS)
+    data, memo = parser.memo_serialize([TerminalDef, Rule])
+    return "".join(
+        [
+            HEADER,
+            f"GRAMMAR_HASH = {grammar_hash(grammar)!r}\n",
+            f"LARK_VERSION = {lark.__version__!r}\n\n",
+            f"DATA = {pprint.pformat(data, width=100)}\n\n",
+            f"MEMO = {pprint.pformat(memo, width=100)}\n",
+        ]
+    )
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Não grava nada; termina com código 1 se as tabelas estiverem desatualizadas.",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Gera as tabelas mesmo que estejam atualizadas.",
+    )
+    args = parser.parse_args(argv)
+    stale = True
+    if TABLES_PATH.exists():
+        from . import _parser_tables
+
+        stale = is_stale(_parser_tables)
+    if args.check:
+        if stale:
+            print(f"{TABLES_PATH.name} está desatualizado; rode `python -m microC.build_parser`.")
+            sys.exit(1)
+        print(f"{TABLES_PATH.name} está atualizado.")
+    elif stale or args.force:
+        # A numeração dos estados LALR muda de uma execução para outra (o
+        # Lark itera sobre conjuntos de objetos), por isso o arquivo só é
+        # gerado de novo quando necessário
+        TABLES_PATH.write_text(build(), encoding="utf-8")
+        print(f"Tabelas gravadas em {TABLES_PATH}")
+    else:
+        print(f"{TABLES_PATH.name} está atualizado.")
+
+
+if __name__ == "__main__":
+    main()
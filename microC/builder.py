@@ -0,0 +1,573 @@
+"""
+Construção da AST direto nas reduções do parser LALR.
+
+Com o transformer passado ao Lark, cada redução passa pelo filtro de filhos
+do Lark (que monta uma lista sem os tokens de pontuação), pelo wrapper
+`inline_with_positions` (que desempacota os filhos e junta as posições
+deles) e pelo método de `McTransformer`. Vários desses métodos criam objetos
+descartados logo em seguida: listas intermediárias (`call_params`,
+`array_init`, `param_list`), um `Var` para cada nome declarado (`name.name`
+em `var_decl` e `func_decl`), um `VarDef` para cada parâmetro, um `Literal`
+para o tamanho de arrays e uma `Tree` do Lark a cada declaração de `decl*`.
+
+`AstBuilder` tem uma redução para cada regra da gramática. Ela recebe os
+valores da pilha do parser (inclusive os tokens de pontuação) e cria os nós
+finais:
+
+* os tokens `VAR`, `NUMBER`, `CHAR` e `NULL` só viram nós nas regras em que
+  são expressões; nomes de variáveis, funções e parâmetros e o tamanho de
+  arrays são lidos direto dos tokens;
+* as repetições (`decl*`, argumentos, parâmetros, valores iniciais de
+  arrays) acumulam numa única lista, usada pelo nó final;
+* as posições são calculadas a partir dos tokens e das posições dos filhos
+  e ficam na tabela do transformer (`transformer.spans`), iguais às que o
+  transformer registraria.
+
+`DirectParser` executa as reduções sem passar pelos objetos `Rule` do Lark
+e sem chamadas nas regras unitárias. `load_parser` o usa no lugar do parser
+do Lark e dos callbacks do transformer quando existe uma redução para cada
+regra. Se a gramática mudar, o parser volta
+a usar o transformer até que as reduções sejam atualizadas. Ao alterar um
+método de `McTransformer`, altere também a redução correspondente (os
+testes comparam as duas árvores).
+"""
+
+from types import MethodType
+from typing import Callable, Iterable, Optional
+
+from lark import Token
+from lark.exceptions import UnexpectedToken
+from lark.parsers.lalr_analysis import Shift
+from lark.parsers.lalr_interactive_parser import InteractiveParser
+from lark.parsers.lalr_parser import ParseConf, ParserState, _Parser
+
+from . import runtime as op
+from .ast import (
+    And,
+    ArrayAccess,
+    ArrayAssign,
+    ArrayDef,
+    Assign,
+    BinOp,
+    Block,
+    Call,
+    Function,
+    If,
+    Literal,
+    Or,
+    Printf,
+    Program,
+    Return,
+    Type,
+    UnaryOp,
+    Var,
+    VarDef,
+    While,
+)
+from .node import Node
+from .positions import Span, join_spans
+
+__all__ = ["AstBuilder", "DirectParser", "REDUCTIONS", "parser_state"]
+
+# Reduções de `AstBuilder` indexadas pela assinatura da regra (veja
+# `signature`)
+REDUCTIONS: dict[str, Callable] = {}
+
+
+def reduces(*signatures: str):
+    """
+    Registra a função como redução das regras com as assinaturas dadas.
+    """
+
+    def decorator(function):
+        for sig in signatures:
+            REDUCTIONS[sig] = function
+        return function
+
+    return decorator
+
+
+def signature(rule) -> str:
+    """
+    Assinatura de uma regra do Lark: o nome (ou o alias) e os símbolos da
+    expansão, com `_` no lugar dos tokens filtrados da árvore.
+
+    Ex.: "var_decl: type VAR _ expr _"
+    """
+    symbols = ["_" if sym.is_term and sym.filter_out else sym.name for sym in rule.expansion]
+    return " ".join([f"{rule.alias or rule.origin.name}:", *symbols])
+
+
+def _token_span(token: Token) -> Span:
+    return token.line, token.column, token.end_line, token.end_column
+
+
+def _join(a: Optional[Span], b: Optional[Span]) -> Optional[Span]:
+    """
+    `join_spans((a, b))`, sem criar listas.
+    """
+    if a is None:
+        return b
+    if b is None:
+        return a
+    first = a if a <= b else b
+    last = b if (b[2], b[3]) > (a[2], a[3]) else a
+    return first[0], first[1], last[2], last[3]
+
+
+def _binop(function: Callable) -> Callable:
+    def reduce(self, s):
+        left, right = s[0], s[2]
+        node = BinOp(left, right, function)
+        spans = self.transformer.spans
+        span = _join(spans.get(id(left)), spans.get(id(right)))
+        if span is not None:
+            spans[id(node)] = span
+        return node
+
+    return reduce
+
+
+def _logic(cls: type) -> Callable:
+    def reduce(self, s):
+        left, right = s[0], s[2]
+        node = cls(left, right)
+        spans = self.transformer.spans
+        span = _join(spans.get(id(left)), spans.get(id(right)))
+        if span is not None:
+            spans[id(node)] = span
+        return node
+
+    return reduce
+
+
+def _unary(name: str, is_postfix: bool = False) -> Callable:
+    def reduce(self, s):
+        expr = s[0] if is_postfix else s[1]
+        node = UnaryOp(name, expr, is_postfix=is_postfix)
+        spans = self.transformer.spans
+        span = spans.get(id(expr))
+        if span is not None:
+            spans[id(node)] = span
+        return node
+
+    return reduce
+
+
+def _compound(function: Callable) -> Callable:
+    def reduce(self, s):
+        token, value = s[0], s[2]
+        var = Var(token.value)
+        expr = BinOp(var, value, function)
+        node = Assign(var.name, expr)
+        spans = self.transformer.spans
+        span = _token_span(token)
+        spans[id(var)] = span
+        span = _join(span, spans.get(id(value)))
+        spans[id(expr)] = spans[id(node)] = span
+        return node
+
+    return reduce
+
+
+class AstBuilder:
+    """
+    Reduções do parser LALR que constroem a AST de MicroC.
+
+    Args:
+        transformer:
+            Transformer cuja tabela de posições (`spans`) recebe as posições
+            dos nós criados.
+    """
+
+    def __init__(self, transformer):
+        self.transformer = transformer
+
+    def callbacks(self, rules: Iterable) -> Optional[dict]:
+        """
+        Callbacks para o parser LALR, indexados pelas regras de `rules` (as
+        chaves de `callbacks` do parser; os nomes de terminais são
+        ignorados), ou None se alguma regra não tiver redução.
+        """
+        result = {}
+        for rule in rules:
+            if isinstance(rule, str):
+                continue
+            reduce = self._reduction(rule)
+            if reduce is None:
+                return None
+            result[rule] = MethodType(reduce, self)
+        return result
+
+    def _reduction(self, rule) -> Optional[Callable]:
+        origin, expansion = rule.origin.name, rule.expansion
+        items = [sym for sym in expansion if not (sym.is_term and sym.filter_out)]
+        # Repetições geradas pelo Lark (ex.: `__program_star_0` para `decl*`)
+        if origin.startswith("__") and len(items) in (1, 2):
+            if len(items) == 1 and items[0].name != origin:
+                return AstBuilder._new_list
+            if len(items) == 2 and items[0].name == origin:
+                return AstBuilder._append
+            return None
+        # Regras como `?expr: assign_expr`, que retornam o único filho
+        if rule.options.expand1 and len(expansion) == 1 and not expansion[0].is_term:
+            return AstBuilder._first
+        return REDUCTIONS.get(signature(rule))
+
+    def _span(self, node) -> Optional[Span]:
+        return self.transformer.spans.get(id(node))
+
+    def _register(self, node: Node, span: Optional[Span]) -> Node:
+        if span is not None:
+            self.transformer.spans[id(node)] = span
+        return node
+
+    def _new_list(self, s):
+        return [s[-1]]
+
+    def _append(self, s):
+        items = s[0]
+        items.append(s[-1])
+        return items
+
+    @reduces("forinit: var_decl", "forinit: expr_stmt", "forcond: expr", "forincr: expr")
+    @reduces("expr_stmt: expr _")
+    def _first(self, s):
+        return s[0]
+
+    @reduces("atom: _ expr _")
+    def _parens(self, s):
+        return s[1]
+
+    @reduces("forinit: _", "forcond:", "forincr:")
+    def _none(self, s):
+        return None
+
+    # Programa
+    @reduces("program: __program_star_0", "program:")
+    def program(self, s):
+        stmts = s[0] if s else []
+        program = Program(stmts)
+        spans = self.transformer.spans
+        return self._register(program, join_spans(spans.get(id(stmt)) for stmt in stmts))
+
+    @reduces("block: _ __program_star_0 _", "block: _ _")
+    def block(self, s):
+        decls = s[1] if len(s) == 3 else []
+        block = Block(decls)
+        spans = self.transformer.spans
+        return self._register(block, join_spans(spans.get(id(decl)) for decl in decls))
+
+    # Tipos
+    @reduces("type_int: _")
+    def type_int(self, s):
+        return Type("int")
+
+    @reduces("type_char: _")
+    def type_char(self, s):
+        return Type("char")
+
+    @reduces("type_void: _")
+    def type_void(self, s):
+        return Type("void")
+
+    # Declarações
+    @reduces("var_decl: type VAR _ expr _", "var_decl: type VAR _")
+    def var_decl(self, s):
+        type_node, name = s[0], s[1]
+        if type_node.name == "void":
+            raise ValueError("Declaracao de variavel do tipo void nao e permitido")
+        value = s[3] if len(s) == 5 else None
+        node = VarDef(type_node, name.value, value)
+        return self._register(node, _join(_token_span(name), self._span(value)))
+
+    @reduces(
+        "array_decl: type VAR _ NUMBER _ _ _ array_init _ _",
+        "array_decl: type VAR _ NUMBER _ _ _ _ _",
+        "array_decl: type VAR _ NUMBER _ _",
+    )
+    def array_decl(self, s):
+        type_node, name, size = s[0], s[1], s[3]
+        if type_node.name == "void":
+            raise ValueError("Declaracao de array do tipo void nao e permitido")
+        init_values = s[7] if len(s) == 10 else None
+        node = ArrayDef(type_node, name.value, int(size), init_values)
+        spans = self.transformer.spans
+        span = join_spans(
+            [
+                _token_span(name),
+                _token_span(size),
+                *(spans.get(id(value)) for value in init_values or ()),
+            ]
+        )
+        return self._register(node, span)
+
+    @reduces("array_init: expr __array_init_star_1", "array_init: expr")
+    @reduces("call_params: expr __array_init_star_1", "call_params: expr")
+    @reduces("param_list: param __param_list_star_2", "param_list: param")
+    def _list(self, s):
+        if len(s) == 1:
+            return [s[0]]
+        items = s[1]
+        items.insert(0, s[0])
+        return items
+
+    @reduces("func_decl: type VAR _ param_list _ block", "func_decl: type VAR _ _ block")
+    def func_decl(self, s):
+        name, body = s[1], s[-1]
+        params = s[3] if len(s) == 6 else []
+        node = Function(
+            type=s[0],
+            name=name.value,
+            params=[token.value for token, _ in params],
+            body=body,
+            param_types=[type_node for _, type_node in params],
+        )
+        span = join_spans(
+            [
+                _token_span(name),
+                *(_token_span(token) for token, _ in params),
+                self._span(body),
+            ]
+        )
+        return self._register(node, span)
+
+    @reduces("simple_param: type VAR", "array_param: type VAR _ _")
+    def param(self, s):
+        # Parâmetros são guardados como (nome, tipo) até a função ser criada
+        return s[1], s[0]
+
+    # Comandos
+    @reduces("for_cmd: _ _ forinit forcond _ forincr _ stmt")
+    def for_cmd(self, s):
+        init, cond, incr, body = s[2], s[3], s[5], s[7]
+        spans = self.transformer.spans
+        stmts = [body]
+        if incr is not None:
+            stmts.append(incr)
+        while_body = Block(stmts)
+        body_span = join_spans(spans.get(id(stmt)) for stmt in stmts)
+        self._register(while_body, body_span)
+        loop = While(Literal(True) if cond is None else cond, while_body)
+        self._register(loop, _join(spans.get(id(cond)), body_span))
+        node = Block([loop] if init is None else [init, loop])
+        span = join_spans(spans.get(id(child)) for child in (init, cond, incr, body))
+        return self._register(node, span)
+
+    @reduces("if_stmt: _ _ expr _ stmt _ stmt", "if_stmt: _ _ expr _ stmt")
+    def if_stmt(self, s):
+        cond, then = s[2], s[4]
+        otherwise = s[6] if len(s) == 7 else None
+        node = If(cond, then, otherwise)
+        spans = self.transformer.spans
+        span = join_spans(spans.get(id(child)) for child in (cond, then, otherwise))
+        return self._register(node, span)
+
+    @reduces("while_stmt: _ _ expr _ stmt")
+    def while_stmt(self, s):
+        cond, body = s[2], s[4]
+        return self._register(While(cond, body), _join(self._span(cond), self._span(body)))
+
+    @reduces("do_while_stmt: _ stmt _ _ expr _ _")
+    def do_while_stmt(self, s):
+        body, cond = s[1], s[4]
+        span = _join(self._span(body), self._span(cond))
+        loop = self._register(While(cond, body), span)
+        return self._register(Block([body, loop]), span)
+
+    @reduces("return_stmt: _ expr _", "return_stmt: _ _")
+    def return_stmt(self, s):
+        value = s[1] if len(s) == 3 else None
+        return self._register(Return(value), self._span(value))
+
+    @reduces("printf_stmt: _ _ expr _ _")
+    def printf_stmt(self, s):
+        return self._register(Printf(s[2]), self._span(s[2]))
+
+    # Expressões
+    @reduces("set: VAR _ assign_expr")
+    def set_var(self, s):
+        token, value = s[0], s[2]
+        node = Assign(token.value, value)
+        return self._register(node, _join(_token_span(token), self._span(value)))
+
+    @reduces("set: postfix _ assign_expr")
+    def set(self, s):
+        target, value = s[0], s[2]
+        if isinstance(target, ArrayAccess):
+            node = ArrayAssign(target.array, target.index, value)
+        else:
+            node = Assign(target.name, value)
+        span = _join(self._span(target), self._span(value))
+        # O alvo é descartado; guardado para que seu id não seja reaproveitado
+        self.transformer.registered.append(target)
+        return self._register(node, span)
+
+    iadd = reduces("iadd: VAR _ assign_expr")(_compound(op.add))
+    isub = reduces("isub: VAR _ assign_expr")(_compound(op.sub))
+    imul = reduces("imul: VAR _ assign_expr")(_compound(op.mul))
+    itruediv = reduces("itruediv: VAR _ assign_expr")(_compound(op.div))
+
+    or_ = reduces("or_: or_expr _ and_expr")(_logic(Or))
+    and_ = reduces("and_: and_expr _ eq_expr")(_logic(And))
+    eq = reduces("eq: eq_expr _ rel_expr")(_binop(op.eq))
+    ne = reduces("ne: eq_expr _ rel_expr")(_binop(op.ne))
+    gt = reduces("gt: rel_expr _ add_expr")(_binop(op.gt))
+    lt = reduces("lt: rel_expr _ add_expr")(_binop(op.lt))
+    ge = reduces("ge: rel_expr _ add_expr")(_binop(op.ge))
+    le = reduces("le: rel_expr _ add_expr")(_binop(op.le))
+    add = reduces("add: add_expr _ mul_expr")(_binop(op.add))
+    sub = reduces("sub: add_expr _ mul_expr")(_binop(op.sub))
+    mul = reduces("mul: mul_expr _ unary_expr")(_binop(op.mul))
+    div = reduces("div: mul_expr _ unary_expr")(_binop(op.div))
+    mod = reduces("mod: mul_expr _ unary_expr")(_binop(op.mod))
+
+    not_ = reduces("not_: _ unary_expr")(_unary("not"))
+    neg = reduces("neg: _ unary_expr")(_unary("-"))
+    preinc = reduces("preinc: _ unary_expr")(_unary("++"))
+    predec = reduces("predec: _ unary_expr")(_unary("--"))
+    postinc = reduces("postinc: postfix _")(_unary("++", is_postfix=True))
+    postdec = reduces("postdec: postfix _")(_unary("--", is_postfix=True))
+
+    @reduces("array_access: call _ expr _")
+    def array_access(self, s):
+        array, index = s[0], s[2]
+        node = ArrayAccess(array, index)
+        return self._register(node, _join(self._span(array), self._span(index)))
+
+    @reduces("call: VAR _ call_params _", "call: VAR _ _")
+    def call(self, s):
+        token = s[0]
+        params = s[2] if len(s) == 4 else []
+        var = self._register(Var(token.value), _token_span(token))
+        spans = self.transformer.spans
+        span = join_spans([_token_span(token), *(spans.get(id(param)) for param in params)])
+        return self._register(Call(var, params), span)
+
+    # Terminais
+    @reduces("atom: VAR")
+    def var(self, s):
+        return self._register(Var(s[0].value), _token_span(s[0]))
+
+    @reduces("atom: NUMBER")
+    def number(self, s):
+        return self._register(Literal(int(s[0])), _token_span(s[0]))
+
+    @reduces("atom: CHAR")
+    def char(self, s):
+        # Tira fora as aspas
+        return self._register(Literal(s[0].value[1:-1]), _token_span(s[0]))
+
+    @reduces("atom: NULL")
+    def null(self, s):
+        return self._register(Literal(None), _token_span(s[0]))
+
+
+class DirectParser(_Parser):
+    """
+    Parser LALR do Lark que executa as reduções de `AstBuilder`.
+
+    Os estados são os da tabela do Lark, então erros, `InteractiveParser` e
+    `accepts` funcionam como antes. A tabela é copiada para dicionários em
+    que um deslocamento é o próximo estado e uma redução é a tupla
+    `(tamanho, callback, símbolo)`, sem os objetos `Rule` (cujo hash e
+    comparação são métodos Python). As regras unitárias (`_first` com um
+    símbolo, como `?expr: assign_expr`), que são a maior parte das reduções,
+    só trocam o estado do topo da pilha.
+
+    Args:
+        parse_table:
+            Tabela do parser LALR do Lark.
+        callbacks:
+            Callbacks de `AstBuilder.callbacks` (sem callbacks de terminais).
+    """
+
+    def __init__(self, parse_table, callbacks: dict, debug: bool = False):
+        super().__init__(parse_table, callbacks, debug)
+        self.actions = _compile(parse_table, callbacks)
+
+    def parse(self, lexer, start, value_stack=None, state_stack=None, start_interactive=False):
+        conf = _DirectConf(self.parse_table, self.callbacks, start)
+        conf.actions = self.actions
+        state = _DirectState(conf, lexer, state_stack, value_stack)
+        if start_interactive:
+            return InteractiveParser(self, state, state.lexer)
+        return self.parse_from_state(state)
+
+
+def parser_state(parser: _Parser, callbacks: dict, lexer, start: str = "start") -> ParserState:
+    """
+    Estado inicial de `parser` com outros callbacks (ex.: com wrappers em
+    algumas regras), para ser alimentado token a token.
+    """
+    if not isinstance(parser, DirectParser):
+        return ParserState(ParseConf(parser.parse_table, callbacks, start), lexer)
+    conf = _DirectConf(parser.parse_table, callbacks, start)
+    if callbacks is parser.callbacks:
+        conf.actions = parser.actions
+    else:
+        conf.actions = _compile(parser.parse_table, callbacks)
+    return _DirectState(conf, lexer)
+
+
+class _DirectConf(ParseConf):
+    __slots__ = ("actions",)
+
+
+def _compile(parse_table, callbacks: dict) -> dict[int, dict]:
+    actions: dict[int, dict] = {}
+    reductions: dict = {}
+    for state, table in parse_table.states.items():
+        row = actions[state] = {}
+        for symbol, (action, arg) in table.items():
+            if action is Shift:
+                row[symbol] = arg
+                continue
+            if arg not in reductions:
+                size, reduce = len(arg.expansion), callbacks[arg]
+                if size == 1 and getattr(reduce, "__func__", None) is AstBuilder._first:
+                    reduce = None
+                reductions[arg] = size, reduce, arg.origin.name
+            row[symbol] = reductions[arg]
+    return actions
+
+
+class _DirectState(ParserState):
+    __slots__ = ()
+
+    def feed_token(self, token, is_end=False):
+        # O laço de `ParserState.feed_token` com a tabela de `_compile`
+        state_stack = self.state_stack
+        value_stack = self.value_stack
+        actions = self.parse_conf.actions
+        end_state = self.parse_conf.end_state
+
+        while True:
+            state = state_stack[-1]
+            try:
+                action = actions[state][token.type]
+            except KeyError:
+                expected = {s for s in actions[state] if s.isupper()}
+                raise UnexpectedToken(token, expected, state=self, interactive_parser=None)
+
+            if action.__class__ is int:
+                state_stack.append(action)
+                value_stack.append(token)
+                return
+
+            size, reduce, origin = action
+            if reduce is None:
+                # Regra unitária: o valor continua no topo da pilha
+                del state_stack[-1]
+            else:
+                if size:
+                    s = value_stack[-size:]
+                    del state_stack[-size:]
+                    del value_stack[-size:]
+                else:
+                    s = []
+                value_stack.append(reduce(s))
+            state_stack.append(actions[state_stack[-1]][origin])
+
+            if is_end and state_stack[-1] == end_state:
+                return value_stack[-1]
@@ -13,13 +13,23 @@ padrão do Python e não requer instalação de dependências externas.
 """
 
 import argparse
+import os
+import sys
 
 from lark import Token
 
 from . import eval as lox_eval
+from .batch import EXECUTORS, run_batch
 from .ctx import Ctx
+from .limits import Limits
+from .output import DEFAULT_BUFFER_SIZE, BufferedOutput
 from .parser import lex, parse, parse_cst, parse_expr
+from .profiler import Profiler
+from .tracing import TRACE_FORMATS, CallTracer, guess_trace_format
 from .runtime import show_repr as lox_repr
+from .server import DEFAULT_CACHE_SIZE, Client, serve
+from .streaming import parse_file
+from .vectorize import vectorize
 
 
 def make_argparser():
@@ -58,24 +68,242 @@ def make_argparser():
         action="store_true",
         help="Mostra o código fonte do arquivo de entrada.",
     )
+    parser.add_argument(
+        "-b",
+        "--buffer-size",
+        type=int,
+        default=DEFAULT_BUFFER_SIZE,
+        help="Tamanho do buffer de saída do printf, em caracteres (0 desativa o buffer).",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Mede o tempo por linha e por função e imprime um relatório em stderr.",
+    )
+    parser.add_argument(
+        "--trace-out",
+        metavar="FILE",
+        help="Registra as pilhas de chamadas MicroC em FILE (.json: formato do Chrome; "
+        "demais extensões: pilhas colapsadas para flamegraph).",
+    )
+    parser.add_argument(
+        "--trace-format",
+        choices=TRACE_FORMATS,
+        help="Formato do arquivo de --trace-out (padrão: deduzido da extensão).",
+    )
+    parser.add_argument(
+        "--sample-interval",
+        type=float,
+        default=0.0,
+        metavar="MS",
+        help="Amostra a pilha de chamadas a cada MS milissegundos em vez de registrar "
+        "todas as chamadas (afeta apenas as pilhas colapsadas).",
+    )
+    parser.add_argument(
+        "--max-steps",
+        type=int,
+        metavar="N",
+        help="Interrompe o programa após N passos (iterações de laços, chamadas e "
+        "comandos nos seus corpos).",
+    )
+    parser.add_argument(
+        "--max-memory",
+        type=parse_size,
+        metavar="SIZE",
+        help="Memória máxima para arrays e frames do programa (ex.: 64M, 512K).",
+    )
+    parser.add_argument(
+        "--vectorize",
+        action="store_true",
+        help="Executa laços simples sobre arrays (somas, máximos, cópias, ...) como "
+        "operações sobre fatias, com NumPy se estiver instalado. Ignora --server.",
+    )
+    parser.add_argument(
+        "--server",
+        nargs="?",
+        const="",
+        metavar="SOCKET",
+        help="Executa (ou imprime a árvore, com -t) usando um servidor `microc serve`; "
+        "sem servidor ativo, executa no próprio processo.",
+    )
+    return parser
+
+
+def make_serve_argparser():
+    parser = argparse.ArgumentParser(
+        prog="microc serve",
+        description="Servidor de compilação MicroC num socket Unix.",
+    )
+    parser.add_argument(
+        "--socket",
+        metavar="PATH",
+        help="Caminho do socket (padrão: $XDG_RUNTIME_DIR/microc.sock).",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_CACHE_SIZE,
+        help="Número de árvores sintáticas mantidas no cache.",
+    )
+    return parser
+
+
+def parse_size(text: str) -> int:
+    """
+    Converte tamanhos como "512", "64K", "16M" ou "1G" em bytes.
+    """
+    units = {"K": 1024, "M": 1024**2, "G": 1024**3}
+    text = text.strip().upper().removesuffix("B")
+    factor = units.get(text[-1:], 1)
+    if factor != 1:
+        text = text[:-1]
+    try:
+        return int(text) * factor
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"tamanho inválido: {text!r}") from None
+
+
+def make_run_argparser():
+    parser = argparse.ArgumentParser(
+        prog="microc run",
+        description="Executa vários programas MicroC num único processo e escreve "
+        "um resultado JSON por programa.",
+    )
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        metavar="PATH",
+        help="Arquivos .microc ou pastas (percorridas recursivamente).",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Número de programas executados ao mesmo tempo (0 usa todos os núcleos).",
+    )
+    parser.add_argument(
+        "--executor",
+        choices=EXECUTORS,
+        default="auto",
+        help="Executa os programas em processos, threads ou subinterpretadores. O padrão "
+        "(auto) usa threads em builds sem GIL e processos nos demais.",
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        help="Programas enviados de uma vez a cada processo (padrão: automático).",
+    )
+    parser.add_argument(
+        "--cpu-limit",
+        type=float,
+        metavar="SECONDS",
+        help="Tempo máximo de CPU por programa (apenas com --executor process).",
+    )
+    parser.add_argument(
+        "--memory-limit",
+        type=int,
+        metavar="MB",
+        help="Memória máxima de cada processo, em megabytes (apenas com --executor process).",
+    )
+    parser.add_argument(
+        "--max-steps",
+        type=int,
+        metavar="N",
+        help="Número máximo de passos de cada programa.",
+    )
+    parser.add_argument(
+        "--max-memory",
+        type=parse_size,
+        metavar="SIZE",
+        help="Memória máxima para arrays e frames de cada programa (ex.: 64M).",
+    )
+    parser.add_argument(
+        "--vectorize",
+        action="store_true",
+        help="Executa laços simples sobre arrays como operações sobre fatias.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        metavar="FILE",
+        help="Escreve os resultados em FILE em vez da saída padrão.",
+    )
     return parser
 
 
-def main():
+def make_diff_argparser():
+    parser = argparse.ArgumentParser(
+        prog="microc diff",
+        description="Executa programas em todos os motores (árvore, asyncio, compilado, "
+        "cache do servidor, --vectorize) e compara saída, globais, erros e passos.",
+    )
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        metavar="PATH",
+        help="Arquivos .microc ou pastas (percorridas recursivamente).",
+    )
+    parser.add_argument(
+        "--generated",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Também compara N programas sintéticos (veja microC.generator).",
+    )
+    parser.add_argument(
+        "--size",
+        type=int,
+        default=100,
+        help="Número aproximado de comandos dos programas sintéticos.",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Seed do primeiro programa sintético.")
+    parser.add_argument(
+        "--engines",
+        help="Motores comparados, separados por vírgula; o primeiro é a referência "
+        "(padrão: todos os disponíveis).",
+    )
+    parser.add_argument(
+        "--no-minimize",
+        action="store_true",
+        help="Mostra os programas originais em vez de reduzi-los.",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None):
     """
     Função principal que cria a interface de linha de comando (CLI) para o compilador Lox.
     """
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "run":
+        return run_many(argv[1:])
+    if argv and argv[0] == "diff":
+        return run_diff(argv[1:])
+    if argv and argv[0] == "serve":
+        args = make_serve_argparser().parse_args(argv[1:])
+        try:
+            return serve(args.socket, args.cache_size)
+        except OSError as e:
+            print(e, file=sys.stderr)
+            exit(1)
+
     parser = make_argparser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    if args.profile and args.trace_out:
+        parser.error("--profile e --trace-out não podem ser usados juntos")
 
     # Inicia o repl, se requisitado
     if args.file == "repl":
         return repl()
 
-    # Lê arquivo de entrada
+    # Lê arquivo de entrada. Executar o programa e mostrar a AST não precisam
+    # do texto: o arquivo é analisado aos poucos por `parse_file`. O relatório
+    # do profiler mostra o código de cada linha
+    read_text = args.show or args.server is not None or args.cst or args.lex or args.profile
     try:
         with open(args.file, "r") as f:
-            source = f.read()
+            source = f.read() if read_text else None
     except FileNotFoundError:
         print(f"Arquivo {args.file} não encontrado.")
         exit(1)
@@ -90,9 +318,25 @@ def main():
         print_color("=" * line_len, "blue")
         print()
 
+    if args.server is not None and not args.cst and not args.lex and not args.vectorize:
+        if run_on_server(source, args):
+            return
+
     if not args.ast and not args.cst and not args.lex:
+        limits = None
+        if args.max_steps is not None or args.max_memory is not None:
+            limits = Limits(args.max_steps, args.max_memory)
+        ctx = Ctx.from_dict(
+            {}, output=BufferedOutput(buffer_size=args.buffer_size), limits=limits
+        )
+        if args.profile or args.trace_out:
+            return run_instrumented(ctx, args, source)
         try:
-            lox_eval(source, auto_execute_main=True)
+            # Analisa aqui para que os erros tragam o nome do arquivo
+            program = parse_file(args.file)
+            if args.vectorize:
+                vectorize(program)
+            lox_eval(program, ctx, auto_execute_main=True)
         except Exception as e:
             on_error(e, args.pm)
 
@@ -100,12 +344,145 @@ def main():
         debug_source(source, args)
 
 
-def debug_source(source: str, args):
+def run_instrumented(ctx: Ctx, args, source: str | None = None):
+    """
+    Executa o programa com o profiler (--profile) ou com o registro de
+    chamadas (--trace-out). `source` é o código mostrado no relatório do
+    profiler.
+    """
+    ast = parse_file(args.file)
+    if args.vectorize:
+        vectorize(ast)
+    if args.profile:
+        tool = Profiler(ast)
+    else:
+        trace_format = args.trace_format or guess_trace_format(args.trace_out)
+        tool = CallTracer(
+            ast,
+            sample_interval=args.sample_interval / 1000,
+            record_events=trace_format == "chrome" or args.sample_interval == 0,
+        )
+    try:
+        with tool:
+            lox_eval(ast, ctx, auto_execute_main=True)
+    except Exception as e:
+        on_error(e, args.pm)
+    finally:
+        if args.profile:
+            print(tool.report(source), file=sys.stderr)
+        else:
+            with open(args.trace_out, "w") as fd:
+                tool.write(fd, trace_format)
+
+
+def run_on_server(source: str, args) -> bool:
+    """
+    Envia o programa para um servidor `microc serve`. Retorna False se não
+    houver servidor, para que o programa seja executado no próprio processo.
+    """
+    try:
+        client = Client(args.server or None)
+    except OSError:
+        return False
+
+    with client:
+        fields = {"path": args.file}
+        if args.max_steps is not None:
+            fields["max_steps"] = args.max_steps
+        if args.max_memory is not None:
+            fields["max_memory"] = args.max_memory
+        response = client.request("ast" if args.ast else "run", source, **fields)
+    if args.ast and response["ok"]:
+        print(response["ast"])
+        return True
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stdout.flush()
+    if not response["ok"]:
+        error = response["error"]
+        if response.get("line") is not None:
+            error = f"{args.file}:{response['line']}:{response['column']}: {error}"
+        print(f"Programa terminou com um erro: {error}", file=sys.stderr)
+        exit(1)
+    return True
+
+
+def run_many(argv: list[str]):
+    """
+    Comando `microc run`: executa vários programas e escreve os resultados
+    em JSON Lines. Termina com código 1 se algum programa falhar.
+    """
+    parser = make_run_argparser()
+    args = parser.parse_args(argv)
+    jobs = args.jobs or os.cpu_count() or 1
+    memory_limit = args.memory_limit * 1024 * 1024 if args.memory_limit else None
+    try:
+        results = run_batch(
+            args.paths,
+            jobs=jobs,
+            executor=args.executor,
+            chunksize=args.chunksize,
+            cpu_limit=args.cpu_limit,
+            memory_limit=memory_limit,
+            max_steps=args.max_steps,
+            max_memory=args.max_memory,
+            vectorize=args.vectorize,
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+    fd = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    failed = False
+    try:
+        for result in results:
+            fd.write(result.to_json() + "\n")
+            failed = failed or not result.ok
+    finally:
+        if fd is not sys.stdout:
+            fd.close()
+    if failed:
+        exit(1)
+
+
+def run_diff(argv: list[str]):
+    """
+    Comando `microc diff`: testes diferenciais entre os motores de execução.
+    Termina com código 1 se houver alguma divergência.
+    """
+    # Importado aqui: microC.testing depende do pytest
+    from .differential import ENGINES, available_engines, check_example, iter_cases
+
+    parser = make_diff_argparser()
+    args = parser.parse_args(argv)
+    if not args.paths and not args.generated:
+        parser.error("informe arquivos ou --generated N")
+    engines = available_engines()
+    if args.engines:
+        names = args.engines.split(",")
+        unknown = [name for name in names if name not in ENGINES]
+        if unknown or len(names) < 2:
+            parser.error(f"motores: escolha dois ou mais entre {', '.join(ENGINES)}")
+        engines = [ENGINES[name] for name in names]
+
+    cases = failed = 0
+    for example, auto_execute_main in iter_cases(args.paths, args.generated, args.size, args.seed):
+        cases += 1
+        mismatches = check_example(example, engines, auto_execute_main, not args.no_minimize)
+        for mismatch in mismatches:
+            failed += 1
+            print_color(f"=== {example.path}", "red")
+            print(mismatch)
+            print(mismatch.source)
+    print(f"{cases} programas, {len(engines)} motores, {failed} divergências")
+    if failed:
+        exit(1)
+
+
+def debug_source(source: str | None, args):
     """
     Mostra informações de depuração sobre o código Lox passado como argumento.
     """
     if args.ast:
-        ast = parse(source)
+        ast = parse_file(args.file)
         for node in ast.lark_descendents():
             if isinstance(node, Token):
                 descr = repr(node)
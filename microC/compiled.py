@@ -0,0 +1,100 @@
+"""
+Programas compilados, que podem ser executados concorrentemente.
+
+`parse` devolve uma árvore que ainda pode ser alterada (`desugar_tree`,
+`replace_child`, instrumentação do profiler). Um `CompiledProgram` guarda a
+árvore já validada e simplificada, com todas as listas convertidas em
+tuplas, e cada execução recebe o seu próprio estado: contexto, tabela de
+funções embutidas, saída e limites. Assim, o mesmo programa pode ser
+executado ao mesmo tempo por várias threads.
+
+O congelamento é raso: a estrutura da árvore (quais comandos e filhos cada
+nó tem) não muda, mas os atributos dos nós continuam graváveis, como
+`node.eval` na instrumentação do profiler. A avaliação só guarda nos nós
+valores derivados da própria árvore, iguais em todas as execuções (o peso
+de um laço, `While.weight`); código que altera atributos de uma árvore
+compilada é responsável por não fazê-lo durante execuções.
+"""
+
+from dataclasses import dataclass, field, fields
+from typing import Callable, Mapping, Optional
+
+from .ast import Program, Value
+from .ctx import Ctx
+from .limits import Limits
+from .node import Node
+from .output import STDOUT, Output
+from .parser import parse
+
+__all__ = ["CompiledProgram", "freeze"]
+
+
+def freeze(tree: Node) -> Node:
+    """
+    Converte as listas da árvore em tuplas, impedindo que comandos sejam
+    inseridos ou removidos depois da compilação. Retorna a própria árvore.
+
+    Os atributos dos nós não são protegidos: `node.name = ...` ainda
+    funciona.
+    """
+    for node in tree.descendants():
+        for f in fields(node):
+            value = getattr(node, f.name)
+            if isinstance(value, list):
+                setattr(node, f.name, tuple(value))
+    return tree
+
+
+@dataclass(frozen=True)
+class CompiledProgram:
+    """
+    Programa MicroC pronto para ser executado várias vezes, inclusive em
+    paralelo.
+
+    A árvore tem congelamento raso (veja `freeze`): as listas viram tuplas,
+    mas os atributos dos nós podem ser alterados. Ela não deve ser
+    instrumentada (ex.: pelo `Profiler`) nem alterada enquanto houver
+    execuções em andamento.
+
+    Examples:
+        >>> program = CompiledProgram.from_source(src)
+        >>> program.run(output=MemoryOutput())
+    """
+
+    program: Program
+    source: Optional[str] = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def from_source(cls, source: str) -> "CompiledProgram":
+        """
+        Analisa, valida e congela o código fonte.
+        """
+        return cls(freeze(parse(source)), source)
+
+    def new_context(
+        self,
+        output: Output = STDOUT,
+        limits: Optional[Limits] = None,
+        builtins: Optional[Mapping[str, Callable]] = None,
+    ) -> Ctx:
+        """
+        Cria o estado de uma execução: um contexto global vazio, com saída,
+        limites e funções embutidas próprios.
+        """
+        return Ctx.from_dict({}, output=output, limits=limits, builtins=builtins)
+
+    def run(
+        self,
+        output: Output = STDOUT,
+        limits: Optional[Limits] = None,
+        builtins: Optional[Mapping[str, Callable]] = None,
+        auto_execute_main: bool = True,
+    ) -> Value:
+        """
+        Executa o programa num contexto novo e retorna o valor de `main`.
+        """
+        ctx = self.new_context(output, limits, builtins)
+        try:
+            return self.program.eval(ctx, auto_execute_main)
+        finally:
+            output.flush()
@@ -1,26 +1,49 @@
 import math
 import time
+from types import MappingProxyType
 from dataclasses import field
-from typing import TYPE_CHECKING, Iterator, Optional, TypeVar
+from typing import TYPE_CHECKING, Callable, Iterator, Mapping, Optional, TypeVar
 
 from microC.ast import dataclass
 
+from .natives import NATIVES
+from .output import STDOUT, Output
+
 if TYPE_CHECKING:
     from .ast import Type, Value
+    from .limits import Limits
 
 T = TypeVar("T")
 ScopeDict = dict[str, tuple["Type", "Value"]]
 
 
 class _Builtins(dict):
-    BUILTINS: dict[str, "Value"] = {
+    """
+    Escopo das funções embutidas.
+
+    Além de `sqrt`, `clock` e `max`, inclui as funções nativas de
+    `microC.natives` (memset, memcpy, sum, minidx, sort e strlen).
+
+    Como os demais escopos, guarda pares (tipo, valor). Cada contexto criado
+    por `Ctx.from_dict` recebe a sua própria tabela, de forma que execuções
+    concorrentes não compartilham estado por meio dela.
+    """
+
+    BUILTINS: dict[str, Callable] = {
         "sqrt": math.sqrt,
         "clock": time.time,
         "max": max,
+        **NATIVES,
     }
 
-    def __init__(self):
-        super().__init__(self.BUILTINS)
+    # Tipo das funções embutidas, `Type("builtin")`. Como `microC.ast` importa
+    # este módulo antes de definir `Type`, é ele quem preenche o atributo
+    TYPE: "Type"
+
+    def __init__(self, functions: Optional[Mapping[str, Callable]] = None):
+        tipo = self.TYPE
+        functions = self.BUILTINS if functions is None else functions
+        super().__init__({name: (tipo, func) for name, func in functions.items()})
 
     def __repr__(self) -> str:
         return "BUILTINS"
@@ -29,7 +52,16 @@ class _Builtins(dict):
         return self.__repr__()
 
 
-BUILTINS = _Builtins()
+# Funções embutidas padrão (somente leitura)
+BUILTINS: Mapping[str, Callable] = MappingProxyType(_Builtins.BUILTINS)
+
+
+def new_builtins(functions: Optional[Mapping[str, Callable]] = None) -> _Builtins:
+    """
+    Cria uma tabela de funções embutidas. Por padrão, usa as funções de
+    `_Builtins.BUILTINS`; `functions` permite trocar o conjunto inteiro.
+    """
+    return _Builtins(functions)
 
 
 @dataclass
@@ -37,17 +69,32 @@ class Ctx:
     """
     Contexto de execução. Por enquanto é só um dicionário que armazena nomes
     das variáveis e seus respectivos valores.
+
+    Os atributos `output` (para onde vai a saída do `printf`) e `limits`
+    (limites de execução, veja `microC.limits`) são compartilhados por todos
+    os escopos empilhados a partir deste contexto.
     """
 
     scope: ScopeDict = field(default_factory=dict)
-    parent: Optional["Ctx"] = field(default_factory=lambda: Ctx(BUILTINS, None))
+    parent: Optional["Ctx"] = field(default_factory=lambda: Ctx(new_builtins(), None))
+    output: Output = field(default=STDOUT, repr=False, compare=False)
+    limits: Optional["Limits"] = field(default=None, repr=False, compare=False)
 
     @classmethod
-    def from_dict(cls, env: ScopeDict) -> "Ctx":
+    def from_dict(
+        cls,
+        env: ScopeDict,
+        output: Output = STDOUT,
+        limits: Optional["Limits"] = None,
+        builtins: Optional[Mapping[str, Callable]] = None,
+    ) -> "Ctx":
         """
         Cria um novo contexto a partir de um dicionário.
+
+        O contexto recebe uma tabela de funções embutidas própria, criada a
+        partir de `builtins` (ou das funções padrão).
         """
-        return cls(env, Ctx(BUILTINS, None))
+        return cls(env, Ctx(new_builtins(builtins), None), output, limits)
 
     def __getitem__(self, name: str) -> "Value":
         """
@@ -138,7 +185,7 @@ class Ctx:
         """
         Empilha um novo escopo no contexto atual.
         """
-        return Ctx(env, self)
+        return Ctx(env, self, self.output, self.limits)
 
     def is_global(self) -> bool:
         """
@@ -0,0 +1,351 @@
+"""
+Testes diferenciais entre as formas de executar um programa MicroC.
+
+O mesmo programa pode ser executado pelo avaliador da árvore (`Node.eval`),
+pelo avaliador com geradores de `microC.aio`, por um `CompiledProgram`
+(árvore congelada), por uma árvore reaproveitada do cache do servidor e com
+o passo `--vectorize`, com e sem NumPy. Todos devem produzir exatamente o
+mesmo resultado: a mesma saída, o mesmo estado final das variáveis globais,
+a mesma classe de erro (veja `microC.batch.error_kind`) e o mesmo número de
+passos contabilizados (veja `microC.limits`).
+
+`compare` executa um programa em todos os motores e retorna as
+divergências em relação ao primeiro deles (o avaliador da árvore). Quando
+há divergência, `minimize` remove linhas do programa enquanto a divergência
+persistir, produzindo um exemplo pequeno do problema.
+
+Os casos de teste são exemplos de `microC.testing` (`Example`): os
+arquivos de `exemplos/` e os programas de `microC.generator`.
+"""
+
+import asyncio
+import copy
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional
+
+from .aio import aeval
+from .ast import Value
+from .batch import error_kind, iter_sources
+from .compiled import CompiledProgram
+from .ctx import Ctx
+from .generator import generate_program
+from .limits import Limits
+from .output import MemoryOutput
+from .parser import parse
+from .server import ASTCache
+from .testing import Example, load_example
+from .vectorize import numpy_available, vectorize
+
+__all__ = [
+    "ENGINES",
+    "Engine",
+    "Mismatch",
+    "Outcome",
+    "available_engines",
+    "check_example",
+    "compare",
+    "iter_cases",
+    "minimize",
+    "run_engine",
+]
+
+FIELDS = ("stdout", "globals", "error_kind", "steps")
+# Limite de passos do programa original durante a minimização. Remover linhas
+# pode criar laços infinitos: os candidatos podem usar no máximo o dobro dos
+# passos do original (mais uma folga)
+MINIMIZE_MAX_STEPS = 1_000_000
+MINIMIZE_SLACK = 1000
+
+
+@dataclass(frozen=True)
+class Engine:
+    """
+    Uma forma de executar programas: `run(source, ctx, auto_execute_main)`.
+    """
+
+    name: str
+    run: Callable[[str, Ctx, bool], Value] = field(repr=False)
+
+
+def _tree(source: str, ctx: Ctx, auto_execute_main: bool) -> Value:
+    return parse(source).eval(ctx, auto_execute_main)
+
+
+def _async(source: str, ctx: Ctx, auto_execute_main: bool) -> Value:
+    # Um passo por fatia: exercita todas as pausas do avaliador
+    coro = aeval(source, ctx, step_budget=1, auto_execute_main=auto_execute_main)
+    return asyncio.run(coro)
+
+
+def _compiled(source: str, ctx: Ctx, auto_execute_main: bool) -> Value:
+    return CompiledProgram.from_source(source).program.eval(ctx, auto_execute_main)
+
+
+def _cached(source: str, ctx: Ctx, auto_execute_main: bool) -> Value:
+    # Executa uma vez e reaproveita a árvore do cache, como o servidor faz
+    # entre requisições: nenhum estado pode vazar de uma execução para outra
+    cache = ASTCache()
+    program, _ = cache.get(source)
+    scratch = Ctx.from_dict({}, output=MemoryOutput(), limits=Limits(ctx.limits.max_steps))
+    try:
+        program.program.eval(scratch, auto_execute_main)
+    except Exception:
+        pass
+    program, _ = cache.get(source)
+    return program.program.eval(ctx, auto_execute_main)
+
+
+def _vectorized(use_numpy: bool) -> Callable[[str, Ctx, bool], Value]:
+    def run(source: str, ctx: Ctx, auto_execute_main: bool) -> Value:
+        tree = parse(source)
+        vectorize(tree, use_numpy=use_numpy)
+        return tree.eval(ctx, auto_execute_main)
+
+    return run
+
+
+ENGINES = {
+    "tree": Engine("tree", _tree),
+    "async": Engine("async", _async),
+    "compiled": Engine("compiled", _compiled),
+    "cached": Engine("cached", _cached),
+    "vectorize": Engine("vectorize", _vectorized(False)),
+    "vectorize-numpy": Engine("vectorize-numpy", _vectorized(True)),
+}
+
+
+def available_engines() -> list[Engine]:
+    """
+    Motores disponíveis neste ambiente. O primeiro é a referência.
+    """
+    return [e for name, e in ENGINES.items() if name != "vectorize-numpy" or numpy_available()]
+
+
+@dataclass
+class Outcome:
+    """
+    Resultado observável de uma execução.
+
+    Attributes:
+        stdout:
+            Tudo o que foi impresso, mesmo que o programa termine com erro.
+        globals:
+            Valores finais das variáveis globais (funções são ignoradas).
+        error_kind:
+            Classe do erro, como em `microC.batch.error_kind`, ou None.
+        steps:
+            Passos contabilizados (veja `microC.limits`).
+        error:
+            Mensagem de erro. Não é comparada entre os motores.
+    """
+
+    stdout: str
+    globals: dict = field(default_factory=dict)
+    error_kind: Optional[str] = None
+    steps: int = 0
+    error: Optional[str] = field(default=None, compare=False)
+
+
+def run_engine(
+    engine: Engine,
+    source: str,
+    auto_execute_main: bool = True,
+    max_steps: Optional[int] = None,
+) -> Outcome:
+    """
+    Executa o programa num contexto novo e coleta o resultado.
+    """
+    out = MemoryOutput()
+    limits = Limits(max_steps)
+    ctx = Ctx.from_dict({}, output=out, limits=limits)
+    kind = message = None
+    try:
+        engine.run(source, ctx, auto_execute_main)
+    except Exception as exc:
+        kind, message = error_kind(exc), str(exc) or type(exc).__name__
+    state = {
+        name: copy.copy(value)
+        for name, (_, value) in ctx.scope.items()
+        if isinstance(value, (int, str, list))
+    }
+    return Outcome(out.getvalue(), state, kind, limits.steps, message)
+
+
+@dataclass
+class Mismatch:
+    """
+    Divergência entre um motor e a referência.
+
+    Attributes:
+        source:
+            Programa que produz a divergência (minimizado, se
+            `minimize` foi usado).
+        engine, reference:
+            Nomes dos motores comparados.
+        field:
+            Campo de `Outcome` que diverge.
+        expected, got:
+            Valores do campo na referência e no motor.
+    """
+
+    source: str
+    engine: str
+    reference: str
+    field: str
+    expected: object
+    got: object
+
+    def __str__(self) -> str:
+        return (
+            f"{self.engine} diverge de {self.reference} em {self.field}:\n"
+            f"  esperado: {self.expected!r}\n"
+            f"  obtido:   {self.got!r}"
+        )
+
+
+def compare(
+    source: str,
+    engines: Optional[list[Engine]] = None,
+    auto_execute_main: bool = True,
+    max_steps: Optional[int] = None,
+) -> list[Mismatch]:
+    """
+    Executa o programa em todos os motores e retorna as divergências em
+    relação ao primeiro.
+    """
+    engines = available_engines() if engines is None else engines
+    reference, *others = engines
+    expected = run_engine(reference, source, auto_execute_main, max_steps)
+    mismatches = []
+    for engine in others:
+        got = run_engine(engine, source, auto_execute_main, max_steps)
+        for name in FIELDS:
+            a, b = getattr(expected, name), getattr(got, name)
+            if a != b:
+                mismatches.append(Mismatch(source, engine.name, reference.name, name, a, b))
+    return mismatches
+
+
+def minimize(
+    mismatch: Mismatch,
+    auto_execute_main: bool = True,
+    max_steps: int = MINIMIZE_MAX_STEPS,
+) -> Mismatch:
+    """
+    Reduz o programa de uma divergência, removendo linhas enquanto o programa
+    continuar válido para a referência e a divergência no mesmo campo
+    persistir. Os candidatos devem terminar na referência com a mesma
+    classe de erro do programa original (normalmente, nenhuma).
+
+    Uma linha que abre um bloco é removida junto com o bloco inteiro (e um
+    `} else {` junto com o `else`), de forma que a maioria dos candidatos
+    continua sintaticamente válida. As remoções seguem a ideia do delta
+    debugging: primeiro metades do programa, depois partes cada vez menores.
+    """
+    reference, engine = ENGINES[mismatch.reference], ENGINES[mismatch.engine]
+    original = run_engine(reference, mismatch.source, auto_execute_main, max_steps)
+    max_steps = min(max_steps, 2 * original.steps + MINIMIZE_SLACK)
+
+    def reproduce(lines: list[str]) -> Optional[Mismatch]:
+        source = "\n".join(lines) + "\n"
+        expected = run_engine(reference, source, auto_execute_main, max_steps)
+        # O candidato deve terminar como o original na referência (em geral,
+        # sem erro), para não trocar a divergência por um programa inválido
+        if expected.error_kind != original.error_kind:
+            return None
+        got = run_engine(engine, source, auto_execute_main, max_steps)
+        a, b = getattr(expected, mismatch.field), getattr(got, mismatch.field)
+        if a == b:
+            return None
+        return Mismatch(source, engine.name, reference.name, mismatch.field, a, b)
+
+    lines = [line for line in mismatch.source.splitlines() if line.strip()]
+    lines = [line for line in lines if not line.lstrip().startswith("//")]
+    best = reproduce(lines)
+    if best is None:
+        # Só ocorre com programas que dependem dos comentários ou que
+        # excedem o limite de passos: mantém o original
+        return mismatch
+
+    n = 2
+    while lines:
+        chunk = max(len(lines) // n, 1)
+        for start in range(0, len(lines), chunk):
+            removed = _expand(lines, range(start, min(start + chunk, len(lines))))
+            if not removed:
+                continue
+            candidate = [line for i, line in enumerate(lines) if i not in removed]
+            found = reproduce(candidate) if candidate else None
+            if found is not None:
+                lines, best = candidate, found
+                n = max(n - 1, 2)
+                break
+        else:
+            if chunk == 1:
+                break
+            n = min(n * 2, len(lines))
+    return best
+
+
+def _expand(lines: list[str], indices: Iterable[int]) -> set[int]:
+    """
+    Linhas removidas junto com `indices`: blocos abertos por elas vão
+    inteiros. Linhas que só fecham blocos não são removidas sozinhas.
+    """
+    removed: set[int] = set()
+    for i in indices:
+        if i in removed:
+            continue
+        text = lines[i].strip()
+        if text.startswith("}") and not text.endswith("{"):
+            continue
+        # `} else {` fecha o bloco do `if` e abre o do `else`: remove até
+        # antes do `}` que fecha o `else`
+        depth = 1 if text.startswith("}") else 0
+        end = i
+        for j in range(i, len(lines)):
+            depth += lines[j].count("{") - lines[j].count("}")
+            end = j
+            if depth <= 0:
+                break
+        if text.startswith("}"):
+            end -= 1
+        removed.update(range(i, end + 1))
+    return removed
+
+
+def check_example(
+    example: Example,
+    engines: Optional[list[Engine]] = None,
+    auto_execute_main: bool = False,
+    shrink: bool = True,
+) -> list[Mismatch]:
+    """
+    Compara os motores num exemplo de `microC.testing`, opcionalmente
+    minimizando cada divergência encontrada.
+
+    Como em `Example.eval`, `main` não é executada automaticamente, a menos
+    que `auto_execute_main` seja verdadeiro (arquivos de `exemplos/`).
+    """
+    mismatches = compare(example.src, engines, auto_execute_main)
+    if shrink:
+        mismatches = [minimize(m, auto_execute_main) for m in mismatches]
+    return mismatches
+
+
+def iter_cases(
+    paths: Iterable[str | Path] = (),
+    generated: int = 0,
+    size: int = 100,
+    seed: int = 0,
+) -> Iterator[tuple[Example, bool]]:
+    """
+    Exemplos dos arquivos em `paths` (executados com `main` automático) e
+    `generated` programas sintéticos a partir de `seed`. Produz pares
+    (exemplo, auto_execute_main).
+    """
+    for path in iter_sources(paths):
+        yield load_example(path), True
+    for i in range(generated):
+        yield generate_program(seed + i, size).example(), False
@@ -0,0 +1,753 @@
+"""
+Gerador de programas MicroC sintéticos.
+
+`generate_program(seed, size)` produz um programa válido (sintática e
+semanticamente) com aproximadamente `size` comandos, cobrindo as construções
+da gramática: variáveis globais e locais, `int` e `char`, arrays com e sem
+inicialização, funções com parâmetros simples e arrays, recursão, blocos
+aninhados (inclusive com variáveis que escondem as de fora), `if`/`else`,
+`for`, `while`, `do-while`, atribuições compostas, `++`/`--` pré e pós-fixos,
+operadores aritméticos, relacionais e lógicos, e `printf`.
+
+A saída esperada é calculada pelo próprio gerador, sem usar o interpretador:
+cada construção gerada vem acompanhada de uma função Python que reproduz a
+sua semântica (divisão e resto truncados como em C, comparações que
+produzem booleanos, `&&`, `||` e `!` que produzem 0 ou 1). Os valores são
+mantidos pequenos com `% 10007` e os divisores nunca são zero, de forma que
+os programas terminam sem erros.
+
+O mesmo `seed` sempre produz o mesmo programa.
+"""
+
+import random
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Optional
+
+if TYPE_CHECKING:
+    from .testing import Example
+
+__all__ = ["GeneratedProgram", "generate_program"]
+
+MODULUS = 10007
+# Número máximo de execuções do corpo de um laço, somando os laços externos
+MAX_WEIGHT = 200
+
+
+@dataclass(frozen=True)
+class GeneratedProgram:
+    """
+    Programa gerado e o resultado esperado da sua execução.
+
+    Attributes:
+        source:
+            Código fonte. Termina com comentários `// expect: ...` com as
+            linhas da saída, no formato de `microC.testing.Example`.
+        stdout:
+            Saída esperada do programa.
+        globals:
+            Valores finais das variáveis globais (inteiros, caracteres e
+            listas, no caso de arrays).
+    """
+
+    seed: int
+    size: int
+    source: str = field(repr=False)
+    stdout: str = field(repr=False)
+    globals: dict = field(default_factory=dict, repr=False)
+
+    def example(self) -> "Example":
+        """
+        O programa como um exemplo de `microC.testing`.
+
+        `Example.eval` não executa `main` automaticamente, então o código do
+        exemplo chama `main()` no nível do programa.
+        """
+        from .testing import Example
+
+        code, sep, expected = self.source.partition("\n// expect:")
+        src = f"{code}main();\n{sep}{expected}"
+        return Example(src, path=Path(f"<gerado:{self.seed}:{self.size}>"))
+
+
+def generate_program(seed: int = 0, size: int = 100) -> GeneratedProgram:
+    """
+    Gera um programa com aproximadamente `size` comandos.
+    """
+    return _Generator(seed, size).program()
+
+
+#
+# Semântica usada para calcular a saída esperada
+#
+
+
+class _Model:
+    """
+    Estado da execução simulada: pilha de escopos e linhas impressas.
+    """
+
+    def __init__(self):
+        self.scopes: list[dict] = [{}]
+        self.output: list[str] = []
+
+    def get(self, name: str):
+        for scope in reversed(self.scopes):
+            if name in scope:
+                return scope[name]
+        raise KeyError(name)
+
+    def set(self, name: str, value) -> None:
+        for scope in reversed(self.scopes):
+            if name in scope:
+                scope[name] = value
+                return
+        raise KeyError(name)
+
+
+def _div(a: int, b: int) -> int:
+    q = abs(a) // abs(b)
+    return q if (a >= 0) == (b > 0) else -q
+
+
+def _mod(a: int, b: int) -> int:
+    return a - b * _div(a, b)
+
+
+def _show(value) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, list):
+        text = "".join(value)
+        end = text.find("\0")
+        return text if end == -1 else text[:end]
+    return str(value)
+
+
+Eval = Callable[[_Model], object]
+Exec = Callable[[_Model], None]
+ARITHMETIC = {"+": lambda a, b: a + b, "-": lambda a, b: a - b, "*": lambda a, b: a * b}
+COMPARISON = {
+    "<": lambda a, b: a < b,
+    ">": lambda a, b: a > b,
+    "<=": lambda a, b: a <= b,
+    ">=": lambda a, b: a >= b,
+    "==": lambda a, b: a == b,
+    "!=": lambda a, b: a != b,
+}
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+
+
+def _sequence(stmts: list[Exec]) -> Exec:
+    def run(m: _Model) -> None:
+        for stmt in stmts:
+            stmt(m)
+
+    return run
+
+
+def _block(stmts: list[Exec]) -> Exec:
+    body = _sequence(stmts)
+
+    def run(m: _Model) -> None:
+        m.scopes.append({})
+        try:
+            body(m)
+        finally:
+            m.scopes.pop()
+
+    return run
+
+
+@dataclass
+class _Function:
+    name: str
+    params: list[str]  # "int" ou "array"
+    returns: bool
+    run: Callable = field(repr=False)
+
+
+class _Generator:
+    def __init__(self, seed: int, size: int):
+        self.seed = seed
+        self.size = size
+        self.rng = random.Random(seed)
+        self.remaining = size
+        self.counter = 0
+        # Nomes visíveis: "int", "char" ou o tamanho do array ("int[]" ou "char[]")
+        self.scopes: list[dict[str, tuple[str, int]]] = [{}]
+        self.readonly: set[str] = set()
+        self.functions: list[_Function] = []
+        self.weight = 1
+
+    #
+    # Auxiliares
+    #
+
+    def fresh(self, prefix: str) -> str:
+        self.counter += 1
+        return f"{prefix}{self.counter}"
+
+    def names(self, kind: str) -> list[str]:
+        seen: dict[str, tuple[str, int]] = {}
+        for scope in self.scopes:
+            seen.update(scope)
+        return [name for name, (k, _) in seen.items() if k == kind]
+
+    def writable(self) -> list[str]:
+        return [name for name in self.names("int") if name not in self.readonly]
+
+    def declare(self, name: str, kind: str, length: int = 0) -> None:
+        self.scopes[-1][name] = (kind, length)
+
+    def length(self, name: str) -> int:
+        for scope in reversed(self.scopes):
+            if name in scope:
+                return scope[name][1]
+        raise KeyError(name)
+
+    def literal(self, hi: int = 99) -> tuple[str, Eval]:
+        value = self.rng.randint(0, hi)
+        return str(value), lambda m: value
+
+    #
+    # Expressões
+    #
+
+    def expr(self, depth: int = 2) -> tuple[str, Eval]:
+        """
+        Expressão inteira sem efeitos colaterais.
+        """
+        rng = self.rng
+        choice = rng.random() if depth > 0 else rng.random() * 0.45
+        ints = self.names("int")
+        arrays = self.names("int[]")
+        if choice < 0.15 or (choice < 0.45 and not ints and not arrays):
+            return self.literal()
+        if choice < 0.32 and ints:
+            name = rng.choice(ints)
+            return name, lambda m: m.get(name)
+        if choice < 0.45 and arrays:
+            return self.element(rng.choice(arrays), depth)
+        if choice < 0.70:
+            op = rng.choice(list(ARITHMETIC))
+            (lt, lf), (rt, rf) = self.expr(depth - 1), self.expr(depth - 1)
+            f = ARITHMETIC[op]
+            return f"({lt} {op} {rt})", lambda m: f(lf(m), rf(m))
+        if choice < 0.78:
+            op = rng.choice(["/", "%"])
+            (lt, lf), (rt, rf) = self.expr(depth - 1), self.expr(depth - 1)
+            f = _div if op == "/" else _mod
+            # O divisor fica entre 2 e 14
+            return f"({lt} {op} ({rt} % 7 + 8))", lambda m: f(lf(m), _mod(rf(m), 7) + 8)
+        if choice < 0.83:
+            text, f = self.expr(depth - 1)
+            return f"(-{text})", lambda m: -f(m)
+        if choice < 0.90:
+            return self.logical(depth - 1)
+        calls = [fn for fn in self.functions if fn.returns]
+        if calls and self.weight <= 50:
+            return self.call(rng.choice(calls), depth)
+        return self.literal()
+
+    def index(self, name: str, depth: int) -> tuple[str, Eval]:
+        """
+        Índice sempre dentro do array: um literal ou ((e % n) + n) % n.
+        """
+        n = self.length(name)
+        if depth <= 0 or self.rng.random() < 0.5:
+            i = self.rng.randrange(n)
+            return str(i), lambda m: i
+        text, f = self.expr(depth - 1)
+        return f"({text} % {n} + {n}) % {n}", lambda m: _mod(_mod(f(m), n) + n, n)
+
+    def element(self, name: str, depth: int) -> tuple[str, Eval]:
+        text, f = self.index(name, depth)
+        return f"{name}[{text}]", lambda m: m.get(name)[f(m)]
+
+    def condition(self, depth: int = 1) -> tuple[str, Eval]:
+        """
+        Comparação entre inteiros, possivelmente combinada com &&, || e !.
+        """
+        if depth > 0 and self.rng.random() < 0.3:
+            return self.logical(depth - 1)
+        op = self.rng.choice(list(COMPARISON))
+        (lt, lf), (rt, rf) = self.expr(1), self.expr(1)
+        f = COMPARISON[op]
+        return f"{lt} {op} {rt}", lambda m: f(lf(m), rf(m))
+
+    def logical(self, depth: int) -> tuple[str, Eval]:
+        kind = self.rng.choice(["&&", "||", "!"])
+        if kind == "!":
+            text, f = self.condition(depth)
+            return f"!({text})", lambda m: 1 if not f(m) else 0
+        (lt, lf), (rt, rf) = self.condition(depth), self.condition(depth)
+        if kind == "&&":
+            return f"({lt} && {rt})", lambda m: (1 if rf(m) else 0) if lf(m) else 0
+        return f"({lt} || {rt})", lambda m: 1 if lf(m) else (1 if rf(m) else 0)
+
+    def call(self, fn: _Function, depth: int) -> tuple[str, Eval]:
+        texts, evals = [], []
+        for kind in fn.params:
+            if kind == "array":
+                candidates = [a for a in self.names("int[]") if self.length(a) >= 4]
+                if not candidates:
+                    return self.literal()
+                name = self.rng.choice(candidates)
+                texts.append(name)
+                evals.append(lambda m, name=name: m.get(name))
+            else:
+                text, f = self.expr(max(depth - 1, 0))
+                texts.append(text)
+                evals.append(f)
+        run = fn.run
+        return f"{fn.name}({', '.join(texts)})", lambda m: run(m, [f(m) for f in evals])
+
+    #
+    # Comandos
+    #
+
+    def statements(self, count: int, indent: int) -> tuple[list[str], list[Exec]]:
+        lines, stmts = [], []
+        for _ in range(count):
+            if self.remaining <= 0:
+                break
+            text, stmt = self.statement(indent)
+            lines.extend(text)
+            stmts.append(stmt)
+        return lines, stmts
+
+    def statement(self, indent: int) -> tuple[list[str], Exec]:
+        self.remaining -= 1
+        rng = self.rng
+        pad = "    " * indent
+        nesting = len(self.scopes)
+        kinds = ["decl", "decl", "assign", "assign", "compound", "incdec", "printf", "printf"]
+        if self.names("int[]"):
+            kinds += ["store", "store"]
+        if nesting < 6:
+            kinds += ["if", "block"]
+            if self.weight * 8 <= MAX_WEIGHT:
+                kinds += ["for", "while", "do"]
+        procedures = [fn for fn in self.functions if not fn.returns]
+        if procedures and self.weight <= 50 and any(self.length(a) >= 4 for a in self.names("int[]")):
+            kinds.append("call")
+        kind = rng.choice(kinds)
+        if kind in ("assign", "compound", "incdec") and not self.writable():
+            kind = "decl"
+        return getattr(self, f"stmt_{kind}")(pad, indent)
+
+    def stmt_decl(self, pad: str, indent: int) -> tuple[list[str], Exec]:
+        rng = self.rng
+        roll = rng.random()
+        if roll < 0.15:
+            name = self.fresh("c")
+            letter = rng.choice(LETTERS)
+            self.declare(name, "char")
+            return [f"{pad}char {name} = '{letter}';"], lambda m: m.scopes[-1].__setitem__(name, letter)
+        if roll < 0.35:
+            return self.array_decl(pad)
+        outer = [n for n in self.names("int") if n not in self.scopes[-1]]
+        if outer and len(self.scopes) > 2 and rng.random() < 0.2:
+            # Esconde uma variável de um escopo externo
+            name = rng.choice(outer)
+        else:
+            name = self.fresh("x")
+        text, f = self.expr()
+        self.declare(name, "int")
+        return (
+            [f"{pad}int {name} = {text} % {MODULUS};"],
+            lambda m: m.scopes[-1].__setitem__(name, _mod(f(m), MODULUS)),
+        )
+
+    def array_decl(self, pad: str) -> tuple[list[str], Exec]:
+        rng = self.rng
+        n = rng.randint(4, 12)
+        if rng.random() < 0.2:
+            name = self.fresh("s")
+            word = "".join(rng.choice(LETTERS) for _ in range(rng.randint(0, n - 1)))
+            chars = ", ".join(f"'{c}'" for c in word)
+            self.declare(name, "char[]", n)
+            init = f" = {{{chars}}}" if word else ""
+            value = list(word) + ["\0"] * (n - len(word))
+            return (
+                [f"{pad}char {name}[{n}]{init};"],
+                lambda m: m.scopes[-1].__setitem__(name, list(value)),
+            )
+        name = self.fresh("v")
+        count = rng.randint(0, n)
+        items = [self.expr(1) for _ in range(count)]
+        self.declare(name, "int[]", n)
+        if not items:
+            return [f"{pad}int {name}[{n}];"], lambda m: m.scopes[-1].__setitem__(name, [0] * n)
+        init = ", ".join(text for text, _ in items)
+        evals = [f for _, f in items]
+
+        def run(m: _Model) -> None:
+            values = [f(m) for f in evals]
+            m.scopes[-1][name] = values + [0] * (n - len(values))
+
+        return [f"{pad}int {name}[{n}] = {{{init}}};"], run
+
+    def stmt_assign(self, pad: str, indent: int) -> tuple[list[str], Exec]:
+        name = self.rng.choice(self.writable())
+        text, f = self.expr()
+        return [f"{pad}{name} = {text} % {MODULUS};"], lambda m: m.set(name, _mod(f(m), MODULUS))
+
+    def stmt_compound(self, pad: str, indent: int) -> tuple[list[str], Exec]:
+        name = self.rng.choice(self.writable())
+        op = self.rng.choice(["+=", "-=", "*=", "/="])
+        text, f = self.expr(1)
+        if op == "/=":
+            line = f"{pad}{name} /= {text} % 7 + 8;"
+
+            def run(m: _Model) -> None:
+                m.set(name, _div(m.get(name), _mod(f(m), 7) + 8))
+
+        else:
+            line = f"{pad}{name} {op} {text};"
+            g = ARITHMETIC[op[0]]
+
+            def run(m: _Model) -> None:
+                m.set(name, g(m.get(name), f(m)))
+
+        normalize = f"{pad}{name} = {name} % {MODULUS};"
+
+        def run_normalized(m: _Model) -> None:
+            run(m)
+            m.set(name, _mod(m.get(name), MODULUS))
+
+        return [line, normalize], run_normalized
+
+    def stmt_incdec(self, pad: str, indent: int) -> tuple[list[str], Exec]:
+        name = self.rng.choice(self.writable())
+        op = self.rng.choice(["++", "--"])
+        step = 1 if op == "++" else -1
+        text = f"{name}{op}" if self.rng.random() < 0.5 else f"{op}{name}"
+        return [f"{pad}{text};"], lambda m: m.set(name, m.get(name) + step)
+
+    def stmt_store(self, pad: str, indent: int) -> tuple[list[str], Exec]:
+        name = self.rng.choice(self.names("int[]"))
+        index, index_f = self.index(name, 1)
+        text, f = self.expr()
+
+        def run(m: _Model) -> None:
+            arr = m.get(name)
+            i = index_f(m)
+            arr[i] = _mod(f(m), MODULUS)
+
+        return [f"{pad}{name}[{index}] = {text} % {MODULUS};"], run
+
+    def stmt_printf(self, pad: str, indent: int) -> tuple[list[str], Exec]:
+        rng = self.rng
+        roll = rng.random()
+        chars = self.names("char") + self.names("char[]")
+        if roll < 0.2 and chars:
+            name = rng.choice(chars)
+            return [f"{pad}printf({name});"], lambda m: m.output.append(_show(m.get(name)))
+        if roll < 0.3:
+            text, f = self.condition(0)
+            return [f"{pad}printf({text});"], lambda m: m.output.append(_show(f(m)))
+        text, f = self.expr()
+        return [f"{pad}printf({text});"], lambda m: m.output.append(_show(f(m)))
+
+    def stmt_if(self, pad: str, indent: int) -> tuple[list[str], Exec]:
+        cond, cf = self.condition()
+        then_lines, then_run = self.body(indent, self.rng.randint(1, 3))
+        lines = [f"{pad}if ({cond}) {{", *then_lines]
+        if self.rng.random() < 0.5:
+            else_lines, else_run = self.body(indent, self.rng.randint(1, 3))
+            lines += [f"{pad}}} else {{", *else_lines, f"{pad}}}"]
+        else:
+            else_run = None
+            lines.append(f"{pad}}}")
+
+        def run(m: _Model) -> None:
+            if cf(m):
+                then_run(m)
+            elif else_run is not None:
+                else_run(m)
+
+        return lines, run
+
+    def body(self, indent: int, count: int, declare: Optional[dict] = None) -> tuple[list[str], Exec]:
+        """
+        Bloco `{ ... }` com `count` comandos, num escopo novo.
+        """
+        self.scopes.append(dict(declare or {}))
+        try:
+            lines, stmts = self.statements(count, indent + 1)
+        finally:
+            self.scopes.pop()
+        return lines, _block(stmts)
+
+    def stmt_block(self, pad: str, indent: int) -> tuple[list[str], Exec]:
+        lines, run = self.body(indent, self.rng.randint(1, 4))
+        return [f"{pad}{{", *lines, f"{pad}}}"], run
+
+    def loop_parts(self) -> tuple[str, int, int]:
+        counter = self.fresh("i")
+        start = self.rng.randint(0, 3)
+        count = self.rng.randint(1, 8)
+        return counter, start, start + count
+
+    def loop_body(self, indent: int, counter: str, count: int) -> tuple[list[str], Exec]:
+        self.readonly.add(counter)
+        self.weight *= count
+        try:
+            return self.body(indent, self.rng.randint(1, 3), {counter: ("int", 0)})
+        finally:
+            self.weight //= count
+            self.readonly.discard(counter)
+
+    def stmt_for(self, pad: str, indent: int) -> tuple[list[str], Exec]:
+        counter, start, stop = self.loop_parts()
+        self.scopes.append({counter: ("int", 0)})
+        try:
+            lines, body = self.loop_body(indent, counter, stop - start)
+        finally:
+            self.scopes.pop()
+
+        def iterate(m: _Model) -> None:
+            while m.get(counter) < stop:
+                body(m)
+                m.set(counter, m.get(counter) + 1)
+
+        if self.rng.random() < 0.25:
+            # Inicialização fora do for: for (; i < n; i++)
+            head = [f"{pad}int {counter} = {start};", f"{pad}for (; {counter} < {stop}; {counter}++) {{"]
+
+            def run(m: _Model) -> None:
+                m.scopes[-1][counter] = start
+                iterate(m)
+
+            self.declare(counter, "int")
+            self.readonly.add(counter)
+            return [*head, *lines, f"{pad}}}"], run
+
+        def run_scoped(m: _Model) -> None:
+            m.scopes.append({counter: start})
+            try:
+                iterate(m)
+            finally:
+                m.scopes.pop()
+
+        head = f"{pad}for (int {counter} = {start}; {counter} < {stop}; {counter}++) {{"
+        return [head, *lines, f"{pad}}}"], run_scoped
+
+    def stmt_while(self, pad: str, indent: int) -> tuple[list[str], Exec]:
+        counter, start, stop = self.loop_parts()
+        self.declare(counter, "int")
+        lines, body = self.loop_body(indent, counter, stop - start)
+        self.readonly.add(counter)
+        inner = "    " * (indent + 1)
+
+        def run(m: _Model) -> None:
+            m.scopes[-1][counter] = start
+            while m.get(counter) < stop:
+                m.scopes.append({})
+                try:
+                    body(m)
+                    m.set(counter, m.get(counter) + 1)
+                finally:
+                    m.scopes.pop()
+
+        return [
+            f"{pad}int {counter} = {start};",
+            f"{pad}while ({counter} < {stop}) {{",
+            f"{inner}{{",
+            *["    " + line for line in lines],
+            f"{inner}}}",
+            f"{inner}{counter} = {counter} + 1;",
+            f"{pad}}}",
+        ], run
+
+    def stmt_do(self, pad: str, indent: int) -> tuple[list[str], Exec]:
+        counter, start, stop = self.loop_parts()
+        self.declare(counter, "int")
+        lines, body = self.loop_body(indent, counter, stop - start)
+        self.readonly.add(counter)
+        inner = "    " * (indent + 1)
+
+        def run(m: _Model) -> None:
+            m.scopes[-1][counter] = start
+            while True:
+                m.scopes.append({})
+                try:
+                    body(m)
+                    m.set(counter, m.get(counter) + 1)
+                finally:
+                    m.scopes.pop()
+                if not m.get(counter) < stop:
+                    break
+
+        return [
+            f"{pad}int {counter} = {start};",
+            f"{pad}do {{",
+            f"{inner}{{",
+            *["    " + line for line in lines],
+            f"{inner}}}",
+            f"{inner}--{counter};",
+            f"{inner}{counter} += 2;",
+            f"{pad}}} while ({counter} < {stop});",
+        ], run
+
+    def stmt_call(self, pad: str, indent: int) -> tuple[list[str], Exec]:
+        fn = self.rng.choice([fn for fn in self.functions if not fn.returns])
+        text, f = self.call(fn, 1)
+
+        def run(m: _Model) -> None:
+            f(m)
+
+        return [f"{pad}{text};"], run
+
+    #
+    # Funções e programa
+    #
+
+    def pure_function(self) -> tuple[list[str], _Function]:
+        """
+        Função int com parâmetros inteiros, que só usa os próprios
+        parâmetros e variáveis locais.
+        """
+        name = self.fresh("f")
+        params = [self.fresh("p") for _ in range(self.rng.randint(1, 3))]
+        saved, self.scopes = self.scopes, [{p: ("int", 0) for p in params}]
+        saved_functions, saved_weight = self.functions, self.weight
+        self.functions = [fn for fn in self.functions if fn.returns]
+        # Funções são chamadas dentro de laços: limita os laços do corpo
+        self.weight = 8
+        try:
+            lines, stmts = self.statements(self.rng.randint(1, 4), 1)
+            result, rf = self.expr()
+        finally:
+            self.scopes = saved
+            self.functions, self.weight = saved_functions, saved_weight
+        body = _sequence(stmts)
+
+        def run(m: _Model, args: list) -> int:
+            saved_scopes = m.scopes
+            m.scopes = [m.scopes[0], dict(zip(params, args))]
+            try:
+                body(m)
+                return _mod(rf(m), MODULUS)
+            finally:
+                m.scopes = saved_scopes
+
+        header = ", ".join(f"int {p}" for p in params)
+        source = [f"int {name}({header}) {{", *lines, f"    return {result} % {MODULUS};", "}"]
+        return source, _Function(name, ["int"] * len(params), True, run)
+
+    def recursive_function(self) -> tuple[list[str], _Function]:
+        name = self.fresh("r")
+        base = self.rng.randint(0, 9)
+        k = self.rng.randint(1, 5)
+
+        def rec(n: int) -> int:
+            if n <= 0:
+                return base
+            if n > 8:
+                return rec(_mod(n, 8))
+            return _mod(rec(n - 1) * k + n, MODULUS)
+
+        source = [
+            f"int {name}(int n) {{",
+            "    if (n <= 0) {",
+            f"        return {base};",
+            "    }",
+            "    if (n > 8) {",
+            f"        return {name}(n % 8);",
+            "    }",
+            f"    return ({name}(n - 1) * {k} + n) % {MODULUS};",
+            "}",
+        ]
+        return source, _Function(name, ["int"], True, lambda m, args: rec(args[0]))
+
+    def array_functions(self) -> list[tuple[list[str], _Function]]:
+        fill, total = self.fresh("preenche"), self.fresh("soma")
+        k = self.rng.randint(1, 9)
+
+        def run_fill(m: _Model, args: list) -> None:
+            arr, seed = args
+            for i in range(4):
+                arr[i] = _mod(seed + i * k, MODULUS)
+
+        def run_total(m: _Model, args: list) -> int:
+            arr = args[0]
+            acc = 0
+            i = 0
+            while i < 4:
+                acc += arr[i]
+                i += 1
+            return acc
+
+        fill_src = [
+            f"void {fill}(int v[], int s) {{",
+            "    for (int i = 0; i < 4; i++) {",
+            f"        v[i] = (s + i * {k}) % {MODULUS};",
+            "    }",
+            "}",
+        ]
+        total_src = [
+            f"int {total}(int v[]) {{",
+            "    int acc = 0;",
+            "    int i = 0;",
+            "    while (i < 4) {",
+            "        acc += v[i];",
+            "        i++;",
+            "    }",
+            "    return acc;",
+            "}",
+        ]
+        return [
+            (fill_src, _Function(fill, ["array", "int"], False, run_fill)),
+            (total_src, _Function(total, ["array"], True, run_total)),
+        ]
+
+    def program(self) -> GeneratedProgram:
+        chunks: list[list[str]] = []
+        top: list[Exec] = []
+
+        # Globais e um comando no nível do programa
+        for _ in range(self.rng.randint(1, 3)):
+            lines, run = self.stmt_decl("", 0)
+            chunks.append(lines)
+            top.append(run)
+
+        # Funções: recursiva, com arrays e puras
+        definitions = [self.recursive_function(), *self.array_functions()]
+        for _ in range(max(1, self.size // 40)):
+            definitions.append(self.pure_function())
+        for lines, fn in definitions:
+            chunks.append(lines)
+            self.functions.append(fn)
+
+        printf_lines, printf_run = self.stmt_printf("", 0)
+        chunks.append(printf_lines)
+        top.append(printf_run)
+
+        # main
+        self.scopes.append({})
+        main_lines, main_stmts = [], []
+        while self.remaining > 0:
+            lines, stmts = self.statements(self.remaining, 1)
+            main_lines += lines
+            main_stmts += stmts
+        globals_names = set(self.scopes[0])
+        self.scopes.pop()
+        main = _sequence(main_stmts)
+        chunks.append(["int main() {", *main_lines, "    return 0;", "}"])
+
+        model = _Model()
+        for run in top:
+            run(model)
+        model.scopes.append({})
+        main(model)
+        model.scopes.pop()
+
+        stdout = "".join(line + "\n" for line in model.output)
+        expect = [f"// expect: {line}" for line in model.output]
+        source = "\n\n".join("\n".join(chunk) for chunk in chunks) + "\n\n" + "\n".join(expect) + "\n"
+        final = {name: model.scopes[0][name] for name in sorted(globals_names)}
+        return GeneratedProgram(self.seed, self.size, source, stdout, final)
+
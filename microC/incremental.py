@@ -0,0 +1,381 @@
+"""
+Análise sintática incremental, para editores e REPLs.
+
+`parse` analisa, valida e remove o açúcar sintático do arquivo inteiro a
+cada chamada. Um `Document` guarda o código fonte, a AST e a extensão de
+cada declaração de nível superior (funções, variáveis globais e comandos
+soltos). A cada edição (`Document.edit`):
+
+* as declarações que tocam o trecho alterado (e as que começam na mesma
+  linha em que o trecho termina) formam a região afetada;
+* apenas a região é tokenizada de novo (veja `microC.lexer`) e analisada
+  como uma sequência de declarações, com o mesmo parser e transformer de
+  `parse`;
+* apenas as declarações novas são validadas e têm o açúcar removido. As
+  chamadas a funções nativas de outras declarações são validadas de novo se
+  a edição criar ou remover uma definição com o nome da função nativa (veja
+  `Call.validate_self`);
+* as declarações seguintes não são tocadas: só o deslocamento e a linha
+  onde começam são atualizados.
+
+Se a região não puder ser analisada sozinha (ex.: a edição apaga o `}` que
+fecha uma função, ou abre um comentário que continua depois da região), o
+arquivo inteiro é analisado de novo. O resultado é sempre igual ao de
+`parse` para o texto completo, inclusive as posições em `source_map` e as
+exceções para programas inválidos.
+"""
+
+import bisect
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+from lark import Token
+from lark.exceptions import UnexpectedCharacters, UnexpectedInput, UnexpectedToken
+
+from .ast import Call, Program, Var, defined_names
+from .builder import parser_state
+from .errors import SemanticError
+from .natives import NATIVES
+from .node import Cursor, Node
+from .parser import _fill_accepts, _parse_lock, ast_parser, tokenizer, transformer
+from .positions import SourceMap, Span, join_spans, locate
+
+__all__ = ["Document"]
+
+# Regras geradas pelo Lark para o `decl*` de `program` (e de `block`): cada
+# redução delas com a pilha vazia termina uma declaração de nível superior
+_DECLS_RULES = [
+    rule
+    for rule in ast_parser.parser.parser.parser.callbacks
+    if getattr(rule, "origin", None) is not None and rule.origin.name.startswith("__program_star")
+]
+
+
+@dataclass(eq=False)
+class _Decl:
+    """
+    Declaração de nível superior.
+
+    Attributes:
+        start:
+            Deslocamento do primeiro token no código fonte.
+        line:
+            Linha do primeiro token.
+        stmt:
+            Nó da AST.
+        spans:
+            Posições dos nós de `stmt`, com linhas relativas a `line`.
+        defines, calls:
+            Nomes de funções nativas definidos (funções, variáveis ou
+            parâmetros) e chamados na declaração.
+    """
+
+    start: int
+    line: int
+    stmt: Node
+    spans: dict[int, Span] = field(repr=False)
+    defines: frozenset[str] = frozenset()
+    calls: frozenset[str] = frozenset()
+
+
+class _Region(Exception):
+    """A região não pode ser analisada sem o restante do arquivo."""
+
+
+class _TokenStream:
+    """
+    Fonte de tokens para o parser LALR do Lark, no lugar de `LexerThread`.
+    Guarda o primeiro token e o token sendo consumido (None depois do
+    último).
+    """
+
+    def __init__(self, tokens: Iterator[Token]):
+        self.tokens = tokens
+        self.first: Optional[Token] = None
+        self.current: Optional[Token] = None
+
+    def lex(self, parser_state) -> Iterator[Token]:
+        for token in self.tokens:
+            if self.first is None:
+                self.first = token
+            self.current = token
+            yield token
+        self.current = None
+
+
+class DocumentSourceMap(SourceMap):
+    """
+    Tabela de posições de um `Document`, montada a partir das declarações
+    na primeira consulta. Vale até a próxima edição.
+    """
+
+    def __init__(self, program: Program, decls: list[_Decl], path: str = "<string>"):
+        self.program = program
+        self.decls = decls
+        self.path = path
+        self._spans: Optional[dict[int, Span]] = None
+
+    @property
+    def spans(self) -> dict[int, Span]:
+        if self._spans is None:
+            spans = {}
+            for decl in self.decls:
+                base = decl.line
+                for key, (line, col, end_line, end_col) in decl.spans.items():
+                    spans[key] = (line + base, col, end_line + base, end_col)
+            # Como em `parse`, o programa cobre as declarações
+            program = join_spans(spans.get(id(decl.stmt)) for decl in self.decls)
+            if program is not None:
+                spans[id(self.program)] = program
+            self._spans = spans
+        return self._spans
+
+
+class Document:
+    """
+    Código fonte de um programa MicroC e sua AST, atualizados a cada edição.
+
+    Args:
+        src:
+            Código fonte inicial.
+        path:
+            Nome do arquivo, usado em `source_map`.
+
+    Attributes:
+        src:
+            Código fonte atual.
+        program:
+            AST do último texto válido. O mesmo objeto `Program` é atualizado
+            a cada edição.
+        reparsed:
+            Número de declarações analisadas na última edição (todas, se o
+            arquivo inteiro foi analisado de novo).
+    """
+
+    def __init__(self, src: str = "", path: str = "<string>"):
+        self.src = src
+        self.path = path
+        self.program = Program([])
+        self.reparsed = 0
+        self._decls: Optional[list[_Decl]] = None
+        self._defined: Counter[str] = Counter()
+        self._reparse_all()
+
+    def edit(self, start: int, end: int, text: str) -> Program:
+        """
+        Substitui `src[start:end]` por `text` e atualiza a AST.
+
+        Se o novo texto for inválido, a exceção de `parse` é propagada: o
+        texto é atualizado, `program` continua com a última AST válida e a
+        próxima edição analisa o arquivo inteiro.
+        """
+        if not 0 <= start <= end <= len(self.src):
+            raise ValueError(f"trecho inválido: {start}:{end} (tamanho {len(self.src)})")
+        old = self.src
+        self.src = old[:start] + text + old[end:]
+        if not self._decls:
+            return self._reparse_all()
+        try:
+            self._reparse_region(old, start, end, text)
+        except _Region:
+            return self._reparse_all()
+        except Exception:
+            self._decls = None
+            raise
+        return self.program
+
+    @property
+    def source_map(self) -> SourceMap:
+        """
+        Posições dos nós de `program` no código fonte.
+        """
+        return self.program.source_map
+
+    def _reparse_all(self) -> Program:
+        self._decls = None
+        try:
+            stmts, decls = _parse_decls(self.src, 0, len(self.src))
+        except UnexpectedInput as exc:
+            locate(exc, path=self.path)
+            raise
+        program = Program(stmts)
+        program.source_map = DocumentSourceMap(program, decls, self.path)
+        try:
+            program.validate_tree()
+        except SemanticError as exc:
+            locate(exc, program)
+            raise
+        program.desugar_tree()
+        self._set_decls(0, 0, decls)
+        self.reparsed = len(decls)
+        return self.program
+
+    def _reparse_region(self, old: str, start: int, end: int, text: str):
+        decls = self._decls
+        starts = [decl.start for decl in decls]
+
+        # Declarações que tocam o trecho [start, end] (cada uma vai do seu
+        # primeiro token até o primeiro token da seguinte) e as que começam
+        # na linha onde o trecho termina, cujas colunas podem mudar
+        first = max(bisect.bisect_left(starts, start) - 1, 0)
+        last = bisect.bisect_right(starts, end)
+        if last:
+            end_line = decls[last - 1].line + old.count("\n", starts[last - 1], end)
+        else:
+            end_line = decls[0].line - old.count("\n", end, starts[0])
+        while last < len(decls) and decls[last].line == end_line:
+            last += 1
+
+        delta = len(text) - (end - start)
+        region_start = 0 if first == 0 else starts[first]
+        region_end = len(self.src) if last == len(decls) else starts[last] + delta
+        stmts, new = _parse_decls(self.src, region_start, region_end)
+
+        # Nomes de funções nativas redefinidos ou liberados pela edição: as
+        # chamadas a eles em outras declarações são validadas de novo
+        removed = decls[first:last]
+        before = {name for name, count in self._defined.items() if count}
+        self._defined.subtract(name for decl in removed for name in decl.defines)
+        self._defined.update(name for decl in new for name in decl.defines)
+        changed = before ^ {name for name, count in self._defined.items() if count}
+        kept = decls[:first] + decls[last:]
+        others = [d.stmt for d in kept if d.calls & changed]
+        definitions = [d.stmt for d in kept if d.defines]
+        try:
+            _validate(stmts + others, stmts + definitions)
+        except Exception:
+            # Reporta o mesmo erro (o primeiro do arquivo) que `parse`
+            raise _Region()
+        for stmt in stmts:
+            stmt.desugar_tree()
+
+        lines = text.count("\n") - old.count("\n", start, end)
+        for decl in decls[last:]:
+            decl.start += delta
+            decl.line += lines
+        self._set_decls(first, last, new)
+        self.reparsed = len(new)
+
+    def _set_decls(self, first: int, last: int, new: list[_Decl]):
+        if self._decls is None:
+            self._decls = new
+            self._defined = Counter(name for decl in new for name in decl.defines)
+            self.program.stmts[:] = [decl.stmt for decl in new]
+        else:
+            self._decls[first:last] = new
+            self.program.stmts[first:last] = [decl.stmt for decl in new]
+        self.program.source_map = DocumentSourceMap(self.program, self._decls, self.path)
+
+
+def _parse_decls(src: str, start: int, end: int) -> tuple[list[Node], list[_Decl]]:
+    """
+    Analisa `src[start:end]` como uma sequência de declarações, com as
+    posições relativas ao texto inteiro.
+
+    Quando a região não é o arquivo inteiro, lança `_Region` se os tokens
+    não terminarem exatamente em `end` ou se a região for inválida.
+    """
+    whole = start == 0 and end == len(src)
+    tokens = _region_tokens(src, start, end)
+    stream = _TokenStream(tokens)
+    boundaries: list[Token] = []
+
+    def on_decl(callback):
+        def wrapper(children):
+            # Reduzida ao ver o primeiro token da declaração seguinte; os
+            # símbolos da regra já saíram da pilha, que só tem o estado
+            # inicial se a declaração não estiver dentro de um bloco
+            if len(state.state_stack) == 1 and stream.current is not None:
+                boundaries.append(stream.current)
+            return callback(children)
+
+        return wrapper
+
+    parser = ast_parser.parser.parser.parser
+    callbacks = dict(parser.callbacks)
+    for rule in _DECLS_RULES:
+        callbacks[rule] = on_decl(callbacks[rule])
+    with _parse_lock:
+        transformer.reset()
+        try:
+            state = parser_state(parser, callbacks, stream)
+            program = parser.parse_from_state(state)
+        except Exception as exc:
+            # Numa região, qualquer erro (inclusive dos callbacks do
+            # transformer) é reportado pela análise do arquivo inteiro
+            if not whole:
+                raise _Region() from exc
+            if isinstance(exc, UnexpectedToken):
+                _fill_accepts(exc)
+            raise
+        finally:
+            spans = transformer.reset()
+
+    stmts = program.stmts
+    if not stmts:
+        return stmts, []
+    firsts = [stream.first] + boundaries
+    decls = []
+    for stmt, token in zip(stmts, firsts):
+        base = token.line
+        rel = {}
+        for node in stmt.descendants():
+            span = spans.get(id(node))
+            if span is not None:
+                rel[id(node)] = (span[0] - base, span[1], span[2] - base, span[3])
+        defines, calls = _natives(stmt)
+        decls.append(_Decl(token.start_pos, base, stmt, rel, defines, calls))
+    return stmts, decls
+
+
+def _region_tokens(src: str, start: int, end: int) -> Iterator[Token]:
+    """
+    Tokens de `src[start:end]`. Lança `_Region` se algum token (ou
+    comentário) ultrapassar `end`, isto é, se a região não termina entre
+    dois tokens do texto inteiro.
+    """
+    whole = start == 0 and end == len(src)
+    try:
+        for token in tokenizer.tokenize(src, start):
+            if token.start_pos >= end:
+                if token.start_pos != end:
+                    raise _Region()
+                return
+            if token.end_pos > end:
+                raise _Region()
+            yield token
+    except UnexpectedCharacters as exc:
+        if not whole:
+            raise _Region() from exc
+        raise
+    if end != len(src):
+        raise _Region()
+
+
+def _natives(stmt: Node) -> tuple[frozenset[str], frozenset[str]]:
+    """
+    Nomes de funções nativas definidos e chamados em `stmt`.
+    """
+    calls = {
+        node.callee.name
+        for node in stmt.descendants()
+        if isinstance(node, Call) and isinstance(node.callee, Var)
+    }
+    defines = defined_names(stmt.cursor())
+    return frozenset(defines & NATIVES.keys()), frozenset(calls & NATIVES.keys())
+
+
+def _validate(stmts: list[Node], context: list[Node]):
+    """
+    Valida `stmts` como em `Program.validate_tree`. A raiz vista pelos nós
+    (`cursor.root()`) é um `Program` com `context`: as declarações novas e
+    as que definem nomes de funções nativas, que é tudo o que a validação
+    consulta fora do próprio nó. Todos os cursores compartilham essa raiz,
+    então os nomes definidos (`defined_names`) são calculados uma vez.
+    """
+    root = Program(context).cursor()
+    for stmt in stmts:
+        cursor = Cursor(stmt, root)
+        for item in cursor.descendants():
+            item.node.validate_self(item)
@@ -0,0 +1,193 @@
+"""
+Analisador léxico rápido para MicroC.
+
+O lexer contextual do Lark tenta, a cada posição, as expressões regulares
+dos terminais aceitos no estado atual do parser e descarta espaços um
+caractere de cada vez (`%ignore /\\s/`). Como os terminais de MicroC não
+dependem do contexto, uma única expressão regular basta:
+
+* espaços e comentários (os terminais ignorados) são consumidos de uma vez;
+* identificadores são reconhecidos pela expressão de `VAR` e as palavras
+  reservadas ("int", "while", "NULL", ...) são separadas por uma consulta
+  num dicionário, como o Lark faz;
+* os demais terminais com expressões regulares (`NUMBER`, `CHAR`) entram
+  como estão na gramática;
+* os operadores e a pontuação formam uma única alternativa, do mais longo
+  para o mais curto.
+
+Tudo é derivado dos terminais do parser (`lexer_conf.terminals`), então os
+nomes dos tokens (inclusive os anônimos, como `__ANON_0`) são os mesmos do
+Lark. Os tokens são `lark.Token` com tipo, valor e posições (`line`,
+`column`, `end_line`, `end_column`, `start_pos`, `end_pos`) idênticos aos do
+lexer do Lark, e caracteres inválidos geram `UnexpectedCharacters`.
+"""
+
+import re
+from typing import Iterator
+
+from lark import Token
+from lark.exceptions import UnexpectedCharacters
+from lark.lexer import Lexer
+
+__all__ = ["MicroCLexer", "Tokenizer"]
+
+_IGNORE = "_IGNORE"
+_OPERATOR = "_OPERATOR"
+
+
+class Tokenizer:
+    """
+    Tokenizador construído a partir dos terminais de um parser Lark.
+
+    Args:
+        terminals:
+            Definições dos terminais (`lark.lexer.TerminalDef`).
+        ignore:
+            Nomes dos terminais ignorados.
+    """
+
+    def __init__(self, terminals, ignore):
+        self.keywords: dict[str, str] = {}
+        self.operators: dict[str, str] = {}
+        ignored, regexps = [], []
+        for terminal in terminals:
+            pattern = terminal.pattern
+            if terminal.name in ignore:
+                ignored.append(pattern.to_regexp())
+            elif pattern.type == "str":
+                self.operators[pattern.value] = terminal.name
+            else:
+                regexps.append(terminal)
+
+        # O terminal de identificadores é o que reconhece as palavras
+        # reservadas: elas saem dos operadores e viram uma consulta
+        identifier = next(
+            t
+            for t in regexps
+            if any(re.fullmatch(t.pattern.to_regexp(), word) for word in self.operators)
+        )
+        self.identifier = identifier.name
+        for word in [w for w in self.operators if re.fullmatch(identifier.pattern.to_regexp(), w)]:
+            self.keywords[word] = self.operators.pop(word)
+
+        regexps.sort(key=lambda t: -t.priority)
+        operators = sorted(self.operators, key=len, reverse=True)
+        groups = [f"(?P<{_IGNORE}>(?:{'|'.join(ignored)})+)"] if ignored else []
+        groups += [f"(?P<{t.name}>{t.pattern.to_regexp()})" for t in regexps]
+        groups.append(f"(?P<{_OPERATOR}>{'|'.join(map(re.escape, operators))})")
+        self.regex = re.compile("|".join(groups))
+        self.bytes_regex = re.compile("|".join(groups).encode())
+        self.terminal_names = [t.name for t in terminals if t.name not in ignore]
+
+    def tokenize(self, text: str, pos: int = 0) -> Iterator[Token]:
+        """
+        Produz os tokens do texto a partir da posição `pos`, ignorando
+        espaços e comentários. As posições dos tokens são relativas ao
+        texto inteiro.
+        """
+        match = self.regex.match
+        keywords, operators, identifier = self.keywords, self.operators, self.identifier
+        line, line_start = text.count("\n", 0, pos) + 1, text.rfind("\n", 0, pos) + 1
+        size = len(text)
+        while pos < size:
+            m = match(text, pos)
+            if m is None:
+                raise UnexpectedCharacters(
+                    text,
+                    pos,
+                    line,
+                    pos - line_start + 1,
+                    allowed=self.terminal_names,
+                )
+            kind, value, end = m.lastgroup, m.group(), m.end()
+            newlines = value.count("\n")
+            if kind != _IGNORE:
+                if kind == _OPERATOR:
+                    kind = operators[value]
+                elif kind == identifier:
+                    kind = keywords.get(value, kind)
+                column = pos - line_start + 1
+                if newlines:
+                    end_line = line + newlines
+                    end_column = end - (pos + value.rindex("\n") + 1) + 1
+                else:
+                    end_line, end_column = line, column + end - pos
+                yield Token(kind, value, pos, line, column, end_line, end_column, end)
+            if newlines:
+                line += newlines
+                line_start = pos + value.rindex("\n") + 1
+            pos = end
+
+    def tokenize_bytes(self, data) -> Iterator[Token]:
+        """
+        Como `tokenize`, mas para o texto codificado em UTF-8 num objeto
+        `bytes` ou `mmap`, sem decodificá-lo inteiro. As posições dos tokens
+        contam caracteres, como em `tokenize`.
+
+        A expressão regular é aplicada aos bytes, o que equivale à versão
+        para texto nos trechos ASCII (comentários podem ter qualquer
+        caractere). Onde ela não casa, ou quando um token termina antes de
+        um byte não ASCII (ex.: um identificador acentuado, já que `\\w`
+        só reconhece letras ASCII em bytes), a linha é decodificada e
+        analisada pela expressão de texto.
+        """
+        match = self.bytes_regex.match
+        keywords, operators, identifier = self.keywords, self.operators, self.identifier
+        line, line_start, line_offset = 1, 0, 0
+        pos = chars = 0
+        size = len(data)
+        while pos < size:
+            m = match(data, pos)
+            end = m.end() if m is not None else pos
+            if m is not None and (m.lastgroup == _IGNORE or end == size or data[end] < 0x80):
+                kind, value = m.lastgroup, m.group().decode()
+            else:
+                line_end = data.find(b"\n", pos)
+                text = data[line_offset : size if line_end < 0 else line_end + 1].decode()
+                m = self.regex.match(text, chars - line_start)
+                if m is None:
+                    exc = UnexpectedCharacters(
+                        text,
+                        chars - line_start,
+                        line,
+                        chars - line_start + 1,
+                        allowed=self.terminal_names,
+                    )
+                    exc.pos_in_stream = chars
+                    raise exc
+                kind, value = m.lastgroup, m.group()
+                end = pos + len(value.encode())
+            newlines = value.count("\n")
+            if kind != _IGNORE:
+                if kind == _OPERATOR:
+                    kind = operators[value]
+                elif kind == identifier:
+                    kind = keywords.get(value, kind)
+                column = chars - line_start + 1
+                if newlines:
+                    end_line = line + newlines
+                    end_column = len(value) - value.rindex("\n")
+                else:
+                    end_line, end_column = line, column + len(value)
+                yield Token(
+                    kind, value, chars, line, column, end_line, end_column, chars + len(value)
+                )
+            if newlines:
+                line += newlines
+                line_start = chars + value.rindex("\n") + 1
+                line_offset = data.rfind(b"\n", pos, end) + 1
+            pos, chars = end, chars + len(value)
+
+
+class MicroCLexer(Lexer):
+    """
+    Lexer para o `ParsingFrontend` do Lark, no lugar do lexer contextual.
+    """
+
+    __future_interface__ = True
+
+    def __init__(self, lexer_conf):
+        self.tokenizer = Tokenizer(lexer_conf.terminals, lexer_conf.ignore)
+
+    def lex(self, lexer_state, parser_state) -> Iterator[Token]:
+        return self.tokenizer.tokenize(lexer_state.text)
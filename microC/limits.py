@@ -0,0 +1,160 @@
+"""
+Limites de execução de programas MicroC.
+
+Um `Limits` é anexado ao contexto de execução (`Ctx.limits`) e compartilhado
+por todos os escopos empilhados a partir dele. Sem limites (o padrão,
+`ctx.limits is None`) o interpretador não faz nenhuma contagem.
+
+O limite de passos é determinístico: o mesmo programa sempre para no mesmo
+ponto, independentemente da carga da máquina. A contagem é feita apenas
+nas voltas dos laços e nas chamadas de função, nunca por expressão:
+
+* cada iteração de um laço conta 1 passo mais o número de nós do corpo;
+* cada chamada de função conta 1 passo mais o número de nós do corpo.
+
+O número de nós (`body_weight`) inclui os comandos e expressões de blocos
+aninhados, então um corpo com um único bloco grande custa tanto quanto o
+mesmo código sem o bloco. Ele é calculado uma vez por laço e por função.
+
+A memória é contabilizada antes de cada alocação, como na pilha do C:
+arrays e frames de ativação são cobrados do bloco ou da chamada em que
+foram criados e liberados quando ele termina (arrays globais nunca são
+liberados). Os tamanhos são estimativas da representação em Python: cada
+posição de um array é um ponteiro numa lista.
+"""
+
+from typing import TYPE_CHECKING, Iterable, Optional
+
+if TYPE_CHECKING:
+    from .node import Node
+    from .runtime import McFunction
+
+# Bytes por posição de array (um ponteiro numa lista Python)
+ELEMENT_SIZE = 8
+# Bytes de um frame de ativação (contexto e dicionário do escopo) e de cada
+# parâmetro guardado nele
+FRAME_SIZE = 128
+PARAM_SIZE = 16
+
+
+def array_size(length: int) -> int:
+    """
+    Bytes contabilizados para um array com `length` posições.
+    """
+    return length * ELEMENT_SIZE
+
+
+def frame_size(func: "McFunction") -> int:
+    """
+    Bytes contabilizados para um frame de ativação de `func`.
+    """
+    return FRAME_SIZE + PARAM_SIZE * len(func.args)
+
+
+class McError(Exception):
+    """
+    Erro de execução de um programa MicroC.
+
+    `call_stack` guarda os nomes das funções MicroC ativas no momento do
+    erro, da mais externa para a mais interna, quando conhecidos.
+    """
+
+    def __init__(self, msg: str, call_stack: list[str] | None = None):
+        super().__init__(msg)
+        self.msg = msg
+        self.call_stack = list(call_stack or ())
+
+    def __str__(self) -> str:
+        if not self.call_stack:
+            return self.msg
+        return f"{self.msg} (em {' > '.join(self.call_stack)})"
+
+
+class LimitExceeded(McError):
+    """
+    O programa excedeu um limite de execução.
+    """
+
+
+def body_weight(nodes: Iterable["Node"]) -> int:
+    """
+    Passos contados para executar `nodes`: o número de nós das subárvores.
+    Nós que apenas envolvem outro (com `counts_as_step = False`) não são
+    contados.
+    """
+    return sum(
+        1
+        for node in nodes
+        for child in node.descendants()
+        if getattr(child, "counts_as_step", True)
+    )
+
+
+class Limits:
+    """
+    Contadores e limites de uma execução.
+
+    Args:
+        max_steps:
+            Número máximo de passos, ou None para não limitar.
+        max_memory:
+            Memória máxima (arrays e frames), em bytes, ou None para não
+            limitar. A memória é contabilizada mesmo sem limite.
+    """
+
+    def __init__(self, max_steps: Optional[int] = None, max_memory: Optional[int] = None):
+        if max_steps is not None and max_steps < 0:
+            raise ValueError("max_steps deve ser positivo")
+        if max_memory is not None and max_memory < 0:
+            raise ValueError("max_memory deve ser positivo")
+        self.max_steps = max_steps
+        self.max_memory = max_memory
+        self.steps = 0
+        self.memory = 0
+        self.peak_memory = 0
+        self.call_stack: list[str] = []
+        self._frames: list[int] = []
+
+    def __repr__(self) -> str:
+        return (
+            f"Limits(max_steps={self.max_steps}, steps={self.steps}, "
+            f"max_memory={self.max_memory}, memory={self.memory})"
+        )
+
+    def tick(self, steps: int = 1) -> None:
+        """
+        Contabiliza passos, levantando `LimitExceeded` se o limite for
+        ultrapassado.
+        """
+        self.steps += steps
+        if self.max_steps is not None and self.steps > self.max_steps:
+            raise LimitExceeded("step limit exceeded", self.call_stack)
+
+    def allocate(self, nbytes: int) -> None:
+        """
+        Contabiliza uma alocação, levantando `LimitExceeded` antes de alocar
+        se o limite for ultrapassado.
+        """
+        memory = self.memory + nbytes
+        if self.max_memory is not None and memory > self.max_memory:
+            raise LimitExceeded("memory limit exceeded", self.call_stack)
+        self.memory = memory
+        if memory > self.peak_memory:
+            self.peak_memory = memory
+
+    def enter(self, func: "McFunction") -> None:
+        """
+        Registra a entrada numa função MicroC e aloca seu frame.
+        """
+        self.call_stack.append(func.name)
+        self._frames.append(self.memory)
+        self.tick(func.weight)
+        self.allocate(frame_size(func))
+
+    def leave(self) -> None:
+        """
+        Registra a saída da função MicroC mais interna, liberando o frame e
+        os arrays criados nela.
+        """
+        self.call_stack.pop()
+        self.memory = self._frames.pop()
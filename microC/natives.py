@@ -0,0 +1,152 @@
+"""
+Funções nativas para operações em bloco sobre arrays.
+
+Arrays MicroC são listas Python (de inteiros, ou de caracteres terminadas em
+'\\0' no caso de `char`). Preencher, copiar, somar ou ordenar um array com um
+laço MicroC passa por `ArrayAccess`/`ArrayAssign` a cada elemento; as funções
+abaixo fazem o mesmo trabalho com fatias e funções embutidas do Python, que
+percorrem a lista em C.
+
+Todas verificam os tipos e os limites dos argumentos antes de alterar o
+array, com as mesmas exceções usadas no acesso a arrays (`TypeError` e
+`IndexError`). O número de argumentos é verificado na análise semântica
+(veja `Call.validate_self`).
+"""
+
+import inspect
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from .ast import Value
+
+__all__ = ["NATIVES", "arity", "memset", "memcpy", "sum_", "minidx", "sort", "strlen"]
+
+NATIVES: dict[str, Callable] = {}
+
+
+def native(func: Callable) -> Callable:
+    """
+    Registra uma função nativa. Um "_" no final do nome evita conflitos com
+    funções do Python (ex.: `sum_` é registrada como `sum`).
+    """
+    NATIVES[func.__name__.rstrip("_")] = func
+    return func
+
+
+def arity(name: str) -> int:
+    """
+    Número de argumentos da função nativa.
+    """
+    return len(inspect.signature(NATIVES[name]).parameters)
+
+
+def _array(name: str, arr: "Value") -> list:
+    if not isinstance(arr, list):
+        raise TypeError(f"{name}: o argumento não é um array!")
+    return arr
+
+
+def _count(name: str, arr: list, n: "Value") -> int:
+    if not isinstance(n, int):
+        raise TypeError(f"{name}: o tamanho deve ser um inteiro!")
+    if n < 0 or n > len(arr):
+        raise IndexError(f"{name}: tamanho {n} fora dos limites do array!")
+    return n
+
+
+def _element(arr: list, value: "Value") -> "Value":
+    """
+    Converte o valor para o tipo dos elementos do array, como em `Assign`.
+    """
+    if arr and isinstance(arr[0], str) and isinstance(value, int):
+        return chr(value)
+    if arr and isinstance(arr[0], int) and isinstance(value, str):
+        return ord(value)
+    return value
+
+
+def _numbers(name: str, arr: list) -> list:
+    if arr and isinstance(arr[0], str):
+        raise TypeError(f"{name}: o array deve ser de números!")
+    return arr
+
+
+@native
+def memset(arr, value, n):
+    """
+    Atribui `value` às `n` primeiras posições do array.
+    """
+    arr = _array("memset", arr)
+    n = _count("memset", arr, n)
+    arr[:n] = [_element(arr, value)] * n
+
+
+@native
+def memcpy(dst, src, n):
+    """
+    Copia as `n` primeiras posições de `src` (array ou string) para `dst`.
+    """
+    dst = _array("memcpy", dst)
+    if not isinstance(src, (list, str)):
+        raise TypeError("memcpy: a origem não é um array!")
+    n = _count("memcpy", dst, n)
+    if n > len(src):
+        raise IndexError(f"memcpy: tamanho {n} fora dos limites da origem!")
+    if isinstance(src, str) or (dst and src and type(src[0]) is not type(dst[0])):
+        dst[:n] = [_element(dst, value) for value in src[:n]]
+    else:
+        dst[:n] = src[:n]
+
+
+@native
+def sum_(arr, n):
+    """
+    Soma das `n` primeiras posições do array.
+    """
+    arr = _numbers("sum", _array("sum", arr))
+    return sum(arr[: _count("sum", arr, n)])
+
+
+@native
+def minidx(arr, lo, hi):
+    """
+    Índice do menor elemento em `arr[lo..hi)`. Em caso de empate, retorna o
+    primeiro.
+    """
+    arr = _array("minidx", arr)
+    hi = _count("minidx", arr, hi)
+    if not isinstance(lo, int):
+        raise TypeError("minidx: o índice deve ser um inteiro!")
+    if lo < 0 or lo >= hi:
+        raise IndexError(f"minidx: intervalo [{lo}, {hi}) vazio ou inválido!")
+    part = arr[lo:hi]
+    return lo + part.index(min(part))
+
+
+@native
+def sort(arr, n):
+    """
+    Ordena as `n` primeiras posições do array.
+    """
+    arr = _array("sort", arr)
+    n = _count("sort", arr, n)
+    arr[:n] = sorted(arr[:n])
+
+
+@native
+def strlen(s):
+    """
+    Comprimento de uma string ou de um array de caracteres, até o primeiro
+    '\\0'.
+    """
+    if isinstance(s, list):
+        if s and not isinstance(s[0], str):
+            raise TypeError("strlen: o array deve ser de caracteres!")
+        try:
+            return s.index("\0")
+        except ValueError:
+            return len(s)
+    if not isinstance(s, str):
+        raise TypeError("strlen: o argumento não é uma string!")
+    end = s.find("\0")
+    return len(s) if end < 0 else end
@@ -0,0 +1,108 @@
+"""
+Destinos de saída usados pelo comando `printf`.
+
+Cada contexto de execução (`Ctx`) carrega um destino de saída. O padrão
+escreve imediatamente em `sys.stdout`, mas podemos trocar por uma versão com
+buffer (usada pela linha de comando) ou por uma versão em memória (usada nos
+testes).
+"""
+
+import sys
+from abc import ABC, abstractmethod
+from typing import TextIO
+
+__all__ = ["Output", "StreamOutput", "BufferedOutput", "MemoryOutput", "STDOUT"]
+
+DEFAULT_BUFFER_SIZE = 64 * 1024
+
+
+class Output(ABC):
+    """
+    Classe base para destinos de saída.
+
+    Subclasses devem implementar `write` e, se mantiverem algum buffer,
+    `flush`.
+    """
+
+    @abstractmethod
+    def write(self, text: str) -> None:
+        """
+        Escreve `text` no destino.
+        """
+
+    def flush(self) -> None:
+        """
+        Descarrega qualquer texto pendente no destino final.
+        """
+
+
+class StreamOutput(Output):
+    """
+    Escreve diretamente num arquivo de texto, sem buffer adicional.
+
+    Se `stream` for omitido, usa o `sys.stdout` vigente no momento da escrita.
+    Isso mantém a compatibilidade com `contextlib.redirect_stdout`.
+    """
+
+    def __init__(self, stream: TextIO | None = None):
+        self.stream = stream
+
+    def write(self, text: str) -> None:
+        (self.stream or sys.stdout).write(text)
+
+    def flush(self) -> None:
+        (self.stream or sys.stdout).flush()
+
+
+class BufferedOutput(Output):
+    """
+    Acumula a saída em memória e só escreve no arquivo quando o buffer
+    ultrapassa `buffer_size` caracteres ou quando `flush` é chamado.
+
+    Programas que imprimem dentro de laços fazem uma única escrita por bloco,
+    em vez de passarem pela camada de texto do Python a cada linha.
+    """
+
+    def __init__(self, stream: TextIO | None = None, buffer_size: int = DEFAULT_BUFFER_SIZE):
+        if buffer_size < 0:
+            raise ValueError("buffer_size deve ser positivo")
+        self.stream = stream
+        self.buffer_size = buffer_size
+        self._parts: list[str] = []
+        self._size = 0
+
+    def write(self, text: str) -> None:
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._parts:
+            return
+        stream = self.stream or sys.stdout
+        stream.write("".join(self._parts))
+        self._parts.clear()
+        self._size = 0
+        stream.flush()
+
+
+class MemoryOutput(Output):
+    """
+    Guarda toda a saída em memória. Útil em testes.
+    """
+
+    def __init__(self):
+        self._parts: list[str] = []
+
+    def write(self, text: str) -> None:
+        self._parts.append(text)
+
+    def getvalue(self) -> str:
+        """
+        Retorna todo o texto escrito até o momento.
+        """
+        return "".join(self._parts)
+
+
+STDOUT = StreamOutput()
@@ -5,46 +5,124 @@ Define a gramática da Linguagem e funções para realizar a análise sintática
 análise léxica, etc.
 """
 
+import copy
+import hashlib
+import threading
 from pathlib import Path
 from typing import Iterator
 
+import lark
 from lark import Lark, Token, Tree
+from lark.exceptions import UnexpectedInput, UnexpectedToken
+from lark.parsers.lalr_parser import ParseConf, ParserState
 
 from .ast import Expr, Program
+from .builder import AstBuilder, DirectParser
+from .errors import SemanticError
+from .lexer import MicroCLexer
+from .node import Node
+from .positions import SourceMap, Span, locate
 from .transformer import McTransformer
 
 DIR = Path(__file__).parent
 GRAMMAR_PATH = DIR / "grammar.lark"
+# Opções dos parsers deste módulo, exceto o transformer
+PARSER_OPTIONS = {"parser": "lalr", "start": ["start", "expr"]}
 
 
-ast_parser = Lark(
-    GRAMMAR_PATH.open(),
-    transformer=McTransformer(),
-    parser="lalr",
-    start=["start", "expr"],
-)
-cst_parser = Lark(
-    GRAMMAR_PATH.open(),
-    parser="lalr",
-    start=["start", "expr"],
-)
+def grammar_hash(path: Path = GRAMMAR_PATH) -> str:
+    """
+    Hash SHA-256 do conteúdo da gramática.
+    """
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def is_stale(tables, grammar: Path = GRAMMAR_PATH) -> bool:
+    """
+    Verifica se o módulo de tabelas (já importado) não corresponde à
+    gramática ou à versão instalada do Lark.
+    """
+    return (
+        getattr(tables, "GRAMMAR_HASH", None) != grammar_hash(grammar)
+        or getattr(tables, "LARK_VERSION", None) != lark.__version__
+    )
+
+
+def _load_tables():
+    """
+    Módulo de tabelas gerado por `microC.build_parser`, ou None se ele não
+    existir ou estiver desatualizado em relação à gramática.
+    """
+    try:
+        from . import _parser_tables
+    except ImportError:
+        return None
+    if is_stale(_parser_tables):
+        return None
+    return _parser_tables
+
+
+def load_parser(transformer=None, tables=True, fast_lexer=True, direct=True) -> Lark:
+    """
+    Cria um parser LALR para a gramática. Usa as tabelas pré-geradas (sem
+    analisar a gramática) quando elas estão atualizadas e, com `fast_lexer`,
+    o lexer de `microC.lexer` no lugar do lexer contextual do Lark. Com
+    `direct`, um `McTransformer` é substituído pelas reduções e pelo parser
+    de `microC.builder`, que constroem a AST direto da pilha do parser.
+    """
+    module = _load_tables() if tables else None
+    if module is not None:
+        parser = Lark._load_from_dict(module.DATA, module.MEMO, transformer=transformer)
+    else:
+        with GRAMMAR_PATH.open() as fd:
+            parser = Lark(fd, transformer=transformer, **PARSER_OPTIONS)
+    if fast_lexer:
+        # A opção `lexer` não pode ser usada com tabelas carregadas; o lexer
+        # é trocado diretamente no frontend
+        parser.parser.lexer = MicroCLexer(parser.lexer_conf)
+    if direct and isinstance(transformer, McTransformer):
+        lalr = parser.parser.parser
+        callbacks = AstBuilder(transformer).callbacks(lalr.parser.callbacks)
+        if callbacks is not None:
+            lalr.parser = DirectParser(lalr.parser.parse_table, callbacks, lalr.parser.debug)
+    return parser
+
 
+transformer = McTransformer()
+ast_parser = load_parser(transformer)
+tokenizer = ast_parser.parser.lexer.tokenizer
+# O transformer guarda as posições da análise em andamento
+_parse_lock = threading.Lock()
+cst_parser = load_parser()
 
-def parse(src: str) -> Program:
+
+def parse(src: str, path: str = "<string>") -> Program:
     """
     Função que recebe um código fonte e retorna a árvore sintática.
 
     A função usa o Lark para fazer a análise léxica e sintática do código
     fonte. O resultado é uma árvore sintática que representa a estrutura
-    do código usando os nós definidos na classe `Node`.
+    do código usando os nós definidos na classe `Node`. As posições dos nós
+    no código ficam em `tree.source_map` (veja `microC.positions`). Erros de
+    sintaxe e semânticos recebem a posição em `exc.location`.
 
     Args:
         src (str):
             Código fonte a ser analisado.
+        path (str):
+            Nome do arquivo, usado nas posições dos erros.
     """
-    tree = ast_parser.parse(src, start="start")
+    try:
+        tree, _ = _parse_with_spans(src, "start", path)
+    except UnexpectedInput as exc:
+        locate(exc, path=path)
+        raise
     assert isinstance(tree, Program), f"Esperava um Program, mas recebi {type(tree)}"
-    tree.validate_tree()
+    try:
+        tree.validate_tree()
+    except SemanticError as exc:
+        locate(exc, tree)
+        raise
     tree.desugar_tree()
     return tree
 
@@ -70,13 +148,145 @@ def parse_expr(src: str) -> Expr:
         >>> parse_expr("1 + 2 * 3").eval(Ctx())
         7
     """
-    tree = ast_parser.parse(src, start="expr")
+    tree, _ = _parse_with_spans(src, "expr")
     assert isinstance(tree, Expr), f"Esperava um Expr, mas recebi {type(tree)}"
     tree.validate_tree()
     tree.desugar_tree()
     return tree
 
 
+def _parse_with_spans(
+    src: str, start: str, path: str = "<string>"
+) -> tuple[Node, dict[int, Span]]:
+    """
+    Executa o parser e retorna a árvore junto com as posições registradas
+    pelo transformer. Programas recebem a tabela de posições já filtrada em
+    `source_map`; a filtragem precisa ocorrer antes de liberar os nós
+    descartados, cujos ids poderiam ser reaproveitados.
+    """
+    with _parse_lock:
+        return _run_parser(ast_parser.parser, transformer, src, start, path)
+
+
+def _run_parser(frontend, transformer: McTransformer, src: str, start: str, path: str):
+    """
+    Analisa `src` com o frontend do Lark cujos callbacks chamam `transformer`.
+    """
+    transformer.reset()
+    try:
+        tree = frontend.parse(src, start)
+        if isinstance(tree, Program):
+            tree.source_map = SourceMap.from_tree(tree, transformer.spans, path)
+    except UnexpectedToken as exc:
+        _fill_accepts(exc)
+        raise
+    finally:
+        spans = transformer.reset()
+    return tree, spans
+
+
+def _fill_accepts(exc: UnexpectedToken):
+    """
+    Calcula `exc.accepts`. O Lark alimenta cada terminal possível numa cópia
+    do parser, o que copia (`deepcopy`) a pilha de valores, com toda a AST
+    construída até o erro, e chama os callbacks com tokens vazios (que
+    falham no transformer, ex.: NUMBER com ""). Aqui só a pilha de estados é
+    copiada e as reduções descartam os valores. Usa `expected` se o erro
+    não tiver o estado do parser.
+    """
+    interactive = exc.interactive_parser
+    if interactive is None:
+        exc._accepts = exc.expected
+        return
+    state = interactive.parser_state
+    conf = ParseConf(state.parse_conf.parse_table, _DiscardValues(), state.parse_conf.start)
+    accepts = set()
+    for terminal in interactive.choices():
+        if not terminal.isupper():
+            continue
+        values = [None] * len(state.value_stack)
+        cursor = ParserState(conf, state.lexer, list(state.state_stack), values)
+        try:
+            cursor.feed_token(Token(terminal, ""), terminal == "$END")
+        except UnexpectedToken:
+            continue
+        accepts.add(terminal)
+    exc._accepts = accepts
+
+
+class _DiscardValues(dict):
+    """
+    Callbacks de `_fill_accepts`: as reduções retornam None e os tokens não
+    são transformados.
+    """
+
+    def __missing__(self, rule):
+        return _discard
+
+
+def _discard(children):
+    return None
+
+
+def _ast_callbacks(transformer: McTransformer) -> dict:
+    """
+    Callbacks do parser LALR de `ast_parser` para outro transformer, usados
+    nas análises que não passam pelo transformer global (e pelo lock).
+    """
+    lalr = ast_parser.parser.parser.parser
+    callbacks = AstBuilder(transformer).callbacks(lalr.callbacks)
+    if callbacks is None:
+        # Mesmas chaves dos callbacks de `ast_parser`: as regras do construtor
+        # são outros objetos, iguais mas mais lentos como chaves
+        rules = ast_parser._parse_tree_builder.create_callback(transformer)
+        callbacks = {
+            key: rules[key] if key in rules else getattr(transformer, key)
+            for key in lalr.callbacks
+        }
+    return callbacks
+
+
+class ThreadParser:
+    """
+    Analisador com o seu próprio transformer, para ser usado por uma única
+    thread.
+
+    As tabelas LALR e o lexer são os de `ast_parser`; só o transformer, que
+    guarda as posições da análise em andamento, é próprio. Assim a análise
+    não passa pelo lock de `parse` e threads com um `ThreadParser` cada
+    analisam ao mesmo tempo (em paralelo nos builds free-threaded).
+    """
+
+    def __init__(self):
+        self.transformer = McTransformer()
+        frontend = copy.copy(ast_parser.parser)
+        lalr = frontend.parser = copy.copy(frontend.parser)
+        # Um `DirectParser` compila os callbacks na sua tabela de ações, então
+        # o parser interno é criado de novo, e não só copiado
+        parser = lalr.parser
+        callbacks = _ast_callbacks(self.transformer)
+        lalr.parser = type(parser)(parser.parse_table, callbacks, parser.debug)
+        self._frontend = frontend
+
+    def parse(self, src: str, path: str = "<string>") -> Program:
+        """
+        Como `parse`, mas com o transformer desta instância.
+        """
+        try:
+            tree, _ = _run_parser(self._frontend, self.transformer, src, "start", path)
+        except UnexpectedInput as exc:
+            locate(exc, path=path)
+            raise
+        assert isinstance(tree, Program), f"Esperava um Program, mas recebi {type(tree)}"
+        try:
+            tree.validate_tree()
+        except SemanticError as exc:
+            locate(exc, tree)
+            raise
+        tree.desugar_tree()
+        return tree
+
+
 def parse_cst(src: str, expr: bool = False) -> Tree:
     """
     Similar a função `parse`, mas retorna a árvore sintática produzida pelo
@@ -99,4 +309,4 @@ def lex(src: str) -> Iterator[Token]:
     """
     Retorna um iterador sobre os tokens do código fonte.
     """
-    return ast_parser.lex(src)
+    return tokenizer.tokenize(src)
@@ -0,0 +1,164 @@
+"""
+Posições dos nós da AST no código fonte.
+
+As posições não são guardadas nos próprios nós (isso mudaria os campos das
+dataclasses, a comparação entre nós e a impressão das árvores). Em vez
+disso, o `McTransformer` registra as posições numa tabela lateral indexada
+por `id(node)`, que a função `parse` anexa ao `Program` como `source_map`.
+
+Os erros recebem a posição onde ocorreram (`error_location`) sem custo
+durante a execução: a posição só é procurada depois que a exceção é
+lançada, a partir dos nós que estavam sendo avaliados (ou validados) nos
+quadros da pilha da exceção.
+"""
+
+from types import TracebackType
+from typing import TYPE_CHECKING, Iterable, NamedTuple, Optional
+
+if TYPE_CHECKING:
+    from .node import Node
+
+# (linha, coluna, linha final, coluna final), como nos tokens do Lark
+Span = tuple[int, int, int, int]
+# Variáveis locais que guardam o nó avaliado: `self` nos métodos dos nós e
+# `node` nos avaliadores externos (ex.: `microC.aio.Stepper`)
+NODE_LOCALS = ("self", "node")
+
+
+class Location(NamedTuple):
+    """
+    Posição de um erro, impressa como `arquivo:linha:coluna`.
+    """
+
+    path: str
+    line: int
+    column: int
+
+    def __str__(self) -> str:
+        return f"{self.path}:{self.line}:{self.column}"
+
+
+class SourceMap:
+    """
+    Tabela de posições de um programa.
+
+    Os nós são identificados por `id`, então a tabela só é válida enquanto
+    a árvore que a originou estiver viva.
+    """
+
+    def __init__(self, spans: dict[int, Span] | None = None, path: str = "<string>"):
+        self.spans: dict[int, Span] = spans if spans is not None else {}
+        self.path = path
+
+    @classmethod
+    def from_tree(cls, tree: "Node", spans: dict[int, Span], path: str = "<string>") -> "SourceMap":
+        """
+        Cria a tabela mantendo apenas as posições dos nós presentes em `tree`.
+
+        O transformer registra posições de nós intermediários que são
+        descartados durante a construção da árvore; eles são removidos aqui.
+        """
+        kept = {}
+        for node in tree.descendants():
+            span = spans.get(id(node))
+            if span is not None:
+                kept[id(node)] = span
+        return cls(kept, path)
+
+    def __len__(self) -> int:
+        return len(self.spans)
+
+    def __contains__(self, node: "Node") -> bool:
+        return id(node) in self.spans
+
+    def get(self, node: "Node") -> Optional[Span]:
+        """
+        Retorna a posição do nó ou None, se for desconhecida.
+        """
+        return self.spans.get(id(node))
+
+    def line(self, node: "Node") -> Optional[int]:
+        """
+        Retorna a linha onde o nó começa ou None, se for desconhecida.
+        """
+        span = self.spans.get(id(node))
+        return None if span is None else span[0]
+
+
+def source_map(tree: "Node") -> SourceMap:
+    """
+    Retorna a tabela de posições associada à árvore, ou uma tabela vazia.
+    """
+    return getattr(tree, "source_map", None) or SourceMap()
+
+
+def join_spans(spans: Iterable[Optional[Span]]) -> Optional[Span]:
+    """
+    Retorna a menor posição que cobre todas as posições conhecidas.
+    """
+    known = [span for span in spans if span is not None]
+    if not known:
+        return None
+    first = min(known)
+    last = max(known, key=lambda span: (span[2], span[3]))
+    return first[0], first[1], last[2], last[3]
+
+
+def locate(
+    exc: BaseException, tree: Optional["Node"] = None, path: Optional[str] = None
+) -> Optional[Location]:
+    """
+    Registra em `exc.location` a posição do erro e a retorna.
+
+    Erros de sintaxe do Lark já trazem linha e coluna. Nos demais, a posição
+    é a do nó mais interno de `tree` encontrado nos quadros da pilha da
+    exceção. Se a exceção já tiver uma posição, ela é mantida.
+    """
+    location = getattr(exc, "location", None)
+    if location is not None:
+        return location
+    positions = source_map(tree) if tree is not None else SourceMap()
+    path = positions.path if path is None else path
+    line, column = getattr(exc, "line", None), getattr(exc, "column", None)
+    if isinstance(line, int) and isinstance(column, int) and line > 0:
+        location = Location(path, line, column)
+    else:
+        span = _innermost_span(exc.__traceback__, positions)
+        if span is not None:
+            location = Location(path, span[0], span[1])
+    if location is not None:
+        exc.location = location  # type: ignore[attr-defined]
+        # BaseException.add_note só existe a partir do Python 3.11
+        if hasattr(exc, "add_note"):
+            exc.add_note(f"em {location}")
+    return location
+
+
+def error_location(exc: BaseException) -> Optional[Location]:
+    """
+    Posição registrada por `locate`, ou None.
+    """
+    return getattr(exc, "location", None)
+
+
+def describe_error(exc: BaseException) -> str:
+    """
+    Mensagem do erro, precedida da posição (`arquivo:linha:coluna: ...`)
+    quando conhecida.
+    """
+    message = str(exc) or type(exc).__name__
+    location = error_location(exc)
+    return message if location is None else f"{location}: {message}"
+
+
+def _innermost_span(tb: Optional[TracebackType], positions: SourceMap) -> Optional[Span]:
+    found = None
+    while tb is not None:
+        local = tb.tb_frame.f_locals
+        for name in NODE_LOCALS:
+            span = positions.get(local.get(name))
+            if span is not None:
+                found = span
+                break
+        tb = tb.tb_next
+    return found
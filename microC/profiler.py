@@ -0,0 +1,259 @@
+"""
+Profiler de programas MicroC.
+
+Conta execuções e mede o tempo gasto em cada nó da AST, agregando os
+resultados por linha do código fonte e por função MicroC.
+
+O profiler não adiciona nenhuma verificação ao caminho normal de `eval`.
+Enquanto está instalado, ele sobrescreve o método `eval` de cada nó com um
+atributo de instância que mede o tempo e chama o método original; as
+funções MicroC criadas durante a execução trocam de classe para
+`ObservedFunction`, que repassa as chamadas ao profiler. Ao desinstalar, os
+atributos são removidos e as classes restauradas.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from .ast import Function, Program
+from .node import Node
+from .positions import source_map
+from .runtime import McFunction
+
+Timer = Callable[[], float]
+
+
+@dataclass
+class NodeStats:
+    """
+    Estatísticas de um nó da AST.
+
+    `self_time` exclui o tempo gasto nos nós filhos, de forma que a soma
+    sobre todos os nós é o tempo total de execução.
+    """
+
+    node: Node = field(repr=False)
+    count: int = 0
+    self_time: float = 0.0
+
+
+@dataclass
+class LineStats:
+    """
+    Estatísticas agregadas de uma linha do código fonte.
+    """
+
+    line: Optional[int]
+    count: int = 0
+    self_time: float = 0.0
+
+
+@dataclass
+class FunctionStats:
+    """
+    Estatísticas de uma função MicroC.
+
+    `total` inclui o tempo das funções chamadas (e conta chamadas recursivas
+    apenas uma vez); `self_time` exclui o tempo das funções chamadas.
+    """
+
+    name: str
+    calls: int = 0
+    total: float = 0.0
+    self_time: float = 0.0
+
+
+class ObservedFunction(McFunction):
+    """
+    Função MicroC cujas chamadas passam por um observador, como o `Profiler`
+    ou o `CallTracer`.
+
+    Não é instanciada diretamente: `observe_function` troca a classe de uma
+    `McFunction` existente.
+    """
+
+    def __call__(self, *args):
+        return self._observer.call_function(self, args)
+
+
+def observe_function(func: McFunction, observer) -> None:
+    """
+    Faz as chamadas de `func` passarem por `observer.call_function(func, args)`.
+    """
+    func._observer = observer
+    func.__class__ = ObservedFunction
+
+
+def restore_function(func: McFunction) -> None:
+    """
+    Desfaz `observe_function`.
+    """
+    func.__class__ = McFunction
+    del func._observer
+
+
+class Profiler:
+    """
+    Mede a execução de um programa.
+
+    Examples:
+        >>> program = parse(src)
+        >>> with Profiler(program) as profiler:
+        ...     program.eval(ctx, auto_execute_main=True)
+        >>> print(profiler.report(src))
+    """
+
+    def __init__(self, program: Program, timer: Timer = time.perf_counter):
+        self.program = program
+        self.timer = timer
+        self.nodes: dict[int, NodeStats] = {}
+        self.functions: dict[str, FunctionStats] = {}
+        self._node_stack: list[float] = []
+        self._function_stack: list[float] = []
+        self._active: dict[str, int] = {}
+        self._wrapped: list[Node] = []
+        self._profiled_functions: list[McFunction] = []
+
+    def __enter__(self) -> "Profiler":
+        self.install()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.uninstall()
+
+    def install(self) -> None:
+        """
+        Instala os medidores em todos os nós do programa.
+        """
+        for node in self.program.descendants():
+            # O próprio Program não corresponde a nenhuma linha do código
+            if "eval" not in vars(node) and not isinstance(node, Program):
+                self._wrap(node)
+
+    def uninstall(self) -> None:
+        """
+        Remove os medidores, restaurando os nós e funções originais.
+        """
+        for node in self._wrapped:
+            del node.eval
+        for func in self._profiled_functions:
+            restore_function(func)
+        self._wrapped.clear()
+        self._profiled_functions.clear()
+
+    def _wrap(self, node: Node) -> None:
+        stats = self.nodes[id(node)] = NodeStats(node)
+        original = node.eval
+        stack = self._node_stack
+        timer = self.timer
+        profile_function = self._profile_function if isinstance(node, Function) else None
+
+        def eval(*args):
+            stack.append(0.0)
+            start = timer()
+            try:
+                result = original(*args)
+            finally:
+                elapsed = timer() - start
+                inner = stack.pop()
+                stats.count += 1
+                stats.self_time += elapsed - inner
+                if stack:
+                    stack[-1] += elapsed
+            if profile_function is not None:
+                profile_function(result)
+            return result
+
+        node.eval = eval
+        self._wrapped.append(node)
+
+    def _profile_function(self, func: McFunction) -> None:
+        observe_function(func, self)
+        self._profiled_functions.append(func)
+
+    def call_function(self, func: McFunction, args: tuple):
+        """
+        Executa e contabiliza uma chamada de função MicroC.
+        """
+        name = func.name
+        stats = self.functions.get(name)
+        if stats is None:
+            stats = self.functions[name] = FunctionStats(name)
+        stack = self._function_stack
+        active = self._active
+        depth = active.get(name, 0)
+        active[name] = depth + 1
+
+        stack.append(0.0)
+        start = self.timer()
+        try:
+            return McFunction.__call__(func, *args)
+        finally:
+            elapsed = self.timer() - start
+            inner = stack.pop()
+            active[name] = depth
+            stats.calls += 1
+            stats.self_time += elapsed - inner
+            if depth == 0:
+                stats.total += elapsed
+            if stack:
+                stack[-1] += elapsed
+
+    def line_stats(self) -> list[LineStats]:
+        """
+        Agrega as estatísticas dos nós por linha, da mais custosa para a
+        menos custosa. Nós sem posição conhecida ficam na linha None.
+        """
+        positions = source_map(self.program)
+        lines: dict[Optional[int], LineStats] = {}
+        for stats in self.nodes.values():
+            if not stats.count:
+                continue
+            line = positions.line(stats.node)
+            entry = lines.get(line)
+            if entry is None:
+                entry = lines[line] = LineStats(line)
+            entry.count += stats.count
+            entry.self_time += stats.self_time
+        return sorted(lines.values(), key=lambda entry: entry.self_time, reverse=True)
+
+    def function_stats(self) -> list[FunctionStats]:
+        """
+        Estatísticas por função, da maior para a menor em tempo inclusivo.
+        """
+        return sorted(self.functions.values(), key=lambda entry: entry.total, reverse=True)
+
+    def total_time(self) -> float:
+        """
+        Tempo total medido, somando o tempo próprio de todos os nós.
+        """
+        return sum(stats.self_time for stats in self.nodes.values())
+
+    def report(self, source: str | None = None, limit: int = 20) -> str:
+        """
+        Relatório textual com as linhas mais custosas e as funções chamadas.
+        """
+        code = source.splitlines() if source is not None else []
+        total = self.total_time() or 1.0
+        out = ["Linhas mais custosas:"]
+        out.append(f"{'linha':>6} {'execuções':>10} {'tempo (ms)':>11} {'%':>6}  código")
+        for entry in self.line_stats()[:limit]:
+            line = "?" if entry.line is None else str(entry.line)
+            text = ""
+            if entry.line is not None and 0 < entry.line <= len(code):
+                text = code[entry.line - 1].strip()
+            percent = 100 * entry.self_time / total
+            out.append(
+                f"{line:>6} {entry.count:>10} {entry.self_time * 1000:>11.3f} {percent:>6.1f}  {text}"
+            )
+
+        out.append("")
+        out.append("Funções:")
+        out.append(f"{'função':<20} {'chamadas':>9} {'inclusivo (ms)':>15} {'exclusivo (ms)':>15}")
+        for entry in self.function_stats():
+            out.append(
+                f"{entry.name:<20} {entry.calls:>9} {entry.total * 1000:>15.3f} "
+                f"{entry.self_time * 1000:>15.3f}"
+            )
+        return "\n".join(out)
@@ -1,15 +1,19 @@
 import builtins
-from dataclasses import dataclass
-from operator import add, ge, gt, le, lt, mul, neg, not_, sub, truediv, mod, iadd, isub, imul, itruediv
-from typing import TYPE_CHECKING
+from dataclasses import dataclass, field
+from functools import cached_property
+from operator import add, ge, gt, le, lt, mul, neg, not_, sub, truediv, iadd, isub, imul, itruediv
+from types import BuiltinFunctionType
+from typing import TYPE_CHECKING, Any, Callable
 
 from .ctx import Ctx
+from .limits import body_weight
 
 if TYPE_CHECKING:
     from .ast import Stmt, Value
 
 __all__ = [
     "add",
+    "div",
     "eq",
     "ge",
     "gt",
@@ -45,6 +49,26 @@ def ne(a, b):
         return True
     return a != b
 
+def div(a, b):
+    """
+    Divisão com a semântica do C: entre inteiros, o resultado é truncado em
+    direção a zero.
+    """
+    if type(a) is int and type(b) is int:
+        q = a // b
+        if q < 0 and q * b != a:
+            q += 1
+        return q
+    return a / b
+
+def mod(a, b):
+    """
+    Resto da divisão com a semântica do C: tem o mesmo sinal do dividendo.
+    """
+    if type(a) is int and type(b) is int:
+        return a - b * div(a, b)
+    return a % b
+
 def increment(a: "Value") -> "Value":
     """
     Incrementa o valor de a, retornando o novo valor.
@@ -71,18 +95,41 @@ class McFunction:
     args: list[str]
     body: list  # lista de Stmt
     ctx: Ctx
+    arg_types: list = field(default_factory=list)  # lista de Type
 
     def __call__(self, *args):
-        # Cria novo escopo para a chamada
-        env = dict(zip(self.args, args, strict=True))
-        local_ctx = self.ctx.push(env)
+        local_ctx = self.enter(args)
+        limits = local_ctx.limits
         try:
+            if limits is not None:
+                limits.enter(self)
             for stmt in self.body:
                 stmt.eval(local_ctx)
         except McReturn as e:
             return e.value
+        finally:
+            if limits is not None:
+                limits.leave()
         return None
 
+    @cached_property
+    def weight(self) -> int:
+        """
+        Passos contados por chamada: 1 mais o número de nós do corpo.
+        """
+        return 1 + body_weight(self.body)
+
+    def enter(self, args) -> Ctx:
+        """
+        Cria o escopo de uma chamada, com os parâmetros ligados aos
+        argumentos. O escopo guarda pares (tipo, valor).
+        """
+        env = {
+            name: (tipo, value)
+            for name, tipo, value in zip(self.args, self.arg_types, args, strict=True)
+        }
+        return self.ctx.push(env)
+
 
 class McReturn(Exception):
     """
@@ -110,37 +157,60 @@ def print(value: "Value"):
     builtins.print(show(value))
 
 
-import types
-
-def show(value):
-    # None -> NULL
-    if value is None:
-        return "NULL"
-    # Arrays
-    if isinstance(value, list):
-        if value and all(isinstance(elem, str) and len(elem) == 1 for elem in value):
-            # Imprime até o primeiro '\0'
-            s = ""
-            for c in value:
-                if c == '\0':
-                    break
-                s += c
-            return s
-        return "<array>"
-    # Booleanos
-    if value is True:
-        return "true"
-    if value is False:
-        return "false"
-    # McFunction
-    if isinstance(value, McFunction):
-        return f"<fn {value.name}>"
-    # Função nativa do Python
-    import types
-    if isinstance(value, types.BuiltinFunctionType):
-        return "<native fn>"
-    # Fallback
-    return str(value)
+def show(value: "Value") -> str:
+    """
+    Converte um valor MicroC na string impressa pelo printf.
+
+    O formatador é escolhido pelo tipo exato do valor na tabela
+    `SHOW_DISPATCH`. Inteiros e caracteres, os casos mais comuns, nem chegam
+    a consultar a tabela.
+    """
+    cls = type(value)
+    if cls is int:
+        return int.__repr__(value)
+    if cls is str:
+        return value
+    try:
+        formatter = SHOW_DISPATCH[cls]
+    except KeyError:
+        formatter = SHOW_DISPATCH[cls] = _find_formatter(cls)
+    return formatter(value)
+
+
+def _show_array(value: list) -> str:
+    # Arrays de caracteres são impressos até o primeiro '\0'. O join falha se
+    # algum elemento não for string e o tamanho só confere se todos os
+    # elementos forem caracteres simples.
+    if value and type(value[0]) is str:
+        try:
+            text = "".join(value)
+        except TypeError:
+            return "<array>"
+        if len(text) == len(value):
+            end = text.find("\0")
+            return text if end == -1 else text[:end]
+    return "<array>"
+
+
+def _find_formatter(cls: type) -> Callable[[Any], str]:
+    """
+    Procura o formatador de uma subclasse de algum tipo registrado.
+    """
+    for base in cls.__mro__:
+        if base in SHOW_DISPATCH:
+            return SHOW_DISPATCH[base]
+    return str
+
+
+SHOW_DISPATCH: dict[type, Callable[[Any], str]] = {
+    int: int.__repr__,
+    str: str,
+    bool: lambda value: "true" if value else "false",
+    type(None): lambda value: "NULL",
+    list: _show_array,
+    McFunction: lambda value: f"<fn {value.name}>",
+    BuiltinFunctionType: lambda value: "<native fn>",
+}
 
 
 def show_repr(value: "Value") -> str:
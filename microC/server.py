@@ -0,0 +1,299 @@
+"""
+Servidor de compilação MicroC.
+
+`microc serve` mantém um processo com o parser carregado e um cache de
+árvores sintáticas, atendendo requisições num socket Unix. Editores e
+ferramentas de teste evitam assim o custo de iniciar o Python e carregar a
+gramática a cada execução.
+
+O protocolo usa JSON Lines: cada requisição é um objeto numa linha e cada
+resposta também. Uma conexão pode enviar várias requisições em sequência.
+
+Requisição:
+    {"id": 1, "op": "run", "source": "int main() { ... }", "path": "a.microc"}
+
+Operações:
+    parse:
+        Analisa o programa (usando o cache). Responde com `cached`.
+    check:
+        Verifica a sintaxe e a semântica do programa, sem executá-lo. Como
+        `parse` já valida a árvore, as duas diferem apenas na intenção do
+        cliente; ambas usam o cache.
+    run:
+        Executa o programa num `Ctx` novo. Responde com os campos de
+        `BatchResult` (stdout, status, error, ...). Os campos opcionais
+        `max_steps` e `max_memory` limitam a execução (veja
+        `microC.limits`). O campo
+        opcional `stdin`
+        é aceito para compatibilidade futura, mas MicroC ainda não tem
+        comandos de leitura.
+    ast:
+        Responde com a árvore sintática formatada em `ast`.
+
+Toda resposta contém `id` (o mesmo da requisição) e `ok`. Em caso de erro,
+`error`, `error_kind` e, se conhecidos, `line` e `column`.
+"""
+
+import hashlib
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import asdict
+from typing import Optional
+
+from .ast import Program
+from .batch import error_kind, run_source
+from .compiled import CompiledProgram
+from .positions import locate
+
+OPS = ("parse", "check", "run", "ast")
+DEFAULT_CACHE_SIZE = 256
+
+
+def default_socket_path() -> str:
+    """
+    Caminho padrão do socket: `$XDG_RUNTIME_DIR/microc.sock` ou, se a
+    variável não existir, um arquivo por usuário no diretório temporário.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "microc.sock")
+    return os.path.join(tempfile.gettempdir(), f"microc-{os.getuid()}.sock")
+
+
+class ASTCache:
+    """
+    Cache LRU de programas compilados, indexado pelo hash do código fonte.
+
+    A avaliação não altera a árvore de um `CompiledProgram` (congelada de
+    forma rasa) e cada execução usa um `Ctx` novo, então o mesmo programa
+    pode atender várias requisições, inclusive em threads diferentes.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._trees: OrderedDict[bytes, CompiledProgram] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._trees)
+
+    def get(self, source: str) -> tuple[CompiledProgram, bool]:
+        """
+        Retorna o programa compilado e se ele veio do cache. Erros de
+        sintaxe e semânticos são propagados e não ficam no cache.
+        """
+        key = hashlib.blake2b(source.encode("utf-8"), digest_size=16).digest()
+        with self._lock:
+            tree = self._trees.get(key)
+            if tree is not None:
+                self._trees.move_to_end(key)
+                self.hits += 1
+                return tree, True
+
+        tree = CompiledProgram.from_source(source)
+        with self._lock:
+            self.misses += 1
+            self._trees[key] = tree
+            if len(self._trees) > self.maxsize:
+                self._trees.popitem(last=False)
+        return tree, False
+
+    def parse(self, source: str) -> Program:
+        """
+        Mesma interface de `microC.parse`, usando o cache.
+        """
+        return self.get(source)[0].program
+
+
+def error_response(exc: Exception) -> dict:
+    """
+    Descreve uma exceção como campos da resposta.
+    """
+    response = {
+        "ok": False,
+        "error": str(exc) or type(exc).__name__,
+        "error_kind": error_kind(exc),
+        "error_type": type(exc).__name__,
+    }
+    location = locate(exc)
+    if location is not None:
+        response["line"], response["column"] = location.line, location.column
+    return response
+
+
+class CompileServer:
+    """
+    Atende as requisições do protocolo, independentemente do transporte.
+    """
+
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE):
+        self.cache = ASTCache(cache_size)
+
+    def handle(self, request: dict) -> dict:
+        """
+        Processa uma requisição já decodificada e retorna a resposta.
+        """
+        op = request.get("op")
+        source = request.get("source")
+        if op not in OPS:
+            response = protocol_error(f"operação desconhecida: {op}")
+        elif not isinstance(source, str):
+            response = protocol_error("campo `source` ausente ou inválido")
+        elif op == "run":
+            path = request.get("path") or "<string>"
+            limits = {name: request.get(name) for name in ("max_steps", "max_memory")}
+            if any(value is not None and type(value) is not int for value in limits.values()):
+                response = protocol_error("`max_steps` e `max_memory` devem ser inteiros")
+            else:
+                result = run_source(source, path, parse=self.cache.parse, **limits)
+                response = asdict(result)
+                response["ok"] = result.ok
+        else:
+            try:
+                tree, cached = self.cache.get(source)
+            except Exception as exc:
+                response = error_response(exc)
+            else:
+                response = {"ok": True, "cached": cached}
+                if op == "ast":
+                    response["ast"] = tree.program.pretty()
+        response["id"] = request.get("id")
+        return response
+
+    def handle_line(self, line: bytes) -> bytes:
+        """
+        Processa uma linha do protocolo e retorna a linha de resposta.
+        """
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("a requisição deve ser um objeto JSON")
+        except ValueError as exc:
+            response = protocol_error(f"requisição inválida: {exc}")
+            response["id"] = None
+        else:
+            response = self.handle(request)
+        return json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+def protocol_error(message: str) -> dict:
+    """
+    Resposta para requisições que não seguem o protocolo.
+    """
+    return {"ok": False, "error": message, "error_kind": "protocol", "error_type": None}
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    server: "UnixServer"
+
+    def handle(self):
+        for line in self.rfile:
+            if line.strip():
+                self.wfile.write(self.server.compile_server.handle_line(line))
+                self.wfile.flush()
+
+
+class UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Servidor num socket Unix; cada conexão é atendida numa thread.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, path: str, compile_server: Optional[CompileServer] = None):
+        self.compile_server = compile_server or CompileServer()
+        _remove_stale_socket(path)
+        super().__init__(path, _Handler)
+
+    def server_close(self):
+        super().server_close()
+        try:
+            os.unlink(self.server_address)
+        except OSError:
+            pass
+
+
+def _remove_stale_socket(path: str) -> None:
+    """
+    Remove o arquivo de um socket abandonado. Falha se houver um servidor
+    ativo no caminho.
+    """
+    if not os.path.exists(path):
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(path)
+        except OSError:
+            os.unlink(path)
+            return
+    raise OSError(f"já existe um servidor MicroC em {path}")
+
+
+def serve(path: Optional[str] = None, cache_size: int = DEFAULT_CACHE_SIZE) -> None:
+    """
+    Inicia o servidor e atende requisições até ser interrompido (Ctrl+C ou
+    SIGTERM). O arquivo do socket é removido ao sair.
+    """
+    path = path or default_socket_path()
+    with UnixServer(path, CompileServer(cache_size)) as server:
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+        print(f"Servidor MicroC em {path}", flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+class Client:
+    """
+    Cliente do servidor de compilação. Mantém a conexão aberta entre
+    requisições.
+
+    Raises:
+        OSError:
+            Se não houver servidor no caminho indicado.
+    """
+
+    def __init__(self, path: Optional[str] = None, timeout: Optional[float] = None):
+        self.path = path or default_socket_path()
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.settimeout(timeout)
+        try:
+            self._sock.connect(self.path)
+        except OSError:
+            self._sock.close()
+            raise
+        self._file = self._sock.makefile("rwb")
+        self._next_id = 0
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._file.close()
+        self._sock.close()
+
+    def request(self, op: str, source: str, **fields) -> dict:
+        """
+        Envia uma requisição e espera a resposta.
+        """
+        self._next_id += 1
+        request = {"id": self._next_id, "op": op, "source": source, **fields}
+        self._file.write(json.dumps(request).encode("utf-8") + b"\n")
+        self._file.flush()
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError("o servidor fechou a conexão")
+        return json.loads(line)
@@ -0,0 +1,204 @@
+"""
+Análise de arquivos grandes, uma declaração de nível superior por vez.
+
+`parse` recebe o código fonte inteiro como `str` e só valida a AST depois
+de construí-la por completo, junto com a tabela de posições de todos os
+nós registrados pelo transformer. `iter_decls` lê o arquivo mapeado na
+memória (`mmap`):
+
+* os tokens saem direto dos bytes do arquivo (`Tokenizer.tokenize_bytes`),
+  sem decodificar o texto inteiro;
+* o parser LALR é alimentado token a token, com um transformer próprio da
+  análise. Quando uma declaração de nível superior (função, variável global
+  ou comando solto) é reduzida, ela sai da lista de declarações na pilha do
+  parser e as posições registradas pelo transformer são filtradas e
+  descartadas;
+* a declaração é validada, tem o açúcar sintático removido e é produzida
+  junto com suas posições.
+
+O parser de `microC.parser` não constrói árvores do Lark (os nós são
+criados nas reduções, veja `microC.builder`), então a memória usada durante
+a análise é limitada pela maior declaração do arquivo. `parse_file` junta as declarações num
+`Program`, igual ao de `parse` para o mesmo texto.
+
+As chamadas a funções nativas consultam o programa inteiro, já que uma
+função ou variável com o mesmo nome pode ser definida depois (veja
+`Call.validate_self`). Quando a validação de uma declaração que chama uma
+função nativa ainda não definida falha, ela é repetida no fim do arquivo,
+com todas as definições; nesse caso, a declaração já foi produzida.
+"""
+
+import mmap
+import os
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, Optional, TextIO, Union
+
+from lark import Token
+from lark.exceptions import UnexpectedInput, UnexpectedToken
+from lark.parsers.lalr_interactive_parser import InteractiveParser
+
+from .ast import Program, Stmt
+from .builder import parser_state
+from .errors import SemanticError
+from .incremental import _DECLS_RULES, _natives, _TokenStream, _validate
+from .node import Node
+from .parser import _ast_callbacks, _fill_accepts, ast_parser, tokenizer
+from .positions import SourceMap, join_spans, locate
+from .transformer import McTransformer
+
+__all__ = ["iter_decls", "parse_file"]
+
+Source = Union[str, os.PathLike, BinaryIO, TextIO]
+
+
+def iter_decls(source: Source, path: Optional[str] = None) -> Iterator[tuple[Stmt, SourceMap]]:
+    """
+    Produz as declarações de nível superior do arquivo, cada uma com a
+    tabela das posições dos seus nós, à medida que são analisadas.
+
+    Args:
+        source:
+            Caminho do arquivo ou arquivo aberto, lido desde o início. O
+            código deve estar em UTF-8.
+        path:
+            Nome do arquivo, usado nas posições. Por padrão, o caminho ou o
+            atributo `name` do arquivo aberto.
+
+    Erros de sintaxe e semânticos recebem a posição em `exc.location`, como
+    em `parse`.
+    """
+    path = _source_name(source) if path is None else path
+    with _open_source(source) as data:
+        yield from _parse_decls(data, path)
+
+
+def parse_file(source: Source, path: Optional[str] = None) -> Program:
+    """
+    Analisa o arquivo com `iter_decls` e retorna o mesmo `Program` que
+    `parse` retornaria para o seu texto, com as posições em `source_map`.
+    """
+    path = _source_name(source) if path is None else path
+    stmts: list[Stmt] = []
+    spans = {}
+    for stmt, positions in iter_decls(source, path):
+        stmts.append(stmt)
+        spans.update(positions.spans)
+    program = Program(stmts)
+    # Como em `parse`, o programa cobre as declarações
+    span = join_spans(spans.get(id(stmt)) for stmt in stmts)
+    if span is not None:
+        spans[id(program)] = span
+    program.source_map = SourceMap(spans, path)
+    return program
+
+
+def _parse_decls(data, path: str) -> Iterator[tuple[Stmt, SourceMap]]:
+    transformer = McTransformer()
+    parser = ast_parser.parser.parser.parser
+    callbacks = _ast_callbacks(transformer)
+    done: list[tuple[Stmt, SourceMap]] = []
+
+    def on_decl(callback):
+        def wrapper(children):
+            decls = callback(children)
+            # Fora de um bloco, a declaração (o último filho) sai da lista
+            # de `program` e as posições do transformer são descartadas.
+            # As posições ficam com a declaração antes que o próximo token
+            # seja transformado.
+            if len(state.state_stack) == 1:
+                stmt = children[-1]
+                done.append((stmt, SourceMap.from_tree(stmt, transformer.reset(), path)))
+                # Uma lista (veja `microC.builder`) ou, com o transformer, uma Tree
+                getattr(decls, "children", decls).clear()
+            return decls
+
+        return wrapper
+
+    for rule in _DECLS_RULES:
+        callbacks[rule] = on_decl(callbacks[rule])
+    stream = _TokenStream(tokenizer.tokenize_bytes(data))
+    state = parser_state(parser, callbacks, stream)
+    definitions: list[Node] = []
+    defined: set[str] = set()
+    deferred: list[tuple[Stmt, SourceMap]] = []
+
+    def finish(stmt: Stmt, positions: SourceMap) -> tuple[Stmt, SourceMap]:
+        defines, calls = _natives(stmt)
+        if defines:
+            definitions.append(stmt)
+            defined.update(defines)
+        try:
+            _validate([stmt], definitions)
+        except SemanticError as exc:
+            if not calls - defined:
+                _locate(exc, stmt, positions)
+                raise
+            deferred.append((stmt, positions))
+        stmt.desugar_tree()
+        return stmt, positions
+
+    # O mesmo laço de `_Parser.parse_from_state`, produzindo cada
+    # declaração assim que ela é reduzida
+    try:
+        token = None
+        for token in stream.lex(state):
+            state.feed_token(token)
+            while done:
+                yield finish(*done.pop(0))
+        if token is None:
+            end = Token("$END", "", 0, 1, 1)
+        else:
+            end = Token.new_borrow_pos("$END", "", token)
+        state.feed_token(end, True)
+    except UnexpectedInput as exc:
+        exc.interactive_parser = InteractiveParser(parser, state, stream)
+        if isinstance(exc, UnexpectedToken):
+            _fill_accepts(exc)
+        locate(exc, path=path)
+        raise
+    while done:
+        yield finish(*done.pop(0))
+
+    for stmt, positions in deferred:
+        try:
+            _validate([stmt], definitions)
+        except SemanticError as exc:
+            _locate(exc, stmt, positions)
+            raise
+
+
+def _locate(exc: BaseException, stmt: Stmt, positions: SourceMap):
+    program = Program([stmt])
+    program.source_map = positions
+    locate(exc, program)
+
+
+def _source_name(source: Source) -> str:
+    if isinstance(source, (str, os.PathLike)):
+        return os.fspath(source)
+    name = getattr(source, "name", None)
+    return name if isinstance(name, str) else "<string>"
+
+
+@contextmanager
+def _open_source(source: Source):
+    """
+    Conteúdo do arquivo como `mmap` (ou `bytes`, se ele não puder ser
+    mapeado).
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as fd:
+            with _open_source(fd) as data:
+                yield data
+        return
+    try:
+        mapped = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+    except (AttributeError, OSError, ValueError):
+        # Arquivos em memória (ex.: `io.BytesIO`), pipes e arquivos vazios
+        mapped = None
+    if mapped is None:
+        data = source.read()
+        yield data.encode() if isinstance(data, str) else data
+    else:
+        with mapped:
+            yield mapped
@@ -6,9 +6,12 @@ Funções que auxiliam na criação de testes e execução de exemplos.
 
 import builtins
 import contextlib
+import hashlib
 import io
 import os
 import re
+import threading
+import time
 from dataclasses import dataclass, field
 from functools import lru_cache
 from pathlib import Path
@@ -24,9 +27,11 @@ except ImportError:
 
 from . import Node, parse, parse_cst, parse_expr
 from . import eval as lox_eval
-from .ast import Literal, Program
+from .ast import Literal, Program, Value
+from .compiled import CompiledProgram
 from .ctx import Ctx
 from .errors import SemanticError
+from .output import MemoryOutput
 
 BASE_DIR = Path(__file__).parent.parent
 EXERCISES = BASE_DIR / "exercicios"
@@ -103,15 +108,15 @@ class Example:
         """
         Executa o exemplo.
         """
-        stdout = io.StringIO()
-        with contextlib.redirect_stdout(stdout) as stdout:
-            ctx = Ctx.from_dict({})
-            try:
-                lox_eval(self.src, ctx)
-            except Exception as e:
-                if self.error is not None and self.error.runtime:
-                    return ctx, "", str(e)
-                raise
+        stdout = MemoryOutput()
+        ctx = Ctx.from_dict({}, output=stdout)
+        try:
+            name = None if self.path == Path("<string>") else normalize(self.path)
+            run_cached(self.src, ctx, name=name)
+        except Exception as e:
+            if self.error is not None and self.error.runtime:
+                return ctx, "", str(e)
+            raise
         return ctx, stdout.getvalue(), None
 
     def test_example(self):
@@ -192,11 +197,9 @@ class ExampleTester:
 
         @pytest.mark.parametrize("path", examples, ids=names)
         def test_expected(self, path: Path):
-            ex = Example(
-                path.read_text(encoding="utf-8"),
-                path=path,
-                fuzzy=cls.fuzzy_output,
-            )
+            ex = load_example(path)
+            if cls.fuzzy_output:
+                ex = Example(ex.src, path=path, fuzzy=True)
             ex.test_example()
 
         test_name = "test_exemplo_válido"
@@ -634,9 +637,102 @@ def load_examples(
             yield path
 
 
-@lru_cache(maxsize=512)
+#
+# Cache dos exemplos
+#
+# Vários módulos de teste leem, analisam e executam os mesmos exemplos. Os
+# exemplos (com as saídas esperadas já extraídas) e as árvores sintáticas
+# ficam guardados durante a sessão, indexados pelo hash do conteúdo: um
+# arquivo alterado no meio da sessão é relido. As árvores são congeladas
+# de forma rasa (veja `microC.compiled`) e a avaliação não as altera, então
+# a mesma árvore pode ser executada por vários testes. Com workers paralelos
+# (pytest-xdist), cada worker tem o seu próprio cache.
+#
+_EXAMPLES: dict[tuple[bytes, Path], Example] = {}
+_PROGRAMS: dict[bytes, CompiledProgram] = {}
+_NAMES: dict[bytes, str] = {}
+_lock = threading.Lock()
+
+# Tempos (exemplo, fase, segundos) registrados desde o último
+# `pop_timings`; as fases são "parse" (só quando a árvore não estava no
+# cache) e "execute"
+_timings: list[tuple[str, str, float]] = []
+
+
+def source_hash(src: str) -> bytes:
+    return hashlib.blake2b(src.encode("utf-8"), digest_size=16).digest()
+
+
+def read_example(place: Path) -> str:
+    """
+    Lê o código de um exemplo e associa o seu hash ao nome do arquivo, usado
+    no relatório de tempos.
+    """
+    src = place.read_text(encoding="utf-8")
+    _NAMES.setdefault(source_hash(src), normalize(place))
+    return src
+
+
 def load_example(place: Path) -> Example:
-    return Example(place.read_text(encoding="utf-8"), path=place)
+    """
+    Carrega um exemplo, reaproveitando o da sessão se o arquivo não mudou.
+    """
+    src = read_example(place)
+    key = (source_hash(src), place)
+    example = _EXAMPLES.get(key)
+    if example is None:
+        example = _EXAMPLES[key] = Example(src, path=place)
+    return example
+
+
+def parse_cached(src: str, name: str | None = None) -> Program:
+    """
+    Como `microC.parse`, mas guarda a árvore (congelada) durante a sessão.
+    Erros de sintaxe e semânticos não ficam no cache.
+    """
+    key = source_hash(src)
+    with _lock:
+        program = _PROGRAMS.get(key)
+    if program is None:
+        start = time.perf_counter()
+        program = CompiledProgram.from_source(src)
+        _record(key, name, "parse", time.perf_counter() - start)
+        with _lock:
+            _PROGRAMS[key] = program
+    return program.program
+
+
+def run_cached(
+    src: str,
+    env: Ctx | None = None,
+    auto_execute_main: bool = False,
+    name: str | None = None,
+) -> Value:
+    """
+    Como `microC.eval`, usando a árvore de `parse_cached`.
+    """
+    ast = parse_cached(src, name)
+    start = time.perf_counter()
+    try:
+        return lox_eval(ast, env, skip_validation=True, auto_execute_main=auto_execute_main)
+    finally:
+        _record(source_hash(src), name, "execute", time.perf_counter() - start)
+
+
+def _record(key: bytes, name: str | None, phase: str, elapsed: float) -> None:
+    name = name or _NAMES.get(key) or "<string>"
+    with _lock:
+        _timings.append((name, phase, elapsed))
+
+
+def pop_timings() -> list[tuple[str, str, float]]:
+    """
+    Retorna e descarta os tempos registrados.
+    """
+    with _lock:
+        timings = _timings[:]
+        _timings.clear()
+    return timings
 
 
 @lru_cache(maxsize=512)
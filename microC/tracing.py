@@ -0,0 +1,208 @@
+"""
+Registro das pilhas de chamadas MicroC.
+
+O `CallTracer` acompanha a cadeia de funções MicroC em execução (os nomes
+das `McFunction`), sem os frames do interpretador Python. As pilhas podem
+ser exportadas em dois formatos:
+
+* pilhas colapsadas (`main;buscaBinaria 42`), lidas por ferramentas de
+  flamegraph como o `flamegraph.pl` e o speedscope;
+* JSON `trace_event` do Chrome, com eventos de entrada e saída de cada
+  função, que pode ser aberto em `chrome://tracing` ou no Perfetto.
+
+Assim como o profiler, o tracer só altera o programa enquanto está
+instalado: ele envolve o `eval` dos nós `Function` para observar as funções
+criadas durante a execução.
+"""
+
+import json
+import threading
+import time
+from collections import Counter
+from typing import Callable, TextIO
+
+from .ast import Function, Program
+from .node import Node
+from .profiler import observe_function, restore_function
+from .runtime import McFunction
+
+TRACE_FORMATS = ("chrome", "collapsed")
+
+
+class CallTracer:
+    """
+    Registra as chamadas de funções MicroC de um programa.
+
+    Args:
+        program:
+            Programa a ser observado.
+        sample_interval:
+            Intervalo de amostragem, em segundos. Se for zero, as pilhas
+            colapsadas são pesadas pelo tempo exato (em microssegundos) gasto
+            em cada pilha. Se for positivo, uma thread registra a pilha
+            corrente a cada intervalo e o peso é o número de amostras.
+        record_events:
+            Se False, não guarda os eventos de entrada e saída (necessários
+            para o formato do Chrome e para as pilhas sem amostragem).
+    """
+
+    def __init__(
+        self,
+        program: Program,
+        sample_interval: float = 0.0,
+        record_events: bool = True,
+        timer: Callable[[], float] = time.perf_counter,
+    ):
+        if sample_interval < 0:
+            raise ValueError("sample_interval deve ser positivo")
+        self.program = program
+        self.sample_interval = sample_interval
+        self.record_events = record_events
+        self.timer = timer
+        self.stack: list[str] = []
+        self.events: list[tuple[str, str, float]] = []
+        self.samples: Counter[tuple[str, ...]] = Counter()
+        self._start = 0.0
+        self._wrapped: list[Node] = []
+        self._observed: list[McFunction] = []
+        self._sampler: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    def __enter__(self) -> "CallTracer":
+        self.install()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.uninstall()
+
+    def install(self) -> None:
+        """
+        Começa a observar as funções do programa.
+        """
+        self._start = self.timer()
+        for node in self.program.descendants():
+            if isinstance(node, Function) and "eval" not in vars(node):
+                self._wrap(node)
+        if self.sample_interval > 0:
+            self._stop.clear()
+            self._sampler = threading.Thread(target=self._sample, daemon=True)
+            self._sampler.start()
+
+    def uninstall(self) -> None:
+        """
+        Para de observar as funções e restaura o programa.
+        """
+        if self._sampler is not None:
+            self._stop.set()
+            self._sampler.join()
+            self._sampler = None
+        for node in self._wrapped:
+            del node.eval
+        for func in self._observed:
+            restore_function(func)
+        self._wrapped.clear()
+        self._observed.clear()
+
+    def _wrap(self, node: Function) -> None:
+        original = node.eval
+
+        def eval(ctx):
+            func = original(ctx)
+            observe_function(func, self)
+            self._observed.append(func)
+            return func
+
+        node.eval = eval
+        self._wrapped.append(node)
+
+    def _sample(self) -> None:
+        while not self._stop.wait(self.sample_interval):
+            stack = tuple(self.stack)
+            if stack:
+                self.samples[stack] += 1
+
+    def call_function(self, func: McFunction, args: tuple):
+        """
+        Executa uma chamada de função MicroC registrando entrada e saída.
+        """
+        name = func.name
+        stack = self.stack
+        stack.append(name)
+        if self.record_events:
+            self.events.append(("B", name, self.timer()))
+        try:
+            return McFunction.__call__(func, *args)
+        finally:
+            if self.record_events:
+                self.events.append(("E", name, self.timer()))
+            stack.pop()
+
+    def collapsed(self) -> Counter[str]:
+        """
+        Retorna as pilhas colapsadas ("main;f;g") e seus pesos.
+        """
+        if self.sample_interval > 0:
+            return Counter({";".join(stack): count for stack, count in self.samples.items()})
+
+        weights: Counter[str] = Counter()
+        stack: list[str] = []
+        last = None
+        for kind, name, ts in self.events:
+            if stack and last is not None:
+                weights[";".join(stack)] += round((ts - last) * 1e6)
+            if kind == "B":
+                stack.append(name)
+            else:
+                stack.pop()
+            last = ts
+        return weights
+
+    def write_collapsed(self, fd: TextIO) -> None:
+        """
+        Escreve as pilhas no formato colapsado, uma por linha.
+        """
+        for stack, weight in sorted(self.collapsed().items()):
+            if weight > 0:
+                fd.write(f"{stack} {weight}\n")
+
+    def chrome_trace(self) -> dict:
+        """
+        Retorna os eventos no formato `trace_event` do Chrome.
+        """
+        events = [
+            {
+                "name": name,
+                "cat": "microc",
+                "ph": kind,
+                "ts": round((ts - self._start) * 1e6, 3),
+                "pid": 1,
+                "tid": 1,
+            }
+            for kind, name, ts in self.events
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, fd: TextIO) -> None:
+        """
+        Escreve os eventos como JSON no formato `trace_event` do Chrome.
+        """
+        json.dump(self.chrome_trace(), fd)
+
+    def write(self, fd: TextIO, format: str) -> None:
+        """
+        Escreve o registro no formato pedido ("chrome" ou "collapsed").
+        """
+        if format == "chrome":
+            self.write_chrome_trace(fd)
+        elif format == "collapsed":
+            self.write_collapsed(fd)
+        else:
+            raise ValueError(f"formato de trace desconhecido: {format}")
+
+
+def guess_trace_format(path: str) -> str:
+    """
+    Escolhe o formato pelo nome do arquivo: .json usa o formato do Chrome e
+    as demais extensões usam pilhas colapsadas.
+    """
+    return "chrome" if path.endswith(".json") else "collapsed"
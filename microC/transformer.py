@@ -8,10 +8,11 @@ métodos desta classe.
 """
 
 from typing import Callable
-from lark import Transformer, v_args
+from lark import Token, Transformer, v_args
 
 from . import runtime as op
 from .ast import *
+from .positions import Span, join_spans
 
 
 def op_handler(op: Callable):
@@ -27,8 +28,56 @@ def op_handler(op: Callable):
     return method
 
 
-@v_args(inline=True)
+def inline_with_positions(f, _data, children, _meta):
+    """
+    Equivalente a `v_args(inline=True)`, mas também registra a posição do
+    nó criado a partir das posições dos filhos.
+    """
+    node = f(*children)
+    f.__self__._register_span(node, children)
+    return node
+
+
+@v_args(wrapper=inline_with_positions)
 class McTransformer(Transformer):
+    def __init__(self):
+        super().__init__()
+        # Posições dos nós criados, indexadas por id(node). A função `parse`
+        # reinicia essa tabela a cada chamada. Guardamos também os nós
+        # registrados para que nós descartados durante a análise (ex.: o Var
+        # com o nome de uma função) não liberem seu id para outro objeto.
+        self.spans: dict[int, Span] = {}
+        self.registered: list[Node] = []
+
+    def reset(self) -> dict[int, Span]:
+        """
+        Inicia uma nova tabela de posições e retorna a tabela anterior.
+        """
+        spans = self.spans
+        self.spans = {}
+        self.registered = []
+        return spans
+
+    def _register_span(self, node, children):
+        if not isinstance(node, Node) or id(node) in self.spans:
+            return
+        span = join_spans(self._child_spans(children))
+        if span is not None:
+            self.spans[id(node)] = span
+            self.registered.append(node)
+
+    def _child_spans(self, children):
+        for child in children:
+            if isinstance(child, list):
+                yield from self._child_spans(child)
+            else:
+                yield self.spans.get(id(child))
+
+    def _token_span(self, node, token: Token):
+        self.spans[id(node)] = (token.line, token.column, token.end_line, token.end_column)
+        self.registered.append(node)
+        return node
+
     # Programa
     def program(self, *stmts):
         return Program(list(stmts))
@@ -38,16 +87,28 @@ class McTransformer(Transformer):
 
     # Operações matemáticas básicas
     mul = op_handler(op.mul)
-    div = op_handler(op.truediv)
+    div = op_handler(op.div)
     sub = op_handler(op.sub)
     add = op_handler(op.add)
     mod = op_handler(op.mod)
 
-    # Operações com atribuição
-    iadd = op_handler(op.iadd)
-    isub = op_handler(op.isub)
-    imul = op_handler(op.imul)
-    itruediv = op_handler(op.itruediv)
+    # Operações com atribuição: x += y vira x = x + y
+    def _compound(self, var, value, op):
+        expr = BinOp(var, value, op)
+        self._register_span(expr, [var, value])
+        return Assign(var.name, expr)
+
+    def iadd(self, var, value):
+        return self._compound(var, value, op.add)
+
+    def isub(self, var, value):
+        return self._compound(var, value, op.sub)
+
+    def imul(self, var, value):
+        return self._compound(var, value, op.mul)
+
+    def itruediv(self, var, value):
+        return self._compound(var, value, op.div)
 
     # Comparações
     gt = op_handler(op.gt)
@@ -113,18 +174,18 @@ class McTransformer(Transformer):
     # Comandos
     def VAR(self, token):
         name = str(token)
-        return Var(name)
+        return self._token_span(Var(name), token)
     
     def CHAR(self, token):
         char = str(token)
-        return Literal(char[1:-1]) # tira fora as aspas
+        return self._token_span(Literal(char[1:-1]), token) # tira fora as aspas
 
     def NUMBER(self, token):
         num = int(token)
-        return Literal(num)
+        return self._token_span(Literal(num), token)
     
-    def NULL(self):
-        return Literal(None)
+    def NULL(self, token):
+        return self._token_span(Literal(None), token)
 
     # Tipos
     def type_int(self):
@@ -152,8 +213,9 @@ class McTransformer(Transformer):
             
         if params is None:
             params = []
-        param_names = [p.name for p in params] if params else []
-        return Function(type = type_node, name=name.name, params=param_names, body=body)
+        param_names = [p.name for p in params]
+        param_types = [p.type for p in params]
+        return Function(type=type_node, name=name.name, params=param_names, body=body, param_types=param_types)
     
     def array_decl(self, type_node, name, size, init_values=None):
         if type_node.name == "void":
@@ -175,7 +237,9 @@ class McTransformer(Transformer):
         return While(expr, stmt)
     
     def do_while_stmt(self, stmt, expr):
-        return Block([stmt, While(expr, stmt)])
+        loop = While(expr, stmt)
+        self._register_span(loop, [stmt, expr])
+        return Block([stmt, loop])
 
     def printf_stmt(self, expr):
         """
@@ -196,11 +260,12 @@ class McTransformer(Transformer):
         return list(args)
 
     def simple_param(self, type_node, name):
-        return Var(name.name)
+        # Parâmetros são declarações sem valor inicial: guardamos nome e tipo
+        return VarDef(type_node, name.name)
 
     def array_param(self, type_node, name):
-        # For array parameters, we still create a Var but mark it as an array parameter
-        return Var(name.name)
+        # Arrays são passados por referência e usam o tipo dos elementos
+        return VarDef(type_node, name.name)
 
     def arg_list(self, *args):
         return list(args)
@@ -227,6 +292,8 @@ class McTransformer(Transformer):
             stmts.append(incr)
         while_body = Block(stmts)
         while_stmt = While(cond, while_body)
+        self._register_span(while_body, stmts)
+        self._register_span(while_stmt, [cond, while_body])
         block_stmts = []
         if init is not None:
             block_stmts.append(init)
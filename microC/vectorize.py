@@ -0,0 +1,447 @@
+"""
+Vetorização de laços simples sobre arrays de inteiros.
+
+`vectorize(tree)` procura laços contados da forma
+
+    for (i = ...; i < n; i++) comando;
+
+(ou `i <= n`, `++i`, `i += 1` e os `while` equivalentes), que o transformer
+já converteu em `While`, cujo corpo é um único comando num dos padrões
+abaixo:
+
+* redução: `s = s op v[i]` ou `s op= v[i]`, com op em +, - e *;
+* máximo e mínimo: `if (v[i] > m) { m = v[i]; }` (e as variações com <,
+  >=, <= e com os operandos trocados);
+* cópia: `b[i] = a[i]`;
+* operação com uma constante: `b[i] = a[i] op k` ou `b[i] = k op a[i]`;
+* soma de prefixos: `v[i] = v[i] op v[i - 1]`.
+
+Nesses padrões cada iteração só escreve a posição `i` (ou um acumulador) e
+só lê a posição `i`, constantes e, na soma de prefixos, o resultado da
+iteração anterior; não há outras dependências entre iterações. Cada laço
+reconhecido é substituído por um `VectorLoop`, que executa o padrão sobre a
+fatia inteira do array.
+
+Na execução, o `VectorLoop` verifica as pré-condições: arrays e variáveis
+declarados como `int` e contendo apenas inteiros, índices dentro dos
+limites e, se houver, o limite de passos. Se alguma falhar, executa o laço
+original, que produz os mesmos erros do interpretador. Os passos
+contabilizados são os mesmos do laço.
+
+Inteiros MicroC têm precisão arbitrária, como os do Python. NumPy (opcional)
+é usado apenas em fatias grandes e quando o resultado cabe garantidamente em
+64 bits; nos demais casos, os kernels usam fatias e funções embutidas do
+Python. Em ambos os casos os resultados são idênticos aos do laço.
+"""
+
+import operator
+from dataclasses import dataclass
+from functools import reduce
+from itertools import accumulate, repeat
+from typing import Callable, Optional
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - NumPy é opcional
+    numpy = None  # type: ignore[assignment]
+
+from .ast import ArrayAccess, ArrayAssign, Assign, BinOp, Block, If, Literal, Stmt, UnaryOp, Var, While
+from .ctx import Ctx
+from .node import Node
+
+__all__ = ["vectorize", "VectorLoop", "Kernel", "numpy_available"]
+
+# Fatias menores que isso não compensam a conversão para arrays NumPy
+NUMPY_MIN_SIZE = 256
+INT64_MAX = 2**63 - 1
+
+ARITHMETIC = (operator.add, operator.sub, operator.mul)
+MAXIMUM = (operator.gt, operator.ge)
+MINIMUM = (operator.lt, operator.le)
+
+
+def numpy_available() -> bool:
+    """
+    Verifica se o NumPy está instalado.
+    """
+    return numpy is not None
+
+
+@dataclass
+class Kernel:
+    """
+    Descrição de um laço reconhecido por `vectorize`.
+
+    Attributes:
+        kind:
+            "reduce", "max", "min", "copy", "map" ou "scan".
+        index:
+            Variável de controle do laço.
+        bound:
+            Limite do laço: expressão aritmética com literais e variáveis
+            que o corpo não altera.
+        inclusive:
+            Se a condição é `i <= n` em vez de `i < n`.
+        target:
+            Variável escrita: o acumulador ("reduce", "max" e "min") ou o
+            array de destino.
+        source:
+            Array lido.
+        op:
+            Operação aplicada aos elementos ("reduce", "map" e "scan").
+        operand:
+            Constante de "map".
+        swapped:
+            Se o elemento de `source` é o operando da esquerda de `op`.
+        use_numpy:
+            Se o kernel pode usar NumPy.
+    """
+
+    kind: str
+    index: str
+    bound: Optional[Node]
+    inclusive: bool
+    target: str
+    source: str
+    op: Optional[Callable] = None
+    operand: Optional[Node] = None
+    swapped: bool = False
+    use_numpy: bool = False
+
+    def run(self, ctx: Ctx, weight: int) -> bool:
+        """
+        Executa o laço inteiro. Retorna False, sem alterar nada, se alguma
+        pré-condição não for satisfeita.
+        """
+        try:
+            lo = ctx[self.index]
+            end = self.bound.eval(ctx)
+            arr = ctx[self.source]
+            source_type = ctx.get_type(self.source).name
+        except (KeyError, NameError):
+            return False
+        if type(lo) is not int or type(end) is not int or not isinstance(arr, list):
+            return False
+        hi = end + 1 if self.inclusive else end
+        first = lo - 1 if self.kind == "scan" else lo
+        if source_type != "int" or lo >= hi or first < 0 or hi > len(arr):
+            return False
+        seg = arr[first:hi]
+        if not set(map(type, seg)) <= {int}:
+            return False
+
+        limits = ctx.limits
+        steps = (hi - lo) * weight
+        if limits is not None and limits.max_steps is not None:
+            if limits.steps + steps > limits.max_steps:
+                return False
+
+        if self.kind in ("reduce", "max", "min"):
+            acc = ctx[self.target] if self.target in ctx else None
+            if type(acc) is not int or ctx.get_type(self.target).name != "int":
+                return False
+            ctx[self.target] = self.reduce(acc, seg)
+        elif self.kind == "scan":
+            arr[lo:hi] = self.scan(seg)
+        else:
+            dst = ctx[self.target] if self.target in ctx else None
+            if not isinstance(dst, list) or ctx.get_type(self.target).name != "int":
+                return False
+            if hi > len(dst):
+                return False
+            if self.kind == "copy":
+                dst[lo:hi] = seg
+            else:
+                k = self.operand.eval(ctx)
+                if type(k) is not int:
+                    return False
+                dst[lo:hi] = self.map(seg, k)
+
+        ctx[self.index] = hi
+        if limits is not None:
+            limits.tick(steps)
+        return True
+
+    def _numpy_array(self, seg: list):
+        """
+        Converte a fatia para um array NumPy de 64 bits, ou retorna None se
+        o NumPy não deve ser usado.
+        """
+        if not self.use_numpy or numpy is None or len(seg) < NUMPY_MIN_SIZE:
+            return None
+        try:
+            return numpy.array(seg, dtype=numpy.int64)
+        except OverflowError:
+            return None
+
+    def reduce(self, acc: int, seg: list) -> int:
+        if self.kind == "max":
+            return max(acc, max(seg))
+        if self.kind == "min":
+            return min(acc, min(seg))
+        op = self.op
+        if op is operator.add or (op is operator.sub and not self.swapped):
+            values = self._numpy_array(seg)
+            if values is not None and _max_abs(values) * len(seg) + abs(acc) <= INT64_MAX:
+                total = int(values.sum())
+            else:
+                total = sum(seg)
+            return acc + total if op is operator.add else acc - total
+        if self.swapped:
+            return reduce(lambda a, x: op(x, a), seg, acc)
+        return reduce(op, seg, acc)
+
+    def map(self, seg: list, k: int) -> list:
+        op = self.op
+        values = self._numpy_array(seg)
+        if values is not None:
+            if op is operator.mul:
+                fits = _max_abs(values) * abs(k) <= INT64_MAX
+            else:
+                fits = _max_abs(values) + abs(k) <= INT64_MAX
+            if fits:
+                return (op(values, k) if self.swapped else op(k, values)).tolist()
+        if self.swapped:
+            return list(map(op, seg, repeat(k)))
+        return list(map(op, repeat(k), seg))
+
+    def scan(self, seg: list) -> list:
+        op = self.op
+        if op is operator.add:
+            values = self._numpy_array(seg)
+            if values is not None and _max_abs(values) * len(seg) <= INT64_MAX:
+                return numpy.cumsum(values)[1:].tolist()
+        if self.swapped:
+            return list(accumulate(seg, lambda prev, x: op(x, prev)))[1:]
+        return list(accumulate(seg, op))[1:]
+
+
+def _max_abs(values) -> int:
+    return max(int(values.max()), -int(values.min()))
+
+
+@dataclass
+class VectorLoop(Stmt):
+    """
+    Laço substituído por um kernel vetorizado. Guarda o laço original, que
+    é executado quando as pré-condições do kernel não são satisfeitas.
+    """
+
+    loop: While
+    kernel: Kernel
+
+    # Os passos são os do laço original (veja `microC.limits.body_weight`)
+    counts_as_step = False
+
+    def eval(self, ctx: Ctx):
+        if not self.kernel.run(ctx, self.loop.weight):
+            self.loop.eval(ctx)
+
+
+def vectorize(tree: Node, use_numpy: Optional[bool] = None) -> int:
+    """
+    Substitui os laços reconhecidos da árvore por `VectorLoop` e retorna
+    quantos foram substituídos.
+
+    Deve ser chamada antes de congelar a árvore (veja `microC.compiled`).
+    Por padrão, usa NumPy se estiver instalado.
+    """
+    if use_numpy is None:
+        use_numpy = numpy is not None
+    elif use_numpy and numpy is None:
+        raise ImportError("a vetorização com NumPy exige o pacote numpy")
+
+    count = 0
+    for cursor in list(tree.cursor().descendants()):
+        loop = cursor.node
+        if type(loop) is not While or cursor.is_root():
+            continue
+        kernel = match_loop(loop)
+        if kernel is not None:
+            kernel.use_numpy = use_numpy
+            cursor.parent().node.replace_child(loop, VectorLoop(loop, kernel))
+            count += 1
+    return count
+
+
+def match_loop(loop: While) -> Optional[Kernel]:
+    """
+    Reconhece um dos padrões do módulo, ou retorna None.
+    """
+    cond = loop.expr
+    if not (
+        isinstance(cond, BinOp)
+        and cond.op in (operator.lt, operator.le)
+        and isinstance(cond.left, Var)
+    ):
+        return None
+    index = cond.left.name
+    bound = cond.right
+
+    body = loop.stmt
+    if not (isinstance(body, Block) and len(body.stmts) == 2):
+        return None
+    if not _is_increment(body.stmts[1], index):
+        return None
+    stmt = _single(body.stmts[0])
+
+    kernel = _match_body(stmt, index)
+    if kernel is None:
+        return None
+    if not _is_invariant(bound, {index, kernel.target}):
+        return None
+    if kernel.source == index or kernel.target == index:
+        return None
+    kernel.bound = bound
+    kernel.inclusive = cond.op is operator.le
+    return kernel
+
+
+def _is_invariant(expr: Node, written: set[str]) -> bool:
+    """
+    Verifica se `expr` é uma expressão aritmética sem efeitos colaterais que
+    não depende das variáveis escritas pelo laço.
+    """
+    if isinstance(expr, Literal):
+        return True
+    if isinstance(expr, Var):
+        return expr.name not in written
+    if isinstance(expr, BinOp) and expr.op in ARITHMETIC:
+        return _is_invariant(expr.left, written) and _is_invariant(expr.right, written)
+    return False
+
+
+def _single(stmt: Node) -> Node:
+    while isinstance(stmt, Block) and len(stmt.stmts) == 1:
+        stmt = stmt.stmts[0]
+    return stmt
+
+
+def _is_increment(stmt: Node, index: str) -> bool:
+    if isinstance(stmt, UnaryOp):
+        return stmt.op == "++" and isinstance(stmt.params, Var) and stmt.params.name == index
+    if isinstance(stmt, Assign) and stmt.name == index:
+        value = stmt.value
+        return (
+            isinstance(value, BinOp)
+            and value.op is operator.add
+            and isinstance(value.left, Var)
+            and value.left.name == index
+            and isinstance(value.right, Literal)
+            and value.right.value == 1
+        )
+    return False
+
+
+def _element(expr: Node, index: str) -> Optional[str]:
+    """
+    Nome do array, se `expr` for `v[i]`.
+    """
+    if (
+        isinstance(expr, ArrayAccess)
+        and isinstance(expr.array, Var)
+        and isinstance(expr.index, Var)
+        and expr.index.name == index
+    ):
+        return expr.array.name
+    return None
+
+
+def _previous(expr: Node, index: str) -> Optional[str]:
+    """
+    Nome do array, se `expr` for `v[i - 1]`.
+    """
+    if not (isinstance(expr, ArrayAccess) and isinstance(expr.array, Var)):
+        return None
+    idx = expr.index
+    if (
+        isinstance(idx, BinOp)
+        and idx.op is operator.sub
+        and isinstance(idx.left, Var)
+        and idx.left.name == index
+        and isinstance(idx.right, Literal)
+        and idx.right.value == 1
+    ):
+        return expr.array.name
+    return None
+
+
+def _match_body(stmt: Node, index: str) -> Optional[Kernel]:
+    if isinstance(stmt, Assign):
+        return _match_reduce(stmt, index)
+    if isinstance(stmt, If):
+        return _match_extreme(stmt, index)
+    if isinstance(stmt, ArrayAssign):
+        return _match_array_assign(stmt, index)
+    return None
+
+
+def _match_reduce(stmt: Assign, index: str) -> Optional[Kernel]:
+    value = stmt.value
+    if not (isinstance(value, BinOp) and value.op in ARITHMETIC):
+        return None
+    acc = stmt.name
+    for left, right, swapped in ((value.left, value.right, False), (value.right, value.left, True)):
+        source = _element(right, index)
+        if isinstance(left, Var) and left.name == acc and source is not None:
+            return Kernel("reduce", index, None, False, acc, source, value.op, swapped=swapped)
+    return None
+
+
+def _match_extreme(stmt: If, index: str) -> Optional[Kernel]:
+    cond = stmt.expr
+    if stmt.else_branch is not None or not isinstance(cond, BinOp):
+        return None
+    then = _single(stmt.then_branch)
+    if not isinstance(then, Assign):
+        return None
+    source = _element(then.value, index)
+    if source is None:
+        return None
+    if _element(cond.left, index) == source and isinstance(cond.right, Var):
+        acc, op = cond.right.name, cond.op
+    elif _element(cond.right, index) == source and isinstance(cond.left, Var):
+        # m < v[i] equivale a v[i] > m
+        acc, op = cond.left.name, _FLIPPED.get(cond.op)
+    else:
+        return None
+    if acc != then.name:
+        return None
+    if op in MAXIMUM:
+        return Kernel("max", index, None, False, acc, source)
+    if op in MINIMUM:
+        return Kernel("min", index, None, False, acc, source)
+    return None
+
+
+_FLIPPED = {operator.lt: operator.gt, operator.le: operator.ge, operator.gt: operator.lt, operator.ge: operator.le}
+
+
+def _match_array_assign(stmt: ArrayAssign, index: str) -> Optional[Kernel]:
+    if not (
+        isinstance(stmt.array, Var)
+        and isinstance(stmt.index, Var)
+        and stmt.index.name == index
+    ):
+        return None
+    target = stmt.array.name
+    value = stmt.value
+    source = _element(value, index)
+    if source is not None:
+        return Kernel("copy", index, None, False, target, source)
+    if not (isinstance(value, BinOp) and value.op in ARITHMETIC):
+        return None
+
+    for left, right, swapped in ((value.left, value.right, True), (value.right, value.left, False)):
+        # Soma de prefixos: v[i] = v[i] op v[i - 1]
+        if _element(left, index) == target and _previous(right, index) == target:
+            return Kernel("scan", index, None, False, target, target, value.op, swapped=swapped)
+    for element, constant, swapped in ((value.left, value.right, True), (value.right, value.left, False)):
+        source = _element(element, index)
+        if source is None:
+            continue
+        if isinstance(constant, Literal) or (
+            isinstance(constant, Var) and constant.name not in (index, target)
+        ):
+            return Kernel("map", index, None, False, target, source, value.op, constant, swapped)
+    return None
@@ -1,4 +1,5 @@
 import re
+from collections import defaultdict
 from pathlib import Path
 from types import SimpleNamespace
 from typing import Any, Callable, Iterable, NamedTuple
@@ -41,6 +42,69 @@ def pytest_addoption(parser):
         action="store_true",
         help="Run the full suite of tests. This includes all examples.",
     )
+    parser.addoption(
+        "--example-timings",
+        nargs="?",
+        type=int,
+        const=20,
+        metavar="N",
+        help="Mostra, ao final, os N exemplos que mais tomaram tempo (padrão: 20).",
+    )
+
+
+#
+# Relatório de tempos por exemplo
+#
+# `microC.testing` registra o tempo de análise e de execução de cada
+# exemplo. Os tempos de cada teste viajam em `report.user_properties`, que o
+# pytest-xdist envia dos workers para o processo principal, onde são
+# somados.
+#
+EXAMPLE_TIMINGS: dict[str, dict] = defaultdict(
+    lambda: {"tests": set(), "parse": 0.0, "runs": 0, "execute": 0.0}
+)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    testing.pop_timings()
+    yield
+    for name, phase, elapsed in testing.pop_timings():
+        item.user_properties.append(("example_timing", (name, phase, elapsed)))
+
+
+def pytest_runtest_logreport(report):
+    if report.when != "call":
+        return
+    for key, value in report.user_properties:
+        if key != "example_timing":
+            continue
+        name, phase, elapsed = value
+        entry = EXAMPLE_TIMINGS[name]
+        entry["tests"].add(report.nodeid)
+        entry[phase] += elapsed
+        if phase == "execute":
+            entry["runs"] += 1
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    limit = config.getoption("--example-timings")
+    if limit is None or not EXAMPLE_TIMINGS:
+        return
+    rows = sorted(
+        EXAMPLE_TIMINGS.items(),
+        key=lambda item: item[1]["parse"] + item[1]["execute"],
+        reverse=True,
+    )
+    terminalreporter.write_sep("=", "tempos por exemplo")
+    terminalreporter.write_line(
+        f"{'exemplo':<48} {'testes':>6} {'parse':>9} {'execuções':>9} {'execução':>10}"
+    )
+    for name, entry in rows[:limit]:
+        terminalreporter.write_line(
+            f"{name:<48} {len(entry['tests']):>6} {entry['parse'] * 1000:>7.2f}ms "
+            f"{entry['runs']:>9} {entry['execute'] * 1000:>8.2f}ms"
+        )
 
 
 def pytest_runtest_setup(item):
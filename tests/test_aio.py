@@ -0,0 +1,112 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from microC import aeval, parse, parse_expr
+from microC.ctx import Ctx
+from microC.output import MemoryOutput
+
+EXEMPLOS = sorted((Path(__file__).parent.parent / "exemplos").rglob("*.microc"))
+
+LOOP = "int main() { int i = 0; while (1) { i++; } return 0; }"
+EMPTY_LOOP = "int main() { while (1) { } return 0; }"
+
+
+def new_ctx() -> Ctx:
+    return Ctx.from_dict({}, output=MemoryOutput())
+
+
+async def run_with_ticks(src: str, **kwargs) -> tuple[object, int]:
+    """Executa o programa enquanto outra tarefa conta quantas vezes rodou"""
+    ticks = 0
+    done = False
+
+    async def ticker():
+        nonlocal ticks
+        while not done:
+            ticks += 1
+            await asyncio.sleep(0)
+
+    task = asyncio.create_task(ticker())
+    try:
+        value = await aeval(src, **kwargs)
+    finally:
+        done = True
+        await task
+    return value, ticks
+
+
+class TestAeval:
+    """Testes para a execução assíncrona com orçamento de passos"""
+
+    @pytest.mark.parametrize("path", EXEMPLOS, ids=lambda path: path.name)
+    def test_mesma_saida_que_eval(self, path):
+        """Testa se aeval produz a mesma saída e valor que eval"""
+        src = path.read_text()
+        expected_ctx = new_ctx()
+        expected = parse(src).eval(expected_ctx, auto_execute_main=True)
+        ctx = new_ctx()
+        value = asyncio.run(aeval(src, ctx, step_budget=3, auto_execute_main=True))
+        assert ctx.output.getvalue() == expected_ctx.output.getvalue()
+        assert value == expected
+
+    def test_cede_o_laco_entre_fatias(self):
+        """Testa se outras tarefas rodam enquanto o programa executa"""
+        src = """
+        int fib(int n) {
+            if (n < 2) { return n; }
+            return fib(n - 1) + fib(n - 2);
+        }
+        int main() { return fib(12); }
+        """
+        value, ticks = asyncio.run(
+            run_with_ticks(src, env=new_ctx(), step_budget=10, auto_execute_main=True)
+        )
+        assert value == 144
+        assert ticks > 10
+
+    def test_expressao(self):
+        """Testa a avaliação assíncrona de uma expressão isolada"""
+        assert asyncio.run(aeval(parse_expr("1 + 2 * 3"), {})) == 7
+
+    @pytest.mark.parametrize("src", [LOOP, EMPTY_LOOP])
+    def test_timeout(self, src):
+        """Testa se laços infinitos são interrompidos pelo prazo"""
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(aeval(src, new_ctx(), timeout=0.05, auto_execute_main=True))
+
+    def test_cancelamento(self):
+        """Testa se a tarefa pode ser cancelada no meio da execução"""
+
+        async def main():
+            task = asyncio.create_task(aeval(LOOP, new_ctx(), auto_execute_main=True))
+            for _ in range(5):
+                await asyncio.sleep(0)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            return task.cancelled()
+
+        assert asyncio.run(main())
+
+    def test_programas_intercalados(self):
+        """Testa se um programa curto termina antes de um longo iniciado antes dele"""
+        src = "int main() { int i = 0; while (i < %d) { i++; } return i; }"
+
+        async def main():
+            order = []
+
+            async def run(name, n):
+                await aeval(src % n, new_ctx(), step_budget=50, auto_execute_main=True)
+                order.append(name)
+
+            await asyncio.gather(run("longo", 5000), run("curto", 50))
+            return order
+
+        assert asyncio.run(main()) == ["curto", "longo"]
+
+    def test_orcamento_invalido(self):
+        """Testa se orçamentos não positivos são recusados"""
+        with pytest.raises(ValueError):
+            asyncio.run(aeval(LOOP, new_ctx(), step_budget=0))
@@ -0,0 +1,180 @@
+import concurrent.futures
+import json
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from microC.batch import (
+    BatchResult,
+    available_executors,
+    chunk_size,
+    iter_sources,
+    resolve_executor,
+    run_batch,
+    run_source,
+)
+from microC.cli import main
+from microC.parser import _parse_lock
+
+EXEMPLOS = Path(__file__).parent.parent / "exemplos"
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+needs_resource = pytest.mark.skipif(resource is None, reason="requer o módulo resource")
+
+
+class TestBatch:
+    """Testes para a execução de vários programas num único processo"""
+
+    def test_saida_isolada_por_programa(self):
+        """Testa se cada programa recebe seu próprio destino de saída"""
+        a = run_source("int main() { printf(1); return 0; }")
+        b = run_source("int main() { printf(2); return 3; }")
+        assert (a.stdout, a.status) == ("1\n", 0)
+        assert (b.stdout, b.status) == ("2\n", 3)
+        assert a.ok and b.ok
+
+    def test_erro_de_sintaxe(self):
+        """Testa se erros de sintaxe são classificados e não interrompem o lote"""
+        result = run_source("int main( { return 0; }", "ruim.microc")
+        assert not result.ok
+        assert result.status == 1
+        assert result.error_kind == "syntax"
+        assert result.file == "ruim.microc"
+
+    def test_erro_de_execucao_preserva_saida(self):
+        """Testa se a saída impressa antes de um erro é mantida"""
+        result = run_source("int main() { printf(1); printf(x); return 0; }")
+        assert result.stdout == "1\n"
+        assert result.error_kind == "runtime"
+
+    def test_pastas_sao_expandidas(self):
+        """Testa se as pastas são percorridas em busca de arquivos .microc"""
+        files = list(iter_sources([EXEMPLOS]))
+        assert EXEMPLOS / "hello.microc" in files
+        assert all(path.suffix == ".microc" for path in files)
+
+    @pytest.mark.parametrize("jobs", [1, 4])
+    def test_lote_de_exemplos(self, jobs):
+        """Testa se todos os exemplos rodam sem erro, em série ou em paralelo"""
+        results = list(run_batch([EXEMPLOS], jobs=jobs))
+        assert len(results) == len(list(iter_sources([EXEMPLOS])))
+        assert all(result.ok for result in results), [r.error for r in results if not r.ok]
+        hello = next(r for r in results if r.file.endswith("hello.microc"))
+        assert hello.stdout.replace("\n", "") == "Hello, World!"
+
+    def test_cli_json_lines(self, tmp_path):
+        """Testa se `microc run` escreve um objeto JSON por programa"""
+        bom = tmp_path / "bom.microc"
+        bom.write_text("int main() { printf(42); return 0; }")
+        ruim = tmp_path / "ruim.microc"
+        ruim.write_text("int main() {")
+        out = tmp_path / "resultados.jsonl"
+
+        with pytest.raises(SystemExit) as exc_info:
+            main(["run", str(tmp_path), "-o", str(out)])
+        assert exc_info.value.code == 1
+
+        lines = [json.loads(line) for line in out.read_text().splitlines()]
+        by_file = {Path(line["file"]).name: line for line in lines}
+        assert set(by_file) == {"bom.microc", "ruim.microc"}
+        assert by_file["bom.microc"]["stdout"] == "42\n"
+        assert by_file["ruim.microc"]["error_kind"] == "syntax"
+        assert set(lines[0]) == set(BatchResult.__dataclass_fields__)
+
+
+class TestBatchProcessos:
+    """Testes para a pool de processos do modo em lote"""
+
+    def test_mesmos_resultados_que_em_serie(self):
+        """Testa se a pool de processos produz os mesmos resultados da execução em série"""
+        serial = {r.file: (r.stdout, r.status) for r in run_batch([EXEMPLOS])}
+        parallel = run_batch([EXEMPLOS], jobs=2, executor="process", chunksize=3)
+        assert {r.file: (r.stdout, r.status) for r in parallel} == serial
+
+    def test_tamanho_dos_blocos(self):
+        """Testa se o tamanho automático dos blocos fica entre 1 e o máximo"""
+        assert chunk_size(3, 8) == 1
+        assert chunk_size(1000, 4) == 32
+        assert chunk_size(200, 4) == 12
+
+    def test_limites_exigem_processos(self):
+        """Testa se limites de recursos são recusados com threads, antes de executar"""
+        with pytest.raises(ValueError):
+            run_batch([EXEMPLOS], jobs=2, executor="thread", cpu_limit=1)
+
+    @needs_resource
+    def test_limite_de_cpu(self, tmp_path):
+        """Testa se um laço infinito é interrompido sem afetar os demais programas"""
+        (tmp_path / "laco.microc").write_text("int main() { while (1) { } return 0; }")
+        (tmp_path / "ok.microc").write_text("int main() { printf(1); return 0; }")
+        results = {Path(r.file).name: r for r in run_batch([tmp_path], cpu_limit=0.5)}
+        assert results["laco.microc"].error_kind == "limit"
+        assert results["ok.microc"].ok
+
+    @needs_resource
+    def test_limite_de_memoria(self, tmp_path):
+        """Testa se estourar o limite de memória vira um erro do programa"""
+        (tmp_path / "grande.microc").write_text("int main() { int a[100000000]; return 0; }")
+        (result,) = run_batch([tmp_path], memory_limit=512 * 1024 * 1024)
+        assert result.error_kind == "limit"
+        assert result.error_type == "MemoryError"
+
+
+class TestBackends:
+    """Testes para a escolha do executor do modo em lote"""
+
+    def test_auto_com_gil(self, monkeypatch):
+        """Testa se "auto" usa processos quando o GIL está ligado"""
+        monkeypatch.setattr(sys, "_is_gil_enabled", lambda: True, raising=False)
+        assert resolve_executor("auto") == "process"
+        assert available_executors()[0] == "process"
+
+    def test_auto_sem_gil(self, monkeypatch):
+        """Testa se "auto" usa threads em builds free-threaded"""
+        monkeypatch.setattr(sys, "_is_gil_enabled", lambda: False, raising=False)
+        assert resolve_executor("auto") == "thread"
+        assert "thread" in available_executors()
+
+    def test_threads_sem_lock_do_parser(self):
+        """Testa se as threads analisam com o próprio transformer, sem o lock do parser"""
+        serial = {r.file: (r.stdout, r.status) for r in run_batch([EXEMPLOS])}
+        results = []
+        worker = threading.Thread(
+            target=lambda: results.extend(run_batch([EXEMPLOS], jobs=2, executor="thread")),
+            daemon=True,
+        )
+        with _parse_lock:
+            worker.start()
+            worker.join(timeout=60)
+            assert not worker.is_alive()
+        assert {r.file: (r.stdout, r.status) for r in results} == serial
+
+    def test_subinterpretadores_indisponiveis(self, monkeypatch):
+        """Testa se pedir subinterpretadores sem suporte é um erro"""
+        monkeypatch.delattr(concurrent.futures, "InterpreterPoolExecutor", raising=False)
+        with pytest.raises(ValueError, match="subinterpretadores"):
+            run_batch([EXEMPLOS], jobs=2, executor="interpreter")
+
+    def test_pool_de_subinterpretadores(self, monkeypatch):
+        """Testa o caminho dos subinterpretadores com uma pool equivalente"""
+        monkeypatch.setattr(
+            concurrent.futures, "InterpreterPoolExecutor", ThreadPoolExecutor, raising=False
+        )
+        serial = {r.file: r.stdout for r in run_batch([EXEMPLOS])}
+        results = run_batch([EXEMPLOS], jobs=2, executor="interpreter", chunksize=4)
+        assert {r.file: r.stdout for r in results} == serial
+
+    def test_subinterpretadores_sem_limites_de_recursos(self, monkeypatch):
+        """Testa se limites de recursos continuam exigindo processos"""
+        monkeypatch.setattr(
+            concurrent.futures, "InterpreterPoolExecutor", ThreadPoolExecutor, raising=False
+        )
+        with pytest.raises(ValueError):
+            run_batch([EXEMPLOS], jobs=2, executor="interpreter", cpu_limit=1)
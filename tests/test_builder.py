@@ -0,0 +1,91 @@
+from pathlib import Path
+
+import pytest
+from lark.exceptions import UnexpectedInput
+
+from microC.builder import REDUCTIONS, AstBuilder, DirectParser
+from microC.generator import generate_program
+from microC.parser import _fill_accepts, ast_parser, load_parser
+from microC.transformer import McTransformer
+
+EXEMPLOS = Path(__file__).parent.parent / "exemplos"
+
+EDGE_CASES = [
+    "",
+    "{}",
+    "f();",
+    "for (;;) {}",
+    "for (int i = 0; i < 3; i++) x += i;",
+    "do { x--; } while (x > 0);",
+    "int a[3] = {}; int b[3] = {1, 2, 3}; b[1] += 2;",
+    "x -= 1; x *= 2; x /= 3; (x) = 1; a[1] = 2; x = y = z;",
+    "int f(int a, char b[]) { return a; }\nint g() { return; }",
+    "printf(\"%d\", 1, 'c', NULL);",
+    "x = !a && -b || ++c + d++ - --e % f-- <= 1 == (2 != 3 > 4);",
+    "if (a) b; else if (c) d; else { e; }",
+    "int x = 1 +;",
+    "int y = 2 @ 3;",
+    "1 = x;",
+    "void x;",
+    "void a[2];",
+]
+
+
+def sources():
+    yield from EDGE_CASES
+    for path in sorted(EXEMPLOS.rglob("*.microc")):
+        yield path.read_text()
+    for seed in range(3):
+        yield generate_program(seed, 300).source
+
+
+def run(parser, transformer: McTransformer, src: str, start: str = "start"):
+    """A árvore e as posições de todos os nós, ou o erro"""
+    transformer.reset()
+    try:
+        tree = parser.parse(src, start=start)
+    except UnexpectedInput as exc:
+        _fill_accepts(exc)
+        return type(exc), str(exc)
+    except (AttributeError, ValueError) as exc:
+        return type(exc), str(exc)
+    finally:
+        spans = transformer.reset()
+    return tree, [spans.get(id(node)) for node in [tree, *tree.descendants()]]
+
+
+@pytest.fixture(scope="module")
+def parsers():
+    """Parser com as reduções diretas e parser com o transformer"""
+    direct, lark = McTransformer(), McTransformer()
+    return (
+        (load_parser(direct), direct),
+        (load_parser(lark, direct=False), lark),
+    )
+
+
+class TestConstrucaoDireta:
+    """Testes para a construção da AST nas reduções do parser"""
+
+    def test_reducoes_em_uso(self):
+        """Testa se todas as regras têm redução e o parser padrão as usa"""
+        lalr = ast_parser.parser.parser.parser
+        assert isinstance(lalr, DirectParser)
+        assert all(isinstance(cb.__self__, AstBuilder) for cb in lalr.callbacks.values())
+
+    def test_mesmas_arvores_e_posicoes(self, parsers):
+        """Testa se as árvores, posições e erros são os do transformer"""
+        (direct, t1), (lark, t2) = parsers
+        for src in sources():
+            assert run(direct, t1, src) == run(lark, t2, src)
+        for src in ["1 + 2 * 3", "f(1, x)[2]", "-x++", "'c'", "NULL", "(1)"]:
+            assert run(direct, t1, src, "expr") == run(lark, t2, src, "expr")
+
+    def test_regra_desconhecida(self, monkeypatch):
+        """Testa se o parser volta ao transformer quando falta uma redução"""
+        monkeypatch.delitem(REDUCTIONS, "while_stmt: _ _ expr _ stmt")
+        callbacks = ast_parser.parser.parser.parser.callbacks
+        assert AstBuilder(McTransformer()).callbacks(callbacks) is None
+        parser = load_parser(McTransformer())
+        assert not isinstance(parser.parser.parser.parser, DirectParser)
+        assert parser.parse("while (1) x;", start="start") is not None
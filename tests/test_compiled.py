@@ -0,0 +1,99 @@
+import dis
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import fields
+
+import pytest
+
+from microC import CompiledProgram
+from microC.ast import Type
+from microC.ctx import BUILTINS, _Builtins, new_builtins
+from microC.limits import Limits
+from microC.output import MemoryOutput
+
+SRC = """
+int total = 0;
+
+int fib(int n) {
+    if (n < 2) {
+        return n;
+    }
+    return fib(n - 1) + fib(n - 2);
+}
+
+int main() {
+    int v[12];
+    int i;
+    for (i = 0; i < 12; i++) {
+        v[i] = fib(i);
+        total += v[i];
+    }
+    for (i = 0; i < 12; i++) {
+        printf(v[i]);
+    }
+    printf(max(total, 0));
+    return total;
+}
+"""
+
+
+class TestCompiledProgram:
+    """Testes para programas compilados e execuções concorrentes"""
+
+    def test_arvore_congelada(self):
+        """Testa se as listas da árvore viram tuplas"""
+        program = CompiledProgram.from_source(SRC)
+        assert isinstance(program.program.stmts, tuple)
+        with pytest.raises(AttributeError):
+            program.program.stmts.append(None)
+
+    def test_congelamento_raso(self):
+        """Testa se a estrutura é congelada, mas os atributos dos nós não"""
+        program = CompiledProgram.from_source(SRC)
+        tree = program.program
+        assert all(
+            not isinstance(getattr(node, f.name), list)
+            for node in tree.descendants()
+            for f in fields(node)
+        )
+        with pytest.raises(TypeError, match="tupla"):
+            tree.replace_child(tree.stmts[0], tree.stmts[1])
+        # Congelamento raso: os atributos continuam graváveis
+        tree.stmts[1].name = "outro"
+        assert tree.stmts[1].name == "outro"
+
+    def test_execucoes_independentes(self):
+        """Testa se variáveis globais não vazam entre execuções"""
+        program = CompiledProgram.from_source(SRC)
+        first, second = MemoryOutput(), MemoryOutput()
+        assert program.run(first) == program.run(second) == 232
+        assert first.getvalue() == second.getvalue()
+
+    def test_builtins_por_execucao(self):
+        """Testa se cada execução pode ter sua própria tabela de funções embutidas"""
+        program = CompiledProgram.from_source("int main() { printf(max(1, 2)); return 0; }")
+        out = MemoryOutput()
+        program.run(out, builtins={"max": min})
+        program.run(out)
+        assert out.getvalue() == "1\n2\n"
+        assert BUILTINS["max"] is max
+
+    def test_builtins_sem_import(self):
+        """Testa se criar a tabela de funções embutidas não faz imports"""
+        ops = {instr.opname for instr in dis.get_instructions(_Builtins.__init__)}
+        assert not ops & {"IMPORT_NAME", "IMPORT_FROM"}
+        assert new_builtins()["max"] == (Type("builtin"), max)
+
+    def test_32_threads(self):
+        """Executa o mesmo programa compilado em 32 threads ao mesmo tempo"""
+        program = CompiledProgram.from_source(SRC)
+        expected = MemoryOutput()
+        program.run(expected)
+
+        def run(_):
+            out = MemoryOutput()
+            value = program.run(out, limits=Limits(max_steps=10**6))
+            return value, out.getvalue()
+
+        with ThreadPoolExecutor(max_workers=32) as pool:
+            results = list(pool.map(run, range(128)))
+        assert set(results) == {(232, expected.getvalue())}
@@ -0,0 +1,101 @@
+from pathlib import Path
+
+import pytest
+
+from microC import differential
+from microC.cli import main
+from microC.differential import (
+    ENGINES,
+    Engine,
+    available_engines,
+    check_example,
+    compare,
+    iter_cases,
+    minimize,
+    run_engine,
+)
+from microC.generator import generate_program
+
+EXEMPLOS = Path(__file__).parent.parent / "exemplos"
+
+
+@pytest.fixture
+def buggy(monkeypatch):
+    """Motor com um erro proposital: `--` vira `++`"""
+
+    def run(source, ctx, auto_execute_main):
+        return ENGINES["tree"].run(source.replace("--", "++"), ctx, auto_execute_main)
+
+    engine = Engine("buggy", run)
+    monkeypatch.setitem(differential.ENGINES, "buggy", engine)
+    return [ENGINES["tree"], engine]
+
+
+class TestDiferencial:
+    """Testes para a comparação entre os motores de execução"""
+
+    def test_exemplos_concordam(self):
+        """Testa se todos os motores concordam nos exemplos"""
+        cases = list(iter_cases([EXEMPLOS]))
+        assert len(cases) > 15
+        for example, auto_execute_main in cases:
+            assert check_example(example, auto_execute_main=auto_execute_main) == []
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_programas_gerados_concordam(self, seed):
+        """Testa se todos os motores concordam em programas sintéticos"""
+        assert check_example(generate_program(seed, 80).example()) == []
+
+    def test_resultado_observavel(self):
+        """Testa se saída, globais, classe de erro e passos são coletados"""
+        source = "int g = 1; int v[2]; int main() { g = 5; v[1] = 3; printf(g); v[7] = 1; }"
+        outcome = run_engine(ENGINES["tree"], source)
+        assert outcome.stdout == "5\n"
+        assert outcome.globals == {"g": 5, "v": [0, 3]}
+        assert outcome.error_kind == "runtime"
+        assert outcome.steps > 0
+        assert compare(source) == []
+
+    def test_erros_de_sintaxe(self):
+        """Testa se erros de sintaxe são iguais em todos os motores"""
+        outcomes = [run_engine(engine, "int main( {") for engine in available_engines()]
+        assert {outcome.error_kind for outcome in outcomes} == {"syntax"}
+
+    def test_divergencia_minimizada(self, buggy):
+        """Testa se uma divergência é encontrada e reduzida a poucas linhas"""
+        source = generate_program(7, 100).source
+        mismatches = compare(source, buggy)
+        assert "stdout" in {m.field for m in mismatches}
+        small = minimize(mismatches[0])
+        assert small.field == mismatches[0].field
+        assert len(small.source.splitlines()) < len(source.splitlines()) // 5
+        assert "--" in small.source
+        assert compare(small.source, buggy)
+
+    def test_blocos_removidos_inteiros(self):
+        """Testa se linhas que abrem blocos são removidas com o bloco"""
+        lines = [
+            "int main() {",
+            "    if (1) {",
+            "        printf(1);",
+            "    } else {",
+            "        printf(2);",
+            "    }",
+            "}",
+        ]
+        assert differential._expand(lines, [1]) == {1, 2, 3, 4, 5}
+        assert differential._expand(lines, [3]) == {3, 4}
+        assert differential._expand(lines, [5]) == set()
+
+    def test_cli(self, capsys):
+        """Testa o comando `microc diff` sem divergências"""
+        main(["diff", str(EXEMPLOS / "hello.microc"), "--generated", "2", "--size", "40"])
+        out = capsys.readouterr().out
+        assert out.startswith("3 programas, ") and out.endswith(", 0 divergências\n")
+
+    def test_cli_com_divergencia(self, buggy, capsys):
+        """Testa se `microc diff` termina com código 1 quando há divergências"""
+        with pytest.raises(SystemExit) as exc_info:
+            main(["diff", "--generated", "1", "--engines", "tree,buggy", "--no-minimize"])
+        assert exc_info.value.code == 1
+        assert "buggy diverge de tree" in capsys.readouterr().out
@@ -1,5 +1,5 @@
 import pytest
-from microC import parse, eval as microc_eval
+from microC.testing import parse_cached, read_example, run_cached
 from microC.ctx import Ctx
 from microC.runtime import McFunction
 from pathlib import Path
@@ -15,14 +15,13 @@ class TestAlgoritmos:
         """Testa algoritmo de ordenação Selection Sort"""
         file_path = EXEMPLOS_DIR / "selection_sort.microc"
         
-        with open(file_path, "r") as f:
-            src = f.read()
+        src = read_example(file_path)
         
-        ast = parse(src)
+        ast = parse_cached(src)
         assert ast is not None
         
         ctx = Ctx.from_dict({})
-        result = microc_eval(src, ctx)
+        result = run_cached(src, ctx)
         
         # Verifica se as funções foram definidas
         assert 'selectionSort' in ctx
@@ -49,14 +48,13 @@ class TestAlgoritmos:
         """Testa busca binária em array ordenado"""
         file_path = EXEMPLOS_DIR / "busca_binaria.microc"
         
-        with open(file_path, "r") as f:
-            src = f.read()
+        src = read_example(file_path)
         
-        ast = parse(src)
+        ast = parse_cached(src)
         assert ast is not None
         
         ctx = Ctx.from_dict({})
-        result = microc_eval(src, ctx)
+        result = run_cached(src, ctx)
         
         # Verifica se as funções foram definidas
         assert 'buscaBinaria' in ctx
@@ -82,14 +80,13 @@ class TestAlgoritmos:
         """Testa algoritmo de Kadane para maior subsequência contígua"""
         file_path = EXEMPLOS_DIR / "kadane_algorithm.microc"
         
-        with open(file_path, "r") as f:
-            src = f.read()
+        src = read_example(file_path)
         
-        ast = parse(src)
+        ast = parse_cached(src)
         assert ast is not None
         
         ctx = Ctx.from_dict({})
-        result = microc_eval(src, ctx)
+        result = run_cached(src, ctx)
         
         # Verifica se as funções foram definidas
         assert 'maxSubarraySum' in ctx
@@ -121,10 +118,9 @@ class TestAlgoritmos:
         
         for exemplo in exemplos:
             file_path = EXEMPLOS_DIR / exemplo
-            with open(file_path, "r") as f:
-                src = f.read()
+            src = read_example(file_path)
             
-            ast = parse(src)
+            ast = parse_cached(src)
             assert ast is not None, f"Falha ao parsear {exemplo}"
             ast.validate_tree()
 
@@ -133,14 +129,13 @@ class TestAlgoritmos:
         bubble_sort_path = BASE_DIR / "exemplos" / "bubble_sort.microc"
         
         if bubble_sort_path.exists():
-            with open(bubble_sort_path, "r") as f:
-                src = f.read()
+            src = read_example(bubble_sort_path)
             
-            ast = parse(src)
+            ast = parse_cached(src)
             assert ast is not None
             
             ctx = Ctx.from_dict({})
-            result = microc_eval(src, ctx)
+            result = run_cached(src, ctx)
             
             # Verifica se o array foi ordenado
             assert 'arr' in ctx
@@ -178,9 +173,9 @@ class TestAlgoritmos:
         }
         """
         
-        ast = parse(src)
+        ast = parse_cached(src)
         ctx = Ctx.from_dict({})
-        result = microc_eval(src, ctx)
+        result = run_cached(src, ctx)
         
         # Verifica se as funções foram definidas
         assert 'fibonacciIterativo' in ctx
@@ -219,9 +214,9 @@ class TestAlgoritmos:
         }
         """
         
-        ast = parse(src)
+        ast = parse_cached(src)
         ctx = Ctx.from_dict({})
-        result = microc_eval(src, ctx)
+        result = run_cached(src, ctx)
         
         # Verifica se as funções foram definidas
         assert 'fatorialIterativo' in ctx
@@ -262,9 +257,9 @@ class TestAlgoritmos:
         }
         """
         
-        ast = parse(src)
+        ast = parse_cached(src)
         ctx = Ctx.from_dict({})
-        result = microc_eval(src, ctx)
+        result = run_cached(src, ctx)
         
         # Verifica se as funções foram definidas
         assert 'buscaLinear' in ctx
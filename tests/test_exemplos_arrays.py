@@ -1,5 +1,5 @@
 import pytest
-from microC import parse, eval as microc_eval
+from microC.testing import parse_cached, read_example, run_cached
 from microC.ctx import Ctx
 from microC.runtime import McFunction
 from pathlib import Path
@@ -15,14 +15,13 @@ class TestArrays:
         """Testa declaração e inicialização de arrays"""
         file_path = EXEMPLOS_DIR / "declaracao_inicializacao.microc"
         
-        with open(file_path, "r") as f:
-            src = f.read()
+        src = read_example(file_path)
         
-        ast = parse(src)
+        ast = parse_cached(src)
         assert ast is not None
         
         ctx = Ctx.from_dict({})
-        result = microc_eval(src, ctx)
+        result = run_cached(src, ctx)
         
         # Verifica se a função main foi definida
         assert 'main' in ctx
@@ -40,14 +39,13 @@ class TestArrays:
         """Testa manipulação de arrays com atribuição"""
         file_path = EXEMPLOS_DIR / "manipulacao_atribuicao.microc"
         
-        with open(file_path, "r") as f:
-            src = f.read()
+        src = read_example(file_path)
         
-        ast = parse(src)
+        ast = parse_cached(src)
         assert ast is not None
         
         ctx = Ctx.from_dict({})
-        result = microc_eval(src, ctx)
+        result = run_cached(src, ctx)
         
         # Verifica se a função main foi definida
         assert 'main' in ctx
@@ -65,14 +63,13 @@ class TestArrays:
         """Testa busca em array"""
         file_path = EXEMPLOS_DIR / "busca_array.microc"
         
-        with open(file_path, "r") as f:
-            src = f.read()
+        src = read_example(file_path)
         
-        ast = parse(src)
+        ast = parse_cached(src)
         assert ast is not None
         
         ctx = Ctx.from_dict({})
-        result = microc_eval(src, ctx)
+        result = run_cached(src, ctx)
         
         # Verifica se a função main foi definida
         assert 'main' in ctx
@@ -96,10 +93,9 @@ class TestArrays:
         
         for exemplo in exemplos:
             file_path = EXEMPLOS_DIR / exemplo
-            with open(file_path, "r") as f:
-                src = f.read()
+            src = read_example(file_path)
             
-            ast = parse(src)
+            ast = parse_cached(src)
             assert ast is not None, f"Falha ao parsear {exemplo}"
             ast.validate_tree()
 
@@ -108,9 +104,8 @@ class TestArrays:
         # Teste com exemplo que sabemos que deve funcionar
         file_path = EXEMPLOS_DIR / "declaracao_inicializacao.microc"
         
-        with open(file_path, "r") as f:
-            src = f.read()
+        src = read_example(file_path)
         
         # Deve executar sem erro de índice
         ctx = Ctx.from_dict({})
-        result = microc_eval(src, ctx)
+        result = run_cached(src, ctx)
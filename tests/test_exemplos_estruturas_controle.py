@@ -1,5 +1,5 @@
 import pytest
-from microC import parse, eval as microc_eval
+from microC.testing import parse_cached, read_example, run_cached
 from microC.ctx import Ctx
 from microC.runtime import McFunction
 from pathlib import Path
@@ -15,14 +15,13 @@ class TestEstruturasControle:
         """Testa estruturas condicionais if/else"""
         file_path = EXEMPLOS_DIR / "condicionais.microc"
         
-        with open(file_path, "r") as f:
-            src = f.read()
+        src = read_example(file_path)
         
-        ast = parse(src)
+        ast = parse_cached(src)
         assert ast is not None
         
         ctx = Ctx.from_dict({})
-        result = microc_eval(src, ctx)
+        result = run_cached(src, ctx)
         
         # Verifica se a função main foi definida
         assert 'main' in ctx
@@ -40,14 +39,13 @@ class TestEstruturasControle:
         """Testa laços while e do-while"""
         file_path = EXEMPLOS_DIR / "lacos_while.microc"
         
-        with open(file_path, "r") as f:
-            src = f.read()
+        src = read_example(file_path)
         
-        ast = parse(src)
+        ast = parse_cached(src)
         assert ast is not None
         
         ctx = Ctx.from_dict({})
-        result = microc_eval(src, ctx)
+        result = run_cached(src, ctx)
         
         # Verifica se a função main foi definida
         assert 'main' in ctx
@@ -65,14 +63,13 @@ class TestEstruturasControle:
         """Testa diferentes variações do laço for"""
         file_path = EXEMPLOS_DIR / "lacos_for.microc"
         
-        with open(file_path, "r") as f:
-            src = f.read()
+        src = read_example(file_path)
         
-        ast = parse(src)
+        ast = parse_cached(src)
         assert ast is not None
         
         ctx = Ctx.from_dict({})
-        result = microc_eval(src, ctx)
+        result = run_cached(src, ctx)
         
         # Verifica se a função main foi definida
         assert 'main' in ctx
@@ -96,10 +93,9 @@ class TestEstruturasControle:
         
         for exemplo in exemplos:
             file_path = EXEMPLOS_DIR / exemplo
-            with open(file_path, "r") as f:
-                src = f.read()
+            src = read_example(file_path)
             
-            ast = parse(src)
+            ast = parse_cached(src)
             assert ast is not None, f"Falha ao parsear {exemplo}"
             ast.validate_tree()
 
@@ -124,9 +120,9 @@ class TestEstruturasControle:
         }
         """
         
-        ast = parse(src)
+        ast = parse_cached(src)
         ctx = Ctx.from_dict({})
-        result = microc_eval(src, ctx)
+        result = run_cached(src, ctx)
         
         # Verifica se a função main foi definida
         assert 'main' in ctx
@@ -161,9 +157,9 @@ class TestEstruturasControle:
         }
         """
         
-        ast = parse(src)
+        ast = parse_cached(src)
         ctx = Ctx.from_dict({})
-        result = microc_eval(src, ctx)
+        result = run_cached(src, ctx)
         
         # Verifica se a função main foi definida
         assert 'main' in ctx
@@ -195,9 +191,9 @@ class TestEstruturasControle:
         }
         """
         
-        ast = parse(src)
+        ast = parse_cached(src)
         ctx = Ctx.from_dict({})
-        result = microc_eval(src, ctx)
+        result = run_cached(src, ctx)
         
         # Verifica se a função main foi definida
         assert 'main' in ctx
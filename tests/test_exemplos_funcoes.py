@@ -1,5 +1,5 @@
 import pytest
-from microC import parse, eval as microc_eval
+from microC.testing import parse_cached, read_example, run_cached
 from microC.ctx import Ctx
 from microC.runtime import McFunction
 from pathlib import Path
@@ -15,14 +15,13 @@ class TestFuncoes:
         """Testa função simples com parâmetros e retorno"""
         file_path = EXEMPLOS_DIR / "funcao_simples.microc"
         
-        with open(file_path, "r") as f:
-            src = f.read()
+        src = read_example(file_path)
         
-        ast = parse(src)
+        ast = parse_cached(src)
         assert ast is not None
         
         ctx = Ctx.from_dict({})
-        result = microc_eval(src, ctx)
+        result = run_cached(src, ctx)
         
         # Verifica se as funções foram definidas
         assert 'soma' in ctx
@@ -44,14 +43,13 @@ class TestFuncoes:
         """Testa múltiplas funções incluindo função void"""
         file_path = EXEMPLOS_DIR / "multiplas_funcoes.microc"
         
-        with open(file_path, "r") as f:
-            src = f.read()
+        src = read_example(file_path)
         
-        ast = parse(src)
+        ast = parse_cached(src)
         assert ast is not None
         
         ctx = Ctx.from_dict({})
-        result = microc_eval(src, ctx)
+        result = run_cached(src, ctx)
         
         # Verifica se as funções foram definidas
         assert 'imprimirNumero' in ctx
@@ -72,14 +70,13 @@ class TestFuncoes:
         """Testa função recursiva para cálculo de potência"""
         file_path = EXEMPLOS_DIR / "funcao_recursiva.microc"
         
-        with open(file_path, "r") as f:
-            src = f.read()
+        src = read_example(file_path)
         
-        ast = parse(src)
+        ast = parse_cached(src)
         assert ast is not None
         
         ctx = Ctx.from_dict({})
-        result = microc_eval(src, ctx)
+        result = run_cached(src, ctx)
         
         # Verifica se as funções foram definidas
         assert 'potencia' in ctx
@@ -102,10 +99,9 @@ class TestFuncoes:
         
         for exemplo in exemplos:
             file_path = EXEMPLOS_DIR / exemplo
-            with open(file_path, "r") as f:
-                src = f.read()
+            src = read_example(file_path)
             
-            ast = parse(src)
+            ast = parse_cached(src)
             assert ast is not None, f"Falha ao parsear {exemplo}"
             ast.validate_tree()
 
@@ -124,11 +120,11 @@ class TestFuncoes:
         }
         """
         
-        ast = parse(src)
+        ast = parse_cached(src)
         assert ast is not None
         
         ctx = Ctx.from_dict({})
-        result = microc_eval(src, ctx)
+        result = run_cached(src, ctx)
         
         # Verifica se as funções foram definidas
         assert 'dobrar' in ctx
@@ -156,9 +152,9 @@ class TestFuncoes:
         }
         """
         
-        ast = parse(src)
+        ast = parse_cached(src)
         ctx = Ctx.from_dict({})
-        result = microc_eval(src, ctx)
+        result = run_cached(src, ctx)
         
         # Verifica se as funções foram definidas
         assert 'func_teste' in ctx
@@ -1,5 +1,5 @@
 import pytest
-from microC import parse, eval as microc_eval
+from microC.testing import parse_cached, read_example, run_cached
 from microC.ctx import Ctx
 from microC.runtime import McFunction
 from pathlib import Path
@@ -15,14 +15,13 @@ class TestOperadores:
         """Testa operadores aritméticos"""
         file_path = EXEMPLOS_DIR / "aritmeticos.microc"
         
-        with open(file_path, "r") as f:
-            src = f.read()
+        src = read_example(file_path)
         
-        ast = parse(src)
+        ast = parse_cached(src)
         assert ast is not None
         
         ctx = Ctx.from_dict({})
-        result = microc_eval(src, ctx)
+        result = run_cached(src, ctx)
         
         # Verifica se a função main foi definida
         assert 'main' in ctx
@@ -40,14 +39,13 @@ class TestOperadores:
         """Testa operadores de comparação e lógicos"""
         file_path = EXEMPLOS_DIR / "comparacao_logicos.microc"
         
-        with open(file_path, "r") as f:
-            src = f.read()
+        src = read_example(file_path)
         
-        ast = parse(src)
+        ast = parse_cached(src)
         assert ast is not None
         
         ctx = Ctx.from_dict({})
-        result = microc_eval(src, ctx)
+        result = run_cached(src, ctx)
         
         # Verifica se a função main foi definida
         assert 'main' in ctx
@@ -65,14 +63,13 @@ class TestOperadores:
         """Testa operadores de incremento/decremento e atribuição composta"""
         file_path = EXEMPLOS_DIR / "incremento_atribuicao.microc"
         
-        with open(file_path, "r") as f:
-            src = f.read()
+        src = read_example(file_path)
         
-        ast = parse(src)
+        ast = parse_cached(src)
         assert ast is not None
         
         ctx = Ctx.from_dict({})
-        result = microc_eval(src, ctx)
+        result = run_cached(src, ctx)
         
         # Verifica se a função main foi definida
         assert 'main' in ctx
@@ -96,10 +93,9 @@ class TestOperadores:
         
         for exemplo in exemplos:
             file_path = EXEMPLOS_DIR / exemplo
-            with open(file_path, "r") as f:
-                src = f.read()
+            src = read_example(file_path)
             
-            ast = parse(src)
+            ast = parse_cached(src)
             assert ast is not None, f"Falha ao parsear {exemplo}"
             ast.validate_tree()
 
@@ -116,9 +112,9 @@ class TestOperadores:
         }
         """
         
-        ast = parse(src)
+        ast = parse_cached(src)
         ctx = Ctx.from_dict({})
-        result = microc_eval(src, ctx)
+        result = run_cached(src, ctx)
         
         # Verifica se a função main foi definida
         assert 'main' in ctx
@@ -150,9 +146,9 @@ class TestOperadores:
         }
         """
         
-        ast = parse(src)
+        ast = parse_cached(src)
         ctx = Ctx.from_dict({})
-        result = microc_eval(src, ctx)
+        result = run_cached(src, ctx)
         
         # Verifica se a função main foi definida
         assert 'main' in ctx
@@ -181,9 +177,9 @@ class TestOperadores:
         }
         """
         
-        ast = parse(src)
+        ast = parse_cached(src)
         ctx = Ctx.from_dict({})
-        result = microc_eval(src, ctx)
+        result = run_cached(src, ctx)
         
         # Verifica se a função main foi definida
         assert 'main' in ctx
@@ -212,9 +208,9 @@ class TestOperadores:
         }
         """
         
-        ast = parse(src)
+        ast = parse_cached(src)
         ctx = Ctx.from_dict({})
-        result = microc_eval(src, ctx)
+        result = run_cached(src, ctx)
         
         # Verifica se a função main foi definida
         assert 'main' in ctx
@@ -1,5 +1,5 @@
 import pytest
-from microC import parse, eval as microc_eval
+from microC.testing import parse_cached, read_example, run_cached
 from microC.ctx import Ctx
 from microC.runtime import McFunction
 from pathlib import Path
@@ -15,16 +15,15 @@ class TestVariaveis:
         """Testa declaração e inicialização básica de variáveis"""
         file_path = EXEMPLOS_DIR / "declaracao_basica.microc"
         
-        with open(file_path, "r") as f:
-            src = f.read()
+        src = read_example(file_path)
         
         # Deve fazer parse sem erro
-        ast = parse(src)
+        ast = parse_cached(src)
         assert ast is not None
         
         # Deve executar sem erro
         ctx = Ctx.from_dict({})
-        result = microc_eval(src, ctx)
+        result = run_cached(src, ctx)
         
         # Verifica se a função main foi definida
         assert 'main' in ctx
@@ -42,14 +41,13 @@ class TestVariaveis:
         """Testa variáveis sem inicialização e atribuição posterior"""
         file_path = EXEMPLOS_DIR / "atribuicao_posterior.microc"
         
-        with open(file_path, "r") as f:
-            src = f.read()
+        src = read_example(file_path)
         
-        ast = parse(src)
+        ast = parse_cached(src)
         assert ast is not None
         
         ctx = Ctx.from_dict({})
-        result = microc_eval(src, ctx)
+        result = run_cached(src, ctx)
         
         # Verifica se a função main foi definida
         assert 'main' in ctx
@@ -67,14 +65,13 @@ class TestVariaveis:
         """Testa escopo de variáveis em blocos"""
         file_path = EXEMPLOS_DIR / "escopo_blocos.microc"
         
-        with open(file_path, "r") as f:
-            src = f.read()
+        src = read_example(file_path)
         
-        ast = parse(src)
+        ast = parse_cached(src)
         assert ast is not None
         
         ctx = Ctx.from_dict({})
-        result = microc_eval(src, ctx)
+        result = run_cached(src, ctx)
         
         # Verifica se a função main foi definida
         assert 'main' in ctx
@@ -98,11 +95,10 @@ class TestVariaveis:
         
         for exemplo in exemplos:
             file_path = EXEMPLOS_DIR / exemplo
-            with open(file_path, "r") as f:
-                src = f.read()
+            src = read_example(file_path)
             
             # Deve fazer parse sem erro
-            ast = parse(src)
+            ast = parse_cached(src)
             assert ast is not None, f"Falha ao parsear {exemplo}"
             
             # Deve validar sem erro
@@ -0,0 +1,65 @@
+import pytest
+
+from microC.batch import run_source
+from microC.generator import generate_program
+
+
+class TestGerador:
+    """Testes para o gerador de programas sintéticos"""
+
+    def test_deterministico(self):
+        """Testa se o mesmo seed gera sempre o mesmo programa"""
+        assert generate_program(7, 80).source == generate_program(7, 80).source
+        assert generate_program(7, 80).source != generate_program(8, 80).source
+
+    @pytest.mark.parametrize("seed", range(25))
+    def test_saida_igual_ao_interpretador(self, seed):
+        """Testa se a saída calculada pelo gerador é a do interpretador"""
+        program = generate_program(seed, 60)
+        result = run_source(program.source)
+        assert result.ok, result.error
+        assert result.stdout == program.stdout
+
+    def test_programa_grande(self):
+        """Testa se o tamanho pedido é respeitado em programas grandes"""
+        program = generate_program(1, 1000)
+        assert program.source.count(";") > 1000
+        assert run_source(program.source).stdout == program.stdout
+
+    def test_cobertura_da_gramatica(self):
+        """Testa se um programa grande usa todas as construções da gramática"""
+        source = generate_program(2, 2000).source
+        for construct in [
+            "char ",
+            "int main() {",
+            "void ",
+            "] = {",
+            "int v[]",
+            "for (",
+            "for (;",
+            "while (",
+            "do {",
+            "} else {",
+            "return ",
+            "++",
+            "--",
+            "+= ",
+            "/ (",
+            "% ",
+            "&&",
+            "||",
+            "!",
+            "<=",
+            "'",
+        ]:
+            assert construct in source, construct
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_exemplo_e_globais(self, seed):
+        """Testa o exemplo de `microC.testing` e os valores finais das globais"""
+        program = generate_program(seed, 60)
+        example = program.example()
+        example.test_example()
+        assert example.outputs == program.stdout.splitlines()
+        ctx, _, _ = example.eval()
+        assert {name: ctx[name] for name in program.globals} == program.globals
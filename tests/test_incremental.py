@@ -0,0 +1,136 @@
+import random
+
+import pytest
+from lark.exceptions import UnexpectedInput
+
+from microC.errors import SemanticError
+from microC.generator import generate_program
+from microC.incremental import Document
+from microC.parser import parse
+from microC.positions import error_location
+
+SRC = """\
+int a = 1;
+
+int f(int x) {
+    return x + a;
+}
+
+int g(int y) {
+    return y * 2;
+}
+
+printf(f(g(3)));
+"""
+
+
+def assert_same(doc: Document):
+    """A árvore e as posições são iguais às de `parse` para o texto completo"""
+    tree = parse(doc.src)
+    assert doc.program == tree
+    got = [doc.source_map.get(node) for node in doc.program.descendants()]
+    expected = [tree.source_map.get(node) for node in tree.descendants()]
+    assert got == expected
+
+
+def replace(doc: Document, old: str, new: str):
+    start = doc.src.index(old)
+    return doc.edit(start, start + len(old), new)
+
+
+class TestAnaliseIncremental:
+    """Testes para a análise sintática incremental"""
+
+    def test_documento_inicial(self):
+        """Testa se o documento começa com a mesma árvore de `parse`"""
+        doc = Document(SRC)
+        assert doc.reparsed == 4
+        assert_same(doc)
+
+    def test_edicao_numa_funcao(self):
+        """Testa se apenas a declaração editada é analisada de novo"""
+        doc = Document(SRC)
+        program, g = doc.program, doc.program.stmts[2]
+        replace(doc, "x + a", "(x + a) * 10")
+        assert doc.reparsed == 1
+        assert doc.program is program and doc.program.stmts[2] is g
+        assert_same(doc)
+
+    def test_novas_linhas_deslocam_posicoes(self):
+        """Testa se as posições das declarações seguintes são atualizadas"""
+        doc = Document(SRC)
+        replace(doc, "return x + a;", "int z = x;\n    return z + a;")
+        assert doc.reparsed == 1
+        assert doc.source_map.line(doc.program.stmts[2]) == 8
+        assert_same(doc)
+
+    def test_declaracoes_na_mesma_linha(self):
+        """Testa edições com várias declarações na mesma linha"""
+        doc = Document("int a = 1; int b = 2; int c = 3;\nint d = 4;\n")
+        replace(doc, "a = 1", "abc = 100")
+        assert doc.reparsed == 3
+        assert_same(doc)
+        doc.edit(len(doc.src), len(doc.src), "int e = 5;")
+        assert_same(doc)
+
+    def test_edicoes_que_afetam_o_arquivo(self):
+        """Testa se edições que não ficam numa região reanalisam o arquivo"""
+        # Comentário aberto antes de `f` que só fecha na linha de `g`
+        doc = Document("int a = 1;\nint f(int x) { return x; }\nint g; // */\nint h;\n")
+        replace(doc, "int f", "/* int f")
+        assert len(doc.program.stmts) == 2
+        assert_same(doc)
+        replace(doc, "/* int f", "int f")
+        assert_same(doc)
+        # Tokens que se juntam a uma declaração vizinha
+        doc = Document("int a;int b;")
+        with pytest.raises(UnexpectedInput):
+            doc.edit(6, 6, "x")
+        assert doc.src == "int a;xint b;"
+        doc.edit(6, 7, "")
+        assert_same(doc)
+
+    def test_erros_de_sintaxe(self):
+        """Testa se erros de sintaxe são os de `parse` e se o documento se recupera"""
+        doc = Document(SRC)
+        program = doc.program
+        with pytest.raises(UnexpectedInput) as exc_info:
+            replace(doc, "return x + a;\n}", "return x + a;\n")
+        with pytest.raises(UnexpectedInput) as expected:
+            parse(doc.src)
+        assert str(exc_info.value) == str(expected.value)
+        assert error_location(exc_info.value) == error_location(expected.value)
+        assert doc.program is program
+        replace(doc, "return x + a;\n", "return x + a;\n}")
+        assert doc.src == SRC
+        assert_same(doc)
+
+    def test_funcoes_nativas_redefinidas(self):
+        """Testa se chamadas a nativas são validadas quando uma definição muda"""
+        src = "int strlen(int a, int b) { return a; }\nint main() { return strlen(1, 2); }\n"
+        doc = Document(src)
+        with pytest.raises(SemanticError) as exc_info:
+            replace(doc, "int strlen(", "int strlen2(")
+        with pytest.raises(SemanticError) as expected:
+            parse(doc.src)
+        assert error_location(exc_info.value) == error_location(expected.value)
+        replace(doc, "int strlen2(", "int strlen(")
+        assert_same(doc)
+
+    @pytest.mark.parametrize("seed", range(2))
+    def test_edicoes_aleatorias(self, seed):
+        """Testa se edições aleatórias produzem o mesmo resultado de `parse`"""
+        rng = random.Random(seed)
+        doc = Document(generate_program(seed, 15).source)
+        pieces = ["", " ", "\n", "x", "1", ";", "}", "{", "/*", "*/", "//", "int q;\n"]
+        for _ in range(25):
+            valid = doc.src
+            start = rng.randrange(len(valid) + 1)
+            end = min(len(valid), start + rng.choice([0, 1, 3, 20]))
+            try:
+                doc.edit(start, end, rng.choice(pieces))
+            except Exception as exc:
+                with pytest.raises(type(exc)):
+                    parse(doc.src)
+                doc.edit(0, len(doc.src), valid)
+            assert_same(doc)
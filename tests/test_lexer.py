@@ -0,0 +1,82 @@
+from pathlib import Path
+
+import pytest
+from lark.exceptions import UnexpectedCharacters
+
+from microC.generator import generate_program
+from microC.parser import cst_parser, lex, load_parser, tokenizer
+
+EXEMPLOS = Path(__file__).parent.parent / "exemplos"
+FIELDS = ("type", "value", "line", "column", "end_line", "end_column", "start_pos", "end_pos")
+
+EDGE_CASES = [
+    "",
+    "   \n\t ",
+    "int integer; int NULLx = NULL; int whilex;",
+    "// comentário\nint x; /* várias\nlinhas */ int y;",
+    "x<=y>=z==w!=v&&u||!t; a+=1; b-=2; c++; d--;",
+    "char c = 'a'; char d = ' ';",
+    "int main() {\r\n    return 0;\r\n}\r\n",
+]
+
+
+@pytest.fixture(scope="module")
+def lark_parser():
+    """Parser com o lexer contextual do Lark, para comparação"""
+    return load_parser(fast_lexer=False)
+
+
+def sources():
+    yield from EDGE_CASES
+    for path in sorted(EXEMPLOS.rglob("*.microc")):
+        yield path.read_text()
+    for seed in range(3):
+        yield generate_program(seed, 300).source
+
+
+def fields(tokens):
+    return [tuple(getattr(tok, name) for name in FIELDS) for tok in tokens]
+
+
+class TestLexer:
+    """Testes para o analisador léxico rápido"""
+
+    def test_mesmos_tokens(self, lark_parser):
+        """Testa se os tokens são iguais aos do lexer do Lark"""
+        for src in sources():
+            assert fields(lex(src)) == fields(lark_parser.lex(src))
+
+    def test_mesmas_arvores(self, lark_parser):
+        """Testa se as árvores são iguais às do parser com o lexer do Lark"""
+        for src in sources():
+            assert cst_parser.parse(src, start="start") == lark_parser.parse(src, start="start")
+
+    def test_palavras_reservadas(self):
+        """Testa se palavras reservadas só são reconhecidas inteiras"""
+        types = [tok.type for tok in lex("int integer NULL NULLx")]
+        assert types[0] != types[1] and types[2] != types[3]
+        assert types[1] == types[3]
+
+    def test_comentarios(self):
+        """Testa se comentários são ignorados e contam as linhas"""
+        tokens = list(lex("/* a\nb */ // c\nx"))
+        assert [(tok.value, tok.line, tok.column) for tok in tokens] == [("x", 3, 1)]
+
+    @pytest.mark.parametrize("src", ["int x = 1 @ 2;", "int x;\n  $y;", "char c = '"])
+    def test_caractere_invalido(self, lark_parser, src):
+        """Testa se caracteres inválidos geram o mesmo erro do Lark"""
+        with pytest.raises(UnexpectedCharacters) as fast:
+            list(lex(src))
+        with pytest.raises(UnexpectedCharacters) as slow:
+            list(lark_parser.lex(src))
+        assert (fast.value.line, fast.value.column) == (slow.value.line, slow.value.column)
+        assert fast.value.pos_in_stream == slow.value.pos_in_stream
+
+    def test_tokens_de_bytes(self):
+        """Testa se os tokens lidos dos bytes em UTF-8 são iguais aos do texto"""
+        extra = ["int ação = 1; /* é */ ação += 2;\n", "char c = 'é'; int\x1cx;\n"]
+        for src in [*sources(), *extra]:
+            assert fields(tokenizer.tokenize_bytes(src.encode())) == fields(lex(src))
+        with pytest.raises(UnexpectedCharacters) as exc_info:
+            list(tokenizer.tokenize_bytes("int é;\n é".encode()))
+        assert (exc_info.value.column, exc_info.value.pos_in_stream) == (5, 4)
@@ -0,0 +1,209 @@
+import asyncio
+
+import pytest
+
+from microC import aeval, ast, parse
+from microC.batch import run_source
+from microC.ctx import Ctx
+from microC.cli import parse_size
+from microC.limits import (
+    FRAME_SIZE,
+    PARAM_SIZE,
+    LimitExceeded,
+    Limits,
+    McError,
+    array_size,
+    body_weight,
+)
+from microC.output import MemoryOutput
+
+INFINITE_FOR = """
+int main() {
+    int i;
+    for (i = 0; ; i++) {
+        printf(i);
+    }
+    return 0;
+}
+"""
+
+NESTED = """
+int gira() {
+    while (1) { }
+    return 0;
+}
+
+int main() {
+    return gira();
+}
+"""
+
+FINITE = """
+int dobra(int x) {
+    return 2 * x;
+}
+
+int main() {
+    int i = 0;
+    int s = 0;
+    while (i < 10) {
+        s = s + dobra(i);
+        i++;
+    }
+    return s;
+}
+"""
+
+
+def run(src: str, max_steps: int) -> tuple[Ctx, object]:
+    ctx = Ctx.from_dict({}, output=MemoryOutput(), limits=Limits(max_steps))
+    return ctx, parse(src).eval(ctx, auto_execute_main=True)
+
+
+class TestLimitePassos:
+    """Testes para o limite de passos de execução"""
+
+    def test_for_sem_condicao(self):
+        """Testa se um for sem condição é interrompido"""
+        with pytest.raises(LimitExceeded, match="step limit exceeded"):
+            run(INFINITE_FOR, 100)
+
+    def test_pilha_de_chamadas(self):
+        """Testa se o erro informa a pilha de chamadas MicroC"""
+        with pytest.raises(McError) as exc_info:
+            run(NESTED, 50)
+        assert exc_info.value.call_stack == ["main", "gira"]
+        assert "main > gira" in str(exc_info.value)
+
+    def test_deterministico(self):
+        """Testa se o programa sempre para no mesmo ponto"""
+        outputs = set()
+        for _ in range(3):
+            ctx = Ctx.from_dict({}, output=MemoryOutput(), limits=Limits(200))
+            with pytest.raises(LimitExceeded):
+                parse(INFINITE_FOR).eval(ctx, auto_execute_main=True)
+            outputs.add(ctx.output.getvalue())
+        assert len(outputs) == 1
+
+    def test_contagem(self):
+        """Testa a contagem de passos de laços e chamadas"""
+        ctx, value = run(FINITE, 10**6)
+        assert value == 90
+        # Cada chamada ou iteração conta 1 mais o número de nós do corpo:
+        # main: 1 + 21 nós; 10 iterações de 1 + 9 nós; 10 chamadas de 1 + 4 nós
+        assert ctx.limits.steps == 22 + 10 * 10 + 10 * 5
+        assert ctx.limits.call_stack == []
+
+    def test_corpo_aninhado(self):
+        """Testa se um bloco aninhado grande conta mais que um comando simples"""
+        loop = "int main() {{ int i; int x = 0; for (i = 0; i < 10; i++) {} return x; }}"
+        simple = loop.format("x++;")
+        nested = loop.format("{ if (x > 0) { x = x + i * 2; x = x - 1; } else { x++; } }")
+        simple_ctx, _ = run(simple, 10**6)
+        nested_ctx, _ = run(nested, 10**6)
+        assert nested_ctx.limits.steps > simple_ctx.limits.steps + 10 * 10
+
+    @pytest.mark.parametrize("engine", ["eval", "aeval"])
+    def test_peso_calculado_uma_vez(self, engine, monkeypatch):
+        """Testa se o peso do laço interno não é recalculado a cada volta do externo"""
+        weighed = []
+
+        def counted(nodes):
+            nodes = list(nodes)
+            weighed.append(nodes)
+            return body_weight(nodes)
+
+        monkeypatch.setattr(ast, "body_weight", counted)
+        src = """
+        int main() {
+            int i; int j; int s = 0;
+            for (i = 0; i < 50; i++) {
+                for (j = 0; j < 50; j++) { s = s + j; }
+            }
+            return s;
+        }
+        """
+        ctx = Ctx.from_dict({}, output=MemoryOutput(), limits=Limits(10**6))
+        if engine == "eval":
+            assert parse(src).eval(ctx, auto_execute_main=True) == 50 * 1225
+        else:
+            asyncio.run(aeval(src, ctx, auto_execute_main=True))
+        assert len(weighed) == 2
+
+    def test_sem_limite_nao_conta(self):
+        """Testa se a contagem fica desligada por padrão"""
+        ctx = Ctx.from_dict({}, output=MemoryOutput())
+        assert parse(FINITE).eval(ctx, auto_execute_main=True) == 90
+        assert ctx.limits is None
+
+    def test_aeval(self):
+        """Testa se o avaliador assíncrono respeita o mesmo limite"""
+        ctx = Ctx.from_dict({}, output=MemoryOutput(), limits=Limits(50))
+        with pytest.raises(LimitExceeded) as exc_info:
+            asyncio.run(aeval(NESTED, ctx, auto_execute_main=True))
+        assert exc_info.value.call_stack == ["main", "gira"]
+
+    def test_lote(self):
+        """Testa se o modo em lote classifica o erro como limite"""
+        result = run_source(INFINITE_FOR, max_steps=100)
+        assert result.error_kind == "limit"
+        assert result.stdout.startswith("0\n1\n")
+
+
+class TestLimiteMemoria:
+    """Testes para a contabilização e o limite de memória"""
+
+    def run(self, src: str, max_memory: int | None) -> Limits:
+        limits = Limits(max_memory=max_memory)
+        ctx = Ctx.from_dict({}, output=MemoryOutput(), limits=limits)
+        parse(src).eval(ctx, auto_execute_main=True)
+        return limits
+
+    def test_array_gigante(self):
+        """Testa se o limite é verificado antes de alocar o array"""
+        src = "int main() { int a[100000000]; return 0; }"
+        with pytest.raises(LimitExceeded, match="memory limit exceeded"):
+            self.run(src, 1024 * 1024)
+
+    def test_arrays_do_bloco_sao_liberados(self):
+        """Testa se arrays declarados num laço não se acumulam"""
+        src = """
+        int main() {
+            int i = 0;
+            while (i < 100) {
+                int a[1000];
+                a[0] = i;
+                i++;
+            }
+            return 0;
+        }
+        """
+        limits = self.run(src, 10_000)
+        assert limits.peak_memory == array_size(1000) + FRAME_SIZE
+        assert limits.memory == 0
+
+    def test_frames_da_recursao(self):
+        """Testa se os frames de uma recursão profunda são contabilizados"""
+        src = """
+        int desce(int n) {
+            if (n == 0) { return 0; }
+            return desce(n - 1);
+        }
+        int main() { return desce(50); }
+        """
+        with pytest.raises(LimitExceeded) as exc_info:
+            self.run(src, 20 * FRAME_SIZE)
+        assert exc_info.value.call_stack[:3] == ["main", "desce", "desce"]
+        limits = self.run(src, None)
+        assert limits.peak_memory == FRAME_SIZE + 51 * (FRAME_SIZE + PARAM_SIZE)
+
+    def test_pico_no_lote(self):
+        """Testa se o resultado do modo em lote informa o pico de memória"""
+        result = run_source("int g[10]; int main() { int a[100]; return 0; }")
+        assert result.peak_memory == array_size(110) + FRAME_SIZE
+
+    def test_tamanhos_na_linha_de_comando(self):
+        """Testa a conversão de tamanhos com sufixo"""
+        assert parse_size("512") == 512
+        assert parse_size("64k") == 64 * 1024
+        assert parse_size("16MB") == 16 * 1024**2
@@ -0,0 +1,113 @@
+import pytest
+
+from microC import parse
+from microC.ast import Program
+from microC.batch import run_source
+from microC.errors import SemanticError
+from microC.natives import NATIVES, arity, memcpy, memset, minidx, sort, strlen, sum_
+
+ARRAYS = """
+int main() {
+    int v[8] = {5, 3, 9, 1, 7, 2, 8, 4};
+    int w[8];
+    char s[10] = {'o', 'l', 'a'};
+    memcpy(w, v, 8);
+    sort(w, 8);
+    printf(w[0]);
+    printf(w[7]);
+    printf(v[0]);
+    printf(sum(v, 8));
+    printf(minidx(v, 4, 8));
+    printf(strlen(s));
+    memset(v, 0, 4);
+    printf(sum(v, 8));
+    return 0;
+}
+"""
+
+
+class TestNativas:
+    """Testes para as funções nativas sobre arrays"""
+
+    def test_programa(self):
+        """Testa as funções nativas chamadas de um programa MicroC"""
+        result = run_source(ARRAYS)
+        assert result.ok, result.error
+        assert result.stdout.split() == ["1", "9", "5", "39", "5", "3", "21"]
+
+    def test_registradas_como_embutidas(self):
+        """Testa se as funções nativas estão na tabela de embutidas"""
+        assert set(NATIVES) == {"memset", "memcpy", "sum", "minidx", "sort", "strlen"}
+        assert arity("minidx") == 3
+
+    def test_aridade_verificada_na_analise(self):
+        """Testa se o número de argumentos é verificado antes da execução"""
+        with pytest.raises(SemanticError, match="sort espera 2 argumentos"):
+            parse("int main() { int v[3]; sort(v); return 0; }")
+
+    def test_funcao_do_programa_tem_precedencia(self):
+        """Testa se uma função do programa com o mesmo nome não é verificada"""
+        src = """
+        int sum(int a) { return a + 1; }
+        int main() { printf(sum(1)); return 0; }
+        """
+        assert run_source(src).stdout == "2\n"
+
+    def test_muitas_chamadas(self, monkeypatch):
+        """Testa se a árvore é percorrida uma vez por validação, e não por chamada"""
+        walks = []
+        descendants = Program.descendants
+
+        def counted(self):
+            walks.append(self)
+            return descendants(self)
+
+        monkeypatch.setattr(Program, "descendants", counted)
+        calls = "".join(f"    s = s + sum(v, {i % 4});\n" for i in range(2000))
+        src = f"int main() {{\n    int v[4] = {{1, 2, 3, 4}};\n    int s = 0;\n{calls}    return s;\n}}"
+        assert len(parse(src).stmts) == 1
+        # Um percurso para o mapa de posições e um para a validação
+        assert len(walks) == 2
+        with pytest.raises(SemanticError, match="sum espera 2 argumentos"):
+            parse(src.replace("sum(v, 3)", "sum(v)"))
+        assert parse(f"int sum(int a, int b, int c) {{ return a; }}\n{src}") is not None
+
+    def test_limites_do_array(self):
+        """Testa se tamanhos fora do array são erros e não alteram o array"""
+        v = [1, 2, 3]
+        with pytest.raises(IndexError):
+            memset(v, 0, 4)
+        with pytest.raises(IndexError):
+            memcpy(v, [1], 2)
+        with pytest.raises(IndexError):
+            minidx(v, 2, 2)
+        assert v == [1, 2, 3]
+
+    def test_zero_posicoes(self):
+        """Testa se copiar zero posições, inclusive de ou para arrays vazios, não faz nada"""
+        v = [1, 2]
+        memcpy([], [1, 2], 0)
+        memcpy(v, [], 0)
+        memcpy([], [], 0)
+        memset([], 0, 0)
+        assert v == [1, 2]
+
+    def test_tipos(self):
+        """Testa se argumentos de tipos errados são recusados"""
+        with pytest.raises(TypeError):
+            sort(3, 1)
+        with pytest.raises(TypeError):
+            sum_(["a", "b"], 2)
+        with pytest.raises(TypeError):
+            strlen([1, 2])
+        with pytest.raises(TypeError):
+            memset([1, 2], 0, "2")
+
+    def test_arrays_de_caracteres(self):
+        """Testa a conversão de valores para arrays de caracteres"""
+        s = ["\0"] * 4
+        memset(s, 97, 2)
+        assert s == ["a", "a", "\0", "\0"]
+        memcpy(s, "xyz", 3)
+        assert strlen(s) == 3
+        assert strlen("ab\0cd") == 2
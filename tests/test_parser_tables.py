@@ -0,0 +1,53 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from lark import Lark
+
+from microC import _parser_tables, build_parser
+from microC.generator import generate_program
+from microC.parser import GRAMMAR_PATH, cst_parser, load_parser
+
+RAIZ = Path(__file__).parent.parent
+EXEMPLOS = RAIZ / "exemplos"
+
+
+class TestTabelas:
+    """Testes para as tabelas do parser geradas a partir da gramática"""
+
+    def test_tabelas_atualizadas(self):
+        """Testa se as tabelas correspondem à gramática (rode `python -m microC.build_parser`)"""
+        assert not build_parser.is_stale(_parser_tables)
+
+    def test_gramatica_alterada(self, tmp_path):
+        """Testa se uma gramática diferente torna as tabelas obsoletas"""
+        grammar = tmp_path / "grammar.lark"
+        grammar.write_text(GRAMMAR_PATH.read_text() + "\n// comentário\n")
+        assert build_parser.is_stale(_parser_tables, grammar)
+
+    def test_mesmas_arvores(self):
+        """Testa se o parser das tabelas e o da gramática produzem as mesmas árvores"""
+        from_grammar = load_parser(tables=False)
+        sources = [path.read_text() for path in sorted(EXEMPLOS.rglob("*.microc"))]
+        sources += [generate_program(seed, 100).source for seed in range(3)]
+        for src in sources:
+            assert cst_parser.parse(src, start="start") == from_grammar.parse(src, start="start")
+
+    def test_modulo_gerado(self):
+        """Testa se o módulo gerado pode ser carregado"""
+        namespace: dict = {}
+        exec(build_parser.build(), namespace)
+        assert namespace["GRAMMAR_HASH"] == build_parser.grammar_hash()
+        parser = Lark._load_from_dict(namespace["DATA"], namespace["MEMO"])
+        assert parser.parse("1 + 2", start="expr") is not None
+
+    def test_executado_como_modulo(self):
+        """Testa se `python -m microC.build_parser` roda sem avisos (o pacote não o importa)"""
+        result = subprocess.run(
+            [sys.executable, "-m", "microC.build_parser", "--check"],
+            cwd=RAIZ,
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0
+        assert result.stderr == ""
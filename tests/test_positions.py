@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+from lark.exceptions import UnexpectedInput
+
+from microC import parse
+from microC.aio import aeval
+from microC.batch import run_source
+from microC.cli import main
+from microC.ctx import Ctx
+from microC.errors import SemanticError
+from microC.output import MemoryOutput
+from microC.parser import ThreadParser
+from microC.positions import Location, describe_error, error_location
+
+SRC = """\
+int v[3];
+
+int f(int i) {
+    return v[i];
+}
+
+int main() {
+    printf(f(1));
+    printf(f(7));
+}
+"""
+
+
+def run(src: str, path: str = "<string>"):
+    ctx = Ctx.from_dict({}, output=MemoryOutput())
+    return parse(src, path).eval(ctx, auto_execute_main=True)
+
+
+class TestPosicoesDosErros:
+    """Testes para as posições (arquivo:linha:coluna) dos erros"""
+
+    def test_erro_de_execucao(self):
+        """Testa se o erro aponta para o nó mais interno em execução"""
+        with pytest.raises(IndexError) as exc_info:
+            run(SRC, "prog.microc")
+        assert error_location(exc_info.value) == Location("prog.microc", 4, 12)
+        assert describe_error(exc_info.value) == (
+            "prog.microc:4:12: Índice 7 fora dos limites do array!"
+        )
+
+    def test_erro_de_sintaxe(self):
+        """Testa se erros de sintaxe recebem a posição do token inesperado"""
+        with pytest.raises(UnexpectedInput) as exc_info:
+            parse("int main() {\n  int x;\n  x = 1 +;\n}\n", "prog.microc")
+        assert str(error_location(exc_info.value)) == "prog.microc:3:10"
+
+    def test_erro_semantico(self):
+        """Testa se erros semânticos apontam para o nó validado"""
+        with pytest.raises(SemanticError) as exc_info:
+            parse("int g;\nint main() { return strlen(1, 2); }\n")
+        assert error_location(exc_info.value) == Location("<string>", 2, 21)
+
+    def test_erros_sem_posicao(self):
+        """Testa erros que não vêm de nós com posição conhecida"""
+        exc = ValueError("erro")
+        assert error_location(exc) is None
+        assert describe_error(exc) == "erro"
+
+    def test_avaliador_assincrono(self):
+        """Testa se `aeval` também registra a posição do erro"""
+        with pytest.raises(IndexError) as exc_info:
+            asyncio.run(aeval(SRC, {}, step_budget=1, auto_execute_main=True))
+        assert error_location(exc_info.value) == Location("<string>", 4, 12)
+
+    def test_parser_por_thread(self):
+        """Testa se `ThreadParser` localiza os erros como `parse`"""
+        parser = ThreadParser()
+        with pytest.raises(UnexpectedInput) as exc_info:
+            parser.parse("int main() {\n  x = 1 +;\n}\n", "prog.microc")
+        assert str(error_location(exc_info.value)) == "prog.microc:2:10"
+        with pytest.raises(SemanticError) as exc_info:
+            parser.parse("int g;\nint main() { return strlen(1, 2); }\n")
+        assert error_location(exc_info.value) == Location("<string>", 2, 21)
+
+    def test_lote(self):
+        """Testa se os resultados de `microc run` trazem linha e coluna"""
+        result = run_source(SRC, "prog.microc")
+        assert (result.error_kind, result.line, result.column) == ("runtime", 4, 12)
+        assert run_source("int main() { return 0; }").line is None
+
+    def test_cli(self, tmp_path, capsys):
+        """Testa se a CLI mostra o arquivo, a linha e a coluna do erro"""
+        path = tmp_path / "prog.microc"
+        path.write_text(SRC)
+        with pytest.raises(IndexError):
+            main([str(path)])
+        out = capsys.readouterr().out
+        assert f"Programa terminou com um erro: {path}:4:12: Índice 7" in out
@@ -0,0 +1,122 @@
+from microC import parse
+from microC.ast import Function, While
+from microC.cli import main
+from microC.ctx import Ctx
+from microC.output import MemoryOutput
+from microC.positions import source_map
+from microC.profiler import Profiler
+from microC.runtime import McFunction
+
+SRC = """\
+int quadrado(int x) {
+    return x * x;
+}
+
+int main() {
+    int i = 0;
+    int soma = 0;
+    while (i < 4) {
+        soma = soma + quadrado(i);
+        i = i + 1;
+    }
+    printf(soma);
+    return 0;
+}
+"""
+
+
+def run_profiled(src: str) -> tuple[Profiler, str]:
+    program = parse(src)
+    out = MemoryOutput()
+    with Profiler(program) as profiler:
+        program.eval(Ctx.from_dict({}, output=out), auto_execute_main=True)
+    return profiler, out.getvalue()
+
+
+class TestPosicoes:
+    """Testes para as posições registradas pelo transformer"""
+
+    def test_nos_guardam_linha_de_origem(self):
+        """Testa se os comandos apontam para a linha onde aparecem"""
+        program = parse(SRC)
+        positions = source_map(program)
+        loop = next(node for node in program.descendants() if isinstance(node, While))
+        assert positions.line(loop) == 8
+        main = program.stmts[1]
+        assert isinstance(main, Function)
+        assert positions.get(main)[0] == 5
+        assert positions.get(main)[2] == 13  # último token com posição: "0"
+
+    def test_posicoes_nao_sao_campos_dos_nos(self):
+        """Testa se as posições não alteram a estrutura dos nós"""
+        assert parse(SRC) == parse("\n\n" + SRC)
+
+
+class TestProfiler:
+    """Testes para o profiler por linha e por função"""
+
+    def test_conta_execucoes_por_linha(self):
+        """Testa a contagem de execuções das linhas do laço"""
+        profiler, stdout = run_profiled(SRC)
+        assert stdout == "14\n"
+        lines = {entry.line: entry for entry in profiler.line_stats()}
+        # Var(i), Var(x) e BinOp x * x são avaliados uma vez por chamada
+        assert lines[2].count == 4 * 4
+        # i = i + 1: Assign, BinOp, Var e Literal a cada iteração
+        assert lines[10].count == 4 * 4
+        assert all(entry.self_time >= 0 for entry in lines.values())
+
+    def test_estatisticas_por_funcao(self):
+        """Testa chamadas e tempos inclusivo/exclusivo das funções"""
+        profiler, _ = run_profiled(SRC)
+        functions = {entry.name: entry for entry in profiler.function_stats()}
+        assert functions["main"].calls == 1
+        assert functions["quadrado"].calls == 4
+        assert functions["main"].total >= functions["quadrado"].total
+        assert functions["main"].self_time <= functions["main"].total
+
+    def test_recursao_nao_duplica_tempo_inclusivo(self):
+        """Testa se chamadas recursivas contam uma única vez no tempo inclusivo"""
+        src = """
+        int fat(int n) {
+            if (n <= 1) {
+                return 1;
+            }
+            return n * fat(n - 1);
+        }
+        int main() {
+            printf(fat(5));
+            return 0;
+        }
+        """
+        profiler, stdout = run_profiled(src)
+        assert stdout == "120\n"
+        functions = {entry.name: entry for entry in profiler.function_stats()}
+        assert functions["fat"].calls == 5
+        assert functions["fat"].total <= functions["main"].total
+
+    def test_desinstalar_restaura_nos_e_funcoes(self):
+        """Testa se nada do profiler fica na árvore após a execução"""
+        program = parse(SRC)
+        ctx = Ctx.from_dict({}, output=MemoryOutput())
+        with Profiler(program):
+            program.eval(ctx, auto_execute_main=True)
+        assert all("eval" not in vars(node) for node in program.descendants())
+        assert type(ctx["quadrado"]) is McFunction
+
+    def test_relatorio(self):
+        """Testa se o relatório mostra linhas e funções"""
+        profiler, _ = run_profiled(SRC)
+        report = profiler.report(SRC)
+        assert "soma = soma + quadrado(i);" in report
+        assert "quadrado" in report.split("Funções:")[1]
+
+    def test_cli(self, tmp_path, capsys):
+        """Testa a opção --profile da linha de comando"""
+        path = tmp_path / "prog.microc"
+        path.write_text(SRC)
+        main(["--profile", str(path)])
+        captured = capsys.readouterr()
+        assert captured.out == "14\n"
+        assert "soma = soma + quadrado(i);" in captured.err
+        assert "quadrado" in captured.err.split("Funções:")[1]
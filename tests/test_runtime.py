@@ -0,0 +1,140 @@
+import dis
+import math
+import os
+import sys
+from operator import mul
+
+import microC
+from microC import ast, parse
+from microC.ctx import Ctx
+from microC.node import Node
+from microC.output import MemoryOutput
+from microC.runtime import McFunction, show, show_repr
+
+
+class TestShow:
+    """Testes para a formatação de valores do printf"""
+
+    def test_valores_simples(self):
+        """Testa inteiros, caracteres, booleanos e NULL"""
+        assert show(42) == "42"
+        assert show(-7) == "-7"
+        assert show("a") == "a"
+        assert show(True) == "true"
+        assert show(False) == "false"
+        assert show(None) == "NULL"
+        assert show(3.75) == "3.75"
+
+    def test_array_de_char_para_no_nulo(self):
+        """Testa se arrays de char são impressos até o primeiro '\\0'"""
+        assert show(["o", "i", "\0", "x"]) == "oi"
+        assert show(["o", "i"]) == "oi"
+        assert show(["\0", "a"]) == ""
+
+    def test_buffer_grande_de_char(self):
+        """Testa um buffer de 64 KiB terminado em '\\0'"""
+        buffer = ["z"] * (64 * 1024 - 1) + ["\0"]
+        assert show(buffer) == "z" * (64 * 1024 - 1)
+
+    def test_arrays_que_nao_sao_strings(self):
+        """Testa arrays vazios, de inteiros e mistos"""
+        assert show([]) == "<array>"
+        assert show([1, 2, 3]) == "<array>"
+        assert show(["a", 1]) == "<array>"
+        assert show(["ab", "c"]) == "<array>"
+
+    def test_funcoes(self):
+        """Testa funções MicroC e funções nativas"""
+        func = McFunction("int", "main", [], [], Ctx())
+        assert show(func) == "<fn main>"
+        assert show(math.sqrt) == "<native fn>"
+
+    def test_subclasses_usam_formatador_da_base(self):
+        """Testa se subclasses de tipos registrados são despachadas pela base"""
+
+        class Lista(list):
+            pass
+
+        assert show(Lista(["o", "k"])) == "ok"
+
+    def test_show_repr(self):
+        """Testa se show_repr coloca aspas em caracteres"""
+        assert show_repr("a") == '"a"'
+        assert show_repr(1) == "1"
+
+
+IMPORT_OPCODES = {dis.opmap["IMPORT_NAME"], dis.opmap["IMPORT_FROM"]}
+PROGRAMA = """
+int dobro(int x) {
+    return x * 2;
+}
+
+int main() {
+    int i = 0;
+    while (i < 3) {
+        if (i > 0) {
+            printf(dobro(i));
+        }
+        i = i + 1;
+    }
+    return 0;
+}
+"""
+
+
+class TestSemImportsNaAvaliacao:
+    """Garante que os métodos executados a cada nó não fazem imports"""
+
+    def test_metodos_eval_nao_contem_imports(self):
+        """Inspeciona o bytecode dos métodos eval de todos os nós"""
+        metodos = [McFunction.__call__, show]
+        for cls in vars(ast).values():
+            if isinstance(cls, type) and issubclass(cls, Node) and "eval" in vars(cls):
+                metodos.append(cls.eval)
+
+        for metodo in metodos:
+            ops = {instr.opcode for instr in dis.get_instructions(metodo)}
+            assert not ops & IMPORT_OPCODES, f"{metodo.__qualname__} faz import"
+
+    def test_execucao_nao_executa_imports(self):
+        """Rastreia os opcodes executados pelo interpretador durante a execução"""
+        program = parse(PROGRAMA)
+        ctx = Ctx.from_dict({}, output=MemoryOutput())
+        package_dir = os.path.dirname(microC.__file__)
+        imports = []
+
+        def trace_opcodes(frame, event, arg):
+            if event == "opcode" and frame.f_code.co_code[frame.f_lasti] in IMPORT_OPCODES:
+                imports.append(f"{frame.f_code.co_name}:{frame.f_lineno}")
+            return trace_opcodes
+
+        def trace_calls(frame, event, arg):
+            if not frame.f_code.co_filename.startswith(package_dir):
+                return None
+            frame.f_trace_opcodes = True
+            return trace_opcodes
+
+        sys.settrace(trace_calls)
+        try:
+            program.eval(ctx, auto_execute_main=True)
+        finally:
+            sys.settrace(None)
+
+        assert ctx.output.getvalue() == "2\n4\n"
+        assert imports == []
+
+
+class TestFuncoes:
+    """Testes para a chamada de funções MicroC"""
+
+    def test_funcao_sem_tipos_dos_parametros(self):
+        """Testa se uma função montada sem `param_types` pode ser chamada"""
+        func = ast.Function(
+            ast.Type("int"),
+            "dobra",
+            ["x"],
+            ast.Block([ast.Return(ast.BinOp(ast.Var("x"), ast.Literal(2), mul))]),
+        )
+        assert func.param_types == [ast.Type("int")]
+        ctx = Ctx.from_dict({}, output=MemoryOutput())
+        assert func.eval(ctx)(21) == 42
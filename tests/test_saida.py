@@ -0,0 +1,103 @@
+import io
+
+import pytest
+from microC import eval as microc_eval
+from microC.ctx import Ctx
+from microC.output import BufferedOutput, MemoryOutput, Output, StreamOutput
+from microC.testing import Example
+
+
+class TestSaida:
+    """Testes para os destinos de saída do printf"""
+
+    def test_memoria_captura_printf(self):
+        """Testa se a saída do printf vai para o destino do contexto"""
+        out = MemoryOutput()
+        ctx = Ctx.from_dict({}, output=out)
+        microc_eval("printf(1); printf('a');", ctx)
+        assert out.getvalue() == "1\na\n"
+
+    def test_saida_compartilhada_entre_escopos(self):
+        """Testa se funções e blocos herdam o destino de saída"""
+        src = """
+        int main() {
+            int x = 21;
+            {
+                printf(x * 2);
+            }
+            return 0;
+        }
+        """
+        out = MemoryOutput()
+        ctx = Ctx.from_dict({}, output=out)
+        microc_eval(src, ctx, auto_execute_main=True)
+        assert out.getvalue() == "42\n"
+
+    def test_buffer_escreve_ao_encher(self):
+        """Testa se o buffer só escreve quando atinge o tamanho configurado"""
+        stream = io.StringIO()
+        out = BufferedOutput(stream, buffer_size=4)
+        out.write("ab")
+        assert stream.getvalue() == ""
+        out.write("cd")
+        assert stream.getvalue() == "abcd"
+        out.write("e")
+        out.flush()
+        assert stream.getvalue() == "abcde"
+
+    def test_buffer_descarregado_ao_final(self):
+        """Testa se eval descarrega o buffer ao terminar o programa"""
+        stream = io.StringIO()
+        ctx = Ctx.from_dict({}, output=BufferedOutput(stream))
+        microc_eval("printf(10); printf(20);", ctx)
+        assert stream.getvalue() == "10\n20\n"
+
+    def test_buffer_descarregado_em_erro(self):
+        """Testa se a saída anterior a um erro de execução não se perde"""
+        stream = io.StringIO()
+        ctx = Ctx.from_dict({}, output=BufferedOutput(stream))
+        with pytest.raises(NameError):
+            microc_eval("printf(10); printf(y);", ctx)
+        assert stream.getvalue().startswith("10\nPrograma terminou com um erro: ")
+
+    def test_erro_escrito_na_saida(self):
+        """Testa se a mensagem de erro vai para a saída do contexto, descarregada uma vez"""
+
+        class Saida(MemoryOutput):
+            flushes = 0
+
+            def flush(self):
+                self.flushes += 1
+
+        out = Saida()
+        with pytest.raises(NameError):
+            microc_eval("printf(1); printf(y);", Ctx.from_dict({}, output=out))
+        lines = out.getvalue().splitlines()
+        assert lines[0] == "1"
+        assert lines[1].startswith("Programa terminou com um erro: ")
+        assert "variável y não existe" in lines[1]
+        assert lines[2].startswith("Variáveis: ")
+        assert out.flushes == 1
+
+    def test_saida_abstrata(self):
+        """Testa se destinos sem `write` não podem ser criados"""
+        with pytest.raises(TypeError):
+            Output()
+
+        class Incompleta(Output):
+            pass
+
+        with pytest.raises(TypeError):
+            Incompleta()
+
+    def test_stream_padrao_usa_stdout_atual(self, capsys):
+        """Testa se a saída padrão respeita redirecionamentos de sys.stdout"""
+        microc_eval("printf(7);", Ctx.from_dict({}, output=StreamOutput()))
+        assert capsys.readouterr().out == "7\n"
+
+    def test_example_usa_saida_em_memoria(self):
+        """Testa se Example.eval captura a saída sem redirecionar stdout"""
+        ex = Example("printf(1);\nprintf(2); // expect: 1\n")
+        _, stdout, err = ex.eval()
+        assert stdout == "1\n2\n"
+        assert err is None
@@ -0,0 +1,194 @@
+import asyncio
+
+import pytest
+from lark.exceptions import UnexpectedToken
+
+from microC import eval as microc_eval
+from microC import parse
+from microC.aio import aeval
+from microC.ctx import Ctx
+from microC.output import MemoryOutput
+
+
+def run(src: str, auto_execute_main: bool = False) -> str:
+    """Executa o programa e retorna a saída do printf"""
+    ctx = Ctx.from_dict({}, output=MemoryOutput())
+    microc_eval(src, ctx, auto_execute_main=auto_execute_main)
+    return ctx.output.getvalue()
+
+
+class TestDivisaoInteira:
+    """Testes para `/` e `%` com a semântica do C"""
+
+    @pytest.mark.parametrize(
+        "a, b, div, mod",
+        [(7, 2, 3, 1), (-7, 2, -3, -1), (7, -2, -3, 1), (-7, -2, 3, -1), (6, 3, 2, 0)],
+    )
+    def test_truncamento_em_direcao_a_zero(self, a, b, div, mod):
+        """Testa se o quociente é truncado e o resto tem o sinal do dividendo"""
+        assert run(f"printf({a} / {b}); printf({a} % {b});") == f"{div}\n{mod}\n"
+
+    def test_resultado_inteiro(self):
+        """Testa se a divisão entre inteiros não produz float"""
+        assert run("int x = 10 / 4; printf(x * 4);") == "8\n"
+
+
+class TestDeclaracaoDeArrays:
+    """Testes para a declaração de arrays no escopo atual"""
+
+    def test_array_local(self):
+        """Testa se um array declarado numa função pode ser usado nela"""
+        src = """
+        int main() {
+            int a[3] = {1, 2};
+            a[2] = a[0] + a[1];
+            printf(a[2]);
+            return 0;
+        }
+        """
+        assert run(src, auto_execute_main=True) == "3\n"
+
+    def test_array_local_nao_altera_global(self):
+        """Testa se o array local esconde o global com o mesmo nome"""
+        src = """
+        int a[2] = {1, 2};
+        int f() {
+            int a[2];
+            a[0] = 9;
+            return a[0];
+        }
+        printf(f());
+        printf(a[0]);
+        """
+        assert run(src) == "9\n1\n"
+
+    def test_array_de_char_mutavel(self):
+        """Testa se posições de um array de char podem ser alteradas"""
+        src = """
+        char s[4] = {'a', 'b'};
+        s[0] = 'x';
+        printf(s);
+        char t[3];
+        t[0] = 'o';
+        t[1] = 'k';
+        printf(t);
+        """
+        assert run(src) == "xb\nok\n"
+
+
+class TestIncrementoDecremento:
+    """Testes para `++` e `--`, que guardam o resultado na variável"""
+
+    def test_variavel(self):
+        """Testa as formas prefixa e posfixa em variáveis"""
+        src = """
+        int x = 1;
+        printf(x++);
+        printf(++x);
+        printf(x--);
+        printf(--x);
+        printf(x);
+        """
+        assert run(src) == "1\n3\n3\n1\n1\n"
+
+    def test_posicao_de_array_e_char(self):
+        """Testa posições de arrays e variáveis do tipo char"""
+        src = """
+        int a[2] = {5, 7};
+        a[1]++;
+        --a[0];
+        printf(a[0]);
+        printf(a[1]);
+        char c = 'a';
+        c++;
+        printf(c);
+        """
+        assert run(src) == "4\n8\nb\n"
+
+    @pytest.mark.parametrize("engine", ["eval", "aeval"])
+    def test_indice_com_efeito_colateral(self, engine):
+        """Testa se o array e o índice de `a[i++]++` são avaliados uma vez"""
+        src = """
+        int a[3] = {10, 20, 30};
+        int i = 0;
+        int calls = 0;
+        int next() {
+            calls++;
+            return i++;
+        }
+        a[i++]++;
+        printf(a[0]); printf(a[1]); printf(i);
+        printf(a[i++]--); printf(a[1]); printf(i);
+        printf(++a[--i]); printf(i);
+        a[next()]--;
+        printf(a[1]); printf(i); printf(calls);
+        """
+        ctx = Ctx.from_dict({}, output=MemoryOutput())
+        if engine == "eval":
+            microc_eval(src, ctx)
+        else:
+            asyncio.run(aeval(src, ctx, step_budget=1))
+        assert ctx.output.getvalue().split() == "11 20 1 20 19 2 20 1 19 2 1".split()
+
+    def test_lacos_terminam(self):
+        """Testa se laços controlados por `++` terminam"""
+        src = """
+        int total = 0;
+        for (int i = 0; i < 4; i++) {
+            total += i;
+        }
+        int j = 3;
+        while (j > 0) j--;
+        printf(total);
+        printf(j);
+        """
+        assert run(src) == "6\n0\n"
+
+
+class TestAtribuicaoComposta:
+    """Testes para `+=`, `-=`, `*=` e `/=`"""
+
+    def test_operadores(self):
+        """Testa se cada operador guarda o resultado na variável"""
+        src = """
+        int x = 10;
+        x += 5; printf(x);
+        x -= 3; printf(x);
+        x *= 2; printf(x);
+        x /= 5; printf(x);
+        x /= -2; printf(x);
+        """
+        assert run(src) == "15\n12\n24\n4\n-2\n"
+
+    def test_valor_da_expressao(self):
+        """Testa se a atribuição composta produz o novo valor"""
+        assert run("int x = 1; int y = 0; y = x += 2; printf(y); printf(x);") == "3\n3\n"
+
+
+class TestRetornoDoMain:
+    """Testes para o valor retornado por `main`"""
+
+    def test_valor_de_main(self):
+        """Testa se `Program.eval` retorna o valor de `main`"""
+        src = "int main() { return 3; }"
+        assert microc_eval(src, Ctx.from_dict({}, output=MemoryOutput()), auto_execute_main=True) == 3
+
+    def test_sem_main(self):
+        """Testa programas sem `main` ou sem execução automática"""
+        ctx = Ctx.from_dict({}, output=MemoryOutput())
+        assert microc_eval("int x = 1;", ctx, auto_execute_main=True) is None
+        ctx = Ctx.from_dict({}, output=MemoryOutput())
+        assert microc_eval("int main() { return 3; }", ctx) is None
+
+
+class TestMensagensDeErroDeSintaxe:
+    """Testes para a mensagem de erros de sintaxe"""
+
+    @pytest.mark.parametrize("src", ["int x = ", "int x = 1 +;", "printf(1"])
+    def test_mensagem_com_tokens_esperados(self, src):
+        """Testa se a mensagem lista os tokens esperados sem falhar"""
+        with pytest.raises(UnexpectedToken) as exc_info:
+            parse(src)
+        message = str(exc_info.value)
+        assert "Expected one of" in message
+        assert exc_info.value.accepts
@@ -0,0 +1,88 @@
+import json
+import threading
+
+import pytest
+
+from microC.server import ASTCache, Client, CompileServer, UnixServer
+
+HELLO = "int main() { printf(42); return 0; }"
+
+
+class TestCompileServer:
+    """Testes para as operações do servidor de compilação"""
+
+    def test_run_isola_contexto(self):
+        """Testa se execuções repetidas usam a mesma árvore, mas contextos novos"""
+        server = CompileServer()
+        src = "int x = 0; int main() { x = x + 1; printf(x); return 0; }"
+        first = server.handle({"id": 1, "op": "run", "source": src})
+        second = server.handle({"id": 2, "op": "run", "source": src})
+        assert first["ok"] and first["stdout"] == "1\n"
+        assert second["stdout"] == "1\n"
+        assert second["id"] == 2
+        assert server.cache.hits == 1 and server.cache.misses == 1
+
+    def test_parse_usa_cache(self):
+        """Testa se a segunda análise do mesmo código vem do cache"""
+        server = CompileServer()
+        assert server.handle({"op": "parse", "source": HELLO})["cached"] is False
+        assert server.handle({"op": "check", "source": HELLO})["cached"] is True
+
+    def test_check_reporta_posicao(self):
+        """Testa se erros de sintaxe trazem tipo, linha e coluna"""
+        response = CompileServer().handle({"op": "check", "source": "int main( {"})
+        assert not response["ok"]
+        assert response["error_kind"] == "syntax"
+        assert (response["line"], response["column"]) == (1, 11)
+
+    def test_ast(self):
+        """Testa se a operação ast devolve a árvore formatada"""
+        response = CompileServer().handle({"op": "ast", "source": HELLO})
+        assert response["ast"].startswith("Program(")
+
+    @pytest.mark.parametrize(
+        "line", [b"nao e json\n", b"[1, 2]\n", b'{"op": "compile", "source": ""}\n', b'{"op": "run"}\n']
+    )
+    def test_erros_de_protocolo(self, line):
+        """Testa se requisições inválidas recebem uma resposta de erro"""
+        response = json.loads(CompileServer().handle_line(line))
+        assert response["ok"] is False
+        assert response["error_kind"] == "protocol"
+
+    def test_cache_lru(self):
+        """Testa se o cache descarta a árvore menos usada"""
+        cache = ASTCache(maxsize=2)
+        sources = [f"int main() {{ return {i}; }}" for i in range(3)]
+        cache.get(sources[0])
+        cache.get(sources[1])
+        cache.get(sources[0])
+        cache.get(sources[2])
+        assert len(cache) == 2
+        assert cache.get(sources[0])[1] is True
+        assert cache.get(sources[1])[1] is False
+
+
+class TestSocket:
+    """Testes para o servidor no socket Unix"""
+
+    def test_varias_requisicoes_por_conexao(self, tmp_path):
+        """Testa se um cliente faz várias requisições na mesma conexão"""
+        path = str(tmp_path / "microc.sock")
+        server = UnixServer(path)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            with Client(path, timeout=5) as client:
+                assert client.request("run", HELLO)["stdout"] == "42\n"
+                response = client.request("run", "int main() {")
+                assert response["error_kind"] == "syntax"
+                assert client.request("parse", HELLO)["cached"] is True
+        finally:
+            server.shutdown()
+            server.server_close()
+        assert not (tmp_path / "microc.sock").exists()
+
+    def test_sem_servidor(self, tmp_path):
+        """Testa se o cliente falha com OSError quando não há servidor"""
+        with pytest.raises(OSError):
+            Client(str(tmp_path / "nada.sock"))
@@ -0,0 +1,87 @@
+import io
+from pathlib import Path
+
+import pytest
+from lark.exceptions import UnexpectedInput
+
+from microC.errors import SemanticError
+from microC.generator import generate_program
+from microC.parser import parse
+from microC.positions import Location, error_location
+from microC.streaming import iter_decls, parse_file
+
+EXEMPLOS = Path(__file__).parent.parent / "exemplos"
+
+
+def sources():
+    for path in sorted(EXEMPLOS.rglob("*.microc")):
+        yield path.read_text()
+    for seed in range(3):
+        yield generate_program(seed, 300).source
+
+
+def assert_same(program, src: str):
+    """A árvore e as posições são iguais às de `parse` para o mesmo texto"""
+    tree = parse(src)
+    assert program == tree
+    got = [program.source_map.get(node) for node in program.descendants()]
+    expected = [tree.source_map.get(node) for node in tree.descendants()]
+    assert got == expected
+
+
+class TestAnaliseDeArquivos:
+    """Testes para a análise de arquivos uma declaração por vez"""
+
+    def test_mesma_arvore(self):
+        """Testa se `parse_file` produz a mesma árvore e posições de `parse`"""
+        for src in sources():
+            assert_same(parse_file(io.BytesIO(src.encode())), src)
+
+    def test_caminho_e_arquivo_aberto(self, tmp_path):
+        """Testa arquivos mapeados na memória, abertos e vazios"""
+        src = generate_program(0, 100).source
+        path = tmp_path / "prog.microc"
+        path.write_text(src)
+        assert_same(parse_file(path), src)
+        with open(path) as f:
+            program = parse_file(f)
+        assert_same(program, src)
+        assert program.source_map.path == str(path)
+        empty = tmp_path / "vazio.microc"
+        empty.write_text("")
+        assert parse_file(empty).stmts == []
+
+    def test_declaracoes_uma_a_uma(self):
+        """Testa se cada declaração é produzida com as suas posições"""
+        src = "int a = 1;\nint f(int x) {\n    return x + a;\n}\nprintf(f(2));\n"
+        decls = list(iter_decls(io.BytesIO(src.encode()), "prog.microc"))
+        assert [stmt for stmt, _ in decls] == parse(src).stmts
+        assert [positions.line(stmt) for stmt, positions in decls] == [1, 2, 5]
+        assert all(positions.path == "prog.microc" for _, positions in decls)
+
+    @pytest.mark.parametrize(
+        "src",
+        [
+            "int main() {\n  int x;\n  x = 1 +;\n}\n",
+            "int x = 1;\nint y = 2 @ 3;\n",
+            "int g;\nint main() { return strlen(1, 2); }\n",
+            "int main() { return strlen(1, 2); }\nint h;\n",
+        ],
+    )
+    def test_erros(self, src):
+        """Testa se os erros e suas posições são os de `parse`"""
+        with pytest.raises((UnexpectedInput, SemanticError)) as exc_info:
+            parse_file(io.BytesIO(src.encode()), "prog.microc")
+        with pytest.raises(type(exc_info.value)) as expected:
+            parse(src, "prog.microc")
+        assert str(exc_info.value) == str(expected.value)
+        assert error_location(exc_info.value) == error_location(expected.value)
+
+    def test_nativa_definida_depois(self):
+        """Testa chamadas a funções nativas redefinidas mais adiante no arquivo"""
+        src = "int main() { return strlen(1, 2); }\nint strlen(int a, int b) { return a; }\n"
+        assert_same(parse_file(io.BytesIO(src.encode())), src)
+        src = "int main() { return strlen(1, 2); }\nint strlen2(int a, int b) { return a; }\n"
+        with pytest.raises(SemanticError) as exc_info:
+            parse_file(io.BytesIO(src.encode()), "prog.microc")
+        assert error_location(exc_info.value) == Location("prog.microc", 1, 21)
@@ -1,5 +1,5 @@
 import pytest
-from microC import parse, eval as microc_eval
+from microC.testing import parse_cached, read_example, run_cached
 from microC.ctx import Ctx
 from pathlib import Path
 import os
@@ -33,11 +33,10 @@ class TestTodosExemplos:
             for arquivo in categoria_dir.glob("*.microc"):
                 print(f"Testando: {categoria}/{arquivo.name}")
                 
-                with open(arquivo, "r") as f:
-                    src = f.read()
+                src = read_example(arquivo)
                 
                 # Deve fazer parse sem erro
-                ast = parse(src)
+                ast = parse_cached(src)
                 assert ast is not None, f"Falha ao parsear {categoria}/{arquivo.name}"
                 
                 # Deve validar sem erro
@@ -46,7 +45,7 @@ class TestTodosExemplos:
                 # Deve executar sem erro crítico
                 ctx = Ctx.from_dict({})
                 try:
-                    result = microc_eval(src, ctx)
+                    result = run_cached(src, ctx)
                     exemplos_testados += 1
                 except Exception as e:
                     # Se houver erro, pelo menos deve ter parseado
@@ -71,16 +70,15 @@ class TestTodosExemplos:
             if arquivo.exists():
                 print(f"Testando exemplo raiz: {exemplo}")
                 
-                with open(arquivo, "r") as f:
-                    src = f.read()
+                src = read_example(arquivo)
                 
-                ast = parse(src)
+                ast = parse_cached(src)
                 assert ast is not None, f"Falha ao parsear {exemplo}"
                 ast.validate_tree()
                 
                 ctx = Ctx.from_dict({})
                 try:
-                    result = microc_eval(src, ctx)
+                    result = run_cached(src, ctx)
                 except Exception as e:
                     print(f"Aviso: {exemplo} deu erro na execução: {e}")
 
@@ -114,8 +112,7 @@ class TestTodosExemplos:
                 continue
                 
             for arquivo in categoria_dir.glob("*.microc"):
-                with open(arquivo, "r") as f:
-                    src = f.read()
+                src = read_example(arquivo)
                 
                 # Deve conter uma função main
                 assert "main()" in src, f"{categoria}/{arquivo.name} não tem função main"
@@ -132,10 +129,9 @@ class TestTodosExemplos:
                     arquivo_path = Path(root) / file
                     
                     try:
-                        with open(arquivo_path, "r") as f:
-                            src = f.read()
+                        src = read_example(arquivo_path)
                         
-                        ast = parse(src)
+                        ast = parse_cached(src)
                         ast.validate_tree()
                         arquivos_validos += 1
                         
@@ -0,0 +1,109 @@
+import io
+import json
+
+from microC import parse
+from microC.ctx import Ctx
+from microC.output import MemoryOutput
+from microC.runtime import McFunction
+from microC.tracing import CallTracer, guess_trace_format
+
+SRC = """
+int fat(int n) {
+    if (n <= 1) {
+        return 1;
+    }
+    return n * fat(n - 1);
+}
+
+int main() {
+    printf(fat(3));
+    return 0;
+}
+"""
+
+LONG_SRC = """
+int passo(int x) {
+    return x + 1;
+}
+
+int main() {
+    int i = 0;
+    while (i < 20000) {
+        i = passo(i);
+    }
+    return 0;
+}
+"""
+
+
+def run_traced(src: str, **kwargs) -> tuple[CallTracer, Ctx]:
+    program = parse(src)
+    ctx = Ctx.from_dict({}, output=MemoryOutput())
+    with CallTracer(program, **kwargs) as tracer:
+        program.eval(ctx, auto_execute_main=True)
+    return tracer, ctx
+
+
+class TestCallTracer:
+    """Testes para o registro de pilhas de chamadas MicroC"""
+
+    def test_eventos_de_entrada_e_saida(self):
+        """Testa se cada chamada gera um par de eventos B/E aninhados"""
+        tracer, ctx = run_traced(SRC)
+        assert ctx.output.getvalue() == "6\n"
+        kinds = [(kind, name) for kind, name, _ in tracer.events]
+        assert kinds == [
+            ("B", "main"),
+            ("B", "fat"),
+            ("B", "fat"),
+            ("B", "fat"),
+            ("E", "fat"),
+            ("E", "fat"),
+            ("E", "fat"),
+            ("E", "main"),
+        ]
+        times = [ts for _, _, ts in tracer.events]
+        assert times == sorted(times)
+
+    def test_pilhas_colapsadas(self):
+        """Testa se as pilhas colapsadas seguem a cadeia de funções MicroC"""
+        tracer, _ = run_traced(SRC)
+        stacks = set(tracer.collapsed())
+        assert stacks <= {"main", "main;fat", "main;fat;fat", "main;fat;fat;fat"}
+        assert "main;fat;fat;fat" in stacks
+
+        fd = io.StringIO()
+        tracer.write_collapsed(fd)
+        for line in fd.getvalue().splitlines():
+            stack, weight = line.rsplit(" ", 1)
+            assert stack.startswith("main")
+            assert int(weight) > 0
+
+    def test_formato_chrome(self):
+        """Testa se o JSON exportado segue o formato trace_event"""
+        tracer, _ = run_traced(SRC)
+        fd = io.StringIO()
+        tracer.write(fd, "chrome")
+        data = json.loads(fd.getvalue())
+        events = data["traceEvents"]
+        assert len(events) == 8
+        assert {event["ph"] for event in events} == {"B", "E"}
+        assert all({"name", "ts", "pid", "tid"} <= event.keys() for event in events)
+
+    def test_amostragem(self):
+        """Testa se o modo de amostragem registra a pilha corrente"""
+        tracer, _ = run_traced(LONG_SRC, sample_interval=0.001, record_events=False)
+        assert tracer.events == []
+        collapsed = tracer.collapsed()
+        assert collapsed
+        assert all(stack.startswith("main") for stack in collapsed)
+
+    def test_desinstalar_restaura_funcoes(self):
+        """Testa se as funções voltam a ser McFunction ao final"""
+        _, ctx = run_traced(SRC)
+        assert type(ctx["fat"]) is McFunction
+
+    def test_formato_pela_extensao(self):
+        """Testa a escolha do formato pelo nome do arquivo"""
+        assert guess_trace_format("saida.json") == "chrome"
+        assert guess_trace_format("saida.folded") == "collapsed"
@@ -0,0 +1,153 @@
+import pytest
+
+from microC import parse
+from microC.batch import run_source
+from microC.ctx import Ctx
+from microC.limits import Limits
+from microC.output import MemoryOutput
+from microC.vectorize import VectorLoop, numpy_available, vectorize
+
+KERNELS = """
+int main() {
+    int v[N];
+    int w[N];
+    int i;
+    for (i = 0; i < N; i++) {
+        v[i] = (37 * i) % 101 - 50;
+    }
+    int s = 0;
+    int m = v[0];
+    int k = 3;
+    for (i = 0; i < N; i++) { s += v[i]; }
+    printf(s);
+    for (i = 0; i < N; i++) { if (m < v[i]) { m = v[i]; } }
+    printf(m);
+    for (i = 0; i <= N - 1; i++) { if (v[i] <= m) { m = v[i]; } }
+    printf(m);
+    for (i = 0; i < N; i++) w[i] = v[i];
+    printf(w[N - 1]);
+    for (i = 0; i < N; i++) w[i] = k - v[i];
+    printf(w[2]);
+    for (int j = 1; j < N; j++) { v[j] = v[j] + v[j - 1]; }
+    printf(v[N - 1]);
+    printf(i);
+    s = 1;
+    for (i = 0; i < N; i = i + 1) { s = v[i] - s; }
+    printf(s);
+    return 0;
+}
+"""
+
+OVERFLOW = """
+int main() {
+    int v[300];
+    int i;
+    for (i = 0; i < 300; i++) {
+        v[i] = 4611686018427387904;
+    }
+    int s = 0;
+    for (i = 0; i < 300; i++) { s += v[i]; }
+    printf(s);
+    for (i = 0; i < 300; i++) v[i] = v[i] * 4;
+    printf(v[0]);
+    return 0;
+}
+"""
+
+backends = [
+    False,
+    pytest.param(True, marks=pytest.mark.skipif(not numpy_available(), reason="requer NumPy")),
+]
+
+
+def run_vectorized(src: str, use_numpy: bool, **limits):
+    def parse_vectorized(source):
+        tree = parse(source)
+        vectorize(tree, use_numpy)
+        return tree
+
+    return run_source(src, parse=parse_vectorized, **limits)
+
+
+@pytest.mark.parametrize("use_numpy", backends)
+class TestVetorizacao:
+    """Testes para a vetorização de laços sobre arrays"""
+
+    @pytest.mark.parametrize("size", [8, 1000])
+    def test_mesmos_resultados(self, use_numpy, size):
+        """Testa se os kernels produzem a mesma saída que os laços"""
+        src = KERNELS.replace("N", str(size))
+        expected = run_source(src)
+        result = run_vectorized(src, use_numpy)
+        assert result.ok, result.error
+        assert result.stdout == expected.stdout
+
+    def test_inteiros_grandes(self, use_numpy):
+        """Testa se resultados maiores que 64 bits são exatos"""
+        result = run_vectorized(OVERFLOW, use_numpy)
+        assert result.stdout.split() == [str(300 * 2**62), str(2**64)]
+
+    def test_passos_contados(self, use_numpy):
+        """Testa se os passos contabilizados são os mesmos do laço"""
+        src = KERNELS.replace("N", "50")
+        counts = []
+        for tree in (parse(src), parse(src)):
+            if counts:
+                vectorize(tree, use_numpy)
+            limits = Limits()
+            tree.eval(Ctx.from_dict({}, output=MemoryOutput(), limits=limits), True)
+            counts.append(limits.steps)
+        assert counts[0] == counts[1]
+
+    def test_limite_de_passos(self, use_numpy):
+        """Testa se o limite de passos interrompe o laço no mesmo ponto"""
+        src = KERNELS.replace("N", "50")
+        expected = run_source(src, max_steps=400)
+        result = run_vectorized(src, use_numpy, max_steps=400)
+        assert result.error_kind == expected.error_kind == "limit"
+        assert result.stdout == expected.stdout
+
+
+class TestPadroes:
+    """Testes para o reconhecimento dos laços vetorizáveis"""
+
+    def test_laco_reconhecido(self):
+        """Testa se os sete laços do exemplo são substituídos"""
+        tree = parse(KERNELS.replace("N", "8"))
+        assert vectorize(tree, use_numpy=False) == 7
+        assert any(isinstance(node, VectorLoop) for node in tree.descendants())
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            "v[i] = v[i + 1];",
+            "{ s += v[i]; i++; }",
+            "s += v[n];",
+            "{ s += v[i]; printf(s); }",
+        ],
+    )
+    def test_lacos_com_dependencias(self, body):
+        """Testa se laços com dependências entre iterações não são alterados"""
+        src = f"int main() {{ int v[4]; int s = 0; int n = 4; for (int i = 0; i < 3; i++) {body} return 0; }}"
+        assert vectorize(parse(src), use_numpy=False) == 0
+
+    def test_fora_dos_limites(self):
+        """Testa se um índice inválido produz o mesmo erro do laço"""
+        src = "int main() { int v[4]; int s = 0; for (int i = 0; i < 5; i++) { s += v[i]; } return 0; }"
+        expected = run_source(src)
+        result = run_vectorized(src, use_numpy=False)
+        assert result.error_kind == expected.error_kind == "runtime"
+        assert result.error == expected.error
+
+    def test_array_de_caracteres(self):
+        """Testa se arrays de caracteres usam o laço original"""
+        src = """
+        int main() {
+            char a[4] = {'a', 'b', 'c'};
+            char b[4];
+            for (int i = 0; i < 4; i++) b[i] = a[i];
+            printf(b[1]);
+            return 0;
+        }
+        """
+        assert run_vectorized(src, use_numpy=False).stdout == run_source(src).stdout